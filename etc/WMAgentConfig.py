@@ -187,6 +187,7 @@ config.JobCreator.componentDir = config.General.workDir + "/JobCreator"
 config.JobCreator.logLevel = globalLogLevel
 config.JobCreator.maxThreads = 1
 config.JobCreator.UpdateFromResourceControl = True
+config.JobCreator.preloadDAOPackages = ["WMCore.WMBS"]
 config.JobCreator.pollInterval = 120
 # This is now OPTIONAL: It defaults to the componentDir
 # However: In a production instance, this should be run on a high performance
@@ -0,0 +1,54 @@
+#! /usr/bin/env python
+from __future__ import division, print_function
+
+import Queue
+import sys
+import threading
+
+
+def parallelMap(func, iterable, maxWorkers=10):
+    """
+    :param func: function to call on every item
+    :type: callable
+    :param iterable: items to process
+    :type: iterable
+    :param maxWorkers: maximum number of threads calling func at the same time
+    :type: int
+    :return: list of the func results, in the order of the items
+
+    Call func on every item from a bounded pool of threads, for I/O bound
+    work like remote service calls. If any call raises, the first exception
+    (in item order) is raised once all the calls finished.
+    """
+    items = list(iterable)
+    if len(items) <= 1 or maxWorkers <= 1:
+        return [func(item) for item in items]
+
+    results = [None] * len(items)
+    errors = [None] * len(items)
+    work = Queue.Queue()
+    for position, item in enumerate(items):
+        work.put((position, item))
+
+    def worker():
+        while True:
+            try:
+                position, item = work.get_nowait()
+            except Queue.Empty:
+                return
+            try:
+                results[position] = func(item)
+            except Exception:
+                errors[position] = sys.exc_info()
+
+    threads = [threading.Thread(target=worker) for _ in range(min(maxWorkers, len(items)))]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for error in errors:
+        if error is not None:
+            raise error[0], error[1], error[2]
+    return results
@@ -0,0 +1,11 @@
+"""
+_CountBlocks_
+
+SQLite implementation of CountBlocks
+"""
+
+from WMComponent.DBS3Buffer.MySQL.CountBlocks \
+     import CountBlocks as MySQLCountBlocks
+
+class CountBlocks(MySQLCountBlocks):
+    pass
@@ -0,0 +1,11 @@
+"""
+_CountFiles_
+
+SQLite implementation of CountFiles
+"""
+
+from WMComponent.DBS3Buffer.MySQL.CountFiles \
+     import CountFiles as MySQLCountFiles
+
+class CountFiles(MySQLCountFiles):
+    pass
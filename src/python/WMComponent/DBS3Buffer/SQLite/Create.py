@@ -0,0 +1,182 @@
+"""
+_Create_DBS3Buffer_
+
+Implementation of Create_DBSBuffer for SQLite.
+
+SQLite can't add constraints to an existing table, so the foreign keys the
+MySQL schema adds with ALTER TABLE are declared in the table definitions.
+"""
+
+from WMComponent.DBS3Buffer.MySQL.Create import Create as MySQLCreate
+
+class Create(MySQLCreate):
+
+    def __init__(self, logger = None, dbi = None, params = None):
+        """
+        _init_
+
+        Call the MySQL constructor, then replace the tables and drop the
+        ALTER TABLE constraints.  Indexes and inserts are kept as they are.
+        """
+        MySQLCreate.__init__(self, logger, dbi, params)
+
+        self.create.clear()
+        self.constraints.clear()
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_dataset (
+                 id              INTEGER      PRIMARY KEY AUTOINCREMENT,
+                 path            VARCHAR(500) NOT NULL,
+                 processing_ver  VARCHAR(255),
+                 acquisition_era VARCHAR(255),
+                 valid_status    VARCHAR(20),
+                 global_tag      VARCHAR(255),
+                 parent          VARCHAR(500),
+                 prep_id         VARCHAR(255),
+                 CONSTRAINT uq_dbs_dat UNIQUE (path)
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_dataset_subscription (
+                 id                     INTEGER      PRIMARY KEY AUTOINCREMENT,
+                 dataset_id             INTEGER      NOT NULL,
+                 site                   VARCHAR(100) NOT NULL,
+                 custodial              INTEGER      DEFAULT 0,
+                 auto_approve           INTEGER      DEFAULT 0,
+                 move                   INTEGER      DEFAULT 0,
+                 priority               VARCHAR(10)  DEFAULT 'Low',
+                 subscribed             INTEGER      DEFAULT 0,
+                 phedex_group           VARCHAR(100),
+                 delete_blocks          INTEGER,
+                 CONSTRAINT uq_dbs_dat_sub UNIQUE (dataset_id, site, custodial, auto_approve, move, priority),
+                 CONSTRAINT fk_dsetsubscription_datasetid FOREIGN KEY (dataset_id)
+                   REFERENCES dbsbuffer_dataset(id) ON DELETE CASCADE
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_algo (
+                 id             INTEGER       PRIMARY KEY AUTOINCREMENT,
+                 app_name       VARCHAR(100),
+                 app_ver        VARCHAR(100),
+                 app_fam        VARCHAR(100),
+                 pset_hash      VARCHAR(700),
+                 config_content LONGTEXT,
+                 in_dbs         INTEGER,
+                 CONSTRAINT uq_dbs_alg UNIQUE (app_name, app_ver, app_fam, pset_hash)
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_algo_dataset_assoc (
+                 id         INTEGER PRIMARY KEY AUTOINCREMENT,
+                 algo_id    INTEGER NOT NULL,
+                 dataset_id INTEGER NOT NULL,
+                 in_dbs     INTEGER DEFAULT 0,
+                 CONSTRAINT fk_algodset_assoc_dataset_id FOREIGN KEY (dataset_id)
+                   REFERENCES dbsbuffer_dataset(id) ON DELETE CASCADE,
+                 CONSTRAINT fk_algodset_assoc_algo_id FOREIGN KEY (algo_id)
+                   REFERENCES dbsbuffer_algo(id) ON DELETE CASCADE
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_workflow (
+                 id                           INTEGER       PRIMARY KEY AUTOINCREMENT,
+                 name                         VARCHAR(700),
+                 task                         VARCHAR(700),
+                 block_close_max_wait_time    INTEGER,
+                 block_close_max_files        INTEGER,
+                 block_close_max_events       INTEGER,
+                 block_close_max_size         BIGINT,
+                 completed                    INTEGER       DEFAULT 0,
+                 CONSTRAINT uq_dbs_wor UNIQUE (name, task)
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_file (
+                 id                    INTEGER      PRIMARY KEY AUTOINCREMENT,
+                 lfn                   VARCHAR(500) NOT NULL,
+                 filesize              BIGINT,
+                 events                INTEGER,
+                 dataset_algo          INTEGER      NOT NULL,
+                 block_id              INTEGER,
+                 status                VARCHAR(20),
+                 in_phedex             INTEGER      DEFAULT 0,
+                 workflow              INTEGER,
+                 LastModificationDate  INTEGER,
+                 CONSTRAINT uq_dbs_fil UNIQUE (lfn),
+                 CONSTRAINT fk_file_workflow FOREIGN KEY (workflow)
+                   REFERENCES dbsbuffer_workflow(id) ON DELETE CASCADE,
+                 CONSTRAINT fk_file_dataset_algo FOREIGN KEY (dataset_algo)
+                   REFERENCES dbsbuffer_algo_dataset_assoc(id) ON DELETE CASCADE
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_file_parent (
+                 child  INTEGER NOT NULL,
+                 parent INTEGER NOT NULL,
+                 CONSTRAINT pk_dbs_fil_par PRIMARY KEY (child, parent),
+                 CONSTRAINT fk_file_parent_child FOREIGN KEY (child)
+                   REFERENCES dbsbuffer_file(id) ON DELETE CASCADE,
+                 CONSTRAINT fk_file_parent_parent FOREIGN KEY (parent)
+                   REFERENCES dbsbuffer_file(id) ON DELETE CASCADE
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_file_runlumi_map (
+                 filename    INTEGER NOT NULL,
+                 run         INTEGER NOT NULL,
+                 lumi        INTEGER NOT NULL,
+                 CONSTRAINT fk_file_runlumi_filename FOREIGN KEY (filename)
+                   REFERENCES dbsbuffer_file(id) ON DELETE CASCADE
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_location (
+                 id       INTEGER      PRIMARY KEY AUTOINCREMENT,
+                 pnn  VARCHAR(255) NOT NULL,
+                 CONSTRAINT uq_dbs_loc UNIQUE (pnn)
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_file_location (
+                 filename INTEGER NOT NULL,
+                 location INTEGER NOT NULL,
+                 CONSTRAINT pk_dbs_fil_loc PRIMARY KEY (filename, location),
+                 CONSTRAINT fk_file_location_location FOREIGN KEY (location)
+                   REFERENCES dbsbuffer_location(id) ON DELETE CASCADE,
+                 CONSTRAINT fk_file_location_filename FOREIGN KEY (filename)
+                   REFERENCES dbsbuffer_file(id) ON DELETE CASCADE
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_block (
+                 id           INTEGER      PRIMARY KEY AUTOINCREMENT,
+                 dataset_id   INTEGER      NOT NULL,
+                 blockname    VARCHAR(250) NOT NULL,
+                 location     INTEGER      NOT NULL,
+                 create_time  INTEGER,
+                 status       VARCHAR(20),
+                 deleted      INTEGER      DEFAULT 0,
+                 CONSTRAINT uq_dbs_blo UNIQUE (blockname, location),
+                 CONSTRAINT fk_block_location FOREIGN KEY (location)
+                   REFERENCES dbsbuffer_location(id) ON DELETE CASCADE,
+                 CONSTRAINT fk_block_dataset_id FOREIGN KEY (dataset_id)
+                   REFERENCES dbsbuffer_dataset(id) ON DELETE CASCADE
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_checksum_type (
+                 id   INTEGER      PRIMARY KEY AUTOINCREMENT,
+                 type VARCHAR(255)
+               )"""
+
+        self.create[len(self.create)] = \
+            """CREATE TABLE dbsbuffer_file_checksums (
+                 fileid  INTEGER,
+                 typeid  INTEGER,
+                 cksum   VARCHAR(100),
+                 CONSTRAINT pk_dbs_fil_che PRIMARY KEY (fileid, typeid),
+                 CONSTRAINT fk_file_checksums_typeid FOREIGN KEY (typeid)
+                   REFERENCES dbsbuffer_checksum_type(id) ON DELETE CASCADE,
+                 CONSTRAINT fk_file_checksums_fileid FOREIGN KEY (fileid)
+                   REFERENCES dbsbuffer_file(id) ON DELETE CASCADE
+               )"""
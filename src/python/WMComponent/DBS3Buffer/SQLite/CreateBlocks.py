@@ -0,0 +1,18 @@
+"""
+_CreateBlocks_
+
+SQLite implementation of CreateBlocks
+"""
+
+from WMComponent.DBS3Buffer.MySQL.CreateBlocks \
+     import CreateBlocks as MySQLCreateBlocks
+
+class CreateBlocks(MySQLCreateBlocks):
+    sql = """INSERT INTO dbsbuffer_block
+             (dataset_id, blockname, location, status, create_time)
+             SELECT (SELECT id from dbsbuffer_dataset WHERE path = :dataset),
+                    :block,
+                    (SELECT id FROM dbsbuffer_location WHERE pnn = :location),
+                    :status,
+                    :time
+             """
@@ -0,0 +1,10 @@
+"""
+_Add_
+
+SQLite implementation of DBSBufferFiles.Add
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.Add import Add as MySQLAdd
+
+class Add(MySQLAdd):
+    pass
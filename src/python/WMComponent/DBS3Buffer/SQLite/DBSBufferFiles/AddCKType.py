@@ -0,0 +1,11 @@
+"""
+_AddCKType_
+
+SQLite implementation of DBSBufferFiles.AddCKType
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.AddCKType \
+     import AddCKType as MySQLAddCKType
+
+class AddCKType(MySQLAddCKType):
+    pass
@@ -0,0 +1,14 @@
+"""
+_AddChecksum_
+
+SQLite implementation of DBSBufferFiles.AddChecksum
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.AddChecksum \
+     import AddChecksum as MySQLAddChecksum
+
+class AddChecksum(MySQLAddChecksum):
+    sql = """INSERT INTO dbsbuffer_file_checksums (fileid, typeid, cksum)
+             SELECT :fileid, (SELECT id FROM dbsbuffer_checksum_type WHERE type = :cktype), :cksum
+             WHERE NOT EXISTS (SELECT fileid FROM dbsbuffer_file_checksums WHERE
+                               fileid = :fileid AND typeid = (SELECT id FROM dbsbuffer_checksum_type WHERE type = :cktype))"""
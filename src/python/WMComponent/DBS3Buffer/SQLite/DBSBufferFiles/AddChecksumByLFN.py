@@ -0,0 +1,13 @@
+"""
+_AddChecksumByLFN_
+
+SQLite implementation of DBSBufferFiles.AddChecksumByLFN
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.AddChecksumByLFN \
+     import AddChecksumByLFN as MySQLAddChecksumByLFN
+
+class AddChecksumByLFN(MySQLAddChecksumByLFN):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_file_checksums (fileid, typeid, cksum)
+             SELECT (SELECT id FROM dbsbuffer_file WHERE lfn = :lfn),
+             (SELECT id FROM dbsbuffer_checksum_type WHERE type = :cktype), :cksum"""
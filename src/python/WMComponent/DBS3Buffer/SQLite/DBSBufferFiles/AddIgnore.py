@@ -0,0 +1,12 @@
+"""
+_AddIgnore_
+
+SQLite implementation of DBSBufferFiles.AddIgnore
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.AddIgnore \
+     import AddIgnore as MySQLAddIgnore
+
+class AddIgnore(MySQLAddIgnore):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_file (lfn, dataset_algo, status)
+                VALUES (:lfn, :dataset_algo, :status)"""
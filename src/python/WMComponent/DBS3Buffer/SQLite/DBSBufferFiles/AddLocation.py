@@ -0,0 +1,12 @@
+"""
+_AddLocation_
+
+SQLite implementation of DBSBufferFiles.AddLocation
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.AddLocation \
+     import AddLocation as MySQLAddLocation
+
+class AddLocation(MySQLAddLocation):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_location (pnn)
+               VALUES (:location)"""
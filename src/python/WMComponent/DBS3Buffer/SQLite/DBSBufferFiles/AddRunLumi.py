@@ -0,0 +1,13 @@
+"""
+_AddRunLumi_
+
+SQLite implementation of DBSBufferFiles.AddRunLumi
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.AddRunLumi \
+     import AddRunLumi as MySQLAddRunLumi
+
+class AddRunLumi(MySQLAddRunLumi):
+    sql = """insert into dbsbuffer_file_runlumi_map (filename, run, lumi)
+            select id, :run, :lumi from dbsbuffer_file
+            where lfn = :lfn"""
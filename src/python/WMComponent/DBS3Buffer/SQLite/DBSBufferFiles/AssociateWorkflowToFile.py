@@ -0,0 +1,11 @@
+"""
+_AssociateWorkflowToFile_
+
+SQLite implementation of DBSBufferFiles.AssociateWorkflowToFile
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.AssociateWorkflowToFile \
+     import AssociateWorkflowToFile as MySQLAssociateWorkflowToFile
+
+class AssociateWorkflowToFile(MySQLAssociateWorkflowToFile):
+    pass
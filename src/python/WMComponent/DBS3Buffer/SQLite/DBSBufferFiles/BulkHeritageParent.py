@@ -0,0 +1,11 @@
+"""
+_BulkHeritageParent_
+
+SQLite implementation of DBSBufferFiles.BulkHeritageParent
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.BulkHeritageParent \
+     import BulkHeritageParent as MySQLBulkHeritageParent
+
+class BulkHeritageParent(MySQLBulkHeritageParent):
+    pass
@@ -0,0 +1,11 @@
+"""
+_Delete_
+
+SQLite implementation of DBSBufferFiles.Delete
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.Delete \
+     import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
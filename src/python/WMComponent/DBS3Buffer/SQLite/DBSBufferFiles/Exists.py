@@ -0,0 +1,11 @@
+"""
+_Exists_
+
+SQLite implementation of DBSBufferFiles.Exists
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.Exists \
+     import Exists as MySQLExists
+
+class Exists(MySQLExists):
+    pass
@@ -0,0 +1,11 @@
+"""
+_ExistsForAccountant_
+
+SQLite implementation of DBSBufferFiles.ExistsForAccountant
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.ExistsForAccountant \
+     import ExistsForAccountant as MySQLExistsForAccountant
+
+class ExistsForAccountant(MySQLExistsForAccountant):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetBlock_
+
+SQLite implementation of DBSBufferFiles.GetBlock
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetBlock \
+     import GetBlock as MySQLGetBlock
+
+class GetBlock(MySQLGetBlock):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetByID_
+
+SQLite implementation of DBSBufferFiles.GetByID
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetByID \
+     import GetByID as MySQLGetByID
+
+class GetByID(MySQLGetByID):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetByLFN_
+
+SQLite implementation of DBSBufferFiles.GetByLFN
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetByLFN \
+     import GetByLFN as MySQLGetByLFN
+
+class GetByLFN(MySQLGetByLFN):
+    pass
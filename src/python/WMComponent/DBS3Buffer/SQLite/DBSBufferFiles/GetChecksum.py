@@ -0,0 +1,11 @@
+"""
+_GetChecksum_
+
+SQLite implementation of DBSBufferFiles.GetChecksum
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetChecksum \
+     import GetChecksum as MySQLGetChecksum
+
+class GetChecksum(MySQLGetChecksum):
+    pass
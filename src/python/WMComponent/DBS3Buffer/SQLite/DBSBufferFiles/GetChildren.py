@@ -0,0 +1,11 @@
+"""
+_GetChildren_
+
+SQLite implementation of DBSBufferFiles.GetChildren
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetChildren \
+     import GetChildren as MySQLGetChildren
+
+class GetChildren(MySQLGetChildren):
+    pass
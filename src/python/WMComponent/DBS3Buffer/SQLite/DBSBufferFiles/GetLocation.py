@@ -0,0 +1,11 @@
+"""
+_GetLocation_
+
+SQLite implementation of DBSBufferFiles.GetLocation
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetLocation \
+     import GetLocation as MySQLGetLocation
+
+class GetLocation(MySQLGetLocation):
+    pass
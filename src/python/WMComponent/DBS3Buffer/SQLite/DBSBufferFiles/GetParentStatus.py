@@ -0,0 +1,11 @@
+"""
+_GetParentStatus_
+
+SQLite implementation of DBSBufferFiles.GetParentStatus
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetParentStatus \
+     import GetParentStatus as MySQLGetParentStatus
+
+class GetParentStatus(MySQLGetParentStatus):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetParents_
+
+SQLite implementation of DBSBufferFiles.GetParents
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetParents \
+     import GetParents as MySQLGetParents
+
+class GetParents(MySQLGetParents):
+    pass
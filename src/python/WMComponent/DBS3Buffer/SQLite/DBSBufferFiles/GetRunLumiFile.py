@@ -0,0 +1,11 @@
+"""
+_GetRunLumiFile_
+
+SQLite implementation of DBSBufferFiles.GetRunLumiFile
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.GetRunLumiFile \
+     import GetRunLumiFile as MySQLGetRunLumiFile
+
+class GetRunLumiFile(MySQLGetRunLumiFile):
+    pass
@@ -0,0 +1,11 @@
+"""
+_HeritageLFNChild_
+
+SQLite implementation of DBSBufferFiles.HeritageLFNChild
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.HeritageLFNChild \
+     import HeritageLFNChild as MySQLHeritageLFNChild
+
+class HeritageLFNChild(MySQLHeritageLFNChild):
+    pass
@@ -0,0 +1,11 @@
+"""
+_HeritageLFNParent_
+
+SQLite implementation of DBSBufferFiles.HeritageLFNParent
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.HeritageLFNParent \
+     import HeritageLFNParent as MySQLHeritageLFNParent
+
+class HeritageLFNParent(MySQLHeritageLFNParent):
+    pass
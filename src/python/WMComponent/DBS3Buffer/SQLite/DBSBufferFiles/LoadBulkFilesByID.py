@@ -0,0 +1,11 @@
+"""
+_LoadBulkFilesByID_
+
+SQLite implementation of DBSBufferFiles.LoadBulkFilesByID
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.LoadBulkFilesByID \
+     import LoadBulkFilesByID as MySQLLoadBulkFilesByID
+
+class LoadBulkFilesByID(MySQLLoadBulkFilesByID):
+    pass
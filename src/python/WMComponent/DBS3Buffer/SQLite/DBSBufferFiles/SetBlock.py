@@ -0,0 +1,11 @@
+"""
+_SetBlock_
+
+SQLite implementation of DBSBufferFiles.SetBlock
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.SetBlock \
+     import SetBlock as MySQLSetBlock
+
+class SetBlock(MySQLSetBlock):
+    pass
@@ -0,0 +1,12 @@
+"""
+_SetLocation_
+
+SQLite implementation of DBSBufferFiles.SetLocation
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.SetLocation \
+     import SetLocation as MySQLSetLocation
+
+class SetLocation(MySQLSetLocation):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_file_location (filename, location)
+               VALUES (:fileid, :locationid)"""
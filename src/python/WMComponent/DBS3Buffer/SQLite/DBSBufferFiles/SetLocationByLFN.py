@@ -0,0 +1,17 @@
+"""
+_SetLocationByLFN_
+
+SQLite implementation of DBSBufferFiles.SetLocationByLFN
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.SetLocationByLFN \
+     import SetLocationByLFN as MySQLSetLocationByLFN
+
+class SetLocationByLFN(MySQLSetLocationByLFN):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_file_location (filename, location)
+               SELECT df.id, dl.id
+               FROM dbsbuffer_file df
+               INNER JOIN dbsbuffer_location dl
+               WHERE df.lfn = :lfn
+               AND dl.pnn = :pnn
+    """
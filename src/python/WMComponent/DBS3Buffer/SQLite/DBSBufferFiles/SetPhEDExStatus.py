@@ -0,0 +1,11 @@
+"""
+_SetPhEDExStatus_
+
+SQLite implementation of DBSBufferFiles.SetPhEDExStatus
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.SetPhEDExStatus \
+     import SetPhEDExStatus as MySQLSetPhEDExStatus
+
+class SetPhEDExStatus(MySQLSetPhEDExStatus):
+    pass
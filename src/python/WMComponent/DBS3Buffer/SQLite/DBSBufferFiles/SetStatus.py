@@ -0,0 +1,11 @@
+"""
+_SetStatus_
+
+SQLite implementation of DBSBufferFiles.SetStatus
+"""
+
+from WMComponent.DBS3Buffer.MySQL.DBSBufferFiles.SetStatus \
+     import SetStatus as MySQLSetStatus
+
+class SetStatus(MySQLSetStatus):
+    pass
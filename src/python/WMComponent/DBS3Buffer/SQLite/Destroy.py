@@ -0,0 +1,10 @@
+"""
+_Destroy_
+
+Implementation of DBSBuffer.Destroy for SQLite
+"""
+
+from WMComponent.DBS3Buffer.MySQL.Destroy import Destroy as MySQLDestroy
+
+class Destroy(MySQLDestroy):
+    pass
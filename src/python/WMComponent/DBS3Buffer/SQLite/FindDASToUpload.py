@@ -0,0 +1,11 @@
+"""
+_FindDASToUpload_
+
+SQLite implementation of FindDASToUpload
+"""
+
+from WMComponent.DBS3Buffer.MySQL.FindDASToUpload \
+     import FindDASToUpload as MySQLFindDASToUpload
+
+class FindDASToUpload(MySQLFindDASToUpload):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetBlockFromDataset_
+
+SQLite implementation of GetBlockFromDataset
+"""
+
+from WMComponent.DBS3Buffer.MySQL.GetBlockFromDataset \
+     import GetBlockFromDataset as MySQLGetBlockFromDataset
+
+class GetBlockFromDataset(MySQLGetBlockFromDataset):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetCompletedWorkflows_
+
+SQLite implementation of GetCompletedWorkflows
+"""
+
+from WMComponent.DBS3Buffer.MySQL.GetCompletedWorkflows \
+     import GetCompletedWorkflows as MySQLGetCompletedWorkflows
+
+class GetCompletedWorkflows(MySQLGetCompletedWorkflows):
+    pass
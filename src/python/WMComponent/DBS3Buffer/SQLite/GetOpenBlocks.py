@@ -0,0 +1,11 @@
+"""
+_GetOpenBlocks_
+
+SQLite implementation of GetOpenBlocks
+"""
+
+from WMComponent.DBS3Buffer.MySQL.GetOpenBlocks \
+     import GetOpenBlocks as MySQLGetOpenBlocks
+
+class GetOpenBlocks(MySQLGetOpenBlocks):
+    pass
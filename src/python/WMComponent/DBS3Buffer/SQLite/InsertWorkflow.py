@@ -0,0 +1,20 @@
+"""
+_InsertWorkflow_
+
+SQLite implementation of InsertWorkflow
+"""
+
+from WMComponent.DBS3Buffer.MySQL.InsertWorkflow \
+     import InsertWorkflow as MySQLInsertWorkflow
+
+class InsertWorkflow(MySQLInsertWorkflow):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_workflow (name, task,
+                                                    block_close_max_wait_time,
+                                                    block_close_max_files,
+                                                    block_close_max_events,
+                                                    block_close_max_size)
+                VALUES (:name, :task,
+                        :blockMaxCloseTime,
+                        :blockMaxFiles,
+                        :blockMaxEvents,
+                        :blockMaxSize)"""
@@ -0,0 +1,10 @@
+"""
+_ListAlgo_
+
+SQLite implementation of ListAlgo
+"""
+
+from WMComponent.DBS3Buffer.MySQL.ListAlgo import ListAlgo as MySQLListAlgo
+
+class ListAlgo(MySQLListAlgo):
+    pass
@@ -0,0 +1,11 @@
+"""
+_ListAlgoDatasetAssoc_
+
+SQLite implementation of ListAlgoDatasetAssoc
+"""
+
+from WMComponent.DBS3Buffer.MySQL.ListAlgoDatasetAssoc \
+     import ListAlgoDatasetAssoc as MySQLListAlgoDatasetAssoc
+
+class ListAlgoDatasetAssoc(MySQLListAlgoDatasetAssoc):
+    pass
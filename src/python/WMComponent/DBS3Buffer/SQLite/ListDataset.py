@@ -0,0 +1,11 @@
+"""
+_ListDataset_
+
+SQLite implementation of ListDataset
+"""
+
+from WMComponent.DBS3Buffer.MySQL.ListDataset \
+     import ListDataset as MySQLListDataset
+
+class ListDataset(MySQLListDataset):
+    pass
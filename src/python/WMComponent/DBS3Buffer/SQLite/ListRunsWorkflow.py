@@ -0,0 +1,11 @@
+"""
+_ListRunsWorkflow_
+
+SQLite implementation of ListRunsWorkflow
+"""
+
+from WMComponent.DBS3Buffer.MySQL.ListRunsWorkflow \
+     import ListRunsWorkflow as MySQLListRunsWorkflow
+
+class ListRunsWorkflow(MySQLListRunsWorkflow):
+    pass
@@ -0,0 +1,11 @@
+"""
+_ListSubscriptions_
+
+SQLite implementation of ListSubscriptions
+"""
+
+from WMComponent.DBS3Buffer.MySQL.ListSubscriptions \
+     import ListSubscriptions as MySQLListSubscriptions
+
+class ListSubscriptions(MySQLListSubscriptions):
+    pass
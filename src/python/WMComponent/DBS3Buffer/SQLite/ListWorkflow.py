@@ -0,0 +1,11 @@
+"""
+_ListWorkflow_
+
+SQLite implementation of ListWorkflow
+"""
+
+from WMComponent.DBS3Buffer.MySQL.ListWorkflow \
+     import ListWorkflow as MySQLListWorkflow
+
+class ListWorkflow(MySQLListWorkflow):
+    pass
@@ -0,0 +1,11 @@
+"""
+_LoadBlocks_
+
+SQLite implementation of LoadBlocks
+"""
+
+from WMComponent.DBS3Buffer.MySQL.LoadBlocks \
+     import LoadBlocks as MySQLLoadBlocks
+
+class LoadBlocks(MySQLLoadBlocks):
+    pass
@@ -0,0 +1,11 @@
+"""
+_LoadBlocksByDAS_
+
+SQLite implementation of LoadBlocksByDAS
+"""
+
+from WMComponent.DBS3Buffer.MySQL.LoadBlocksByDAS \
+     import LoadBlocksByDAS as MySQLLoadBlocksByDAS
+
+class LoadBlocksByDAS(MySQLLoadBlocksByDAS):
+    pass
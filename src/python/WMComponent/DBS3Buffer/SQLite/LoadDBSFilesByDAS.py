@@ -0,0 +1,11 @@
+"""
+_LoadDBSFilesByDAS_
+
+SQLite implementation of LoadDBSFilesByDAS
+"""
+
+from WMComponent.DBS3Buffer.MySQL.LoadDBSFilesByDAS \
+     import LoadDBSFilesByDAS as MySQLLoadDBSFilesByDAS
+
+class LoadDBSFilesByDAS(MySQLLoadDBSFilesByDAS):
+    pass
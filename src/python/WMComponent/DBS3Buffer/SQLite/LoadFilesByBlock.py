@@ -0,0 +1,11 @@
+"""
+_LoadFilesByBlock_
+
+SQLite implementation of LoadFilesByBlock
+"""
+
+from WMComponent.DBS3Buffer.MySQL.LoadFilesByBlock \
+     import LoadFilesByBlock as MySQLLoadFilesByBlock
+
+class LoadFilesByBlock(MySQLLoadFilesByBlock):
+    pass
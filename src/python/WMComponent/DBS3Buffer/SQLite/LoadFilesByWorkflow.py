@@ -0,0 +1,11 @@
+"""
+_LoadFilesByWorkflow_
+
+SQLite implementation of LoadFilesByWorkflow
+"""
+
+from WMComponent.DBS3Buffer.MySQL.LoadFilesByWorkflow \
+     import LoadFilesByWorkflow as MySQLLoadFilesByWorkflow
+
+class LoadFilesByWorkflow(MySQLLoadFilesByWorkflow):
+    pass
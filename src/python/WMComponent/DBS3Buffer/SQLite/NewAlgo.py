@@ -0,0 +1,13 @@
+"""
+_NewAlgo_
+
+SQLite implementation of NewAlgo
+"""
+
+from WMComponent.DBS3Buffer.MySQL.NewAlgo import NewAlgo as MySQLNewAlgo
+
+class NewAlgo(MySQLNewAlgo):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_algo
+             (app_name, app_ver, app_fam, pset_hash, config_content, in_dbs)
+             VALUES (:app_name, :app_ver, :app_fam, :pset_hash, :config_content, 0)
+             """
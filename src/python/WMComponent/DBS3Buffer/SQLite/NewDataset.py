@@ -0,0 +1,12 @@
+"""
+_NewDataset_
+
+SQLite implementation of NewDataset
+"""
+
+from WMComponent.DBS3Buffer.MySQL.NewDataset \
+     import NewDataset as MySQLNewDataset
+
+class NewDataset(MySQLNewDataset):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_dataset (path, processing_ver, acquisition_era, valid_status, global_tag, parent, prep_id)
+               VALUES (:path, :processing_ver, :acquisition_era, :valid_status, :global_tag, :parent, :prep_id)"""
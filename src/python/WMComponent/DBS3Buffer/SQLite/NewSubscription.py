@@ -0,0 +1,14 @@
+"""
+_NewSubscription_
+
+SQLite implementation of NewSubscription
+"""
+
+from WMComponent.DBS3Buffer.MySQL.NewSubscription \
+     import NewSubscription as MySQLNewSubscription
+
+class NewSubscription(MySQLNewSubscription):
+    sql = """INSERT OR IGNORE INTO dbsbuffer_dataset_subscription
+            (dataset_id, site, custodial, auto_approve, move, priority, subscribed, phedex_group, delete_blocks)
+            VALUES (:id, :site, :custodial, :auto_approve, :move, :priority, 0, :phedex_group, :delete_blocks)
+          """
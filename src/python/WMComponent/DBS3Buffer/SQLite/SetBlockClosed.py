@@ -0,0 +1,11 @@
+"""
+_SetBlockClosed_
+
+SQLite implementation of SetBlockClosed
+"""
+
+from WMComponent.DBS3Buffer.MySQL.SetBlockClosed \
+     import SetBlockClosed as MySQLSetBlockClosed
+
+class SetBlockClosed(MySQLSetBlockClosed):
+    pass
@@ -0,0 +1,11 @@
+"""
+_SetBlockFiles_
+
+SQLite implementation of SetBlockFiles
+"""
+
+from WMComponent.DBS3Buffer.MySQL.SetBlockFiles \
+     import SetBlockFiles as MySQLSetBlockFiles
+
+class SetBlockFiles(MySQLSetBlockFiles):
+    pass
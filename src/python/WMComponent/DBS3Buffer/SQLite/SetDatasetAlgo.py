@@ -0,0 +1,14 @@
+"""
+_SetDatasetAlgo_
+
+SQLite implementation of SetDatasetAlgo
+"""
+
+from WMComponent.DBS3Buffer.MySQL.SetDatasetAlgo \
+     import SetDatasetAlgo as MySQLSetDatasetAlgo
+
+class SetDatasetAlgo(MySQLSetDatasetAlgo):
+    sql = """UPDATE dbsbuffer_algo_dataset_assoc
+             SET in_dbs = :in_dbs
+             WHERE id = :datasetAlgo
+    """
@@ -0,0 +1,10 @@
+"""
+_Status_
+
+SQLite implementation of Status
+"""
+
+from WMComponent.DBS3Buffer.MySQL.Status import Status as MySQLStatus
+
+class Status(MySQLStatus):
+    pass
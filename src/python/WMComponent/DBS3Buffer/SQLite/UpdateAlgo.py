@@ -0,0 +1,11 @@
+"""
+_UpdateAlgo_
+
+SQLite implementation of UpdateAlgo
+"""
+
+from WMComponent.DBS3Buffer.MySQL.UpdateAlgo \
+     import UpdateAlgo as MySQLUpdateAlgo
+
+class UpdateAlgo(MySQLUpdateAlgo):
+    pass
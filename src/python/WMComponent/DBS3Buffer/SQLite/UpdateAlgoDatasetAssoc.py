@@ -0,0 +1,11 @@
+"""
+_UpdateAlgoDatasetAssoc_
+
+SQLite implementation of UpdateAlgoDatasetAssoc
+"""
+
+from WMComponent.DBS3Buffer.MySQL.UpdateAlgoDatasetAssoc \
+     import UpdateAlgoDatasetAssoc as MySQLUpdateAlgoDatasetAssoc
+
+class UpdateAlgoDatasetAssoc(MySQLUpdateAlgoDatasetAssoc):
+    pass
@@ -0,0 +1,11 @@
+"""
+_UpdateBlocks_
+
+SQLite implementation of UpdateBlocks
+"""
+
+from WMComponent.DBS3Buffer.MySQL.UpdateBlocks \
+     import UpdateBlocks as MySQLUpdateBlocks
+
+class UpdateBlocks(MySQLUpdateBlocks):
+    pass
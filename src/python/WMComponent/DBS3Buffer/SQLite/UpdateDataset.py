@@ -0,0 +1,11 @@
+"""
+_UpdateDataset_
+
+SQLite implementation of UpdateDataset
+"""
+
+from WMComponent.DBS3Buffer.MySQL.UpdateDataset \
+     import UpdateDataset as MySQLUpdateDataset
+
+class UpdateDataset(MySQLUpdateDataset):
+    pass
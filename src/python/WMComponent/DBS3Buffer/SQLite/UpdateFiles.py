@@ -0,0 +1,11 @@
+"""
+_UpdateFiles_
+
+SQLite implementation of UpdateFiles
+"""
+
+from WMComponent.DBS3Buffer.MySQL.UpdateFiles \
+     import UpdateFiles as MySQLUpdateFiles
+
+class UpdateFiles(MySQLUpdateFiles):
+    pass
@@ -0,0 +1,11 @@
+"""
+_UpdateSpec_
+
+SQLite implementation of UpdateSpec
+"""
+
+from WMComponent.DBS3Buffer.MySQL.UpdateSpec \
+     import UpdateSpec as MySQLUpdateSpec
+
+class UpdateSpec(MySQLUpdateSpec):
+    pass
@@ -0,0 +1,11 @@
+"""
+_UpdateWorkflowsToCompleted_
+
+SQLite implementation of UpdateWorkflowsToCompleted
+"""
+
+from WMComponent.DBS3Buffer.MySQL.UpdateWorkflowsToCompleted \
+     import UpdateWorkflowsToCompleted as MySQLUpdateWorkflowsToCompleted
+
+class UpdateWorkflowsToCompleted(MySQLUpdateWorkflowsToCompleted):
+    pass
@@ -0,0 +1,6 @@
+#!/usr/bin/env python
+"""
+__init__
+
+"""
+__all__ = []
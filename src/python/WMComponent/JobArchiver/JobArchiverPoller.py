@@ -10,6 +10,12 @@ import os
 import os.path
 import shutil
 import tarfile
+import time
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+from cStringIO import StringIO
 
 from Utils.IterTools import grouper
 from WMComponent.TaskArchiver.CleanCouchPoller import uploadPublishWorkflow
@@ -19,6 +25,7 @@ from WMCore.WorkQueue.WorkQueueExceptions import WorkQueueNoMatchingElements
 from WMCore.WorkQueue.WorkQueueUtils import queueFromConfig
 
 from WMCore.WMBS.Job import Job
+from WMCore.DataStructs.JobStore import JobLoader
 from WMCore.DAOFactory import DAOFactory
 from WMCore.WMBS.Fileset import Fileset
 from WMCore.WMException import WMException
@@ -51,6 +58,8 @@ class JobArchiverPoller(BaseWorkerThread):
                                      logger=myThread.logger,
                                      dbinterface=myThread.dbi)
         self.loadAction = self.daoFactory(classname="Jobs.LoadFromIDWithWorkflow")
+        # reads the job records from the packed job stores, kept for a cleanup cycle
+        self.jobLoader = JobLoader()
 
 
         # Variables
@@ -220,9 +229,12 @@ class JobArchiverPoller(BaseWorkerThread):
         regarding those jobs is cleaned up.
         """
 
-        for job in doneList:
-            # print "About to clean cache for job %i" % (job['id'])
-            self.cleanJobCache(job)
+        try:
+            for job in doneList:
+                # print "About to clean cache for job %i" % (job['id'])
+                self.cleanJobCache(job)
+        finally:
+            self.jobLoader.close()
 
         return
 
@@ -243,7 +255,18 @@ class JobArchiverPoller(BaseWorkerThread):
 
         cacheDirList = os.listdir(cacheDir)
 
-        if cacheDirList == []:
+        # jobs saved in the packed store of their job collection don't have
+        # a job.pkl, archive their record from the store instead
+        pickledJob = None
+        if 'job.pkl' not in cacheDirList:
+            try:
+                loadedJob = self.jobLoader.load(cacheDir)
+                if loadedJob is not None:
+                    pickledJob = pickle.dumps(loadedJob, pickle.HIGHEST_PROTOCOL)
+            except Exception as ex:
+                logging.error("Cannot load the job object of %s, not archiving it: %s", cacheDir, str(ex))
+
+        if cacheDirList == [] and pickledJob is None:
             os.rmdir(cacheDir)
             return
 
@@ -278,6 +301,11 @@ class JobArchiverPoller(BaseWorkerThread):
                                 arcname='Job_%i/%s' % (job['id'], fileName))
                 except IOError:
                     logging.error('Cannot read %s, skipping', fullFile)
+            if pickledJob is not None:
+                tarInfo = tarfile.TarInfo(name='Job_%i/job.pkl' % (job['id']))
+                tarInfo.size = len(pickledJob)
+                tarInfo.mtime = time.time()
+                tarball.addfile(tarInfo, StringIO(pickledJob))
             tarball.close()
         except Exception as ex:
             msg = "Exception while opening and adding to a tarfile\n"
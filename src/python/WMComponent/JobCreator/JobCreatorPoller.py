@@ -27,6 +27,13 @@ from WMCore.WMBS.Subscription               import Subscription
 from WMCore.WMBS.Workflow                   import Workflow
 from WMCore.WMSpec.WMWorkload               import WMWorkload, WMWorkloadHelper
 from WMCore.FwkJobReport.Report             import Report
+from WMCore.DataStructs.JobStore            import saveJobs
+
+# job keys with the same value for all the jobs of a job group, stored
+# only once per job collection by the packed job store
+SHARED_JOB_KEYS = ['spec', 'task', 'sandbox', 'workflow', 'jobgroup', 'agentNumber',
+                   'owner', 'ownerDN', 'ownerGroup', 'ownerRole', 'scramArch', 'swVersion',
+                   'numberOfCores', 'inputDataset', 'inputDatasetLocations', 'allowOpportunistic']
 
 
 def retrieveWMSpec(workflow = None, wmWorkloadURL = None):
@@ -122,11 +129,14 @@ def capResourceEstimates(jobGroups, nCores, constraints):
 def saveJob(job, workflow, sandbox, wmTask = None, jobNumber = 0,
             owner = None, ownerDN = None, ownerGroup = '', ownerRole = '',
             scramArch = None, swVersion = None, agentNumber = 0, numberOfCores = 1,
-            inputDataset = None, inputDatasetLocations = None, allowOpportunistic=False):
+            inputDataset = None, inputDatasetLocations = None, allowOpportunistic=False,
+            pickleJob = True):
     """
     _saveJob_
 
-    Actually do the mechanics of saving the job to a pickle file
+    Actually do the mechanics of saving the job to a pickle file.
+    With pickleJob False the job is only filled in, to be saved with the
+    other jobs of its group in the packed job store.
     """
     if wmTask:
             # If we managed to load the task,
@@ -151,9 +161,10 @@ def saveJob(job, workflow, sandbox, wmTask = None, jobNumber = 0,
     job['inputDatasetLocations'] = inputDatasetLocations
     job['allowOpportunistic'] = allowOpportunistic
 
-    output = open(os.path.join(cacheDir, 'job.pkl'), 'w')
-    pickle.dump(job, output, pickle.HIGHEST_PROTOCOL)
-    output.close()
+    if pickleJob:
+        output = open(os.path.join(cacheDir, 'job.pkl'), 'w')
+        pickle.dump(job, output, pickle.HIGHEST_PROTOCOL)
+        output.close()
 
 
     return
@@ -184,6 +195,7 @@ def creatorProcess(work, jobCacheDir):
         inputDataset = work.get('inputDataset', None)
         inputDatasetLocations = work.get('inputDatasetLocations', None)
         allowOpportunistic = work.get('allowOpportunistic', False)
+        packJobs     = work.get('packJobs', True)
 
         if ownerDN == None:
             ownerDN = owner
@@ -225,7 +237,11 @@ def creatorProcess(work, jobCacheDir):
                     numberOfCores = numberOfCores,
                     inputDataset = inputDataset,
                     inputDatasetLocations = inputDatasetLocations,
-                    allowOpportunistic = allowOpportunistic)
+                    allowOpportunistic = allowOpportunistic,
+                    pickleJob = not packJobs)
+
+        if packJobs:
+            saveJobs(wmbsJobGroup.jobs, sharedKeys = SHARED_JOB_KEYS)
 
     except Exception as ex:
         # Register as failure; move on
@@ -380,6 +396,8 @@ class JobCreatorPoller(BaseWorkerThread):
         self.limit          = getattr(config.JobCreator, 'fileLoadLimit', 500)
         self.agentNumber    = int(getattr(config.Agent, 'agentNumber', 0))
         self.glideinLimits  = getattr(config.JobCreator, 'GlideInRestriction', None)
+        # save the jobs of a group in one packed job store instead of a job.pkl each
+        self.packJobs       = getattr(config.JobCreator, 'packJobs', True)
 
         # initialize the alert framework (if available - config.Alert present)
         #    self.sendAlert will be then be available
@@ -618,6 +636,7 @@ class JobCreatorPoller(BaseWorkerThread):
                     tempDict['agentNumber'] = self.agentNumber
                     tempDict['inputDatasetLocations'] = wmbsJobGroup.getLocationsForJobs()
                     tempDict['allowOpportunistic'] = allowOpport
+                    tempDict['packJobs'] = self.packJobs
 
                     jobGroup = creatorProcess(work = tempDict,
                                               jobCacheDir = self.jobCacheDir)
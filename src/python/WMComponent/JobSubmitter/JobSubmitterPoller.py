@@ -11,8 +11,8 @@ Submit jobs for execution.
 
 import logging
 import threading
+import time
 import os.path
-from operator import itemgetter
 try:
     import cPickle as pickle
 except ImportError:
@@ -25,10 +25,13 @@ from WMCore.JobStateMachine.ChangeState       import ChangeState
 from WMCore.WorkerThreads.BaseWorkerThread    import BaseWorkerThread
 from WMCore.ResourceControl.ResourceControl   import ResourceControl
 from WMCore.DataStructs.JobPackage            import JobPackage
+from WMCore.DataStructs.JobStore              import JobLoader
 from WMCore.FwkJobReport.Report               import Report
 from WMCore.WMException                       import WMException
 from WMCore.BossAir.BossAirAPI                import BossAirAPI
 from WMCore.Services.ReqMgr.ReqMgr import ReqMgr
+from WMComponent.JobSubmitter.PendingJobIndex import PendingJobIndex
+from Utils.Concurrency import parallelMap
 
 
 class JobSubmitterPollerException(WMException):
@@ -71,7 +74,7 @@ class JobSubmitterPoller(BaseWorkerThread):
 
         # Additions for caching-based JobSubmitter
         self.cachedJobIDs = set()
-        self.cachedJobs = {}
+        self.cachedJobs = PendingJobIndex()
         self.jobDataCache = {}
         self.jobsToPackage = {}
         self.sandboxPackage = {}
@@ -80,6 +83,10 @@ class JobSubmitterPoller(BaseWorkerThread):
         self.drainSites = set()
         self.abortSites = set()
         self.refreshPollingCount = 0
+        self.loadJobsWorkers = int(getattr(self.config.JobSubmitter, 'loadJobsWorkers', 8))
+        self.loadJobsBatchSize = int(getattr(self.config.JobSubmitter, 'loadJobsBatchSize', 5000))
+        self.cacheSnapshotInterval = int(getattr(self.config.JobSubmitter, 'cacheSnapshotInterval', 600))
+        self.lastSnapshotTime = 0
 
         try:
             if not getattr(self.config.JobSubmitter, 'submitDir', None):
@@ -88,6 +95,9 @@ class JobSubmitterPoller(BaseWorkerThread):
 
             if not os.path.exists(self.packageDir):
                 os.makedirs(self.packageDir)
+            self.cacheSnapshotFile = getattr(self.config.JobSubmitter, 'cacheSnapshotFile',
+                                             os.path.join(self.config.JobSubmitter.submitDir,
+                                                          'JobCacheSnapshot.pkl'))
         except Exception as ex:
             msg = "Error while trying to create packageDir %s\n!"
             msg += str(ex)
@@ -109,6 +119,9 @@ class JobSubmitterPoller(BaseWorkerThread):
 
         # Keep a record of the thresholds in memory
         self.currentRcThresholds = {}
+
+        # Cached jobs of the previous run, restored instead of loading their jobs again
+        self.cacheSnapshot = self.loadCacheSnapshot()
         
         self.reqmgr2Svc = ReqMgr(self.config.TaskArchiver.ReqMgr2ServiceURL)
         self.abortedAndForceCompleteWorkflowCache = self.reqmgr2Svc.getAbortedAndForceCompleteRequestsFromMemoryCache()
@@ -208,14 +221,152 @@ class JobSubmitterPoller(BaseWorkerThread):
 
         return
 
+    def filterLocations(self, newJob, possibleLocations, jobName, badJobs):
+        """
+        _filterLocations_
+
+        Remove the aborted and draining sites from the possible locations of
+        a job. Jobs that can't run anywhere are added to badJobs and None
+        is returned for them.
+        """
+        # now check for sites in drain and adjust the possible locations
+        # also check if there is at least one site left to run the job
+        if len(possibleLocations) == 0:
+            newJob['name'] = jobName
+            badJobs[71101].append(newJob)
+            return None
+        else:
+            nonAbortSites = [x for x in possibleLocations if x not in self.abortSites]
+            if nonAbortSites: # if there is at least a non aborted/down site then run there, otherwise fail the job
+                possibleLocations = nonAbortSites
+            else:
+                newJob['name'] = jobName
+                newJob['possibleLocations'] = possibleLocations
+                badJobs[71102].append(newJob)
+                return None
+
+        # try to remove draining sites if possible, this is needed to stop
+        # jobs that could run anywhere blocking draining sites
+        # if the job type is Merge, LogCollect or Cleanup this is skipped
+        if newJob['type'] not in ('LogCollect', 'Merge', 'Cleanup', 'Harvesting'):
+            nonDrainingSites = [x for x in possibleLocations if x not in self.drainSites]
+            if nonDrainingSites: # if >1 viable non-draining site remove draining ones
+                possibleLocations = nonDrainingSites
+            else:
+                newJob['name'] = jobName
+                newJob['possibleLocations'] = possibleLocations
+                badJobs[71104].append(newJob)
+                return None
+
+        return possibleLocations
+
+    def loadJobs(self, newJobs):
+        """
+        _loadJobs_
+
+        Yield (newJob, loadedJob, jobInfo) for the new jobs, in their order.
+        Jobs found in the cache snapshot, with the same retry count and their
+        job package still on disk, come with their cached jobInfo and no
+        loadedJob. The others are loaded by batches, the job collections of a
+        batch being read in parallel by at most loadJobsWorkers threads;
+        loadedJob is None if the job could not be found.
+        """
+        existingPackages = {}
+
+        def loadCollection(batchJobs):
+            jobLoader = JobLoader(maxStores=1)
+            try:
+                loadedJobs = []
+                for newJob in batchJobs:
+                    try:
+                        loadedJobs.append(jobLoader.load(newJob["cache_dir"]))
+                    except Exception as ex:
+                        msg = "Error while loading pickled job object from %s\n" % newJob["cache_dir"]
+                        msg += str(ex)
+                        logging.error(msg)
+                        raise JobSubmitterPollerException(msg)
+                return loadedJobs
+            finally:
+                jobLoader.close()
+
+        for start in range(0, len(newJobs), self.loadJobsBatchSize):
+            batch = newJobs[start:start + self.loadJobsBatchSize]
+            results = []
+            collections = {}
+            for newJob in batch:
+                jobInfo = self.cacheSnapshot.pop((newJob['id'], newJob['retry_count']), None)
+                if jobInfo is not None:
+                    packageDir = jobInfo['packageDir']
+                    if packageDir not in existingPackages:
+                        existingPackages[packageDir] = os.path.isfile(os.path.join(packageDir, "JobPackage.pkl"))
+                    if existingPackages[packageDir]:
+                        results.append((newJob, None, jobInfo))
+                        continue
+                results.append((newJob, None, None))
+                collectionDir = os.path.dirname(newJob["cache_dir"].rstrip('/'))
+                collections.setdefault(collectionDir, []).append(len(results) - 1)
+
+            positions = collections.values()
+            loaded = parallelMap(loadCollection, [[results[i][0] for i in jobPositions] for jobPositions in positions],
+                                 maxWorkers=self.loadJobsWorkers)
+            for jobPositions, loadedJobs in zip(positions, loaded):
+                for position, loadedJob in zip(jobPositions, loadedJobs):
+                    results[position] = (results[position][0], loadedJob, None)
+
+            for result in results:
+                yield result
+
+        return
+
+    def loadCacheSnapshot(self):
+        """
+        _loadCacheSnapshot_
+
+        Read the cached jobs saved by a previous run of the component, keyed
+        by job id and retry count. Return an empty dict if there are none.
+        """
+        if not self.cacheSnapshotFile or not os.path.isfile(self.cacheSnapshotFile):
+            return {}
+        try:
+            with open(self.cacheSnapshotFile, 'rb') as fd:
+                jobInfos = pickle.load(fd)
+        except Exception as ex:
+            logging.warning("Could not read the job cache snapshot %s: %s", self.cacheSnapshotFile, str(ex))
+            return {}
+
+        logging.info("Loaded %d cached jobs from %s", len(jobInfos), self.cacheSnapshotFile)
+        return dict(((jobInfo['id'], jobInfo['retry_count']), jobInfo) for jobInfo in jobInfos)
+
+    def saveCacheSnapshot(self):
+        """
+        _saveCacheSnapshot_
+
+        Save the cached jobs to disk so that the cache can be restored when
+        the component is restarted. The snapshot is written to a temporary
+        file first, so a crash never leaves a partial snapshot behind.
+        """
+        if not self.cacheSnapshotFile:
+            return
+        tmpFile = "%s.%s.tmp" % (self.cacheSnapshotFile, os.getpid())
+        try:
+            with open(tmpFile, 'wb') as fd:
+                pickle.dump(self.jobDataCache.values(), fd, pickle.HIGHEST_PROTOCOL)
+            os.rename(tmpFile, self.cacheSnapshotFile)
+        except Exception as ex:
+            logging.warning("Could not save the job cache snapshot %s: %s", self.cacheSnapshotFile, str(ex))
+            return
+        self.lastSnapshotTime = time.time()
+        return
+
     def refreshCache(self):
         """
         _refreshCache_
 
         Query WMBS for all jobs in the 'created' state.  For all jobs returned
         from the query, check if they already exist in the cache.  If they
-        don't, unpickle them and combine their site white and black list with
-        the list of locations they can run at.  Add them to the cache.
+        don't, restore them from the cache snapshot or unpickle them and
+        combine their site white and black list with the list of locations
+        they can run at.  Add them to the cache.
 
         Each entry in the cache is a tuple with five items:
           - WMBS Job ID
@@ -231,20 +382,23 @@ class JobSubmitterPoller(BaseWorkerThread):
 
         if self.cacheRefreshSize == -1 or len(self.cachedJobIDs) < self.cacheRefreshSize or \
            self.refreshPollingCount >= self.skipRefreshCount:
-            newJobs = self.listJobsAction.execute()
+            newJobs = self.listJobsAction.execute(stream=True)
             self.refreshPollingCount = 0
+            dbRefresh = True
             abortedAndForceCompleteRequests = self.abortedAndForceCompleteWorkflowCache.getData()
-            logging.info("Found %s new jobs to be submitted.", len(newJobs))
         else:
             self.refreshPollingCount += 1
             newJobs = []
+            dbRefresh = False
             dbJobs = self.cachedJobIDs
             abortedAndForceCompleteRequests = []
             logging.info("Skipping cache update to be submitted. (%s job in cache)" % len(dbJobs))
         
         logging.info("Determining possible sites for new jobs...")
-        jobCount = 0
+        jobsToLoad = []
+        listedCount = 0
         for newJob in newJobs:
+            listedCount += 1
             # whether newJob belongs to aborted or force-complete workflow, and skip it if it is.
             if (newJob['request_name'] in abortedAndForceCompleteRequests) and \
                (newJob['type'] not in ['LogCollect', "Cleanup"]):
@@ -252,122 +406,96 @@ class JobSubmitterPoller(BaseWorkerThread):
             
             jobID = newJob['id']
             dbJobs.add(jobID)
-            if jobID in self.cachedJobIDs:
-                continue
+            if jobID not in self.cachedJobIDs:
+                jobsToLoad.append(newJob)
 
+        jobCount = 0
+        for newJob, loadedJob, jobInfo in self.loadJobs(jobsToLoad):
             jobCount += 1
             if jobCount % 5000 == 0:
-                logging.info("Processed %d/%d new jobs.", jobCount, len(newJobs))
-
-            pickledJobPath = os.path.join(newJob["cache_dir"], "job.pkl")
+                logging.info("Processed %d new jobs.", jobCount)
 
-            if not os.path.isfile(pickledJobPath):
+            if loadedJob is None and jobInfo is None:
                 # Then we have a problem - there's no file
-                logging.error("Could not find pickled jobObject %s", pickledJobPath)
+                logging.error("Could not find pickled jobObject in %s", newJob["cache_dir"])
                 badJobs[71103].append(newJob)
                 continue
-            try:
-                jobHandle = open(pickledJobPath, "r")
-                loadedJob = pickle.load(jobHandle)
-                jobHandle.close()
-            except Exception as ex:
-                msg = "Error while loading pickled job object %s\n" % pickledJobPath
-                msg += str(ex)
-                logging.error(msg)
-                raise JobSubmitterPollerException(msg)
-
-            loadedJob['retry_count'] = newJob['retry_count']
-
-            # figure out possible locations for job
-            possibleLocations = loadedJob["possiblePSN"]
-
-            # Create another set of locations that may change when a site goes white/black listed
-            # Does not care about the non_draining or aborted sites, they may change and that is the point
-            potentialLocations = set()
-            potentialLocations.update(possibleLocations)
-
-            # now check for sites in drain and adjust the possible locations
-            # also check if there is at least one site left to run the job
-            if len(possibleLocations) == 0:
-                newJob['name'] = loadedJob['name']
-                badJobs[71101].append(newJob)
-                continue
-            else:
-                nonAbortSites = [x for x in possibleLocations if x not in self.abortSites]
-                if nonAbortSites: # if there is at least a non aborted/down site then run there, otherwise fail the job
-                    possibleLocations = nonAbortSites
-                else:
-                    newJob['name'] = loadedJob['name']
-                    newJob['possibleLocations'] = possibleLocations
-                    badJobs[71102].append(newJob)
+
+            if jobInfo is not None:
+                # restored from the cache snapshot, it is already in a job package
+                possibleLocations = self.filterLocations(newJob, jobInfo['potentialSites'],
+                                                         jobInfo['name'], badJobs)
+                if possibleLocations is None:
                     continue
+                jobInfo['priority'] = newJob['wf_priority']
+                jobInfo['possibleSites'] = frozenset(possibleLocations)
+            else:
+                loadedJob['retry_count'] = newJob['retry_count']
 
-            # try to remove draining sites if possible, this is needed to stop
-            # jobs that could run anywhere blocking draining sites
-            # if the job type is Merge, LogCollect or Cleanup this is skipped
-            if newJob['type'] not in ('LogCollect', 'Merge', 'Cleanup', 'Harvesting'):
-                nonDrainingSites = [x for x in possibleLocations if x not in self.drainSites]
-                if nonDrainingSites: # if >1 viable non-draining site remove draining ones
-                    possibleLocations = nonDrainingSites
-                else:
-                    newJob['name'] = loadedJob['name']
-                    newJob['possibleLocations'] = possibleLocations
-                    badJobs[71104].append(newJob)
+                # figure out possible locations for job
+                possibleLocations = self.filterLocations(newJob, loadedJob["possiblePSN"],
+                                                         loadedJob['name'], badJobs)
+                if possibleLocations is None:
                     continue
 
+                # Create another set of locations that may change when a site goes white/black listed
+                # Does not care about the non_draining or aborted sites, they may change and that is the point
+                potentialLocations = set()
+                potentialLocations.update(loadedJob["possiblePSN"])
+
+                batchDir = self.addJobsToPackage(loadedJob)
+
+                # allow job baggage to override numberOfCores
+                #       => used for repacking to get more slots/disk
+                numberOfCores = loadedJob.get('numberOfCores', 1)
+                if numberOfCores == 1:
+                    baggage = loadedJob.getBaggage()
+                    numberOfCores = getattr(baggage, "numberOfCores", 1)
+                loadedJob['numberOfCores'] = numberOfCores
+
+                # Create a job dictionary object and put it in the cache (needs to be in sync with RunJob)
+                jobInfo = {'id': newJob['id'],
+                           'requestName': newJob['request_name'],
+                           'taskName': newJob['task_name'],
+                           'taskType': newJob['type'],
+                           'cache_dir': newJob["cache_dir"],
+                           'priority': newJob['wf_priority'],
+                           'taskID': newJob['task_id'],
+                           'retry_count': newJob["retry_count"],
+                           'taskPriority': None,                                # update from the thresholds
+                           'custom': {'location': None},                        # update later
+                           'packageDir': batchDir,
+                           'sandbox': loadedJob["sandbox"],                     # remove before submit
+                           'userdn': loadedJob.get("ownerDN", None),
+                           'usergroup': loadedJob.get("ownerGroup", ''),
+                           'userrole': loadedJob.get("ownerRole", ''),
+                           'possibleSites': frozenset(possibleLocations),       # abort and drain sites filtered out
+                           'potentialSites': frozenset(potentialLocations),     # original list of sites
+                           'scramArch': loadedJob.get("scramArch", None),
+                           'swVersion': loadedJob.get("swVersion", None),
+                           'name': loadedJob["name"],
+                           'proxyPath': loadedJob.get("proxyPath", None),
+                           'estimatedJobTime': loadedJob.get("estimatedJobTime", None),
+                           'estimatedDiskUsage': loadedJob.get("estimatedDiskUsage", None),
+                           'estimatedMemoryUsage': loadedJob.get("estimatedMemoryUsage", None),
+                           'numberOfCores': loadedJob.get("numberOfCores", 1),  # may update it later
+                           'inputDataset': loadedJob.get('inputDataset', None),
+                           'inputDatasetLocations': loadedJob.get('inputDatasetLocations', None),
+                           'allowOpportunistic': loadedJob.get('allowOpportunistic', False)}
+
             # locations clear of abort and draining sites
             newJob['possibleLocations'] = possibleLocations
-
-            batchDir = self.addJobsToPackage(loadedJob)
-            self.cachedJobIDs.add(jobID)
+            self.cachedJobIDs.add(newJob['id'])
 
             # calculate the final job priority such that we can order cached jobs by prio
             jobPrio = self.taskTypePrioMap.get(newJob['type'], 0) + newJob['wf_priority']
-            if jobPrio not in self.cachedJobs:
-                self.cachedJobs[jobPrio] = {}
-
-            # now add basic information keyed by the jobid
-            self.cachedJobs[jobPrio][jobID] = newJob
-
-            # allow job baggage to override numberOfCores
-            #       => used for repacking to get more slots/disk
-            numberOfCores = loadedJob.get('numberOfCores', 1)
-            if numberOfCores == 1:
-                baggage = loadedJob.getBaggage()
-                numberOfCores = getattr(baggage, "numberOfCores", 1)
-            loadedJob['numberOfCores'] = numberOfCores
-
-            # Create a job dictionary object and put it in the cache (needs to be in sync with RunJob)
-            jobInfo = {'id': jobID,
-                       'requestName': newJob['request_name'],
-                       'taskName': newJob['task_name'],
-                       'taskType': newJob['type'],
-                       'cache_dir': newJob["cache_dir"],
-                       'priority': newJob['wf_priority'],
-                       'taskID': newJob['task_id'],
-                       'retry_count': newJob["retry_count"],
-                       'taskPriority': None,                                # update from the thresholds
-                       'custom': {'location': None},                        # update later
-                       'packageDir': batchDir,
-                       'sandbox': loadedJob["sandbox"],                     # remove before submit
-                       'userdn': loadedJob.get("ownerDN", None),
-                       'usergroup': loadedJob.get("ownerGroup", ''),
-                       'userrole': loadedJob.get("ownerRole", ''),
-                       'possibleSites': frozenset(possibleLocations),       # abort and drain sites filtered out
-                       'potentialSites': frozenset(potentialLocations),     # original list of sites
-                       'scramArch': loadedJob.get("scramArch", None),
-                       'swVersion': loadedJob.get("swVersion", None),
-                       'name': loadedJob["name"],
-                       'proxyPath': loadedJob.get("proxyPath", None),
-                       'estimatedJobTime': loadedJob.get("estimatedJobTime", None),
-                       'estimatedDiskUsage': loadedJob.get("estimatedDiskUsage", None),
-                       'estimatedMemoryUsage': loadedJob.get("estimatedMemoryUsage", None),
-                       'numberOfCores': loadedJob.get("numberOfCores", 1),  # may update it later
-                       'inputDataset': loadedJob.get('inputDataset', None),
-                       'inputDatasetLocations': loadedJob.get('inputDatasetLocations', None),
-                       'allowOpportunistic': loadedJob.get('allowOpportunistic', False)}
-
-            self.jobDataCache[jobID] = jobInfo
+
+            # now add basic information to the priority/site index
+            self.cachedJobs.add(jobPrio, newJob)
+
+            self.jobDataCache[newJob['id']] = jobInfo
+
+        logging.info("Found %s jobs to be submitted, %s of them new.", listedCount, jobCount)
 
         # Register failures in submission
         for errorCode in badJobs:
@@ -383,6 +511,12 @@ class JobSubmitterPoller(BaseWorkerThread):
         jobIDsToPurge = self.cachedJobIDs - dbJobs
         self._purgeJobsFromCache(jobIDsToPurge)
 
+        if dbRefresh:
+            # jobs of the snapshot not listed anymore have been handled meanwhile
+            self.cacheSnapshot = {}
+            if time.time() - self.lastSnapshotTime >= self.cacheSnapshotInterval:
+                self.saveCacheSnapshot()
+
         logging.info("Done pruning killed jobs, moving on to submit.")
         return
         
@@ -405,10 +539,7 @@ class JobSubmitterPoller(BaseWorkerThread):
 
         for jobid in jobIDsToPurge:
             self.jobDataCache.pop(jobid, None)
-            for jobPrio in self.cachedJobs:
-                if self.cachedJobs[jobPrio].pop(jobid, None):
-                    # then the jobid was found, go to the next one
-                    break
+            self.cachedJobs.remove(jobid)
         return  
         
     def _handleSubmitFailedJobs(self, badJobs, exitCode):
@@ -487,8 +618,11 @@ class JobSubmitterPoller(BaseWorkerThread):
         # refresh is needed, for now it forces a full cache refresh
         if newDrainSites != self.drainSites or  newAbortSites != self.abortSites:
             logging.info("Draining or Aborted sites have changed, the cache will be rebuilt.")
+            # the jobs don't need to be loaded again, only their locations refreshed
+            self.cacheSnapshot.update(((jobInfo['id'], jobInfo['retry_count']), jobInfo)
+                                      for jobInfo in self.jobDataCache.itervalues())
             self.cachedJobIDs = set()
-            self.cachedJobs = {}
+            self.cachedJobs = PendingJobIndex()
             self.jobDataCache = {}
 
         self.currentRcThresholds = rcThresholds
@@ -498,110 +632,112 @@ class JobSubmitterPoller(BaseWorkerThread):
         return
 
         
-    def assignJobLocations(self):
+    def getFreeSlots(self):
         """
-        _assignJobLocations_
+        _getFreeSlots_
 
-        Loop through the submit thresholds and pull sites out of the job cache
-        as we discover open slots.  This will return a list of tuple where each
-        tuple will have six elements:
-          - WMBS Job ID
-          - Retry count
-          - Batch ID
-          - Path to sanbox
-          - Path to cache directory
-          - SE name of the site to run at
+        Count from the submit thresholds how many more jobs every site, and
+        every task type at every site, can take, considering both the pending
+        and the overall (pending plus running) slots. A job needs a free slot
+        at both levels. Return the free slots per site and per (site, task
+        type), and the task priorities per (site, task type).
         """
-        jobsToSubmit = {}
-        jobsToUncache = []
-        jobsCount = 0
-        exitLoop = False
-
-        # iterate over jobs from the highest to the lowest prio
-        for jobPrio in sorted(self.cachedJobs, reverse=True):
-
-            # then we're completely done and have our basket full of jobs to submit
-            if exitLoop:
-                break
+        siteFreeSlots = {}
+        taskFreeSlots = {}
+        taskPriorities = {}
+        for siteName, siteInfo in self.currentRcThresholds.iteritems():
+            try:
+                siteFreeSlots[siteName] = min(siteInfo["total_pending_slots"] - siteInfo["total_pending_jobs"],
+                                              siteInfo["total_pending_slots"] + siteInfo["total_running_slots"] -
+                                              siteInfo["total_pending_jobs"] - siteInfo["total_running_jobs"])
+                taskThresholds = siteInfo['thresholds']
+            except KeyError as ex:
+                logging.error("Invalid key for site %s\n%s", siteName, str(ex))
+                continue
 
-            # start eating through the elder jobs first
-            for job in sorted(self.cachedJobs[jobPrio].values(), key=itemgetter('timestamp')):
-                jobid = job['id']
-                jobType = job['type']
-                possibleSites = job['possibleLocations']
+            for jobType, taskInfo in taskThresholds.iteritems():
+                try:
+                    freeSlots = min(taskInfo["pending_slots"] - taskInfo["task_pending_jobs"],
+                                    taskInfo["pending_slots"] + taskInfo["max_slots"] -
+                                    taskInfo["task_pending_jobs"] - taskInfo["task_running_jobs"])
+                    taskPriorities[(siteName, jobType)] = taskInfo["priority"]
+                except KeyError as ex:
+                    logging.error("Invalid key for site %s and job type %s\n%s", siteName, jobType, str(ex))
+                    continue
+                taskFreeSlots[(siteName, jobType)] = freeSlots
 
-                # now look for sites with free pending slots
-                for siteName in possibleSites:
-                    if siteName not in self.currentRcThresholds:
-                        logging.warn("Have a job for %s which is not in the resource control", siteName)
-                        continue
+        return siteFreeSlots, taskFreeSlots, taskPriorities
 
-                    try:
-                        totalPendingSlots = self.currentRcThresholds[siteName]["total_pending_slots"]
-                        totalPendingJobs = self.currentRcThresholds[siteName]["total_pending_jobs"]
-                        totalRunningSlots = self.currentRcThresholds[siteName]["total_running_slots"]
-                        totalRunningJobs = self.currentRcThresholds[siteName]["total_running_jobs"]
-
-                        taskPendingSlots = self.currentRcThresholds[siteName]['thresholds'][jobType]["pending_slots"]
-                        taskPendingJobs = self.currentRcThresholds[siteName]['thresholds'][jobType]["task_pending_jobs"]
-                        taskRunningSlots = self.currentRcThresholds[siteName]['thresholds'][jobType]["max_slots"]
-                        taskRunningJobs = self.currentRcThresholds[siteName]['thresholds'][jobType]["task_running_jobs"]
-                        taskPriority = self.currentRcThresholds[siteName]['thresholds'][jobType]["priority"]
-                    except KeyError as ex:
-                        msg = "Invalid key for site %s and job type %s\n" % (siteName, jobType)
-                        msg += str(ex)
-                        logging.error(msg)
-                        continue
-
-                    # check if site has free pending slots AND free pending task slots
-                    if totalPendingJobs >= totalPendingSlots or taskPendingJobs >= taskPendingSlots:
-                        logging.debug("Found a job for %s which has no free pending slots", siteName)
-                        continue
-                    # check if site overall thresholds have free slots
-                    if totalPendingJobs + totalRunningJobs >= totalPendingSlots + totalRunningSlots:
-                        logging.debug("Found a job for %s which has no free overall slots", siteName)
-                        continue
-                    # finally, check whether task has free overall slots
-                    if taskPendingJobs + taskRunningJobs >= taskPendingSlots + taskRunningSlots:
-                        logging.debug("Found a job for %s which has no free task slots", siteName)
-                        continue
+    def assignJobLocations(self):
+        """
+        _assignJobLocations_
 
-                    # otherwise, update the site/task thresholds and the component job counter
-                    self.currentRcThresholds[siteName]["total_pending_jobs"] += 1
-                    self.currentRcThresholds[siteName]['thresholds'][jobType]["task_pending_jobs"] += 1
-                    jobsCount += 1
+        Loop through the cached jobs, from the highest priority and oldest
+        ones, and pick for each the first of its sites with free slots. The
+        jobs of a task type waiting for a site are skipped all at once as
+        soon as the site has no free slots left for the task type.
+        Return the jobs to submit, keyed by job package.
+        """
+        jobsToSubmit = {}
+        jobsCount = 0
+        siteFreeSlots, taskFreeSlots, taskPriorities = self.getFreeSlots()
+        unknownSites = set()
+
+        def siteIsFull(queueKey):
+            """
+            Whether a site has no free slots for a task type
+            """
+            jobType, siteName = queueKey
+            if siteFreeSlots.get(siteName, 0) > 0 and taskFreeSlots.get((siteName, jobType), 0) > 0:
+                return False
+            if siteName not in self.currentRcThresholds and siteName not in unknownSites:
+                logging.warn("Have jobs for %s which is not in the resource control", siteName)
+                unknownSites.add(siteName)
+            return True
+
+        # iterate over jobs from the highest to the lowest prio, elder jobs first
+        for dummyPrio, job in self.cachedJobs.iterJobs(siteIsFull):
+            jobid = job['id']
+            jobType = job['type']
+
+            # now look for the first site with free pending slots
+            for siteName in job['possibleLocations']:
+                if siteFreeSlots.get(siteName, 0) <= 0 or taskFreeSlots.get((siteName, jobType), 0) <= 0:
+                    continue
 
-                    # load (and remove) the job dictionary object from jobDataCache
-                    cachedJob = self.jobDataCache.pop(jobid)
-                    jobsToUncache.append((jobPrio, jobid))
+                # update the site/task thresholds and the component job counter
+                siteFreeSlots[siteName] -= 1
+                taskFreeSlots[(siteName, jobType)] -= 1
+                self.currentRcThresholds[siteName]["total_pending_jobs"] += 1
+                self.currentRcThresholds[siteName]['thresholds'][jobType]["task_pending_jobs"] += 1
+                jobsCount += 1
 
-                    # Sort jobs by jobPackage
-                    package = cachedJob['packageDir']
-                    if package not in jobsToSubmit.keys():
-                        jobsToSubmit[package] = []
+                # load (and remove) the job dictionary object from all caches
+                cachedJob = self.jobDataCache.pop(jobid)
+                self.cachedJobs.remove(jobid)
+                self.cachedJobIDs.remove(jobid)
 
-                    # Add the sandbox to a global list
-                    self.sandboxPackage[package] = cachedJob.pop('sandbox')
+                # Sort jobs by jobPackage
+                package = cachedJob['packageDir']
+                if package not in jobsToSubmit:
+                    jobsToSubmit[package] = []
 
-                    # Now update the job dictionary object
-                    cachedJob['custom'] = {'location': siteName}
-                    cachedJob['taskPriority'] = taskPriority
+                # Add the sandbox to a global list
+                self.sandboxPackage[package] = cachedJob.pop('sandbox')
 
-                    # Get this job in place to be submitted by the plugin
-                    jobsToSubmit[package].append(cachedJob)
+                # Now update the job dictionary object
+                cachedJob['custom'] = {'location': siteName}
+                cachedJob['taskPriority'] = taskPriorities[(siteName, jobType)]
 
-                    # found a site to submit this job, so go to the next job
-                    break
+                # Get this job in place to be submitted by the plugin
+                jobsToSubmit[package].append(cachedJob)
 
-                # set the flag and get out of the job iteration
-                if jobsCount >= self.maxJobsPerPoll:
-                    exitLoop = True
-                    break
+                # found a site to submit this job, so go to the next job
+                break
 
-        # jobs that are going to be submitted must be removed from all caches
-        for prio, jobid in jobsToUncache:
-            self.cachedJobs[prio].pop(jobid)
-            self.cachedJobIDs.remove(jobid)
+            # our basket is full of jobs to submit
+            if jobsCount >= self.maxJobsPerPoll:
+                break
 
         logging.info("Have %s packages to submit.", len(jobsToSubmit))
         logging.info("Done assigning site locations.")
@@ -718,3 +854,4 @@ class JobSubmitterPoller(BaseWorkerThread):
         """
         logging.debug("terminating. doing one more pass before we die")
         self.algorithm(params)
+        self.saveCacheSnapshot()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+"""
+_PendingJobIndex_
+
+Index of the jobs cached by the JobSubmitter while they wait for a site.
+"""
+
+import heapq
+from bisect import insort
+
+
+class PendingJobIndex(object):
+    """
+    _PendingJobIndex_
+
+    Cached jobs indexed by priority, task type and possible site. Each
+    (task type, site) of a priority has a queue of its jobs ordered by
+    timestamp (then job id), kept sorted as jobs are added, so that jobs can
+    be handed out oldest first without sorting the whole cache, and a site
+    without free slots for a task type is skipped with all its jobs at once.
+
+    A job is queued at each of its possible sites. Removed jobs are dropped
+    lazily from the queues, which are compacted when they hold more entries
+    of removed jobs than of cached ones.
+    """
+
+    def __init__(self):
+        self.queues = {}
+        self.jobs = {}
+        self.liveEntries = 0
+        self.deadEntries = 0
+        return
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __contains__(self, jobID):
+        return jobID in self.jobs
+
+    def add(self, priority, job):
+        """
+        _add_
+
+        Add a job with its id, type, possibleLocations and timestamp keys
+        """
+        if job['id'] in self.jobs:
+            self.remove(job['id'])
+        self.maybeCompact()
+
+        sites = frozenset(job['possibleLocations'])
+        sortKey = (job['timestamp'], job['id'])
+        priorityQueues = self.queues.setdefault(priority, {})
+        for siteName in sites:
+            queue = priorityQueues.setdefault((job['type'], siteName), [])
+            if not queue or queue[-1] < sortKey:
+                queue.append(sortKey)
+            else:
+                insort(queue, sortKey)
+        self.jobs[job['id']] = (priority, job['type'], sites, sortKey, job)
+        self.liveEntries += len(sites)
+        return
+
+    def remove(self, jobID):
+        """
+        _remove_
+
+        Remove a job from the index, return it or None if it was not there
+        """
+        entry = self.jobs.pop(jobID, None)
+        if entry is None:
+            return None
+
+        self.liveEntries -= len(entry[2])
+        self.deadEntries += len(entry[2])
+        return entry[4]
+
+    def isQueued(self, priority, queueKey, sortKey):
+        """
+        _isQueued_
+
+        Whether a queue entry belongs to a job still in the index
+        """
+        entry = self.jobs.get(sortKey[1])
+        return entry is not None and entry[3] == sortKey and entry[0] == priority and \
+            entry[1] == queueKey[0] and queueKey[1] in entry[2]
+
+    def maybeCompact(self):
+        """
+        _maybeCompact_
+
+        Compact the queues if they hold too many entries of removed jobs
+        """
+        if self.deadEntries > max(1000, self.liveEntries):
+            self.compact()
+        return
+
+    def compact(self):
+        """
+        _compact_
+
+        Drop the entries of removed jobs from the queues. A job removed and
+        added back in the same queue has two identical entries, keep one.
+        """
+        for priority in self.queues.keys():
+            priorityQueues = self.queues[priority]
+            for queueKey in priorityQueues.keys():
+                queue = []
+                for sortKey in priorityQueues[queueKey]:
+                    if self.isQueued(priority, queueKey, sortKey) and (not queue or queue[-1] != sortKey):
+                        queue.append(sortKey)
+                if queue:
+                    priorityQueues[queueKey] = queue
+                else:
+                    del priorityQueues[queueKey]
+            if not priorityQueues:
+                del self.queues[priority]
+        self.deadEntries = 0
+        return
+
+    def iterJobs(self, queueIsFull):
+        """
+        _iterJobs_
+
+        Yield (priority, job) from the highest to the lowest priority and, in
+        a priority, from the oldest to the newest job. queueIsFull is called
+        with the (task type, site) of a queue before any of its jobs is
+        yielded; once it returns True the queue is skipped, so jobs are only
+        yielded while at least one of their sites is not full.
+        Jobs can be removed while iterating.
+        """
+        self.maybeCompact()
+        yielded = set()
+        for priority in sorted(self.queues, reverse=True):
+            priorityQueues = self.queues[priority]
+            heap = [(queue[0], queueKey, 0) for queueKey, queue in priorityQueues.iteritems() if queue]
+            heapq.heapify(heap)
+
+            while heap:
+                sortKey, queueKey, position = heap[0]
+                if queueIsFull(queueKey):
+                    heapq.heappop(heap)
+                    continue
+
+                queue = priorityQueues[queueKey]
+                if position + 1 < len(queue):
+                    heapq.heapreplace(heap, (queue[position + 1], queueKey, position + 1))
+                else:
+                    heapq.heappop(heap)
+
+                if sortKey[1] not in yielded and self.isQueued(priority, queueKey, sortKey):
+                    yielded.add(sortKey[1])
+                    yield priority, self.jobs[sortKey[1]][4]
+        return
@@ -190,6 +190,8 @@ class CleanCouchPoller(BaseWorkerThread):
         self.perfDashBoardMaxLumi = getattr(config.TaskArchiver, "perfDashBoardMaxLumi", 9000)
         self.dashBoardUrl = getattr(config.TaskArchiver, "dashBoardUrl", None)
         self.DataKeepDays = getattr(config.TaskArchiver, "DataKeepDays", 0.125)  # 3 hours
+        # number of rows read (and docs deleted) per request when cleaning couch
+        self.couchPageSize = getattr(config.TaskArchiver, "couchPageSize", 1000)
 
     def setup(self, parameters=None):
         """
@@ -394,19 +396,23 @@ class CleanCouchPoller(BaseWorkerThread):
             except CouchNotFoundError as ex:
                 return {'status': 'warning', 'message': "%s: %s" % (workflowName, str(ex))}
         else:
+            # page through the view and delete one page at a time, so huge
+            # workflows don't have to be loaded into memory at once
+            committed = []
             try:
-                jobs = couchDB.loadView(db, view, options=options)['rows']
+                for nJob, j in enumerate(couchDB.iterView(db, view, options=options,
+                                                          pageSize=self.couchPageSize), 1):
+                    doc = {}
+                    doc["_id"] = j['value']['id']
+                    doc["_rev"] = j['value']['rev']
+                    couchDB.queueDelete(doc)
+                    if nJob % self.couchPageSize == 0:
+                        committed.extend(couchDB.commit())
             except Exception as ex:
                 errorMsg = "Error on loading jobs for %s" % workflowName
                 logging.warning("%s/n%s", str(ex), errorMsg)
                 return {'status': 'error', 'message': errorMsg}
-
-            for j in jobs:
-                doc = {}
-                doc["_id"] = j['value']['id']
-                doc["_rev"] = j['value']['rev']
-                couchDB.queueDelete(doc)
-            committed = couchDB.commit()
+            committed.extend(couchDB.commit() or [])
 
         if committed:
             # create the error report
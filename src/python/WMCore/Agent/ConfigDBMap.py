@@ -15,6 +15,8 @@ class ConfigDBMap(ConfigDBMapInterface):
             self.option["unix_socket"] = config.CoreDatabase.socket
         if hasattr(config.CoreDatabase, "engineParameters"):
             self.option['engine_parameters'] = config.CoreDatabase.engineParameters
+        if hasattr(config.CoreDatabase, "maxBindsPerQuery"):
+            self.option['max_binds_per_query'] = config.CoreDatabase.maxBindsPerQuery
 
     def getDBUrl(self):
         return self.dbUrl
@@ -35,6 +35,8 @@ import time
 import traceback
 
 from WMCore.Agent.Daemon.Create import createDaemon
+from WMCore.DAOFactory import DAOFactory
+from WMCore.Database.DAOStats import daoStats
 from WMCore.Database.DBFactory import DBFactory
 from WMCore.Database.Transaction import Transaction
 from WMCore.WMException import WMException
@@ -188,6 +190,17 @@ class Harness:
                 myThread.dbi = myThread.dbFactory.connect()
                 myThread.transaction = Transaction(myThread.dbi)
 
+                # time every DAO and dump the stats to the log every daoStatsInterval seconds
+                if getattr(compSect, 'daoStatsInterval', 0):
+                    daoStats.enable(dumpInterval = compSect.daoStatsInterval)
+
+                # import the DAOs up front so the first polling cycle doesn't pay for it
+                for daoPackage in getattr(compSect, 'preloadDAOPackages', []):
+                    daoFactory = DAOFactory(package = daoPackage,
+                                            logger = myThread.logger,
+                                            dbinterface = myThread.dbi)
+                    logging.info(">>>Preloaded %s DAOs from %s" % (daoFactory.preload(), daoPackage))
+
             else:
 
                 myThread.dbi = myThread.config.CoreDatabase.connectUrl
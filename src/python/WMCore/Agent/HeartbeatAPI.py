@@ -11,6 +11,7 @@ import threading
 import os
 import logging
 
+from WMCore.Database.DAOStats import daoStats
 from WMCore.WMConnectionBase import WMConnectionBase
 
 class HeartbeatAPI(WMConnectionBase):
@@ -63,6 +64,16 @@ class HeartbeatAPI(WMConnectionBase):
                            conn = self.getDBConn(),
                            transaction = self.existingTransaction())
 
+    def getDAOStats(self):
+        """
+        _getDAOStats_
+
+        Return the DAO timing and row count stats of this component,
+        empty if the instrumentation is not enabled (see daoStatsInterval).
+        """
+        return {"name": self.componentName, "pid": self.pid,
+                "dao_stats": daoStats.summary()}
+
     def getHeartbeatInfo(self):
 
         heartbeatInfo = self.daofactory(classname = "GetHeartbeatInfo")
@@ -31,6 +31,11 @@ from WMCore.FwkJobReport.Report import Report
 from WMCore.WMExceptions        import WM_JOB_ERROR_CODES
 
 
+# runjob fields that only change when a job is tracked or updated, a cached
+# job that differs from the database on any of them is loaded again
+TRACKED_KEYS = ('gridid', 'retry_count', 'status', 'status_time')
+
+
 class BossAirException(WMException):
     """
     I expect you'll be seeing this a lot
@@ -65,6 +70,9 @@ class BossAirAPI(WMConnectionBase):
 
         self.jobs = []
 
+        # Resident view of the active jobs being tracked, by runjob id
+        self.runningJobs = {}
+
         self.pluginDir = config.BossAir.pluginDir
         # This is the default state jobs are created in
         self.newState = getattr(config.BossAir, 'newState', 'New')
@@ -256,11 +264,13 @@ class BossAirAPI(WMConnectionBase):
 
         return loadedJobs
 
-    def _updateJobs(self, jobs):
+    def _updateJobs(self, jobs, locationJobs=None):
         """
         _updateJobs_
 
-        Update the job entries in the BossAir database
+        Update the job entries in the BossAir database.
+        The location change is recorded for locationJobs, by default
+        for all the jobs with a location.
         """
 
         if len(jobs) < 1:
@@ -273,9 +283,10 @@ class BossAirAPI(WMConnectionBase):
         self.updateDAO.execute(jobs=jobs, conn=self.getDBConn(),
                                transaction=self.existingTransaction())
 
-        jobsWithLocation = filter(lambda x: x.get('location') is not None, jobs)
-        if jobsWithLocation:
-            self.stateMachine.recordLocationChange(jobsWithLocation)
+        if locationJobs is None:
+            locationJobs = filter(lambda x: x.get('location') is not None, jobs)
+        if locationJobs:
+            self.stateMachine.recordLocationChange(locationJobs)
 
         self.commitTransaction(existingTransaction)
 
@@ -456,6 +467,9 @@ class BossAirAPI(WMConnectionBase):
         Track all running jobs
         Load job info from the cache (it should be there since we submitted the job)
 
+        The tracked jobs are kept between calls, only the new jobs are built
+        from the database and only the jobs which changed are written back.
+
         OPTIONAL: You can submit a list of jobs to check, based either on wmbsIDs or
          on runjobIDs.  This takes a list of integer IDs.
         """
@@ -470,24 +484,23 @@ class BossAirAPI(WMConnectionBase):
         runningJobs = self._listRunJobs(active=True)
 
         if runJobIDs:
-            for job in runningJobs:
-                if not job['id'] in runJobIDs:
-                    runningJobs.remove(job)
+            runningJobs = [job for job in runningJobs if job['id'] in runJobIDs]
         if wmbsIDs:
-            for job in runningJobs:
-                if not job['jobid'] in wmbsIDs:
-                    runningJobs.remove(job)
-
-        if len(runningJobs) < 1:
-            # Then we have no running jobs
-            return returnList
+            runningJobs = [job for job in runningJobs if job['jobid'] in wmbsIDs]
 
         logging.info("About to start building running jobs")
 
-        loadedJobs = self._buildRunningJobsFromRunJobs(runJobs=runningJobs)
+        loadedJobs = self._refreshRunningJobs(runJobs=runningJobs,
+                                              prune=not (runJobIDs or wmbsIDs))
+
+        if len(loadedJobs) < 1:
+            # Then we have no running jobs
+            return returnList
 
         logging.info("About to look for %i loadedJobs.\n", len(loadedJobs))
 
+        previousLocations = dict((job['id'], job.get('location')) for job in loadedJobs)
+
         for runningJob in loadedJobs:
             plugin = runningJob['plugin']
             if not plugin in jobsToTrack.keys():
@@ -524,9 +537,14 @@ class BossAirAPI(WMConnectionBase):
         logging.info("About to complete %i jobs", len(jobsToComplete))
         logging.debug("JobsToComplete: %s", jobsToComplete)
 
-        self._updateJobs(jobs=jobsToChange)
+        movedJobs = [job for job in jobsToChange
+                     if job.get('location') is not None and job['location'] != previousLocations[job['id']]]
+        self._updateJobs(jobs=jobsToChange, locationJobs=movedJobs)
         self._complete(jobs=jobsToComplete)
 
+        for job in jobsToComplete:
+            self.runningJobs.pop(job['id'], None)
+
 
         # We should have a globalState variable for changed jobs
         # from the plugin
@@ -798,6 +816,38 @@ class BossAirAPI(WMConnectionBase):
                 raise BossAirException(msg)
         return jobkill
 
+    def _refreshRunningJobs(self, runJobs, prune=True):
+        """
+        _refreshRunningJobs_
+
+        Update the tracked jobs with the runJobs listed from the database
+        and return the tracked jobs for them. Only the jobs not tracked yet,
+        or changed by someone else since, are built from the database.
+        With prune, the tracked jobs not in runJobs are dropped.
+        """
+        refreshedJobs = {}
+        jobsToBuild = []
+
+        for runJob in runJobs:
+            trackedJob = self.runningJobs.get(runJob['id'])
+            if trackedJob is not None and \
+               all(trackedJob.get(key) == runJob.get(key) for key in TRACKED_KEYS):
+                refreshedJobs[runJob['id']] = trackedJob
+            else:
+                jobsToBuild.append(runJob)
+
+        if jobsToBuild:
+            logging.info("Building %i new running jobs", len(jobsToBuild))
+            for runJob in self._buildRunningJobsFromRunJobs(runJobs=jobsToBuild):
+                refreshedJobs[runJob['id']] = runJob
+
+        if prune:
+            self.runningJobs = refreshedJobs
+        else:
+            self.runningJobs.update(refreshedJobs)
+
+        return [refreshedJobs[runJob['id']] for runJob in runJobs if runJob['id'] in refreshedJobs]
+
     def _buildRunningJobsFromRunJobs(self, runJobs):
         """
         _buildRunningJobsFromRunJobs_
@@ -807,13 +857,12 @@ class BossAirAPI(WMConnectionBase):
         finalJobs = []
 
         loadedJobs = self._loadByID(jobs=runJobs)
+        runJobsByID = dict((rj['id'], rj) for rj in runJobs)
 
         for loadJob in loadedJobs:
-            runJob = None
-            for rj in runJobs:
-                if rj['id'] == loadJob['id']:
-                    runJob = rj
-                    break
+            runJob = runJobsByID.get(loadJob['id'])
+            if runJob is None:
+                continue
             # We should have two instances of the job
             for key in runJob.keys():
                 # Fill one from the other
@@ -13,6 +13,8 @@ import time
 import logging
 import threading
 
+from xml.sax.saxutils import unescape
+
 import WMCore.Algorithms.BasicAlgos as BasicAlgos
 
 from WMCore.DAOFactory import DAOFactory
@@ -26,6 +28,10 @@ from Utils.IterTools import grouper, convertFromUnicodeToStr
 import htcondor
 import classad
 
+# events and their string, integer and real attributes in the XML job event logs
+EVENT_RE = re.compile(r'<c>(.*?)</c>', re.DOTALL)
+ATTRIBUTE_RE = re.compile(r'<a n="([^"]+)">\s*<([sir])>([^<]*)</\2>\s*</a>')
+
 class SimpleCondorPlugin(BasePlugin):
     """
     _SimpleCondorPlugin_
@@ -68,6 +74,47 @@ class SimpleCondorPlugin(BasePlugin):
 
         return exitCodeMap
 
+    @staticmethod
+    def eventStatusMap():
+        """
+        HTCondor job event type numbers which change the status of a job
+        http://research.cs.wisc.edu/htcondor/manual/current/2_6Managing_Job.html#sec:job-log-events
+        """
+        eventStatusMap = {0: "Idle",         # submit
+                          1: "Running",      # execute
+                          4: "Idle",         # evicted
+                          5: "Completed",    # terminated
+                          9: "Removed",      # aborted
+                          10: "Suspended",   # suspended
+                          11: "Running",     # unsuspended
+                          12: "Held",        # held
+                          13: "Idle"}        # released
+
+        return eventStatusMap
+
+    @staticmethod
+    def parseEventLog(data):
+        """
+        Parse the complete events of a chunk of an XML job event log.
+        Return the events, as dictionaries of their attributes, and the number
+        of bytes they were read from; an event still being written is left
+        for the next read.
+        """
+        events = []
+        consumed = 0
+        for eventMatch in EVENT_RE.finditer(data):
+            event = {}
+            for name, attrType, value in ATTRIBUTE_RE.findall(eventMatch.group(1)):
+                if attrType == 'i':
+                    event[name] = int(value)
+                elif attrType == 'r':
+                    event[name] = float(value)
+                else:
+                    event[name] = unescape(value, {'&quot;': '"', '&apos;': "'"})
+            events.append(event)
+            consumed = eventMatch.end()
+        return events, consumed
+
     def __init__(self, config):
         BasePlugin.__init__(self, config)
 
@@ -98,6 +145,13 @@ class SimpleCondorPlugin(BasePlugin):
         self.jobsPerSubmit = getattr(config.JobSubmitter, 'jobsPerSubmit', 200)
         self.extraMem = getattr(config.JobSubmitter, 'extraMemoryPerCore', 500)
 
+        # Track the jobs from their event logs, querying the schedd for all the
+        # jobs only every fullTrackInterval seconds to catch up on missed events
+        self.trackEventLogs = getattr(config.BossAir, 'trackEventLogs', False)
+        self.fullTrackInterval = getattr(config.BossAir, 'fullTrackInterval', 1800)
+        self.eventLogOffsets = {}
+        self.lastFullTrack = 0
+
         # Required for global pool accounting
         self.acctGroup = getattr(config.BossAir, 'acctGroup', "production")
         self.acctGroupUser = getattr(config.BossAir, 'acctGroupUser', "cmsdataops")
@@ -178,34 +232,44 @@ class SimpleCondorPlugin(BasePlugin):
         # get info about all active and recent jobs
         logging.debug("SimpleCondorPlugin is going to track %s jobs", len(jobs))
 
-        schedd = htcondor.Schedd()
+        fromEventLogs = self.trackEventLogs and time.time() - self.lastFullTrack < self.fullTrackInterval
+        if fromEventLogs:
+            logging.debug("Start: Reading the job event logs")
+            jobInfo = self.readEventLogs(jobs)
+            logging.debug("Finished reading new events for %d jobs from their event logs", len(jobInfo))
+        else:
+            schedd = htcondor.Schedd()
 
-        logging.debug("Start: Retrieving classAds using Condor Python XQuery")
-        try:
-            itobj = schedd.xquery("WMAgent_AgentName == %s" % classad.quote(self.agent),
-                                  ['ClusterId', 'ProcId', 'JobStatus', 'MATCH_EXP_JOBGLIDEIN_CMSSite'])
-            for jobAd in itobj:
-                gridId = "%s.%s" % (jobAd['ClusterId'], jobAd['ProcId'])
-                jobStatus = SimpleCondorPlugin.exitCodeMap().get(jobAd.get('JobStatus'), 'Unknown')
-                location = jobAd.get('MATCH_EXP_JOBGLIDEIN_CMSSite', None)
-                jobInfo[gridId] = (jobStatus, location)
-        except Exception as ex:
-            logging.error("Query to condor schedd failed in SimpleCondorPlugin.")
-            logging.error("Returning empty lists for all job types...")
-            logging.exception(ex)
-            return runningList, changeList, completeList
+            logging.debug("Start: Retrieving classAds using Condor Python XQuery")
+            try:
+                itobj = schedd.xquery("WMAgent_AgentName == %s" % classad.quote(self.agent),
+                                      ['ClusterId', 'ProcId', 'JobStatus', 'MATCH_EXP_JOBGLIDEIN_CMSSite'])
+                for jobAd in itobj:
+                    gridId = "%s.%s" % (jobAd['ClusterId'], jobAd['ProcId'])
+                    jobStatus = SimpleCondorPlugin.exitCodeMap().get(jobAd.get('JobStatus'), 'Unknown')
+                    location = jobAd.get('MATCH_EXP_JOBGLIDEIN_CMSSite', None)
+                    jobInfo[gridId] = (jobStatus, location)
+            except Exception as ex:
+                logging.error("Query to condor schedd failed in SimpleCondorPlugin.")
+                logging.error("Returning empty lists for all job types...")
+                logging.exception(ex)
+                return runningList, changeList, completeList
 
-        logging.debug("Finished retrieving %d classAds from Condor", len(jobInfo))
+            self.lastFullTrack = time.time()
+            logging.debug("Finished retrieving %d classAds from Condor", len(jobInfo))
 
         # now go over the jobs and see what we have
         for job in jobs:
 
-            # if the schedd doesn't know a job, consider it complete
-            # doing any further checks is not cost effective
-            if job['gridid'] not in jobInfo:
-                (newStatus, location) = ('Completed', None)
-            else:
+            if job['gridid'] in jobInfo:
                 (newStatus,location) = jobInfo[job['gridid']]
+            elif fromEventLogs:
+                # no new event, the job did not change
+                (newStatus, location) = (job['status'], None)
+            else:
+                # if the schedd doesn't know a job, consider it complete
+                # doing any further checks is not cost effective
+                (newStatus, location) = ('Completed', None)
 
             # check for status changes
             if newStatus != job['status']:
@@ -234,6 +298,49 @@ class SimpleCondorPlugin(BasePlugin):
 
         return runningList, changeList, completeList
 
+    def readEventLogs(self, jobs):
+        """
+        _readEventLogs_
+
+        Read the events written to the job event logs since they were last
+        read, keeping the offset reached in each log.
+        Return the (status, location) of the jobs with new events, keyed by
+        grid id. The location comes from the job ad information events.
+        """
+        jobInfo = {}
+        eventLogOffsets = {}
+        eventStatusMap = SimpleCondorPlugin.eventStatusMap()
+
+        for job in jobs:
+            gridId = job['gridid']
+            offset = self.eventLogOffsets.get(gridId, 0)
+            eventLogOffsets[gridId] = offset
+            if not job.get('cache_dir'):
+                continue
+
+            logPath = os.path.join(job['cache_dir'], "condor.%s.log" % gridId)
+            try:
+                if os.path.getsize(logPath) <= offset:
+                    continue
+                with open(logPath, 'r') as logFile:
+                    logFile.seek(offset)
+                    events, consumed = SimpleCondorPlugin.parseEventLog(logFile.read())
+            except (IOError, OSError):
+                # not written yet, or gone with the job cache
+                continue
+            eventLogOffsets[gridId] = offset + consumed
+
+            (newStatus, location) = (None, None)
+            for event in events:
+                newStatus = eventStatusMap.get(event.get('EventTypeNumber'), newStatus)
+                location = event.get('MATCH_EXP_JOBGLIDEIN_CMSSite', location)
+            if newStatus is not None:
+                jobInfo[gridId] = (newStatus, location)
+
+        # forget about the jobs that are not tracked anymore
+        self.eventLogOffsets = eventLogOffsets
+        return jobInfo
+
     def complete(self, jobs):
         """
         Do any completion work required
@@ -0,0 +1,10 @@
+"""
+_CompleteJob_
+
+SQLite implementation of CompleteJob
+"""
+
+from WMCore.BossAir.MySQL.CompleteJob import CompleteJob as MySQLCompleteJob
+
+class CompleteJob(MySQLCompleteJob):
+    pass
@@ -0,0 +1,52 @@
+"""
+_Create_
+
+SQLite implementation of BossAir.Create
+"""
+
+from WMCore.BossAir.MySQL.Create import Create as MySQLCreate
+
+class Create(MySQLCreate):
+    """
+    Create the BossAir schema without the MySQL table options.
+    """
+
+    def __init__(self, logger = None, dbi = None, params = None):
+        """
+        _init_
+
+        Call the MySQL constructor and replace the table definitions.
+        """
+        MySQLCreate.__init__(self, logger, dbi, params)
+
+        self.create['01bl_status'] = \
+        """CREATE TABLE bl_status
+            (
+            id            INTEGER PRIMARY KEY AUTOINCREMENT,
+            name          VARCHAR(255),
+            UNIQUE (name)
+            )
+        """
+
+        self.create['02bl_runjob'] = \
+        """CREATE TABLE bl_runjob
+           (
+           id            INTEGER PRIMARY KEY AUTOINCREMENT,
+           wmbs_id       INT,
+           grid_id       VARCHAR(255),
+           bulk_id       VARCHAR(255),
+           status        CHAR(1)   DEFAULT '1',
+           sched_status  INT,
+           retry_count   INT,
+           status_time   INT,
+           location      INT,
+           user_id       INT,
+           FOREIGN KEY (wmbs_id) REFERENCES wmbs_job(id) ON DELETE CASCADE,
+           FOREIGN KEY (sched_status) REFERENCES bl_status(id),
+           FOREIGN KEY (user_id) REFERENCES wmbs_users(id) ON DELETE CASCADE,
+           FOREIGN KEY (location) REFERENCES wmbs_location(id) ON DELETE CASCADE,
+           UNIQUE (retry_count, wmbs_id)
+           )
+        """
+
+        return
@@ -0,0 +1,10 @@
+"""
+_DeleteJobs_
+
+SQLite implementation of DeleteJobs
+"""
+
+from WMCore.BossAir.MySQL.DeleteJobs import DeleteJobs as MySQLDeleteJobs
+
+class DeleteJobs(MySQLDeleteJobs):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Destroy_
+
+SQLite implementation of BossAir.Destroy
+"""
+
+from WMCore.BossAir.MySQL.Destroy import Destroy as MySQLDestroy
+
+class Destroy(MySQLDestroy):
+    pass
@@ -0,0 +1,11 @@
+"""
+_JobStatusByLocation_
+
+SQLite implementation of JobStatusByLocation
+"""
+
+from WMCore.BossAir.MySQL.JobStatusByLocation \
+     import JobStatusByLocation as MySQLJobStatusByLocation
+
+class JobStatusByLocation(MySQLJobStatusByLocation):
+    pass
@@ -0,0 +1,11 @@
+"""
+_JobStatusByTaskAndSite_
+
+SQLite implementation of JobStatusByTaskAndSite
+"""
+
+from WMCore.BossAir.MySQL.JobStatusByTaskAndSite \
+     import JobStatusByTaskAndSite as MySQLJobStatusByTaskAndSite
+
+class JobStatusByTaskAndSite(MySQLJobStatusByTaskAndSite):
+    pass
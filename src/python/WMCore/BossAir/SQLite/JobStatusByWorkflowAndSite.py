@@ -0,0 +1,11 @@
+"""
+_JobStatusByWorkflowAndSite_
+
+SQLite implementation of JobStatusByWorkflowAndSite
+"""
+
+from WMCore.BossAir.MySQL.JobStatusByWorkflowAndSite \
+     import JobStatusByWorkflowAndSite as MySQLJobStatusByWorkflowAndSite
+
+class JobStatusByWorkflowAndSite(MySQLJobStatusByWorkflowAndSite):
+    pass
@@ -0,0 +1,10 @@
+"""
+_LoadByID_
+
+SQLite implementation of LoadByID
+"""
+
+from WMCore.BossAir.MySQL.LoadByID import LoadByID as MySQLLoadByID
+
+class LoadByID(MySQLLoadByID):
+    pass
@@ -0,0 +1,10 @@
+"""
+_LoadByStatus_
+
+SQLite implementation of LoadByStatus
+"""
+
+from WMCore.BossAir.MySQL.LoadByStatus import LoadByStatus as MySQLLoadByStatus
+
+class LoadByStatus(MySQLLoadByStatus):
+    pass
@@ -0,0 +1,10 @@
+"""
+_LoadByWMBSID_
+
+SQLite implementation of LoadByWMBSID
+"""
+
+from WMCore.BossAir.MySQL.LoadByWMBSID import LoadByWMBSID as MySQLLoadByWMBSID
+
+class LoadByWMBSID(MySQLLoadByWMBSID):
+    pass
@@ -0,0 +1,10 @@
+"""
+_LoadComplete_
+
+SQLite implementation of LoadComplete
+"""
+
+from WMCore.BossAir.MySQL.LoadComplete import LoadComplete as MySQLLoadComplete
+
+class LoadComplete(MySQLLoadComplete):
+    pass
@@ -0,0 +1,11 @@
+"""
+_LoadForMonitoring_
+
+SQLite implementation of LoadForMonitoring
+"""
+
+from WMCore.BossAir.MySQL.LoadForMonitoring \
+     import LoadForMonitoring as MySQLLoadForMonitoring
+
+class LoadForMonitoring(MySQLLoadForMonitoring):
+    pass
@@ -0,0 +1,10 @@
+"""
+_LoadRunning_
+
+SQLite implementation of LoadRunning
+"""
+
+from WMCore.BossAir.MySQL.LoadRunning import LoadRunning as MySQLLoadRunning
+
+class LoadRunning(MySQLLoadRunning):
+    pass
@@ -0,0 +1,16 @@
+"""
+_NewJobs_
+
+SQLite implementation of NewJobs
+"""
+
+from WMCore.BossAir.MySQL.NewJobs import NewJobs as MySQLNewJobs
+
+class NewJobs(MySQLNewJobs):
+    sql = """INSERT OR IGNORE INTO bl_runjob (wmbs_id, grid_id, bulk_id, sched_status, retry_count, user_id, location)
+               VALUES (:jobid, :gridid, :bulkid,
+                 (SELECT id FROM bl_status WHERE name = :status),
+                 :retry_count,
+                 (SELECT id FROM wmbs_users WHERE cert_dn = :userdn AND group_name = :usergroup AND role_name = :userrole),
+                 (SELECT id FROM wmbs_location WHERE site_name = :location)
+          )"""
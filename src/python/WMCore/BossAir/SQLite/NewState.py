@@ -0,0 +1,10 @@
+"""
+_NewState_
+
+SQLite implementation of NewState
+"""
+
+from WMCore.BossAir.MySQL.NewState import NewState as MySQLNewState
+
+class NewState(MySQLNewState):
+    sql = """INSERT OR IGNORE INTO bl_status (name) VALUES (:name)"""
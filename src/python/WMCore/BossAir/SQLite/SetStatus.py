@@ -0,0 +1,10 @@
+"""
+_SetStatus_
+
+SQLite implementation of SetStatus
+"""
+
+from WMCore.BossAir.MySQL.SetStatus import SetStatus as MySQLSetStatus
+
+class SetStatus(MySQLSetStatus):
+    pass
@@ -0,0 +1,10 @@
+"""
+_UpdateJobs_
+
+SQLite implementation of UpdateJobs
+"""
+
+from WMCore.BossAir.MySQL.UpdateJobs import UpdateJobs as MySQLUpdateJobs
+
+class UpdateJobs(MySQLUpdateJobs):
+    pass
@@ -0,0 +1,8 @@
+#!/usr/bin/env python
+"""
+_BossAir_
+
+MySQL DAO libraries for BossAir
+
+"""
+__all__ = []
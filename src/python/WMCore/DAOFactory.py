@@ -3,7 +3,22 @@ A basic action is a thing that will run a SQL statement
 
 A more complex one would be something that ran multiple SQL
 objects to produce a single output.
+
+The DAO classes and the dialect of each engine are resolved only once per
+process, the results are kept in module level caches shared by every
+DAOFactory instance.
 """
+
+import pkgutil
+
+from WMCore.Database.DAOCache import CachedDAO
+from WMCore.Database.DAOStats import daoStats
+
+# (package, dialect, classname) -> DAO class
+_daoClassCache = {}
+# engine dialect class -> dialect name
+_dialectCache = {}
+
 class DAOFactory(object):
     def __init__(self, package='WMCore', logger=None, dbinterface=None, owner=""):
         self.package = package
@@ -18,29 +33,97 @@ class DAOFactory(object):
                     "MySQL" : MySQLDialect,
                     "SQLite" : SQLiteDialect}
 
-    def __call__(self, classname):
+    def getDialect(self):
         """
-        Somewhat fugly method to load generic SQL classes...
+        _getDialect_
+
+        Return the name of the dialect used by the dbinterface, the
+        isinstance checks are only done once per engine dialect class.
         """
-        if not isinstance(self.dbinterface, str):
+        if isinstance(self.dbinterface, str):
+            return 'CouchDB'
 
-            dia = self.dbinterface.engine.dialect
-            #TODO: Make good
-            dialect = None
-            for i in self.dialects.keys():
-                if isinstance(dia, self.dialects[i]):
-                    dialect = i
-            if not dialect:
-                raise TypeError("unknown connection type: %s" % dia)
-        else:
-            dialect = 'CouchDB'
+        dia = self.dbinterface.engine.dialect
+        dialect = _dialectCache.get(dia.__class__, None)
+        if dialect:
+            return dialect
+
+        #TODO: Make good
+        for i in self.dialects.keys():
+            if isinstance(dia, self.dialects[i]):
+                dialect = i
+        if not dialect:
+            raise TypeError("unknown connection type: %s" % dia)
+
+        _dialectCache[dia.__class__] = dialect
+        return dialect
+
+    def getDAOClass(self, classname, dialect = None):
+        """
+        _getDAOClass_
+
+        Import and return the DAO class, the lookup is cached by package,
+        dialect and classname.
+        """
+        dialect = dialect or self.getDialect()
+        key = (self.package, dialect, classname)
+        daoClass = _daoClassCache.get(key, None)
+        if daoClass == None:
+            module = "%s.%s.%s" % (self.package, dialect, classname)
+            #self.logger.debug("importing %s, %s" % (module, classname))
+            module = __import__(module, globals(), locals(), [classname])#, -1)
+            daoClass = getattr(module, classname.split('.')[-1])
+            _daoClassCache[key] = daoClass
 
+        return daoClass
 
-        module = "%s.%s.%s" % (self.package, dialect, classname)
-        #self.logger.debug("importing %s, %s" % (module, classname))
-        module = __import__(module, globals(), locals(), [classname])#, -1)
-        instance = getattr(module, classname.split('.')[-1])
+    def preload(self):
+        """
+        _preload_
+
+        Import every DAO of the package for the current dialect and put them
+        in the cache, so that no imports happen later in the polling cycles.
+        Modules that don't define a class with the module name are skipped.
+        Returns the number of DAO classes in the cache for the package.
+        """
+        dialect = self.getDialect()
+        basePackage = "%s.%s" % (self.package, dialect)
+        baseModule = __import__(basePackage, globals(), locals(), ['__name__'])
+
+        for dummyLoader, moduleName, isPackage in pkgutil.walk_packages(baseModule.__path__,
+                                                                       basePackage + '.'):
+            if isPackage:
+                continue
+            classname = moduleName[len(basePackage) + 1:]
+            try:
+                self.getDAOClass(classname, dialect)
+            except (ImportError, AttributeError) as ex:
+                if self.logger:
+                    self.logger.debug("Not preloading %s: %s" % (moduleName, str(ex)))
+
+        return len([x for x in _daoClassCache if x[0] == self.package and x[1] == dialect])
+
+    def __call__(self, classname):
+        """
+        Somewhat fugly method to load generic SQL classes...
+        """
+        dialect = self.getDialect()
+        instance = self.getDAOClass(classname, dialect)
         if self.owner:
-            return instance(self.logger, self.dbinterface, self.owner)
+            dao = instance(self.logger, self.dbinterface, self.owner)
         else:
-            return instance(self.logger, self.dbinterface)
+            dao = instance(self.logger, self.dbinterface)
+
+        if daoStats.enabled:
+            daoStats.instrument(dao, classname, dialect)
+        return dao
+
+    def cached(self, classname, expire = 300):
+        """
+        _cached_
+
+        Return the DAO wrapped in a CachedDAO, its results are shared by the
+        whole process for expire seconds.  Only for DAOs returning data that
+        rarely changes, see WMCore.Database.DAOCache.
+        """
+        return CachedDAO(self(classname), (self.package, self.getDialect(), classname), expire)
@@ -0,0 +1,247 @@
+#!/usr/bin/env python
+"""
+_JobStore_
+
+Packed storage of the pickled job objects of a job collection.
+
+Instead of one job.pkl per job cache directory, the jobs of a job
+collection directory (JobCollection_<group>_<n>) are written to a single
+data file holding the compact per job records, one after the other, and an
+index file with the offset of every record and the metadata shared by all
+the jobs of the collection (spec, sandbox, owner, ...), stored only once.
+
+Jobs are always looked up by their cache directory, which falls back to the
+job.pkl of the cache directory for jobs written before the store existed.
+"""
+
+import os
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from collections import OrderedDict
+
+
+def _writeFile(fileName, data):
+    """
+    Write data to a temporary file and move it in place, so that readers
+    never see a partial file.
+    """
+    tmpName = "%s.%s.tmp" % (fileName, os.getpid())
+    with open(tmpName, "wb") as fd:
+        fd.write(data)
+    os.rename(tmpName, fileName)
+    return
+
+
+class JobStore(object):
+    """
+    _JobStore_
+
+    The packed job store of one job collection directory. Jobs are keyed by
+    the name of their cache directory, e.g. job_1234.
+    """
+    dataFile = "JobStore.pkl"
+    indexFile = "JobStore.idx"
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.dataPath = os.path.join(directory, self.dataFile)
+        self.indexPath = os.path.join(directory, self.indexFile)
+        self.shared = {}
+        self.records = {}
+        self.indexStat = None
+        self.handle = None
+        return
+
+    def exists(self):
+        """
+        _exists_
+
+        Whether the store was written. The index is written after the data.
+        """
+        return os.path.isfile(self.indexPath)
+
+    def save(self, jobs, sharedKeys=None):
+        """
+        _save_
+
+        Write the jobs in the store, replacing its content. The values of
+        sharedKeys are stored once, with the values of the first job, and left
+        out of the records of the jobs that have the same value.
+        """
+        shared = {}
+        if jobs:
+            shared = dict((key, jobs[0][key]) for key in sharedKeys or [] if key in jobs[0])
+
+        records = []
+        index = OrderedDict()
+        offset = 0
+        for job in jobs:
+            packed = dict((key, job.pop(key)) for key in shared if key in job and job[key] == shared[key])
+            try:
+                record = pickle.dumps(job, pickle.HIGHEST_PROTOCOL)
+            finally:
+                job.update(packed)
+            index[os.path.basename(job['cache_dir'].rstrip('/'))] = (offset, len(record), tuple(packed))
+            records.append(record)
+            offset += len(record)
+
+        _writeFile(self.dataPath, "".join(records))
+        _writeFile(self.indexPath, pickle.dumps({'shared': shared, 'records': index},
+                                                pickle.HIGHEST_PROTOCOL))
+        self.close()
+        self.records = {}
+        return
+
+    def refresh(self):
+        """
+        _refresh_
+
+        (Re)load the index if the store was written since it was last read.
+        Return whether the store exists.
+        """
+        try:
+            stat = os.stat(self.indexPath)
+        except OSError:
+            return False
+        stat = (stat.st_ino, stat.st_mtime, stat.st_size)
+        if stat != self.indexStat:
+            self.close()
+            with open(self.indexPath, "rb") as fd:
+                index = pickle.load(fd)
+            self.shared = index['shared']
+            self.records = index['records']
+            self.indexStat = stat
+        return True
+
+    def __contains__(self, name):
+        if name not in self.records:
+            self.refresh()
+        return name in self.records
+
+    def load(self, name):
+        """
+        _load_
+
+        Load the job stored under the name of its cache directory
+        """
+        if name not in self:
+            raise KeyError("Job %s is not in the job store %s" % (name, self.directory))
+        offset, length, sharedKeys = self.records[name]
+        if self.handle is None:
+            self.handle = open(self.dataPath, "rb")
+        self.handle.seek(offset)
+        job = pickle.loads(self.handle.read(length))
+        for key in sharedKeys:
+            job[key] = self.shared[key]
+        return job
+
+    def names(self):
+        """
+        _names_
+
+        Names of the jobs in the store, in the order they were written
+        """
+        self.refresh()
+        return self.records.keys()
+
+    def close(self):
+        """
+        _close_
+
+        Close the data file, it is reopened on the next load
+        """
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+        self.indexStat = None
+        return
+
+
+def saveJobs(jobs, sharedKeys=None):
+    """
+    _saveJobs_
+
+    Save the jobs in the packed stores of their job collection directories,
+    the parent directories of their cache directories.
+    """
+    jobsPerDir = OrderedDict()
+    for job in jobs:
+        directory = os.path.dirname(job['cache_dir'].rstrip('/'))
+        jobsPerDir.setdefault(directory, []).append(job)
+
+    for directory, dirJobs in jobsPerDir.items():
+        JobStore(directory).save(dirJobs, sharedKeys)
+    return
+
+
+class JobLoader(object):
+    """
+    _JobLoader_
+
+    Load jobs from their cache directories, through the packed store of their
+    job collection or from job.pkl for jobs that are not in a store. The
+    stores of the last maxStores collections are kept open.
+    """
+
+    def __init__(self, maxStores=20):
+        self.maxStores = maxStores
+        self.stores = OrderedDict()
+        return
+
+    def getStore(self, directory):
+        """
+        _getStore_
+
+        Return the store of a job collection directory
+        """
+        store = self.stores.pop(directory, None)
+        if store is None:
+            store = JobStore(directory)
+            while len(self.stores) >= self.maxStores:
+                self.stores.popitem(last=False)[1].close()
+        self.stores[directory] = store
+        return store
+
+    def load(self, cacheDir):
+        """
+        _load_
+
+        Load the job of a cache directory, return None if it was not saved
+        """
+        directory, name = os.path.split(cacheDir.rstrip('/'))
+        store = self.getStore(directory)
+        if name in store:
+            return store.load(name)
+
+        pickledJobPath = os.path.join(cacheDir, "job.pkl")
+        if not os.path.isfile(pickledJobPath):
+            return None
+        with open(pickledJobPath, "rb") as jobHandle:
+            return pickle.load(jobHandle)
+
+    def close(self):
+        """
+        _close_
+
+        Close all the open stores
+        """
+        for store in self.stores.values():
+            store.close()
+        self.stores.clear()
+        return
+
+
+def loadJob(cacheDir):
+    """
+    _loadJob_
+
+    Load a single job from its cache directory, or None if it was not saved
+    """
+    loader = JobLoader(maxStores=1)
+    try:
+        return loader.load(cacheDir)
+    finally:
+        loader.close()
@@ -10,14 +10,142 @@ This class can also handle ranges of events as the structure is identical
 or could be subclassed renaming a function or two.
 
 This code began life in COMP/CRAB/python/LumiList.py
+
+Unlike the CMSSW version, the set operations run as linear merges of the
+sorted lumi ranges of each run, and lookups bisect the range starts, so
+that their cost does not grow with the number of lumis in the ranges.
 """
 
 
-import copy
+import heapq
 import itertools
 import json
+import logging
 import re
 import urllib2
+import weakref
+from bisect import bisect_right
+
+
+def _mergeRanges(ranges):
+    """
+    Sort [first, last] lumi ranges and merge the overlapping and adjacent ones
+    """
+    merged = []
+    for lumiRange in sorted(ranges):
+        if merged and merged[-1][0] <= lumiRange[0] <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], lumiRange[1])
+        else:
+            merged.append(lumiRange)
+    return merged
+
+
+def _intersectRanges(aRanges, bRanges):
+    """
+    Lumi ranges in both sorted, merged range lists
+    """
+    result = []
+    i = j = 0
+    while i < len(aRanges) and j < len(bRanges):
+        first = max(aRanges[i][0], bRanges[j][0])
+        last = min(aRanges[i][1], bRanges[j][1])
+        if first <= last:
+            result.append([first, last])
+        if aRanges[i][1] < bRanges[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def _subtractRanges(aRanges, bRanges):
+    """
+    Lumi ranges of the sorted, merged aRanges not in the sorted, merged bRanges
+    """
+    result = []
+    j = 0
+    for first, last in aRanges:
+        while j < len(bRanges) and bRanges[j][1] < first:
+            j += 1
+        k = j
+        while k < len(bRanges) and bRanges[k][0] <= last and first <= last:
+            if bRanges[k][0] > first:
+                result.append([first, bRanges[k][0] - 1])
+            first = max(first, bRanges[k][1] + 1)
+            k += 1
+        if first <= last:
+            result.append([first, last])
+    return result
+
+
+def _unionRanges(aRanges, bRanges):
+    """
+    Lumi ranges in either of the sorted range lists
+    """
+    result = []
+    for first, last in heapq.merge(aRanges, bRanges):
+        if result and first <= result[-1][1] + 1:
+            result[-1][1] = max(result[-1][1], last)
+        else:
+            result.append([first, last])
+    return result
+
+
+class LumiMaskIndex(object):
+    """
+    Lookup index of a {run: [[first, last], ...]} lumi mask, like the ones
+    of buildLumiMask, ACDC whitelists or Mask runAndLumis. It is built once
+    and answers membership checks by bisecting the sorted range starts of
+    the run. An empty mask lets everything through.
+
+    Run numbers are looked up as given, unless runType is set, in which case
+    the mask runs are converted with it, e.g. runType=int for masks keyed by
+    run number strings.
+    """
+
+    def __init__(self, runAndLumis, runType=None):
+        self.index = {}
+        for run, lumiRanges in (runAndLumis or {}).items():
+            closed = []
+            for lumiRange in lumiRanges:
+                if len(lumiRange) != 2:
+                    logging.error("Invalid lumi range %s for run %s in the lumi mask, ignoring it",
+                                  lumiRange, run)
+                elif lumiRange[0] <= lumiRange[1]:
+                    closed.append([lumiRange[0], lumiRange[1]])
+            closed = _mergeRanges(closed)
+            self.index[runType(run) if runType else run] = ([x[0] for x in closed], [x[1] for x in closed])
+        self.empty = not self.index
+
+    def hasRun(self, run):
+        """
+        Whether the mask has ranges for the run
+        """
+        return self.empty or run in self.index
+
+    def contains(self, run, lumi):
+        """
+        Whether lumi of run is within the mask
+        """
+        if self.empty:
+            return True
+        try:
+            starts, ends = self.index[run]
+        except KeyError:
+            return False
+        position = bisect_right(starts, lumi) - 1
+        return position >= 0 and lumi <= ends[position]
+
+    def filterLumis(self, run, lumis):
+        """
+        Return the lumis of run within the mask, in their order
+        """
+        return [lumi for lumi in lumis if self.contains(run, lumi)]
+
+
+# LumiList -> the lookup index of its runs, see LumiList._getRangeIndex
+_rangeIndexes = weakref.WeakKeyDictionary()
+
 
 class LumiList(object):
     """
@@ -136,88 +264,82 @@ class LumiList(object):
         # Compact each run and make it unique
 
         for run in self.compactList.keys():
-            newLumis = []
-            for lumi in sorted(self.compactList[run]):
-                # If the next lumi starts inside or just after the last just change the endpoint of the first
-                if newLumis and newLumis[-1][0] <= lumi[0] <= newLumis[-1][1] + 1:
-                    newLumis[-1][1] = max(newLumis[-1][1], lumi[1])
-                else:
-                    newLumis.append(lumi)
-            self.compactList[run] = newLumis
+            self.compactList[run] = _mergeRanges(self.compactList[run])
+
+    def _getRanges(self, run):
+        """
+        Return the sorted and merged lumi ranges of run, as fresh lists
+        """
+        return _mergeRanges([[first, last] for first, last in self.compactList.get(run, [])])
+
+    def _splitRanges(self, run):
+        """
+        Return the sorted and merged [first, last] lumi ranges of run and the
+        starts of its ranges ending at 0 (to the end of the run)
+        """
+        lumiRanges = self.compactList.get(run, [])
+        closed = _mergeRanges([[first, last] for first, last in lumiRanges if first <= last])
+        return closed, [first for first, last in lumiRanges if last == 0]
+
+    def _getRangeIndex(self, run):
+        """
+        Return the (starts, ends, openStart) lookup index of the lumi ranges
+        of run: the starts and ends of the merged ranges, for bisect, and the
+        lowest start of the ranges ending at 0 (to the end of the run) if any.
+        The index is rebuilt when the ranges of the run were replaced, and is
+        kept out of the instance so it is not pickled nor JSON thunked.
+        """
+        # run -> (lumi ranges indexed, their number, starts, ends, open start)
+        rangeIndex = _rangeIndexes.setdefault(self, {})
+        lumiRanges = self.compactList.get(run)
+        entry = rangeIndex.get(run)
+        if entry is None or entry[0] is not lumiRanges or entry[1] != len(lumiRanges):
+            closed, openStarts = self._splitRanges(run)
+            entry = (lumiRanges, len(lumiRanges),
+                     [x[0] for x in closed], [x[1] for x in closed],
+                     min(openStarts) if openStarts else None)
+            rangeIndex[run] = entry
+        return entry[2:]
+
+    def _inRanges(self, run, lumi):
+        """
+        Whether lumi is within one of the [first, last] ranges of run
+        """
+        starts, ends, _ = self._getRangeIndex(run)
+        position = bisect_right(starts, lumi) - 1
+        return position >= 0 and lumi <= ends[position]
 
     def __sub__(self, other): # Things from self not in other
         result = {}
-        for run in sorted(self.compactList.keys()):
-            alumis = sorted(self.compactList[run])
-            blumis = sorted(other.compactList.get(run, []))
-            alist = []                    # verified part
-            for alumi in alumis:
-                tmplist = [alumi[0], alumi[1]] # may be part
-                for blumi in blumis:
-                    if blumi[0] <= tmplist[0] and blumi[1] >= tmplist[1]: # blumi has all of alumi
-                        tmplist = []
-                        break # blumi is has all of alumi
-                    if blumi[0] > tmplist[0] and blumi[1] < tmplist[1]: # blumi is part of alumi
-                        alist.append([tmplist[0], blumi[0]-1])
-                        tmplist = [blumi[1]+1, tmplist[1]]
-                    elif blumi[0] <= tmplist[0] and blumi[1] < tmplist[1] and blumi[1]>=tmplist[0]: # overlaps start
-                        tmplist = [blumi[1]+1, tmplist[1]]
-                    elif blumi[0] > tmplist[0] and blumi[1] >= tmplist[1] and blumi[0]<=tmplist[1]: # overlaps end
-                        alist.append([tmplist[0], blumi[0]-1])
-                        tmplist = []
-                        break
-                if tmplist:
-                    alist.append(tmplist)
-            result[run] = alist
-
+        for run in self.compactList:
+            closed, openStarts = self._splitRanges(run)
+            otherClosed, otherOpenStarts = other._splitRanges(run)
+            lumiRanges = _subtractRanges(closed, otherClosed)
+            if otherOpenStarts:
+                # other has everything from its first open start on
+                end = min(otherOpenStarts)
+                lumiRanges = [[first, min(last, end - 1)] for first, last in lumiRanges if first < end]
+            # ranges to the end of the run are kept unless other has a range
+            # starting at or before them
+            otherStarts = [x[0] for x in otherClosed] + otherOpenStarts
+            for first in openStarts:
+                if not otherStarts or first < min(otherStarts):
+                    lumiRanges.append([first, 0])
+            result[run] = lumiRanges
         return LumiList(compactList = result)
 
 
     def __and__(self, other): # Things in both
         result = {}
-        aruns = set(self.compactList.keys())
-        bruns = set(other.compactList.keys())
-        for run in aruns & bruns:
-            lumiList = []                    # List for this run
-            unique = []                    # List for this run
-            for alumi in self.compactList[run]:
-                for blumi in other.compactList[run]:
-                    if blumi[0] <= alumi[0] and blumi[1] >= alumi[1]: # blumi has all of alumi
-                        lumiList.append(alumi)
-                    if blumi[0] > alumi[0] and blumi[1] < alumi[1]: # blumi is part of alumi
-                        lumiList.append(blumi)
-                    elif blumi[0] <= alumi[0] and blumi[1] < alumi[1] and blumi[1] >= alumi[0]: # overlaps start
-                        lumiList.append([alumi[0], blumi[1]])
-                    elif blumi[0] > alumi[0] and blumi[1] >= alumi[1] and blumi[0] <= alumi[1]: # overlaps end
-                        lumiList.append([blumi[0], alumi[1]])
-
-
-            if lumiList:
-                unique = [lumiList[0]]
-            for pair in lumiList[1:]:
-                if pair[0] == unique[-1][1]+1:
-                    unique[-1][1] = copy.deepcopy(pair[1])
-                else:
-                    unique.append(copy.deepcopy(pair))
-
-            result[run] = unique
+        for run in set(self.compactList) & set(other.compactList):
+            result[run] = _intersectRanges(self._getRanges(run), other._getRanges(run))
         return LumiList(compactList = result)
 
 
     def __or__(self, other):
         result = {}
-        aruns = self.compactList.keys()
-        bruns = other.compactList.keys()
-        runs = set(aruns + bruns)
-        for run in runs:
-            overlap = sorted(self.compactList.get(run, []) + other.compactList.get(run, []))
-            unique = [overlap[0]]
-            for pair in overlap[1:]:
-                if pair[0] >= unique[-1][0] and pair[0] <= unique[-1][1]+1 and pair[1] > unique[-1][1]:
-                    unique[-1][1] = copy.deepcopy(pair[1])
-                elif pair[0] > unique[-1][1]:
-                    unique.append(copy.deepcopy(pair))
-            result[run] = unique
+        for run in set(self.compactList) | set(other.compactList):
+            result[run] = _unionRanges(self._getRanges(run), other._getRanges(run))
         return LumiList(compactList = result)
 
 
@@ -237,11 +359,9 @@ class LumiList(object):
         """
         filteredList = []
         for (run, lumi) in lumiList:
-            runsInLumi = self.compactList.get(str(run), [[0, -1]])
-            for (first, last) in runsInLumi:
-                if lumi >= first and lumi <= last:
-                    filteredList.append((run, lumi))
-                    break
+            runString = str(run)
+            if runString in self.compactList and self._inRanges(runString, lumi):
+                filteredList.append((run, lumi))
         return filteredList
 
 
@@ -385,21 +505,19 @@ class LumiList(object):
                 run         = run[0]
             except:
                 raise RuntimeError("Improper format for run '%s'" % run)
-        lumiRangeList = self.compactList.get( str(run) )
-        if not lumiRangeList:
+        run = str(run)
+        if not self.compactList.get(run):
             # the run isn't there, so no need to look any further
             return False
-        for lumiRange in lumiRangeList:
-            # we want to make this as found if either the lumiSection
-            # is inside the range OR if the lumi section is greater
-            # than or equal to the lower bound of the lumi range and
-            # the upper bound is 0 (which means extends to the end of
-            # the run)
-            if lumiRange[0] <= lumiSection and \
-               (0 == lumiRange[1] or lumiSection <= lumiRange[1]):
-                # got it
-                return True
-        return False
+        # we want to make this as found if either the lumiSection
+        # is inside a range OR if the lumi section is greater
+        # than or equal to the lower bound of a lumi range whose
+        # upper bound is 0 (which means extends to the end of
+        # the run)
+        openStart = self._getRangeIndex(run)[2]
+        if openStart is not None and openStart <= lumiSection:
+            return True
+        return self._inRanges(run, lumiSection)
 
 
     def __contains__ (self, runTuple):
@@ -10,6 +10,7 @@ job in two ways:
 
 """
 
+from WMCore.DataStructs.LumiList import LumiMaskIndex
 from WMCore.DataStructs.Run import Run
 
 class Mask(dict):
@@ -161,6 +162,15 @@ class Mask(dict):
 
         return self['runAndLumis']
 
+    def getLumiMaskIndex(self):
+        """
+        _getLumiMaskIndex_
+
+        Return a LumiMaskIndex of the current runs and lumis, for checking
+        many run/lumis against the mask
+        """
+        return LumiMaskIndex(self['runAndLumis'])
+
     def runLumiInMask(self, run, lumi):
         """
         _runLumiInMask_
@@ -208,16 +218,10 @@ class Mask(dict):
         passedRuns = set([r.run for r in runs])
         filteredRuns = maskRuns.intersection(passedRuns)
 
+        lumiMaskIndex = self.getLumiMaskIndex()
         newRuns = set()
         for runNumber in filteredRuns:
-            maskLumis = set()
-            for pair in self["runAndLumis"][runNumber]:
-                if pair[0] == pair[1]:
-                    maskLumis.add(pair[0])
-                else:
-                    maskLumis = maskLumis.union(range(pair[0], pair[1] + 1, 1))
-
-            filteredLumis = set(runDict[runNumber].lumis).intersection(maskLumis)
+            filteredLumis = set(lumiMaskIndex.filterLumis(runNumber, runDict[runNumber].lumis))
             if len(filteredLumis) > 0:
                 newRuns.add(Run(runNumber, *list(filteredLumis)))
 
@@ -10,6 +10,10 @@ NOT A THREAD SAFE CLASS.
 """
 from __future__ import print_function
 
+import Queue
+import json
+import os
+import threading
 import time
 import urllib
 import re
@@ -164,9 +168,14 @@ class Database(CouchDBRequests):
     TODO: remove leading whitespace when committing a view
     """
 
-    def __init__(self, dbname='database', url='http://localhost:5984', size=1000, ckey=None, cert=None):
+    def __init__(self, dbname='database', url='http://localhost:5984', size=1000, ckey=None, cert=None,
+                 bulkSize=4 * 1024 * 1024, commitThreads=4):
         """
         A set of queries against a CouchDB database
+
+        size is the number of queued docs that triggers a commit, bulkSize
+        the maximum size in bytes of a single _bulk_docs request and
+        commitThreads the number of those requests a commit keeps in flight.
         """
         check_name(dbname)
 
@@ -176,6 +185,8 @@ class Database(CouchDBRequests):
         self._reset_queue()
 
         self._queue_size = size
+        self._bulk_size = bulkSize
+        self._commit_threads = commitThreads
         self.threads = []
         self.last_seq = 0
 
@@ -264,7 +275,10 @@ class Database(CouchDBRequests):
         TODO: restore support for returndocs and viewlist
 
         Returns a list of good documents
-            throws an exception otherwise
+            throws an exception otherwise. If some batches of documents
+            were committed before the exception, their results are in the
+            commitResults attribute of the exception (None for the documents
+            that were not committed), the other documents stay in the queue.
         """
         if doc:
             self.queue(doc, timestamp, viewlist)
@@ -274,22 +288,118 @@ class Database(CouchDBRequests):
 
         if timestamp:
             self.timestamp(self._queue, timestamp)
-        # TODO: commit in thread to avoid blocking others
-        uri = '/%s/_bulk_docs/' % self.name
 
-        data['docs'] = list(self._queue)
-        retval = self.post(uri, data)
+        docs = list(self._queue)
+
+        batches = self._bulkBatches(docs)
+        results, errors = self._postBulkDocs(batches, data)
+
+        retval = [None] * len(docs)
+        for batch, batchResults in zip(batches, results):
+            if batchResults is None:
+                # failed or not posted, the docs are kept in the queue below
+                continue
+            if callback:
+                batchData = dict(data, docs=[doc for _, doc, _ in batch])
+                for idx, result in enumerate(batchResults):
+                    if result.get('error', None) == 'conflict':
+                        batchResults[idx] = callback(self, batchData, result)
+            for (docIdx, _, _), result in zip(batch, batchResults):
+                retval[docIdx] = result
+
+        if errors:
+            # keep the docs not committed in the queue, in their order
+            notCommitted = sorted(docIdx for batch, batchResults in zip(batches, results)
+                                  if batchResults is None for docIdx, _, _ in batch)
+            self._queue = [docs[docIdx] for docIdx in notCommitted]
+            error = errors[0]
+            error.commitResults = retval
+            raise error
         self._reset_queue()
+
         for v in viewlist:
             design, view = v.split('/')
             self.loadView(design, view, {'limit': 0})
-        if callback:
-            for idx, result in enumerate(retval):
-                if result.get('error', None) == 'conflict':
-                    retval[idx] = callback(self, data, result)
 
         return retval
 
+    def _bulkBatches(self, docs):
+        """
+        _bulkBatches_
+
+        Encode docs and split them into batches of about self._bulk_size
+        bytes, as lists of (position, doc, encoded doc) tuples. Docs sharing
+        an id always go into the same batch, so that CouchDB resolves them
+        within a single request as it would without batching.
+        """
+        batches = []
+        batchBytes = 0
+        batchById = {}
+        for docIdx, doc in enumerate(docs):
+            encoded = self.encode(doc)
+            docId = doc.get('_id')
+            if docId is not None and docId in batchById:
+                batchById[docId].append((docIdx, doc, encoded))
+                continue
+            if not batches or (batches[-1] and batchBytes + len(encoded) > self._bulk_size):
+                batches.append([])
+                batchBytes = 0
+            batches[-1].append((docIdx, doc, encoded))
+            batchBytes += len(encoded) + 2
+            if docId is not None:
+                batchById[docId] = batches[-1]
+        return batches
+
+    def _postBulkDocs(self, batches, data):
+        """
+        _postBulkDocs_
+
+        Post each batch to _bulk_docs, keeping up to self._commit_threads
+        requests in flight. No more batches are posted once one failed.
+        Returns the results in batch order, None for the batches that failed
+        or were not posted, and the exceptions of the failed batches.
+        """
+        uri = '/%s/_bulk_docs/' % self.name
+        extra = ''.join([', %s: %s' % (self.encode(k), self.encode(v))
+                         for k, v in data.items() if k != 'docs'])
+
+        results = [None] * len(batches)
+        errors = []
+
+        def postBatch(idx):
+            body = '{"docs": [%s]%s}' % (', '.join([encoded for _, _, encoded in batches[idx]]), extra)
+            try:
+                results[idx] = self.post(uri, body, encode=False)
+            except Exception as ex:
+                errors.append(ex)
+
+        nThreads = min(self._commit_threads, len(batches))
+        if nThreads <= 1:
+            for idx in range(len(batches)):
+                if errors:
+                    break
+                postBatch(idx)
+            return results, errors
+
+        work = Queue.Queue()
+        for idx in range(len(batches)):
+            work.put(idx)
+
+        def worker():
+            while not errors:
+                try:
+                    idx = work.get_nowait()
+                except Queue.Empty:
+                    return
+                postBatch(idx)
+
+        threads = [threading.Thread(target=worker) for _ in range(nThreads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
     def document(self, id, rev=None):
         """
         Load a document identified by id. You can specify a rev to see an older revision
@@ -437,6 +547,21 @@ class Database(CouchDBRequests):
         self.last_seq = data['last_seq']
         return data
 
+    def longPollChanges(self, since=0, limit=1000, timeout=60000, filter=None, params={}):
+        """
+        Wait up to timeout milliseconds for changes after the since sequence
+        and return at most limit of them. Extra query parameters for the
+        filter function (or e.g. include_docs) can be passed in params.
+        """
+        options = dict(params)
+        options.update({'feed': 'longpoll', 'since': since,
+                        'limit': limit, 'timeout': timeout})
+        if filter:
+            options['filter'] = filter
+        data = self.get('/%s/_changes' % self.name, options)
+        self.last_seq = data['last_seq']
+        return data
+
     def purge(self, data):
         return self.post('/%s/_purge' % self.name, data)
 
@@ -469,8 +594,8 @@ class Database(CouchDBRequests):
         encodedOptions = {}
         for k, v in options.iteritems():
             # We can't encode the stale option, as it will be converted to '"ok"'
-            # which couch barfs on.
-            if k == "stale":
+            # which couch barfs on. The doc ids are plain strings, not JSON.
+            if k in ("stale", "startkey_docid", "endkey_docid"):
                 encodedOptions[k] = v
             else:
                 encodedOptions[k] = self.encode(v)
@@ -492,6 +617,56 @@ class Database(CouchDBRequests):
         else:
             return retval
 
+    def iterView(self, design, view, options={}, pageSize=1000):
+        """
+        Generator over the rows of a view. The rows are fetched pageSize at a
+        time, paging on startkey/startkey_docid, so only one page is ever held
+        in memory. options are the same as for loadView; limit caps the total
+        number of rows returned.
+        """
+        loader = lambda pageOptions: self.loadView(design, view, pageOptions)
+        return self._iterRows(loader, options, pageSize)
+
+    def iterAllDocs(self, options={}, pageSize=1000):
+        """
+        Generator over the rows of _all_docs, fetched pageSize at a time.
+        See iterView.
+        """
+        return self._iterRows(self.allDocs, options, pageSize)
+
+    def _iterRows(self, loader, options, pageSize):
+        """
+        Page through the rows returned by loader(options). One row more than
+        the page is requested so that the next page can start exactly on it,
+        which works for views where a key is emitted by several documents.
+        """
+        options = dict(options)
+        maxRows = options.pop('limit', None)
+        if 'key' in options:
+            options['startkey'] = options['endkey'] = options.pop('key')
+
+        count = 0
+        while maxRows is None or count < maxRows:
+            pageLimit = pageSize
+            if maxRows is not None:
+                pageLimit = min(pageSize, maxRows - count)
+            options['limit'] = pageLimit + 1
+            rows = loader(options)['rows']
+
+            for row in rows[:pageLimit]:
+                yield row
+            count += min(len(rows), pageLimit)
+
+            if len(rows) <= pageLimit:
+                return
+
+            nextRow = rows[pageLimit]
+            options.pop('skip', None)
+            options['startkey'] = nextRow['key']
+            if 'id' in nextRow:
+                options['startkey_docid'] = nextRow['id']
+        return
+
     def loadList(self, design, list, view, options={}, keys=[]):
         """
         Load data from a list function. This returns data that hasn't been
@@ -541,7 +716,11 @@ class Database(CouchDBRequests):
         """
         encodedOptions = {}
         for k, v in options.iteritems():
-            encodedOptions[k] = self.encode(v)
+            # the doc ids are plain strings, not JSON
+            if k in ("startkey_docid", "endkey_docid"):
+                encodedOptions[k] = v
+            else:
+                encodedOptions[k] = self.encode(v)
 
         if len(keys):
             if encodedOptions:
@@ -1165,3 +1344,79 @@ class CouchMonitor(object):
                                 secsUpdateOn)
                 return False
         return False
+
+
+class ChangesConsumer(object):
+    """
+    Follow the _changes feed of a database with longpoll requests and hand
+    each batch of changes to a callback.
+
+    The sequence reached is saved to a local checkpoint file after every
+    batch the callback handled without raising, so a restarted consumer
+    carries on from there instead of rescanning the database. A batch whose
+    callback fails is delivered again on the next poll.
+    """
+
+    def __init__(self, database, callback, checkpointFile, filter=None,
+                 params=None, batchSize=1000, timeout=60000):
+        """
+        database is a Database instance, callback a function taking the
+        list of change rows, filter and params select the changes as for
+        Database.longPollChanges.
+        """
+        self.database = database
+        self.callback = callback
+        self.checkpointFile = checkpointFile
+        self.filter = filter
+        self.params = params or {}
+        self.batchSize = batchSize
+        self.timeout = timeout
+        self.since = self.loadCheckpoint()
+
+    def loadCheckpoint(self):
+        """
+        Return the sequence saved in the checkpoint file, 0 if there is none.
+        """
+        if not os.path.exists(self.checkpointFile):
+            return 0
+        with open(self.checkpointFile) as checkpoint:
+            return json.load(checkpoint)['since']
+
+    def saveCheckpoint(self):
+        """
+        Atomically replace the checkpoint file with the current sequence.
+        """
+        tmpFile = "%s.tmp" % self.checkpointFile
+        with open(tmpFile, 'w') as checkpoint:
+            json.dump({'database': self.database.name, 'since': self.since}, checkpoint)
+        os.rename(tmpFile, self.checkpointFile)
+
+    def poll(self):
+        """
+        Fetch the next batch of changes, waiting for up to self.timeout
+        milliseconds if there are none yet, and dispatch it. Returns the
+        number of changes handled.
+        """
+        data = self.database.longPollChanges(self.since, self.batchSize, self.timeout,
+                                             self.filter, self.params)
+        changes = data.get('results', [])
+        if changes:
+            self.callback(changes)
+        if data['last_seq'] != self.since:
+            self.since = data['last_seq']
+            self.saveCheckpoint()
+        return len(changes)
+
+    def run(self, stopEvent=None, maxPolls=None):
+        """
+        Keep polling until stopEvent (a threading.Event) is set or maxPolls
+        polls have been made. A full batch is followed by another poll
+        straight away, so a backlog is drained without waiting.
+        """
+        nPolls = 0
+        while not (stopEvent and stopEvent.is_set()):
+            if maxPolls is not None and nPolls >= maxPolls:
+                break
+            self.poll()
+            nPolls += 1
+        return
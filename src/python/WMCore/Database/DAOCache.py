@@ -0,0 +1,78 @@
+"""
+_DAOCache_
+
+Read-through cache with a time to live for DAOs returning data that rarely
+changes (site and location mappings, etc).
+
+The cached results are shared by all the CachedDAO instances of a process,
+so that DAOs rebuilt every cycle (e.g. by the JobFactory) still hit the
+cache.  The results are handed out as they are, callers must not modify
+them.  Code changing the underlying tables in this process should call
+invalidateDAOCache once the change is committed (otherwise the old rows may
+be read back into the cache), other processes will see the change once the
+time to live expires.
+"""
+
+import threading
+import time
+
+# (package, dialect, classname) -> {(args, kwargs): (timestamp, result)}
+_daoResultCache = {}
+_daoResultCacheLock = threading.Lock()
+
+
+def invalidateDAOCache(package = None, classnames = None):
+    """
+    _invalidateDAOCache_
+
+    Drop the cached results of the given DAOs of a package, of all the DAOs
+    of the package if no classnames are given, or everything if no package
+    is given.
+    """
+    with _daoResultCacheLock:
+        for key in _daoResultCache.keys():
+            if package and key[0] != package:
+                continue
+            if classnames and key[2] not in classnames:
+                continue
+            del _daoResultCache[key]
+    return
+
+
+class CachedDAO(object):
+    """
+    _CachedDAO_
+
+    Wrap a DAO so that the results of execute are cached for expire seconds,
+    per set of arguments.  The conn and transaction arguments are not part of
+    the key.  Calls with unhashable arguments are not cached.
+    """
+    def __init__(self, dao, key, expire):
+        self.dao = dao
+        self.key = key
+        self.expire = expire
+
+    def execute(self, *args, **kwargs):
+        callKwargs = dict(kwargs)
+        kwargs.pop("conn", None)
+        kwargs.pop("transaction", None)
+        callKey = (args, tuple(sorted(kwargs.items())))
+        try:
+            hash(callKey)
+        except TypeError:
+            return self.dao.execute(*args, **callKwargs)
+
+        with _daoResultCacheLock:
+            entry = _daoResultCache.get(self.key, {}).get(callKey, None)
+        if entry and time.time() - entry[0] < self.expire:
+            return entry[1]
+
+        result = self.dao.execute(*args, **callKwargs)
+        with _daoResultCacheLock:
+            _daoResultCache.setdefault(self.key, {})[callKey] = (time.time(), result)
+        return result
+
+    def invalidate(self):
+        with _daoResultCacheLock:
+            _daoResultCache.pop(self.key, None)
+        return
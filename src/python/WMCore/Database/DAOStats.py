@@ -0,0 +1,186 @@
+"""
+_DAOStats_
+
+Optional instrumentation of the DAOs handed out by the DAOFactory.
+
+When enabled, the execute method of every DAO built by a DAOFactory is timed,
+and the number of rows returned or affected by the underlying processData
+calls is counted.  The numbers are kept per DAO class and dialect in the
+process wide daoStats object, and can be dumped to the component log at a
+configurable interval.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+
+
+class DAOStats(object):
+    """
+    _DAOStats_
+
+    Keep the call count, the total time, the rows and the most recent
+    latencies (used for the percentiles) of every instrumented DAO.
+    """
+    def __init__(self, maxSamples = 1000):
+        self.enabled = False
+        self.maxSamples = maxSamples
+        self.dumpInterval = 0
+        self.lastDump = time.time()
+        self.stats = {}
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    def enable(self, dumpInterval = 0, maxSamples = None):
+        """
+        _enable_
+
+        Start instrumenting the DAOs built from now on, dumpInterval is the
+        number of seconds between dumps of the stats to the log, 0 to never
+        dump them.
+        """
+        if maxSamples:
+            self.maxSamples = maxSamples
+        self.dumpInterval = dumpInterval
+        self.lastDump = time.time()
+        self.enabled = True
+        return
+
+    def disable(self):
+        self.enabled = False
+        return
+
+    def reset(self):
+        with self.lock:
+            self.stats = {}
+        return
+
+    def instrument(self, dao, classname, dialect):
+        """
+        _instrument_
+
+        Replace the execute method of the DAO instance with a timed version.
+        """
+        key = "%s/%s" % (classname, dialect)
+        execute = dao.execute
+
+        def timedExecute(*args, **kwargs):
+            rowStack = self._rowStack()
+            rowStack.append(0)
+            startTime = time.time()
+            try:
+                return execute(*args, **kwargs)
+            finally:
+                self.record(key, time.time() - startTime, rowStack.pop())
+
+        dao.execute = timedExecute
+        return dao
+
+    def _rowStack(self):
+        rowStack = getattr(self.local, "rows", None)
+        if rowStack == None:
+            rowStack = self.local.rows = []
+        return rowStack
+
+    def addRows(self, results):
+        """
+        _addRows_
+
+        Called by processData, count the rows of the results against the DAO
+        being executed in this thread, if any.  Results that haven't been
+        read yet (cursors) are only counted when the driver sets rowcount.
+        """
+        rowStack = getattr(self.local, "rows", None)
+        if not rowStack:
+            return
+
+        nRows = 0
+        for result in results:
+            data = getattr(result, "data", None)
+            if isinstance(data, list):
+                nRows += len(data)
+            elif getattr(result, "rowcount", -1) > 0:
+                nRows += result.rowcount
+        rowStack[-1] += nRows
+        return
+
+    def record(self, key, seconds, rows = 0):
+        with self.lock:
+            if key not in self.stats:
+                self.stats[key] = {"count": 0, "total": 0.0, "max": 0.0, "rows": 0,
+                                   "samples": deque(maxlen = self.maxSamples)}
+            entry = self.stats[key]
+            entry["count"] += 1
+            entry["total"] += seconds
+            entry["rows"] += rows
+            entry["max"] = max(entry["max"], seconds)
+            entry["samples"].append(seconds)
+        return
+
+    def summary(self):
+        """
+        _summary_
+
+        Return a dictionary keyed by "classname/dialect" with the count, the
+        total, average, 50th/90th/99th percentile and max latency in seconds
+        and the number of rows.
+        """
+        summary = {}
+        with self.lock:
+            for key, entry in self.stats.items():
+                samples = sorted(entry["samples"])
+                summary[key] = {"count": entry["count"],
+                                "total": entry["total"],
+                                "average": entry["total"] / entry["count"],
+                                "p50": percentile(samples, 50),
+                                "p90": percentile(samples, 90),
+                                "p99": percentile(samples, 99),
+                                "max": entry["max"],
+                                "rows": entry["rows"]}
+        return summary
+
+    def logSummary(self, logger = logging):
+        """
+        _logSummary_
+
+        Write the stats to the log, the most time consuming DAOs first.
+        """
+        summary = self.summary()
+        logger.info("DAO stats for %i DAOs:", len(summary))
+        for key in sorted(summary, key = lambda x: summary[x]["total"], reverse = True):
+            logger.info("  %s: %s", key,
+                        ", ".join(["%s=%s" % (x, summary[key][x]) for x in
+                                   ["count", "total", "average", "p50", "p90", "p99", "max", "rows"]]))
+        return
+
+    def dumpIfDue(self, logger = logging):
+        """
+        _dumpIfDue_
+
+        Log the stats if dumpInterval seconds passed since the last dump.
+        """
+        if not self.enabled or self.dumpInterval <= 0:
+            return
+        with self.lock:
+            if time.time() - self.lastDump < self.dumpInterval:
+                return
+            self.lastDump = time.time()
+        self.logSummary(logger)
+        return
+
+
+def percentile(samples, pct):
+    """
+    _percentile_
+
+    Nearest rank percentile of an already sorted list.
+    """
+    if not samples:
+        return 0.0
+    index = int(math.ceil(pct / 100.0 * len(samples))) - 1
+    return samples[max(0, min(index, len(samples) - 1))]
+
+# the instance shared by the whole process
+daoStats = DAOStats()
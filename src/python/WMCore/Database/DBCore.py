@@ -10,8 +10,10 @@ Core Database APIs
 
 
 from WMCore.DataStructs.WMObject import WMObject
-from WMCore.Database.ResultSet import ResultSet
+from WMCore.Database.DAOStats import daoStats
+from WMCore.Database.ResultSet import ResultSet, StreamingResultSet
 from copy import copy
+import time
 import WMCore.WMLogging
 
 class DBInterface(WMObject):
@@ -32,11 +34,12 @@ class DBInterface(WMObject):
     logger = None
     engine = None
 
-    def __init__(self, logger, engine):
+    def __init__(self, logger, engine, maxBindsPerQuery = 500):
         self.logger = logger
         self.logger.info ("Instantiating base WM DBInterface")
         self.engine = engine
-        self.maxBindsPerQuery = 500
+        self.maxBindsPerQuery = maxBindsPerQuery
+        self.streamBatchSize = 1000
 
     def buildbinds(self, sequence, thename, therest=[{}]):
         """
@@ -52,6 +55,16 @@ class DBInterface(WMObject):
                 binds.append(thebind)
         return binds
 
+    def chunkbinds(self, binds):
+        """
+        _chunkbinds_
+
+        Split a list of binds in chunks of at most maxBindsPerQuery binds,
+        each chunk is handed to the driver in a single executemany call.
+        """
+        for start in range(0, len(binds), self.maxBindsPerQuery):
+            yield binds[start:start + self.maxBindsPerQuery]
+
     def executebinds(self, s=None, b=None, connection=None,
                      returnCursor=False):
         """
@@ -122,13 +135,20 @@ class DBInterface(WMObject):
 
 
     def processData(self, sqlstmt, binds={}, conn=None,
-                    transaction=False, returnCursor=False):
+                    transaction=False, returnCursor=False, stream=False):
         """
         set conn if you already have an active connection to reuse
         set transaction = True if you already have an active transaction
+        set stream = True to get back StreamingResultSet objects that read
+        rows lazily in batches of self.streamBatchSize instead of ResultSets
+        holding every row in memory.  If no conn is passed in the connection
+        is released once the last result set has been read or closed.
 
         """
         connection = None
+        streamConnection = None
+        if stream:
+            returnCursor = True
         try:
             if not conn:
                 connection = self.connection()
@@ -154,17 +174,17 @@ class DBInterface(WMObject):
                     trans.commit()
             elif len(binds) > len(sqlstmt) and len(sqlstmt) == 1:
                 #Run single SQL statement for a list of binds - use execute_many()
+                #in chunks of maxBindsPerQuery to keep the bind arrays bounded
                 if not transaction:
                     trans = connection.begin()
-                while(len(binds) > self.maxBindsPerQuery):
-                    result.extend(self.processData(sqlstmt, binds[:self.maxBindsPerQuery],
-                                                   conn=connection, transaction=True,
-                                                   returnCursor=returnCursor))
-                    binds = binds[self.maxBindsPerQuery:]
 
-                for i in sqlstmt:
-                    result.extend(self.executemanybinds(i, binds, connection=connection,
+                nBinds = len(binds)
+                for nChunk, chunk in enumerate(self.chunkbinds(binds)):
+                    startTime = time.time()
+                    result.extend(self.executemanybinds(sqlstmt[0], chunk, connection=connection,
                                                         returnCursor=returnCursor))
+                    WMCore.WMLogging.sqldebug('DBInterface.processData chunk %i (%i of %i binds) took %.3f seconds' %
+                                              (nChunk, len(chunk), nBinds, time.time() - startTime))
                 if not transaction:
                     trans.commit()
             elif len(binds) == len(sqlstmt):
@@ -198,7 +218,18 @@ class DBInterface(WMObject):
                                            (type(sqlstmt), type(binds), type(connection), type(transaction)))
                 raise Exception("""DBInterface.processData Nothing executed, problem with your arguments
                 Probably mismatched sizes for sql (%i) and binds (%i)""" % (len(sqlstmt), len(binds)))
+
+            if daoStats.enabled:
+                daoStats.addRows(result)
+
+            if stream:
+                result = [StreamingResultSet(r, self.streamBatchSize) for r in result]
+                openResults = [r for r in result if not r.closed]
+                if not conn and len(openResults) > 0:
+                    # hand the connection over to the last open result set
+                    streamConnection = connection
+                    openResults[-1].connection = connection
         finally:
-            if not conn and connection != None:
+            if not conn and connection != None and connection is not streamConnection:
                 connection.close() # Return connection to the pool
         return result
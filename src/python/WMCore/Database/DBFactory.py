@@ -1,12 +1,30 @@
 
 import threading
+import time
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy import __version__ as sqlalchemy_version
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 from WMCore.Database.Dialects import MySQLDialect
 from WMCore.Database.Dialects import SQLiteDialect
 from WMCore.Database.Dialects import OracleDialect
 
+def _sqliteConnect(dbapiConnection, connectionRecord):
+    """
+    _sqliteConnect_
+
+    Prepare a new SQLite connection for the MySQL flavoured DAOs: enforce
+    foreign keys (and their ON DELETE CASCADE clauses) and provide the
+    unix_timestamp() function.
+    """
+    dbapiConnection.create_function("unix_timestamp", 0,
+                                    lambda: int(time.time()))
+    cursor = dbapiConnection.cursor()
+    cursor.execute("PRAGMA foreign_keys = ON")
+    cursor.close()
+    return
+
 class DBFactory(object):
 
     # class variable
@@ -22,6 +40,9 @@ class DBFactory(object):
             self._defaultEngineParams.update(options['engine_parameters'])
             del options['engine_parameters']
 
+        # number of binds handed to the driver in one executemany call
+        self.maxBindsPerQuery = options.pop('max_binds_per_query', 500)
+
         if dburl:
             self.dburl = dburl
         else:
@@ -88,9 +109,25 @@ class DBFactory(object):
 
         else:
             if self.dburl.split(':')[0].lower() == "sqlite":
+                # Keep the SQLite connections open when they go back to the
+                # pool (the default NullPool of file databases closes them),
+                # the JobFactory reads its result proxies across commits.
+                # An in-memory database lives in its connection, so all the
+                # threads share a single one, and its transaction: returning
+                # it to the pool must not roll back the work of the others.
+                engineParams = dict(self._defaultEngineParams)
+                if make_url(self.dburl).database in (None, "", ":memory:"):
+                    engineParams["poolclass"] = StaticPool
+                    engineParams["pool_reset_on_return"] = None
+                else:
+                    engineParams["poolclass"] = SingletonThreadPool
+                    engineParams.setdefault("pool_size", 20)
+                sqliteOptions = {"check_same_thread": False}
+                sqliteOptions.update(options)
                 self.engine = create_engine(self.dburl,
-                                            connect_args = options,
-                                            **self._defaultEngineParams)
+                                            connect_args = sqliteOptions,
+                                            **engineParams)
+                event.listen(self.engine, "connect", _sqliteConnect)
             else:
                 self.engine = self._engineMap.setdefault(self.dburl,
                                              create_engine(self.dburl,
@@ -114,7 +151,8 @@ class DBFactory(object):
             else:
                 from WMCore.Database.DBCore import DBInterface
             # we instantiate within the lock so we can safely return the local instance.
-            dbInterface =  DBInterface(self.logger, self.engine)
+            dbInterface =  DBInterface(self.logger, self.engine,
+                                       maxBindsPerQuery = self.maxBindsPerQuery)
 
         else:
             dbInterface =  None
@@ -42,15 +42,7 @@ class DBFormatter(WMObject):
         """
         Some standard formatting, put all records into a list
         """
-        out = []
-        for r in result:
-            for i in r.fetchall():
-                row = []
-                for j in i:
-                    row.append(j)
-                out.append(row)
-            r.close()
-        return out
+        return list(self.formatIter(result))
 
     def formatOne(self, result):
         """
@@ -66,26 +58,45 @@ class DBFormatter(WMObject):
         """
         Returns an array of dictionaries representing the results
         """
-        dictOut = []
+        return list(self.formatDictIter(result))
+
+    def formatIter(self, result):
+        """
+        _formatIter_
+
+        Generator version of format, yields one list per record.  When used
+        with StreamingResultSets (processData(..., stream = True)) the rows
+        are only read from the cursor as they are consumed.
+        """
         for r in result:
-            descriptions = r.keys
-            for i in r.fetchall():
+            for i in r:
+                yield list(i)
+            r.close()
+
+    def formatDictIter(self, result):
+        """
+        _formatDictIter_
+
+        Generator version of formatDict, yields one dictionary per record.
+        The column names are only lowercased once per cursor.
+        """
+        for r in result:
+            # WARNING: Oracle returns table names in CAP!
+            descriptions = [str(x.lower()) for x in r.keys]
+            for i in r:
                 #WARNING: this can generate errors for some stupid reason
                 # in both oracle and mysql.
                 entry = {}
-                for index in xrange(0,len(descriptions)):
-                    # WARNING: Oracle returns table names in CAP!
+                for index, key in enumerate(descriptions):
                     if type(i[index]) == unicode:
-                        entry[str(descriptions[index].lower())] = str(i[index])
+                        entry[key] = str(i[index])
                     else:
-                        entry[str(descriptions[index].lower())] = i[index]
+                        entry[key] = i[index]
 
-                dictOut.append(entry)
+                yield entry
 
             r.close()
 
-        return dictOut
-
     def formatOneDict(self, result):
         """
         Return a dictionary representing the first record
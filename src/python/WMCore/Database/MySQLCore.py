@@ -5,38 +5,62 @@ _MySQLCore_
 Handle bind variable parsing for MySQL.
 """
 
-import copy
-
 from WMCore.Database.DBCore import DBInterface
 from WMCore.Database.ResultSet import ResultSet
 
-def bindVarCompare(a, b):
-    """
-    _bindVarCompare_
+# (sql, bind names) -> (MySQL sql, bind names in positional order)
+_substituteCache = {}
+_maxSubstituteCacheSize = 10000
 
-    Bind variables are represented as a tuple with the first element being the
-    variable name and the second being it's position in the query.  We sort on
-    the position in the query.
-    """
-    if a[1] > b[1]:
-        return 1
-    elif a[1] == b[1]:
-        return 0
-    else:
-        return -1
-
-def stringLengthCompare(a, b):
+def compileBinds(origSQL, bindVarNames):
     """
-    _stringLengthCompare_
+    _compileBinds_
 
-    Sort comparison function to sort strings by length from longest to shortest.
+    Replace the named binds in the SQL by %s and work out in which order
+    the bind values have to be passed in.  Returns a tuple with the updated
+    SQL and the bind names in positional order.
     """
-    if len(a) > len(b):
-        return -1
-    if len(a) == len(b):
-        return 0
-    else:
-        return 1
+    bindVarPositionList = []
+    updatedSQL = origSQL
+    lowerSQL = origSQL.lower()
+
+    # We process bind variables from longest to shortest to avoid a shorter
+    # bind variable matching a longer one.  For example if we have two bind
+    # variables: RELEASE_VERSION and RELEASE_VERSION_ID the former will
+    # match against the latter, causing problems.  We'll sort the variable
+    # names by length to guard against this.
+    bindVarNames = sorted(bindVarNames, key = len, reverse = True)
+
+    bindPositions = {}
+    for bindName in bindVarNames:
+        searchPosition = 0
+
+        while True:
+            bindPosition = lowerSQL.find(":%s" % bindName.lower(),
+                                         searchPosition)
+            if bindPosition == -1:
+                break
+
+            if bindPosition not in bindPositions:
+                bindPositions[bindPosition] = 0
+                bindVarPositionList.append((bindName, bindPosition))
+            searchPosition = bindPosition + 1
+
+        searchPosition = 0
+        while True:
+            bindPosition = updatedSQL.lower().find(":%s" % bindName.lower(),
+                                                   searchPosition)
+
+            if bindPosition == -1:
+                break
+
+            left = updatedSQL[0:bindPosition]
+            right = updatedSQL[bindPosition + len(bindName) + 1:]
+            updatedSQL = left + "%s" + right
+
+    bindVarPositionList.sort(key = lambda x: x[1])
+
+    return (updatedSQL, tuple([x[0] for x in bindVarPositionList]))
 
 class MySQLInterface(DBInterface):
     def substitute(self, origSQL, origBindsList):
@@ -65,53 +89,19 @@ class MySQLInterface(DBInterface):
         origBindsList = self.makelist(origBindsList)
         origBind = origBindsList[0]
 
-        bindVarPositionList = []
-        updatedSQL = copy.copy(origSQL)
-
-        # We process bind variables from longest to shortest to avoid a shorter
-        # bind variable matching a longer one.  For example if we have two bind
-        # variables: RELEASE_VERSION and RELEASE_VERSION_ID the former will
-        # match against the latter, causing problems.  We'll sort the variable
-        # names by length to guard against this.
-        bindVarNames = origBind.keys()
-        bindVarNames.sort(stringLengthCompare)
-
-        bindPositions = {}
-        for bindName in bindVarNames:
-            searchPosition = 0
-
-            while True:
-                bindPosition = origSQL.lower().find(":%s" % bindName.lower(),
-                                                    searchPosition)
-                if bindPosition == -1:
-                    break
-
-                if bindPosition not in bindPositions:
-                    bindPositions[bindPosition] = 0
-                    bindVarPositionList.append((bindName, bindPosition))
-                searchPosition = bindPosition + 1
-
-            searchPosition = 0
-            while True:
-                bindPosition = updatedSQL.lower().find(":%s" % bindName.lower(),
-                                                       searchPosition)
-
-                if bindPosition == -1:
-                    break
-
-                left = updatedSQL[0:bindPosition]
-                right = updatedSQL[bindPosition + len(bindName) + 1:]
-                updatedSQL = left + "%s" + right
-
-        bindVarPositionList.sort(bindVarCompare)
-
-        mySQLBindVarsList = []
-        for origBind in origBindsList:
-            mySQLBindVars = []
-            for bindVarPosition in bindVarPositionList:
-                mySQLBindVars.append(origBind[bindVarPosition[0]])
-
-            mySQLBindVarsList.append(tuple(mySQLBindVars))
+        # The rewritten SQL only depends on the SQL and on the bind names, so
+        # it is only worked out once and then kept in _substituteCache.
+        cacheKey = (origSQL, frozenset(origBind.keys()))
+        compiled = _substituteCache.get(cacheKey, None)
+        if compiled == None:
+            compiled = compileBinds(origSQL, origBind.keys())
+            if len(_substituteCache) >= _maxSubstituteCacheSize:
+                _substituteCache.clear()
+            _substituteCache[cacheKey] = compiled
+
+        (updatedSQL, bindVarNames) = compiled
+        mySQLBindVarsList = [tuple([origBind[x] for x in bindVarNames])
+                             for origBind in origBindsList]
 
         return (updatedSQL, mySQLBindVarsList)
 
@@ -28,6 +28,9 @@ class ResultSet:
     def fetchall(self):
         return self.data
 
+    def __iter__(self):
+        return iter(self.data)
+
     def add(self, resultproxy):
 
         myThread = threading.currentThread()
@@ -41,3 +44,76 @@ class ResultSet:
                 self.data.append(r)
 
         return
+
+
+class StreamingResultSet(object):
+    """
+    _StreamingResultSet_
+
+    Wrap an open SQLAlchemy result proxy and hand out its rows lazily, in
+    fetchmany batches, instead of copying the whole result into memory like
+    ResultSet does.  The column names are read once when the object is built.
+
+    If a connection is attached it is returned to the pool when the result
+    set is closed, which happens automatically once all rows have been read.
+    """
+    def __init__(self, resultproxy, batchSize = 1000, connection = None):
+        self.resultproxy = resultproxy
+        self.batchSize = batchSize
+        self.connection = connection
+        self.keys = []
+
+        if not resultproxy.closed and resultproxy.returns_rows:
+            if callable(resultproxy.keys):
+                self.keys.extend(resultproxy.keys())
+            else:
+                self.keys.extend(resultproxy.keys)
+        else:
+            self.close()
+
+    @property
+    def closed(self):
+        return self.resultproxy.closed
+
+    def close(self):
+        if not self.resultproxy.closed:
+            self.resultproxy.close()
+        if self.connection != None:
+            self.connection.close()
+            self.connection = None
+        return
+
+    def fetchmany(self, size = None):
+        """
+        _fetchmany_
+
+        Return the next batch of rows, closing the result set when there are
+        no rows left.
+        """
+        if self.resultproxy.closed:
+            return []
+
+        rows = self.resultproxy.fetchmany(size or self.batchSize)
+        if not rows:
+            self.close()
+        return rows
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        if len(rows) > 0:
+            return rows[0]
+        return []
+
+    def fetchall(self):
+        return list(self)
+
+    def __iter__(self):
+        try:
+            while True:
+                rows = self.fetchmany()
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+        finally:
+            self.close()
@@ -0,0 +1,40 @@
+"""
+_Destroy_
+
+Implementation of Destroy for SQLite
+
+"""
+
+from WMCore.Database.DBFormatter import DBFormatter
+
+class Destroy(DBFormatter):
+
+    def execute(self, subscription = None, conn = None, transaction = False):
+
+        # PRAGMA settings are per connection, so hold one for the whole run
+        ownConn = conn == None
+        if ownConn:
+            conn = self.dbi.connection()
+
+        sql = """SELECT name FROM sqlite_master
+                 WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"""
+
+        results = self.dbi.processData(sql, {}, conn = conn,
+                                       transaction = transaction)
+        tables = [row[0] for row in self.format(results)]
+
+        # Foreign keys are switched off while dropping so the tables can go
+        # in any order; this only works outside of a transaction.
+        self.dbi.processData("PRAGMA foreign_keys = OFF", {}, conn = conn,
+                             transaction = transaction)
+        try:
+            for table in tables:
+                self.dbi.processData("DROP TABLE %s" % table, {}, conn = conn,
+                                     transaction = transaction)
+        finally:
+            self.dbi.processData("PRAGMA foreign_keys = ON", {}, conn = conn,
+                                 transaction = transaction)
+            if ownConn:
+                conn.close()
+
+        return
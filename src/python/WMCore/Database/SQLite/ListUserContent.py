@@ -0,0 +1,20 @@
+"""
+_ListUserContent_
+
+Implementation of ListUserContent for SQLite
+
+"""
+
+from WMCore.Database.DBFormatter import DBFormatter
+
+class ListUserContent(DBFormatter):
+
+    def execute(self, subscription = None, conn = None, transaction = False):
+
+        sql = """SELECT name AS table_name FROM sqlite_master
+                 WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"""
+
+        result = self.dbi.processData(sql, {}, conn = conn,
+                                      transaction = transaction)
+
+        return self.formatDict(result)
@@ -0,0 +1,9 @@
+#!/usr/bin/env python
+"""
+_Database_
+
+Core Database interface libraries for workload management
+
+
+"""
+__all__ = []
@@ -17,9 +17,10 @@ import operator
 import traceback
 import math
 
+from WMCore.DataStructs.LumiList    import LumiMaskIndex
 from WMCore.DataStructs.Run         import Run
 from WMCore.JobSplitting.JobFactory import JobFactory
-from WMCore.JobSplitting.LumiBased  import isGoodLumi, isGoodRun, LumiChecker
+from WMCore.JobSplitting.LumiBased  import LumiChecker
 from WMCore.WMBS.File               import File
 from WMCore.WMSpec.WMTask           import buildLumiMask
 
@@ -96,6 +97,9 @@ class EventAwareLumiBased(JobFactory):
                     logging.error(msg)
                     return
 
+        # run numbers of the mask are strings, build the lookup index once
+        goodRunIndex = LumiMaskIndex(goodRunList, runType=int)
+
         lDict = self.sortByLocation()
         locationDict = {}
 
@@ -192,7 +196,7 @@ class EventAwareLumiBased(JobFactory):
                     lumisPerJob = max(lumisInJob + lumisAllowed, 1)
 
                 for run in f['runs']:
-                    if not isGoodRun(goodRunList = goodRunList, run = run.run):
+                    if not goodRunIndex.hasRun(run.run):
                         # Then skip this one
                         continue
                     if len(runWhitelist) > 0 and not run.run in runWhitelist:
@@ -206,7 +210,7 @@ class EventAwareLumiBased(JobFactory):
 
                     # Now loop over the lumis
                     for lumi in run:
-                        if (not isGoodLumi(goodRunList, run = run.run, lumi = lumi) or
+                        if (not goodRunIndex.contains(run.run, lumi) or
                             self.lumiChecker.isSplitLumi(run.run, lumi, f)):
                             # Kill the chain of good lumis
                             # Skip this lumi
@@ -6,6 +6,7 @@ _JobFactory_
 
 import logging
 import threading
+import time
 
 from WMCore.DataStructs.WMObject import WMObject
 from WMCore.Services.UUID        import makeUUID
@@ -41,6 +42,9 @@ class JobFactory(WMObject):
         self.proxies       = []
         self.grabByProxy   = False
         self.daoFactory    = None
+        # seconds spent per phase during the last call: creating jobs, sorting
+        # the available files, committing the job groups and acquiring their
+        # files, and opening/closing job groups
         self.timing = {'jobInstance': 0, 'sortByLocation': 0, 'acquireFiles': 0, 'jobGroup': 0}
 
         if package == "WMCore.WMBS":
@@ -52,7 +56,7 @@ class JobFactory(WMObject):
                                          dbinterface = myThread.dbi)
             self.getParentInfoAction  = self.daoFactory(classname = "Files.GetParentInfo")
 
-            self.pnn_to_psn = self.daoFactory(classname = "Locations.GetPNNtoPSNMapping").execute()
+            self.pnn_to_psn = self.daoFactory.cached(classname = "Locations.GetPNNtoPSNMapping").execute()
 
         return
 
@@ -75,6 +79,7 @@ class JobFactory(WMObject):
 
         # Every time we restart, re-zero the jobs
         self.nJobs = 0
+        self.timing = dict.fromkeys(self.timing, 0)
 
         # Create a new name
         self.baseUUID = makeUUID()
@@ -92,7 +97,9 @@ class JobFactory(WMObject):
 
         self.limit = int(kwargs.get("file_load_limit", self.limit))
         self.algorithm(*args, **kwargs)
+        start = time.time()
         self.commit()
+        self.timing['acquireFiles'] += time.time() - start
 
         map(lambda x: x.finish(), self.generators)
         return self.jobGroups
@@ -114,14 +121,17 @@ class JobFactory(WMObject):
         Return and new JobGroup
         """
         self.appendJobGroup()
+        start = time.time()
         self.currentGroup = self.groupInstance(subscription=self.subscription)
         map(lambda x: x.startGroup(self.currentGroup), self.generators)
+        self.timing['jobGroup'] += time.time() - start
         return
 
     def newJob(self, name=None, files=None, failedJob=False, failedReason=None):
         """
         Instantiate a new Job onject, apply all the generators to it
         """
+        start = time.time()
         self.currentJob = self.jobInstance(name, files)
         self.currentJob["task"] = self.subscription.taskName()
         self.currentJob["workflow"] = self.subscription.workflowName()
@@ -146,6 +156,7 @@ class JobFactory(WMObject):
         for gen in self.generators:
             gen(self.currentJob)
         self.currentGroup.add(self.currentJob)
+        self.timing['jobInstance'] += time.time() - start
         return
 
     def appendJobGroup(self):
@@ -153,12 +164,13 @@ class JobFactory(WMObject):
         Append jobGroup to jobGroup list
 
         """
-
+        start = time.time()
         if self.currentGroup:
             map(lambda x: x.finishGroup(self.currentGroup), self.generators)
         if self.currentGroup:
             self.jobGroups.append(self.currentGroup)
             self.currentGroup = None
+        self.timing['jobGroup'] += time.time() - start
 
         return
 
@@ -228,6 +240,7 @@ class JobFactory(WMObject):
         as being present in the same place (use key "AAA" location).
         """
 
+        start = time.time()
         fileDict = {}
 
         if self.grabByProxy:
@@ -253,6 +266,7 @@ class JobFactory(WMObject):
             else:
                 fileDict[locSet] = [fileInfo]
 
+        self.timing['sortByLocation'] += time.time() - start
         return fileDict
 
     def getJobName(self, length = None):
@@ -15,6 +15,7 @@ import logging
 import threading
 import traceback
 
+from WMCore.DataStructs.LumiList import LumiMaskIndex
 from WMCore.DataStructs.Run import Run
 
 from WMCore.JobSplitting.JobFactory import JobFactory
@@ -203,6 +204,9 @@ class LumiBased(JobFactory):
                     logging.error(msg)
                     return
 
+        # run numbers of the mask are strings, build the lookup index once
+        goodRunIndex = LumiMaskIndex(goodRunList, runType=int)
+
         lDict = self.sortByLocation()
         locationDict = {}
 
@@ -272,7 +276,7 @@ class LumiBased(JobFactory):
                     stopJob = True
 
                 for run in f['runs']:
-                    if not isGoodRun(goodRunList = goodRunList, run = run.run):
+                    if not goodRunIndex.hasRun(run.run):
                         # Then skip this one
                         continue
                     if len(runWhitelist) > 0 and not run.run in runWhitelist:
@@ -286,7 +290,7 @@ class LumiBased(JobFactory):
 
                     # Now loop over the lumis
                     for lumi in run:
-                        if (not isGoodLumi(goodRunList, run = run.run, lumi = lumi)
+                        if (not goodRunIndex.contains(run.run, lumi)
                                 or self.lumiChecker.isSplitLumi(run.run, lumi, f)): # splitLumi checks if the lumi is split across jobs
                             # Kill the chain of good lumis
                             # Skip this lumi
@@ -6,6 +6,7 @@ Library from manipulating and querying the resource control database.
 """
 
 from WMCore.DAOFactory import DAOFactory
+from WMCore.Database.DAOCache import invalidateDAOCache
 from WMCore.WMConnectionBase import WMConnectionBase
 from WMCore.WMException import WMException
 from WMCore.BossAir.BossAirAPI import BossAirAPI
@@ -37,13 +38,18 @@ class ResourceControl(WMConnectionBase):
         Insert a site into WMBS.  The site must be inserted before any
         thresholds can be added.
         """
+        existingTransaction = self.beginTransaction()
         insertAction = self.wmbsDAOFactory(classname = "Locations.New")
         insertAction.execute(siteName = siteName, pendingSlots = pendingSlots,
                              runningSlots = runningSlots,
                              pnn = pnn, ceName = ceName,
                              plugin = plugin, cmsName = cmsName,
                              conn = self.getDBConn(),
-                             transaction = self.existingTransaction())
+                             transaction = existingTransaction)
+        self.commitTransaction(existingTransaction)
+
+        # the new site is part of the cached WMBS Locations results
+        invalidateDAOCache(package = "WMCore.WMBS")
         return
 
     def changeSiteState(self, siteName, state):
@@ -66,11 +72,15 @@ class ResourceControl(WMConnectionBase):
             bossAir.kill(jobtokill, errorCode=ercode)
 
         # only now that jobs were updated by the plugin, we flip the site state
+        existingTransaction = self.beginTransaction()
         setStateAction = self.wmbsDAOFactory(classname = "Locations.SetState")
         setStateAction.execute(siteName = siteName, state = state,
                                conn = self.getDBConn(),
-                               transaction = self.existingTransaction())
-        
+                               transaction = existingTransaction)
+        self.commitTransaction(existingTransaction)
+
+        # the site state is part of the cached WMBS Locations results
+        invalidateDAOCache(package = "WMCore.WMBS")
         return
 
     def listCurrentSites(self):
@@ -231,17 +241,23 @@ class ResourceControl(WMConnectionBase):
 
         Set the number of running and/or pending job slots for the given site.
         """
+        existingTransaction = self.beginTransaction()
         if pendingJobSlots != None:
             pendingSlotsAction = self.daofactory(classname = "SetPendingJobSlotsForSite")
             pendingSlotsAction.execute(siteName, pendingJobSlots,
                                        conn = self.getDBConn(),
-                                       transaction = self.existingTransaction())
+                                       transaction = existingTransaction)
 
         if runningJobSlots != None:
             runningSlotsAction = self.daofactory(classname = "SetRunningJobSlotsForSite")
             runningSlotsAction.execute(siteName, runningJobSlots,
                                        conn = self.getDBConn(),
-                                       transaction = self.existingTransaction())
+                                       transaction = existingTransaction)
+        self.commitTransaction(existingTransaction)
+
+        # the slots are part of the cached WMBS Locations results
+        invalidateDAOCache(package = "WMCore.WMBS")
+        return
 
     def thresholdBySite(self, siteName):
         """
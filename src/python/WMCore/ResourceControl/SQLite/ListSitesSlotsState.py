@@ -0,0 +1,11 @@
+"""
+_ListSitesSlotsState_
+
+SQLite implementation of ListSitesSlotsState
+"""
+
+from WMCore.ResourceControl.MySQL.ListSitesSlotsState \
+     import ListSitesSlotsState as MySQLListSitesSlotsState
+
+class ListSitesSlotsState(MySQLListSitesSlotsState):
+    pass
@@ -0,0 +1,11 @@
+"""
+_ListThresholds_
+
+SQLite implementation of ListThresholds
+"""
+
+from WMCore.ResourceControl.MySQL.ListThresholds \
+     import ListThresholds as MySQLListThresholds
+
+class ListThresholds(MySQLListThresholds):
+    pass
@@ -0,0 +1,11 @@
+"""
+_SetPendingJobSlotsForSite_
+
+SQLite implementation of SetPendingJobSlotsForSite
+"""
+
+from WMCore.ResourceControl.MySQL.SetPendingJobSlotsForSite \
+     import SetPendingJobSlotsForSite as MySQLSetPendingJobSlotsForSite
+
+class SetPendingJobSlotsForSite(MySQLSetPendingJobSlotsForSite):
+    pass
@@ -0,0 +1,11 @@
+"""
+_SetRunningJobSlotsForSite_
+
+SQLite implementation of SetRunningJobSlotsForSite
+"""
+
+from WMCore.ResourceControl.MySQL.SetRunningJobSlotsForSite \
+     import SetRunningJobSlotsForSite as MySQLSetRunningJobSlotsForSite
+
+class SetRunningJobSlotsForSite(MySQLSetRunningJobSlotsForSite):
+    pass
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+"""
+_ConnectionPool_
+
+A process wide, thread safe pool of idle HTTP connection objects (httplib2
+Http instances or pycurl handles) so that keep-alive connections survive
+from one request, and one Requests instance, to the next.
+
+A connection is checked out with acquire and handed back with release once
+the request using it succeeded. Connections that failed are simply not
+released. Idle connections are closed once they have not been used for
+idleTimeout seconds, or when more than maxSize are held.
+"""
+
+import threading
+import time
+
+
+class ConnectionPool(object):
+    """
+    Idle connections keyed by whatever identifies the remote end they are
+    bound to, e.g. (library, scheme, host, port, key, cert).
+    """
+
+    def __init__(self, maxSize=50, idleTimeout=300):
+        self.maxSize = maxSize
+        self.idleTimeout = idleTimeout
+        self.lock = threading.Lock()
+        # key -> list of [lastUsed, connection, closer], most recent last
+        self.idle = {}
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    def acquire(self, key, factory):
+        """
+        Return an idle connection for key, or a new one made by factory().
+        """
+        connection = None
+        with self.lock:
+            expired = self._evictExpired(time.time())
+            entries = self.idle.get(key)
+            if entries:
+                connection = entries.pop()[1]
+                if not entries:
+                    del self.idle[key]
+                self.reused += 1
+            else:
+                self.created += 1
+        self._close(expired)
+        if connection is None:
+            connection = factory()
+        return connection
+
+    def release(self, key, connection, closer=None):
+        """
+        Hand a healthy connection back to the pool. closer(connection) is
+        called when the connection is eventually evicted.
+        """
+        toClose = []
+        with self.lock:
+            now = time.time()
+            self.idle.setdefault(key, []).append([now, connection, closer])
+            toClose.extend(self._evictExpired(now))
+            toClose.extend(self._evictOverflow())
+        self._close(toClose)
+        return
+
+    def clear(self):
+        """
+        Close and forget all idle connections.
+        """
+        with self.lock:
+            toClose = [entry for entries in self.idle.values() for entry in entries]
+            self.evicted += len(toClose)
+            self.idle = {}
+        self._close(toClose)
+        return
+
+    def stats(self):
+        """
+        Return the pool counters and the ratio of acquires served by reuse.
+        """
+        with self.lock:
+            acquired = self.created + self.reused
+            return {'created': self.created, 'reused': self.reused,
+                    'evicted': self.evicted,
+                    'idle': sum(len(x) for x in self.idle.values()),
+                    'reuse_ratio': float(self.reused) / acquired if acquired else 0.0}
+
+    def _evictExpired(self, now):
+        """
+        Remove the entries idle for longer than idleTimeout, return them.
+        """
+        expired = []
+        for key in self.idle.keys():
+            entries = self.idle[key]
+            while entries and now - entries[0][0] > self.idleTimeout:
+                expired.append(entries.pop(0))
+            if not entries:
+                del self.idle[key]
+        self.evicted += len(expired)
+        return expired
+
+    def _evictOverflow(self):
+        """
+        Remove the least recently used entries beyond maxSize, return them.
+        """
+        entries = sorted([(entry[0], key) for key in self.idle for entry in self.idle[key]])
+        overflow = []
+        for _, key in entries[:max(len(entries) - self.maxSize, 0)]:
+            overflow.append(self.idle[key].pop(0))
+            if not self.idle[key]:
+                del self.idle[key]
+        self.evicted += len(overflow)
+        return overflow
+
+    def _close(self, entries):
+        """
+        Close evicted connections outside of the lock.
+        """
+        for _, connection, closer in entries:
+            if closer:
+                try:
+                    closer(connection)
+                except Exception:
+                    pass
+        return
+
+
+_connectionPool = ConnectionPool()
+
+
+def getConnectionPool():
+    """
+    Return the connection pool shared by all Requests in this process.
+    """
+    return _connectionPool
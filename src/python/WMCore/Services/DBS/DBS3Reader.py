@@ -5,6 +5,7 @@ _DBSReader_
 Readonly DBS Interface
 
 """
+import Queue
 import time
 from collections import defaultdict
 
@@ -12,6 +13,7 @@ from dbs.apis.dbsClient import DbsApi
 from dbs.exceptions.dbsClientException import dbsClientException
 
 from RestClient.ErrorHandling.RestClientExceptions import HTTPError
+from Utils.Concurrency import parallelMap
 from Utils.IterTools import grouper
 from WMCore.Services.DBS.DBSErrors import DBSReaderError, formatEx3
 from WMCore.Services.PhEDEx.PhEDEx import PhEDEx
@@ -51,7 +53,7 @@ class DBS3Reader(object):
     # cache all the datatiers known by DBS
     _datatiers = {}
 
-    def __init__(self, url, **contact):
+    def __init__(self, url, maxWorkers=10, **contact):
 
         # instantiate dbs api object
         try:
@@ -62,9 +64,40 @@ class DBS3Reader(object):
             msg += "%s\n" % formatEx3(ex)
             raise DBSReaderError(msg)
 
+        # DbsApi objects are not thread safe, the bulk APIs use one per worker
+        self.contact = contact
+        self.maxWorkers = maxWorkers
+        self._workerApis = Queue.Queue()
+
         # connection to PhEDEx (Use default endpoint url)
         self.phedex = PhEDEx(responseType="json")
 
+    def _callWorkerApi(self, apiName, **kwargs):
+        """
+        Call a DbsApi method from a worker thread, on a DbsApi object
+        not used by any other thread in the meantime.
+        """
+        try:
+            api = self._workerApis.get_nowait()
+        except Queue.Empty:
+            api = DbsApi(self.dbsURL, **self.contact)
+        try:
+            return getattr(api, apiName)(**kwargs)
+        finally:
+            self._workerApis.put(api)
+
+    def _lumiDict(self, lumiLists, lumiDict=None):
+        """
+        Merge DBS file lumi records into a {lfn: [{RunNumber, LumiSectionNumber}]} dict
+        """
+        lumiDict = {} if lumiDict is None else lumiDict
+        for lumisItem in lumiLists:
+            item = {}
+            item["RunNumber"] = lumisItem['run_num']
+            item['LumiSectionNumber'] = lumisItem['lumi_section_num']
+            lumiDict.setdefault(lumisItem['logical_file_name'], []).append(item)
+        return lumiDict
+
     def _getLumiList(self, blockName=None, lfns=None, validFileOnly=1):
         """
         currently only take one lfn but dbs api need be updated
@@ -73,9 +106,12 @@ class DBS3Reader(object):
             if blockName:
                 lumiLists = self.dbs.listFileLumis(block_name=blockName, validFileOnly=validFileOnly)
             elif lfns:
+                # query the LFN chunks in parallel
                 lumiLists = []
-                for slfn in grouper(lfns, 50):
-                    lumiLists.extend(self.dbs.listFileLumiArray(logical_file_name = slfn))
+                for chunk in parallelMap(lambda slfn: self._callWorkerApi('listFileLumiArray',
+                                                                          logical_file_name=slfn),
+                                         grouper(lfns, 50), self.maxWorkers):
+                    lumiLists.extend(chunk)
             else:
                 # shouldn't call this with both blockName and lfns empty
                 # but still returns empty dict for that case
@@ -86,13 +122,29 @@ class DBS3Reader(object):
             msg += "%s\n" % formatEx3(ex)
             raise DBSReaderError(msg)
 
+        return self._lumiDict(lumiLists)
+
+    def getLumiListForBlocks(self, fileBlockNames, validFileOnly=1):
+        """
+        _getLumiListForBlocks_
+
+        Fetch the lumis of the files of all the given blocks in parallel and
+        return them as a single {lfn: [{RunNumber, LumiSectionNumber}]} dict
+        """
+        def blockLumis(blockName):
+            return self._callWorkerApi('listFileLumis', block_name=blockName, validFileOnly=validFileOnly)
+
+        try:
+            lumiLists = parallelMap(blockLumis, fileBlockNames, self.maxWorkers)
+        except dbsClientException as ex:
+            msg = "Error in "
+            msg += "DBSReader.getLumiListForBlocks(%s)\n" % fileBlockNames
+            msg += "%s\n" % formatEx3(ex)
+            raise DBSReaderError(msg)
+
         lumiDict = {}
-        for lumisItem in lumiLists:
-            lumiDict.setdefault(lumisItem['logical_file_name'], [])
-            item = {}
-            item["RunNumber"] = lumisItem['run_num']
-            item['LumiSectionNumber'] = lumisItem['lumi_section_num']
-            lumiDict[lumisItem['logical_file_name']].append(item)
+        for lumiList in lumiLists:
+            self._lumiDict(lumiList, lumiDict)
         return lumiDict
 
     def checkDBSServer(self):
@@ -519,6 +571,39 @@ class DBS3Reader(object):
             result.append(remapDBS3Keys(fileInfo, stringify=True))
         return result
 
+    def listFilesInBlocks(self, fileBlockNames, lumis=True, validFileOnly=1):
+        """
+        _listFilesInBlocks_
+
+        Bulk version of listFilesInBlock: fetch the files (and lumis) of all
+        the given blocks in parallel and return a {blockName: [files]} dict
+        """
+        def blockFiles(blockName):
+            if not self._callWorkerApi('listBlocks', block_name=blockName):
+                msg = "DBSReader.listFilesInBlocks(%s): No matching data"
+                raise DBSReaderError(msg % blockName)
+            files = self._callWorkerApi('listFileArray', block_name=blockName,
+                                        validFileOnly=validFileOnly, detail=True)
+            if lumis:
+                lumiDict = self._lumiDict(self._callWorkerApi('listFileLumis', block_name=blockName,
+                                                              validFileOnly=validFileOnly))
+            result = []
+            for fileInfo in files:
+                if lumis:
+                    fileInfo["LumiList"] = lumiDict[fileInfo['logical_file_name']]
+                result.append(remapDBS3Keys(fileInfo, stringify=True))
+            return result
+
+        try:
+            blockFileLists = parallelMap(blockFiles, fileBlockNames, self.maxWorkers)
+        except dbsClientException as ex:
+            msg = "Error in "
+            msg += "DBSReader.listFilesInBlocks(%s)\n" % fileBlockNames
+            msg += "%s\n" % formatEx3(ex)
+            raise DBSReaderError(msg)
+
+        return dict(zip(fileBlockNames, blockFileLists))
+
     def listFilesInBlockWithParents(self, fileBlockName, lumis=True, validFileOnly=1):
         """
         _listFilesInBlockWithParents_
@@ -627,11 +712,14 @@ class DBS3Reader(object):
         if dbsOnly:
             blocksInfo = {}
             try:
-                for block in fileBlockNames:
-                    blocksInfo.setdefault(block, [])
+                if len(fileBlockNames) == 1:
+                    origins = [self.dbs.listBlockOrigin(block_name=fileBlockNames[0])]
+                else:
+                    origins = parallelMap(lambda block: self._callWorkerApi('listBlockOrigin', block_name=block),
+                                          fileBlockNames, self.maxWorkers)
+                for block, blockOrigins in zip(fileBlockNames, origins):
                     # there should be only one element with a single origin site string ...
-                    for blockInfo in self.dbs.listBlockOrigin(block_name=block):
-                        blocksInfo[block].append(blockInfo['origin_site_name'])
+                    blocksInfo[block] = [x['origin_site_name'] for x in blockOrigins]
             except dbsClientException as ex:
                 msg = "Error in DBS3Reader: self.dbs.listBlockOrigin(block_name=%s)\n" % fileBlockNames
                 msg += "%s\n" % formatEx3(ex)
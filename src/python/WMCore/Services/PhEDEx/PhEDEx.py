@@ -1,10 +1,28 @@
 import json
 import logging
+import threading
+import time
+from collections import OrderedDict
 from xml.dom.minidom import parseString
 
+from Utils.Concurrency import parallelMap
 from WMCore.Services.EmulatorSwitch import emulatorHook
 from WMCore.Services.Service import Service
 
+# (endpoint, block, query options) -> (timestamp, blockreplicas entry or None),
+# oldest first
+_replicaCache = OrderedDict()
+_replicaCacheLock = threading.Lock()
+
+
+def clearReplicaCache():
+    """
+    Drop all the block replica information cached in this process.
+    """
+    with _replicaCacheLock:
+        _replicaCache.clear()
+    return
+
 
 # emulator hook is used to swap the class instance
 # when emulator values are set.
@@ -33,6 +51,16 @@ class PhEDEx(Service):
             dict['endpoint'] = "https://cmsweb.cern.ch/phedex/datasvc/%s/prod/" % self.responseType
 
         dict.setdefault('cacheduration', 0)
+        # blockreplicas block lists are split in requests of at most
+        # maxBlocksPerCall blocks / maxBlockNamesLength characters of block
+        # names, run by up to maxWorkers threads. Per block answers are reused
+        # for replicaCacheTTL seconds (0 disables it), for at most
+        # replicaCacheSize blocks.
+        dict.setdefault('maxBlocksPerCall', 100)
+        dict.setdefault('maxBlockNamesLength', 7000)
+        dict.setdefault('maxWorkers', 5)
+        dict.setdefault('replicaCacheTTL', 60)
+        dict.setdefault('replicaCacheSize', 50000)
         Service.__init__(self, dict)
 
     def _getResult(self, callname, clearCache = False,
@@ -145,7 +173,7 @@ class PhEDEx(Service):
 
         return self._getResult('updaterequest', args = args, verb = "POST")
 
-    def getReplicaInfoForBlocks(self, **kwargs):
+    def getReplicaInfoForBlocks(self, skipFailures = False, **kwargs):
         """
         _blockreplicas_
 
@@ -166,10 +194,84 @@ class PhEDEx(Service):
         custodial      y or n. filter for custodial responsibility.  default is
                 to return either.
         group          group name.  default is to return replicas for any group.
-        """
 
-        callname = 'blockreplicas'
-        return self._getResult(callname, args = kwargs)
+        Long block lists are split into several requests run in parallel and
+        the answers merged. With skipFailures, the blocks of the requests that
+        failed are logged and left out of the answer instead of raising.
+        The replicas of blocks queried by exact name (and no dataset, nor
+        update_since/create_since) are cached for replicaCacheTTL seconds.
+        """
+        blocks = kwargs.get('block')
+        if not blocks or kwargs.get('dataset'):
+            return self._getResult('blockreplicas', args = kwargs)
+        if isinstance(blocks, basestring):
+            blocks = [blocks]
+
+        options = tuple(sorted((k, str(v)) for k, v in kwargs.items() if k != 'block'))
+        cacheKey = lambda block: (self['endpoint'], block, options)
+        blockInfo = OrderedDict()
+        missing = []
+        now = time.time()
+        with _replicaCacheLock:
+            for block in blocks:
+                entry = _replicaCache.get(cacheKey(block))
+                if entry and now - entry[0] < self['replicaCacheTTL']:
+                    blockInfo[block] = entry[1]
+                else:
+                    missing.append(block)
+
+        def query(chunk):
+            try:
+                return self._getResult('blockreplicas', args = dict(kwargs, block = chunk))['phedex']
+            except Exception as ex:
+                if not skipFailures:
+                    raise
+                logging.error("Error getting the replicas of %i blocks from PhEDEx: %s", len(chunk), str(ex))
+                failed.update(chunk)
+                return {'block': []}
+
+        failed = set()
+        responses = parallelMap(query, self._splitBlocks(missing), self['maxWorkers'])
+
+        result = {}
+        for response in responses:
+            for entry in response['block']:
+                blockInfo[entry['name']] = entry
+            result.update((k, v) for k, v in response.items() if k != 'block')
+
+        # answers about changes since a given time are not worth keeping
+        if self['replicaCacheTTL'] and 'update_since' not in kwargs and 'create_since' not in kwargs:
+            with _replicaCacheLock:
+                for block in missing:
+                    if '*' not in block and '%' not in block and block not in failed:
+                        _replicaCache.pop(cacheKey(block), None)
+                        _replicaCache[cacheKey(block)] = (now, blockInfo.get(block))
+                # entries are in time order, drop the expired and the oldest ones
+                while _replicaCache and (len(_replicaCache) > self['replicaCacheSize'] or
+                                         now - next(_replicaCache.itervalues())[0] >= self['replicaCacheTTL']):
+                    _replicaCache.popitem(last = False)
+
+        # wildcards can match blocks other than the ones asked for
+        result['block'] = [x for x in blockInfo.values() if x is not None]
+        return {'phedex': result}
+
+    def _splitBlocks(self, blocks):
+        """
+        Split a block list in chunks of at most maxBlocksPerCall blocks and
+        maxBlockNamesLength characters.
+        """
+        chunks = []
+        chunk, length = [], 0
+        for block in blocks:
+            if chunk and (len(chunk) >= self['maxBlocksPerCall'] or
+                          length + len(block) > self['maxBlockNamesLength']):
+                chunks.append(chunk)
+                chunk, length = [], 0
+            chunk.append(block)
+            length += len(block)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
 
     def getReplicaInfoForFiles(self, **args):
         """
@@ -259,13 +361,22 @@ class PhEDEx(Service):
                 datasetsOnly.add(item)
 
         # Hard to query all at once in one GET call, POST not cacheable
-        # Query each dataset and record relevant dataset or block location
-        for dsname, items in inputs.items():
+        # Query each dataset (in parallel) and record relevant dataset or block location
+        def datasetSubscriptions(dsname):
             try:
                 # query for all blocks in dataset
-                kwargs['block'] = dsname + '#%'
-                response = self.subscriptions(**kwargs)['phedex']
-
+                return self.subscriptions(**dict(kwargs, block = dsname + '#%'))['phedex']
+            except Exception as ex:
+                logging.error('Error looking up phedex subscription for %s: %s' % (dsname, str(ex)))
+                return None
+
+        datasetNames = inputs.keys()
+        responses = parallelMap(datasetSubscriptions, datasetNames, self['maxWorkers'])
+        for dsname, response in zip(datasetNames, responses):
+            if response is None:
+                continue
+            items = inputs[dsname]
+            try:
                 # iterate over response as can't jump to specific datasets
                 for dset in response['dataset']:
                     if dset['name'] != dsname:
@@ -504,8 +615,7 @@ class PhEDEx(Service):
         Returns a dictionary with se names per block
         """
 
-        callname = 'blockreplicas'
-        response = self._getResult(callname, args = kwargs)
+        response = self.getReplicaInfoForBlocks(**kwargs)
         
         blockSE = dict()
 
@@ -546,8 +656,7 @@ class PhEDEx(Service):
         Returns a dictionary with se names per block
         """
 
-        callname = 'blockreplicas'
-        response = self._getResult(callname, args = kwargs)
+        response = self.getReplicaInfoForBlocks(**kwargs)
 
         blockNodes = dict()
 
@@ -27,6 +27,7 @@ from json import JSONEncoder, JSONDecoder
 
 from WMCore.Algorithms import Permissions
 from WMCore.Lexicon import sanitizeURL
+from WMCore.Services.ConnectionPool import getConnectionPool
 from WMCore.WMException import WMException
 from WMCore.Wrappers.JsonWrapper.JSONThunker import JSONThunker
 
@@ -45,6 +46,17 @@ def check_server_url(srvurl):
         raise ValueError(msg)
 
 
+def closeURLOpener(http):
+    """Close the sockets held by a pooled httplib2 Http object"""
+    for conn in http.connections.values():
+        conn.close()
+
+
+def closeCurl(curl):
+    """Close a pooled pycurl handle"""
+    curl.close()
+
+
 class Requests(dict):
     """
     Generic class for sending different types of HTTP Request to a given URL
@@ -60,6 +72,7 @@ class Requests(dict):
         dict.__init__(self, idict)
         self.pycurl = idict.get('pycurl', None)
         self.capath = idict.get('capath', None)
+        self.connectionPool = getConnectionPool()
         if self.pycurl:
             self.reqmgr = RequestHandler()
 
@@ -158,8 +171,19 @@ class Requests(dict):
         # And now overwrite any headers that have been passed into the call:
         headers.update(incoming_headers)
         url = self['host'] + uri
-        response, data = self.reqmgr.request(url, params, headers, \
-                                             verb=verb, ckey=ckey, cert=cert, capath=capath, decode=decoder)
+        import pycurl
+        components = self['endpoint_components']
+        poolKey = ('pycurl', components.scheme, components.hostname, components.port,
+                   ckey, cert, capath)
+        curl = self.connectionPool.acquire(poolKey, pycurl.Curl)
+        try:
+            response, data = self.reqmgr.request(url, params, headers, \
+                                                 verb=verb, ckey=ckey, cert=cert, capath=capath,
+                                                 decode=decoder, curl=curl)
+        except HTTPException:
+            self.connectionPool.release(poolKey, curl, closeCurl)
+            raise
+        self.connectionPool.release(poolKey, curl, closeCurl)
         return data, response.status, response.reason, response.fromcache
 
     def makeRequest_httplib(self, uri=None, data={}, verb='GET',
@@ -254,6 +278,7 @@ class Requests(dict):
                 # socket/httplib really screwed up - nuclear option
                 conn.connections = {}
                 raise socket.error('Error contacting: %s: %s' % (self.getDomainName(), msg))
+        self._releaseURLOpener(conn)
         if response.status >= 400:
             e = HTTPException()
             setattr(e, 'req_data', encoded_data)
@@ -344,7 +369,8 @@ class Requests(dict):
 
     def _getURLOpener(self):
         """
-        method getting a secure (HTTPS) connection
+        method getting a secure (HTTPS) connection, an idle one from the
+        process connection pool if there is one for the same endpoint
         """
         import httplib2
         key, cert = None, None
@@ -359,19 +385,33 @@ class Requests(dict):
                 self['logger'].info(msg)
                 self['logger'].debug(str(ex))
 
-        try:
-            # disable validation as we don't have a single PEM with all ca's
-            http = httplib2.Http(self['req_cache_path'], self['timeout'],
-                                 disable_ssl_certificate_validation=True)
-        except TypeError:
-            # old httplib2 versions disable validation by default
-            http = httplib2.Http(self['req_cache_path'], self['timeout'])
-
-        # Domain must be just a hostname and port. self[host] is a URL currently
-        if key or cert:
-            http.add_certificate(key=key, cert=cert, domain='')
+        def newURLOpener():
+            try:
+                # disable validation as we don't have a single PEM with all ca's
+                http = httplib2.Http(self['req_cache_path'], self['timeout'],
+                                     disable_ssl_certificate_validation=True)
+            except TypeError:
+                # old httplib2 versions disable validation by default
+                http = httplib2.Http(self['req_cache_path'], self['timeout'])
+
+            # Domain must be just a hostname and port. self[host] is a URL currently
+            if key or cert:
+                http.add_certificate(key=key, cert=cert, domain='')
+            return http
+
+        components = self['endpoint_components']
+        poolKey = ('httplib2', components.scheme, components.hostname, components.port,
+                   key, cert, self['req_cache_path'], self['timeout'])
+        http = self.connectionPool.acquire(poolKey, newURLOpener)
+        http.poolKey = poolKey
         return http
 
+    def _releaseURLOpener(self, http):
+        """
+        Return a connection that completed its request to the connection pool
+        """
+        self.connectionPool.release(http.poolKey, http, closeURLOpener)
+
     def addBasicAuth(self, username, password):
         """Add basic auth headers to request"""
         auth_string = "Basic %s" % base64.encodestring('%s:%s' % (
@@ -31,6 +31,11 @@ dict, set to None if you want to turn off the timeout.
 If you just want to retrieve the data without caching use the Requests class
 directly.
 
+refreshCacheData returns the decoded content of the cache instead of a file.
+The decoded objects are kept in memory, in a LRU cache shared by all the
+Services of a process, for cacheduration hours, so that data read over and
+over again is not re-read and re-parsed from the cache file every time.
+
 The Service class provides two layers of caching:
     1. Caching from httplib2 is provided via Request, this respectsetag and
     expires, but the cache will be lost if the service raises an exception or
@@ -52,7 +57,9 @@ import datetime
 import json
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
 from cStringIO import StringIO
 from httplib import HTTPException
 
@@ -90,6 +97,103 @@ def cache_expired(cache, delta = 0):
     return False
 
 
+class DecodedDataCache(object):
+    """
+    LRU cache of decoded service responses, keyed by cache file name.
+
+    Entries are evicted once older than their expiry time, when their cache
+    file changed or disappeared, or least recently used first when the size
+    of the cached payloads exceeds maxSize bytes. The cached objects are
+    handed out as they are, callers must not modify them.
+    """
+    def __init__(self, maxSize=64 * 1024 * 1024):
+        self.maxSize = maxSize
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        # cachefile -> (expires, mtime, size, data)
+        self.entries = OrderedDict()
+
+    def get(self, cachefile):
+        """
+        Return (True, data) for a valid entry, (False, None) otherwise.
+        """
+        try:
+            mtime = os.path.getmtime(cachefile)
+        except OSError:
+            mtime = None
+        with self.lock:
+            entry = self.entries.pop(cachefile, None)
+            if entry is None or entry[0] < time.time() or entry[1] != mtime:
+                if entry is not None:
+                    self.size -= entry[2]
+                self.misses += 1
+                return False, None
+            self.entries[cachefile] = entry
+            self.hits += 1
+            return True, entry[3]
+
+    def put(self, cachefile, data, size, duration):
+        """
+        Cache data decoded from size bytes of cachefile for duration hours.
+        """
+        if size > self.maxSize:
+            return
+        try:
+            mtime = os.path.getmtime(cachefile)
+        except OSError:
+            return
+        with self.lock:
+            self._remove(cachefile)
+            self.entries[cachefile] = (time.time() + duration * 3600, mtime, size, data)
+            self.size += size
+            while self.size > self.maxSize:
+                self.size -= self.entries.popitem(last=False)[1][2]
+        return
+
+    def remove(self, cachefile):
+        """
+        Drop the entry of cachefile, if any.
+        """
+        with self.lock:
+            self._remove(cachefile)
+        return
+
+    def clear(self):
+        """
+        Drop all entries and reset the counters.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = self.hits = self.misses = 0
+        return
+
+    def stats(self):
+        """
+        Return the hit/miss counters, number of entries and cached size.
+        """
+        with self.lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'entries': len(self.entries), 'size': self.size}
+
+    def _remove(self, cachefile):
+        entry = self.entries.pop(cachefile, None)
+        if entry is not None:
+            self.size -= entry[2]
+        return
+
+
+_decodedDataCache = DecodedDataCache()
+
+
+def getDecodedDataCache():
+    """
+    Return the decoded data cache shared by all Services in this process.
+    """
+    return _decodedDataCache
+
+
 class Service(dict):
 
     def __init__(self, cfg_dict = None):
@@ -206,6 +310,35 @@ class Service(dict):
         else:
             return cachefile
 
+    def refreshCacheData(self, cachefile, url='', inputdata = None, decoder = json.loads,
+                         verb = 'GET', contentType = None, incoming_headers = None):
+        """
+        Return the content of the cache decoded with decoder, reusing the
+        decoded object for cacheduration hours. The object is shared with
+        other callers and must not be modified. Without a cache path the data
+        is fetched and decoded every time.
+        """
+        verb = self._verbCheck(verb)
+        cachefilename = self.cacheFileName(cachefile, verb, inputdata or {})
+        if isfile(cachefilename):
+            f = self.refreshCache(cachefile, url, inputdata, verb = verb, contentType = contentType,
+                                  incoming_headers = incoming_headers)
+            return decoder(f.read())
+
+        found, data = _decodedDataCache.get(cachefilename)
+        if found:
+            return data
+
+        f = self.refreshCache(cachefile, url, inputdata, verb = verb, contentType = contentType,
+                              incoming_headers = incoming_headers)
+        try:
+            content = f.read()
+        finally:
+            f.close()
+        data = decoder(content)
+        _decodedDataCache.put(cachefilename, data, len(content), self['cacheduration'])
+        return data
+
     def forceRefresh(self, cachefile, url='', inputdata = {}, openfile=True,
                      encoder = True, decoder = True, verb = 'GET',
                      contentType = None, incoming_headers={}):
@@ -238,6 +371,7 @@ class Service(dict):
         verb = self._verbCheck(verb)
         os.system("/bin/rm -f %s/*" % self['requests']['req_cache_path'])
         cachefile = self.cacheFileName(cachefile, verb, inputdata)
+        _decodedDataCache.remove(cachefile)
         try:
             if not isfile(cachefile):
                 os.remove(cachefile)
@@ -281,6 +415,7 @@ class Service(dict):
                     cachefile.write(str(data))
                     cachefile.seek (0, 0) # return to beginning of file
                 else:
+                    _decodedDataCache.remove(cachefile)
                     f = open(cachefile, 'w')
                     if isinstance(data, dict) or isinstance(data, list):
                         f.write(json.dumps(data))
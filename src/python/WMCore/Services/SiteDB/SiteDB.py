@@ -4,15 +4,118 @@ _SiteDB_
 
 API for dealing with interpreting information from SiteDB
 
+The site names, site resources and data processing mappings are turned into
+a SiteDBIndex, shared by all SiteDBJSON instances of a process and refreshed
+every cacheduration hours, so that the lookups are dictionary hits. The data
+the index is built from is also written to a compact snapshot file, which
+lets a new process start with a warm index and serves as fallback for up to
+maxcachereuse hours if SiteDB can not be reached.
 """
 from WMCore.Services.SiteDB.SiteDBAPI import SiteDBAPI
 from WMCore.Services.EmulatorSwitch import emulatorHook
 
+import json
+import os
 import re
+import threading
+import time
 
 #TODO remove this when all DBS origin_site_name is converted to PNN
 pnn_regex = re.compile(r'^T[0-3%]((_[A-Z]{2}(_[A-Za-z0-9]+)*)?)')
 
+# endpoint -> (timestamp, SiteDBIndex)
+_siteIndexes = {}
+_siteIndexLock = threading.Lock()
+
+
+def clearSiteIndex():
+    """
+    Drop the SiteDB indexes held in memory by this process.
+    """
+    with _siteIndexLock:
+        _siteIndexes.clear()
+    return
+
+
+class SiteDBIndex(object):
+    """
+    Lookup tables built once from the SiteDB site-names, site-resources and
+    data-processing data. The inputs are lists of (type, site_name, alias),
+    (type, site_name, fqdn) and (phedex_name, psn_name) tuples. Lists are
+    kept in the order of the SiteDB data and copied when handed out.
+    """
+
+    def __init__(self, sitenames, resources, processing):
+        self.sitenames = [tuple(x) for x in sitenames]
+        self.resources = [tuple(x) for x in resources]
+        self.processing = [tuple(x) for x in processing]
+
+        # site_name -> type -> [alias], (type, alias) -> [site_name]
+        self.siteAliases = {}
+        self.aliasSites = {}
+        # type -> [alias]
+        self.aliasesByType = {}
+        for aliasType, siteName, alias in self.sitenames:
+            self.siteAliases.setdefault(siteName, {}).setdefault(aliasType, []).append(alias)
+            self.aliasSites.setdefault((aliasType, alias), []).append(siteName)
+            self.aliasesByType.setdefault(aliasType, []).append(alias)
+
+        # fqdn -> [site_name], type -> [fqdn]
+        self.fqdnSites = {}
+        self.fqdnsByType = {}
+        for resourceType, siteName, fqdn in self.resources:
+            self.fqdnSites.setdefault(fqdn, []).append(siteName)
+            self.fqdnsByType.setdefault(resourceType, []).append(fqdn)
+
+        # pnn -> [psn], psn -> [pnn]
+        self.pnnToPSNs = {}
+        self.psnToPNNs = {}
+        for pnn, psn in self.processing:
+            self.pnnToPSNs.setdefault(pnn, []).append(psn)
+            self.psnToPNNs.setdefault(psn, []).append(pnn)
+
+        # (cms name pattern, kind) -> [fqdn]
+        self.patternHosts = {}
+
+    @classmethod
+    def fromJSON(cls, sitenames, resources, processing):
+        """
+        Build the index from the unflattened SiteDB JSON rows.
+        """
+        return cls([(x['type'], x['site_name'], x['alias']) for x in sitenames],
+                   [(x['type'], x['site_name'], x['fqdn']) for x in resources],
+                   [(x['phedex_name'], x['psn_name']) for x in processing])
+
+    def snapshot(self):
+        """
+        Return the data the index is built from, in a JSON serialisable form.
+        """
+        return {'site-names': self.sitenames,
+                'site-resources': self.resources,
+                'data-processing': self.processing}
+
+    def siteAliasesForFQDN(self, fqdn, aliasType):
+        """
+        Aliases of the given type of all the sites a host belongs to.
+        """
+        return [alias for siteName in self.fqdnSites.get(fqdn, [])
+                for alias in self.siteAliases.get(siteName, {}).get(aliasType, [])]
+
+    def hostsForPattern(self, cmsname_pattern, kind):
+        """
+        Hosts of the given kind of the sites with a psn alias matching the
+        pattern. Results are remembered per pattern and kind.
+        """
+        key = (cmsname_pattern, kind)
+        if key not in self.patternHosts:
+            regex = re.compile(cmsname_pattern.replace('*', '.*').replace('%', '.*'))
+            siteNames = set(siteName for aliasType, siteName, alias in self.sitenames
+                            if aliasType == 'psn' and regex.match(alias))
+            self.patternHosts[key] = [fqdn for resourceType, siteName, fqdn in self.resources
+                                      if resourceType == kind and siteName in siteNames]
+        return list(self.patternHosts[key])
+
+
 # emulator hook is used to swap the class instance
 # when emulator values are set.
 # Look WMCore.Services.EmulatorSwitch module for the values
@@ -23,6 +126,79 @@ class SiteDBJSON(SiteDBAPI):
     API for dealing with interpreting information from SiteDB
     """
 
+    def __init__(self, config={}):
+        SiteDBAPI.__init__(self, config)
+        # index snapshot, by default next to the other cache files
+        if self.get('snapshotfile') is None and self['cachepath']:
+            self['snapshotfile'] = os.path.join(self['cachepath'], 'sitedb-snapshot.json')
+
+    def _loadSnapshot(self):
+        """
+        Return (timestamp, SiteDBIndex) from the snapshot file, or None.
+        """
+        if not self.get('snapshotfile'):
+            return None
+        try:
+            with open(self['snapshotfile']) as snapshotFile:
+                snapshot = json.load(snapshotFile)
+            index = SiteDBIndex(snapshot['site-names'], snapshot['site-resources'],
+                                snapshot['data-processing'])
+            return (snapshot['timestamp'], index)
+        except (IOError, ValueError, KeyError, TypeError) as ex:
+            self['logger'].debug("No usable SiteDB snapshot %s: %s" % (self['snapshotfile'], str(ex)))
+            return None
+
+    def _saveSnapshot(self, timestamp, index):
+        """
+        Atomically replace the snapshot file with the index data.
+        """
+        if not self.get('snapshotfile'):
+            return
+        snapshot = index.snapshot()
+        snapshot['timestamp'] = timestamp
+        tmpFile = '%s.%s.tmp' % (self['snapshotfile'], os.getpid())
+        try:
+            with open(tmpFile, 'w') as snapshotFile:
+                json.dump(snapshot, snapshotFile, separators=(',', ':'))
+            os.rename(tmpFile, self['snapshotfile'])
+        except (IOError, OSError) as ex:
+            self['logger'].warning("Failed to write SiteDB snapshot %s: %s" % (self['snapshotfile'], str(ex)))
+        return
+
+    def siteIndex(self):
+        """
+        _siteIndex_
+
+        Return the SiteDBIndex of this endpoint, rebuilding it from SiteDB once
+        it is older than cacheduration hours. A new index replaces the old one
+        only when it is complete. If SiteDB can not be read, an index younger
+        than maxcachereuse hours is used instead.
+        """
+        now = time.time()
+        with _siteIndexLock:
+            entry = _siteIndexes.get(self['endpoint'])
+        if entry is None:
+            entry = self._loadSnapshot()
+        if entry and now - entry[0] < self['cacheduration'] * 3600:
+            with _siteIndexLock:
+                _siteIndexes.setdefault(self['endpoint'], entry)
+            return entry[1]
+
+        try:
+            index = SiteDBIndex.fromJSON(self._sitenames(), self._siteresources(), self._dataProcessing())
+        except Exception as ex:
+            if entry and now - entry[0] < self['maxcachereuse'] * 3600:
+                self['logger'].warning("Failed to refresh the SiteDB index, reusing data from %s: %s" %
+                                       (time.ctime(entry[0]), str(ex)))
+                with _siteIndexLock:
+                    _siteIndexes.setdefault(self['endpoint'], entry)
+                return entry[1]
+            raise
+        with _siteIndexLock:
+            _siteIndexes[self['endpoint']] = (now, index)
+        self._saveSnapshot(now, index)
+        return index
+
     def _people(self, username=None, clearCache=False):
         if username:
             filename = 'people_%s.json' % (username)
@@ -103,10 +279,7 @@ class SiteDBJSON(SiteDBAPI):
         Get all CE names from SiteDB
         This is so that we can easily add them to ResourceControl
         """
-        siteresources = self._siteresources()
-        ceList = filter(lambda x: x['type'] == 'CE', siteresources)
-        ceList = map(lambda x: x['fqdn'], ceList)
-        return ceList
+        return list(self.siteIndex().fqdnsByType.get('CE', []))
 
     def getAllSENames(self):
         """
@@ -115,10 +288,7 @@ class SiteDBJSON(SiteDBAPI):
         Get all SE names from SiteDB
         This is so that we can easily add them to ResourceControl
         """
-        siteresources = self._siteresources()
-        seList = filter(lambda x: x['type'] == 'SE', siteresources)
-        seList = map(lambda x: x['fqdn'], seList)
-        return seList
+        return list(self.siteIndex().fqdnsByType.get('SE', []))
 
     def getAllCMSNames(self):
         """
@@ -127,10 +297,7 @@ class SiteDBJSON(SiteDBAPI):
         Get all the CMSNames from siteDB
         This will allow us to add them in resourceControl at once
         """
-        sitenames = self._sitenames()
-        cmsnames = filter(lambda x: x['type'] == 'psn', sitenames)
-        cmsnames = map(lambda x: x['alias'], cmsnames)
-        return cmsnames
+        return list(self.siteIndex().aliasesByType.get('psn', []))
 
     def getAllPhEDExNodeNames(self, excludeBuffer=False):
         """
@@ -139,9 +306,7 @@ class SiteDBJSON(SiteDBAPI):
         Get all the CMSNames from siteDB
         This will allow us to add them in resourceControl at once
         """
-        sitenames = self._sitenames()
-        node_names = filter(lambda x: x['type'] == 'phedex', sitenames)
-        node_names = map(lambda x: x['alias'], node_names)
+        node_names = list(self.siteIndex().aliasesByType.get('phedex', []))
         if excludeBuffer:
             node_names = filter(lambda x: not x.endswith("_Buffer"), node_names)
         return node_names
@@ -150,100 +315,64 @@ class SiteDBJSON(SiteDBAPI):
         """
         Convert CMS name pattern T1*, T2* to a list of CEs or SEs.
         """
-        cmsname_pattern = cmsname_pattern.replace('*', '.*')
-        cmsname_pattern = cmsname_pattern.replace('%', '.*')
-        cmsname_pattern = re.compile(cmsname_pattern)
-
-        sitenames = filter(lambda x: x[u'type'] == 'psn' and cmsname_pattern.match(x[u'alias']),
-                           self._sitenames())
-        sitenames = set(map(lambda x: x['site_name'], sitenames))
-        siteresources = filter(lambda x: x['site_name'] in sitenames, self._siteresources())
-        hostlist = filter(lambda x: x['type'] == kind, siteresources)
-        hostlist = map(lambda x: x['fqdn'], hostlist)
-
-        return hostlist
+        return self.siteIndex().hostsForPattern(cmsname_pattern, kind)
 
     def ceToCMSName(self, ce):
         """
         Convert SE name to the CMS Site they belong to,
         this is not a 1-to-1 relation but 1-to-many, return a list of cms site alias
         """
-        try:
-            siteresources = filter(lambda x: x['fqdn'] == ce, self._siteresources())
-        except IndexError:
-            return None
-        siteNames = []
-        for resource in siteresources:
-            siteNames.extend(self._sitenames(sitename=resource['site_name']))
-        cmsname = filter(lambda x: x['type'] == 'cms', siteNames)
-        return [x['alias'] for x in cmsname]
+        return self.siteIndex().siteAliasesForFQDN(ce, 'cms')
 
     def seToCMSName(self, se):
         """
         Convert SE name to the CMS Site they belong to,
         this is not a 1-to-1 relation but 1-to-many, return a list of cms site alias
         """
-        try:
-            siteresources = filter(lambda x: x['fqdn'] == se, self._siteresources())
-        except IndexError:
-            return None
-        siteNames = []
-        for resource in siteresources:
-            siteNames.extend(self._sitenames(sitename=resource['site_name']))
-        cmsname = filter(lambda x: x['type'] == 'cms', siteNames)
-        return [x['alias'] for x in cmsname]
+        return self.siteIndex().siteAliasesForFQDN(se, 'cms')
 
     def seToPNNs(self, se):
         """
         Convert SE name to the PNN they belong to,
         this is not a 1-to-1 relation but 1-to-many, return a list of pnns
         """
-        try:
-            siteresources = filter(lambda x: x['fqdn'] == se, self._siteresources())
-        except IndexError:
-            return None
-        siteNames = []
-        for resource in siteresources:
-            siteNames.extend(self._sitenames(sitename=resource['site_name']))
-        pnns = filter(lambda x: x['type'] == 'phedex', siteNames)
-        return [x['alias'] for x in pnns]
+        return self.siteIndex().siteAliasesForFQDN(se, 'phedex')
 
 
     def cmsNametoPhEDExNode(self, cmsName):
         """
         Convert CMS name to list of Phedex Nodes
         """
-        sitenames = self._sitenames()
+        index = self.siteIndex()
         try:
-            sitename = filter(lambda x: x['type'] == 'cms' and x['alias'] == cmsName, sitenames)[0]['site_name']
-        except IndexError:
+            sitename = index.aliasSites[('cms', cmsName)][0]
+        except KeyError:
             return None
-        phedexnames = filter(lambda x: x['type'] == 'phedex' and x['site_name'] == sitename, sitenames)
-        phedexnames = map(lambda x: x['alias'], phedexnames)
-        return phedexnames
+        return list(index.siteAliases[sitename].get('phedex', []))
 
 
     def PNNtoPSN(self, pnn):
         """
         Convert PhEDEx node name to Processing Site Name(s)
         """
-        return self._dataProcessing(pnn=pnn)
+        return list(self.siteIndex().pnnToPSNs.get(pnn, []))
 
     def PSNtoPNN(self, psn):
         """
         Convert Processing Site Name to PhEDEx Node Name(s)
         """
-        return self._dataProcessing(psn=psn)
+        return list(self.siteIndex().psnToPNNs.get(psn, []))
 
     def PNNstoPSNs(self, pnns):
         """
         Convert list of PhEDEx node names to Processing Site Name(s)
         """
+        pnnToPSNs = self.siteIndex().pnnToPSNs
         psns = set()
         for pnn in pnns:
             if pnn == "T0_CH_CERN_Export" or pnn.endswith("_MSS") or pnn.endswith("_Buffer"):
                 continue
-            psn_list = self.PNNtoPSN(pnn)
+            psn_list = pnnToPSNs.get(pnn, [])
             psns.update(psn_list)
             if not psn_list:
                 self["logger"].warning("No PSNs for PNN: %s" % pnn)
@@ -253,9 +382,10 @@ class SiteDBJSON(SiteDBAPI):
         """
         Convert list of Processing Site Names to PhEDEx Node Names
         """
+        psnToPNNs = self.siteIndex().psnToPNNs
         pnns = set()
         for psn in psns:
-            pnn_list = self.PSNtoPNN(psn)
+            pnn_list = psnToPNNs.get(psn, [])
             if not pnn_list:
                 self["logger"].warning("No PNNs for PSN: %s" % psn)
             pnns.update(pnn_list)
@@ -267,8 +397,7 @@ class SiteDBJSON(SiteDBAPI):
 
         mapping = {}
         psn_pattern = re.compile(psn_pattern)  # .replace('*', '.*').replace('%', '.*'))
-        for entry in self._dataProcessing():
-            if not psn_pattern.match(entry['psn_name']):
-                continue
-            mapping.setdefault(entry['psn_name'], set()).add(entry['phedex_name'])
+        for psn, pnns in self.siteIndex().psnToPNNs.iteritems():
+            if psn_pattern.match(psn):
+                mapping[psn] = set(pnns)
         return mapping
@@ -7,7 +7,6 @@ API for retrieving information from SiteDB
 """
 from __future__ import print_function
 from __future__ import division
-import json
 from WMCore.Services.Service import Service
 
 def unflattenJSON(data):
@@ -44,7 +43,6 @@ class SiteDBAPI(Service):
         TODO: Probably want to move this up into Service
         """
 
-        result = ''
         if clearCache:
             self.clearCache(cachefile=filename, inputdata=data, verb=verb)
         try:
@@ -52,17 +50,15 @@ class SiteDBAPI(Service):
             # Default is text/html which will return xml instead
             # Add accept-encoding to gzip,identity to overwrite httplib default gzip,deflate,
             # which is not working properly with cmsweb
-            f = self.refreshCache(cachefile=filename, url=callname, inputdata=data,
-                                  verb=verb, contentType='application/json',
-                                  incoming_headers={'Accept': 'application/json',
-                                                    'accept-encoding': 'gzip,identity'})
-            result = f.read()
-            f.close()
+            # SiteDB data hardly changes, so the decoded data is reused for cacheduration hours
+            result = self.refreshCacheData(cachefile=filename, url=callname, inputdata=data,
+                                           verb=verb, contentType='application/json',
+                                           incoming_headers={'Accept': 'application/json',
+                                                             'accept-encoding': 'gzip,identity'})
         except IOError:
             raise RuntimeError("URL not available: %s" % callname)
         try:
-            results = json.loads(result)
-            results = unflattenJSON(results)
+            results = unflattenJSON(result)
             return results
         except SyntaxError:
             self.clearCache(filename, inputdata=data, verb=verb)
@@ -15,6 +15,7 @@ import cStringIO as StringIO
 import httplib
 import json
 import logging
+import time
 import urllib
 
 import pycurl
@@ -63,6 +64,7 @@ class RequestHandler(object):
         self.connecttimeout = config.get('connecttimeout', 30)
         self.followlocation = config.get('followlocation', 1)
         self.maxredirs = config.get('maxredirs', 5)
+        self.num_conn = config.get('num_conn', 10)
         self.logger = logger if logger else logging.getLogger()
 
     def encode_params(self, params, verb, doseq):
@@ -175,10 +177,31 @@ class RequestHandler(object):
         """
         return ResponseHeader(header)
 
+    def http_error(self, url, params, headers, header, data):
+        """Build the HTTPException reported for an unsuccessful response"""
+        msg = 'url=%s, code=%s, reason=%s, headers=%s' \
+                % (url, header.status, header.reason, header.header)
+        exc = httplib.HTTPException(msg)
+        setattr(exc, 'req_data', params)
+        setattr(exc, 'req_headers', headers)
+        setattr(exc, 'url', url)
+        setattr(exc, 'result', data)
+        setattr(exc, 'status', header.status)
+        setattr(exc, 'reason', header.reason)
+        setattr(exc, 'headers', header.header)
+        return exc
+
     def request(self, url, params, headers=None, verb='GET',
-                verbose=0, ckey=None, cert=None, capath=None, doseq=True, decode=False, cainfo=None):
-        """Fetch data for given set of parameters"""
-        curl = pycurl.Curl()
+                verbose=0, ckey=None, cert=None, capath=None, doseq=True, decode=False, cainfo=None,
+                curl=None):
+        """
+        Fetch data for given set of parameters. An existing curl handle
+        can be passed in to reuse its open connections.
+        """
+        if  curl is None:
+            curl = pycurl.Curl()
+        else:
+            curl.reset()
         bbuf, hbuf = self.set_opts(curl, url, params, headers,
                 ckey, cert, capath, verbose, verb, doseq, cainfo)
         curl.perform()
@@ -191,17 +214,7 @@ class RequestHandler(object):
             else:
                 data = self.parse_body(bbuf.getvalue(), decode)
         else:
-            data = bbuf.getvalue()
-            msg = 'url=%s, code=%s, reason=%s, headers=%s' \
-                    % (url, header.status, header.reason, header.header)
-            exc = httplib.HTTPException(msg)
-            setattr(exc, 'req_data', params)
-            setattr(exc, 'req_headers', headers)
-            setattr(exc, 'url', url)
-            setattr(exc, 'result', data)
-            setattr(exc, 'status', header.status)
-            setattr(exc, 'reason', header.reason)
-            setattr(exc, 'headers', header.header)
+            exc = self.http_error(url, params, headers, header, bbuf.getvalue())
             bbuf.flush()
             hbuf.flush()
             raise exc
@@ -224,41 +237,112 @@ class RequestHandler(object):
                     verbose, ckey, cert, doseq)
         return header
 
-    def multirequest(self, url, parray, headers=None,
-                ckey=None, cert=None, verbose=None):
-        """Fetch data for given set of parameters"""
+    def multi_request(self, requests, headers=None, verb='GET',
+                      verbose=0, ckey=None, cert=None, capath=None, doseq=True,
+                      decode=False, cainfo=None, num_conn=None):
+        """
+        Fetch a sequence of (url, params) requests concurrently, keeping up
+        to num_conn of them in flight. Curl handles, and with them their
+        open connections, are reused for the following requests.
+
+        Yield one dictionary per request as soon as it completes, with the
+        url, params, parsed header, data, error (None on success, otherwise
+        the HTTPException or pycurl.error) and time (seconds) of the request.
+        """
+        num_conn = num_conn or self.num_conn
+        pending = iter(requests)
         multi = pycurl.CurlMulti()
-        for params in parray:
-            curl = pycurl.Curl()
-            bbuf, hbuf = \
-                self.set_opts(curl, url, params, headers, ckey, cert, verbose)
-            multi.add_handle(curl)
+        free = [pycurl.Curl() for _ in range(num_conn)]
+        in_flight = 0
+        exhausted = False
+        try:
             while True:
-                ret, num_handles = multi.perform()
-                if  ret != pycurl.E_CALL_MULTI_PERFORM:
+                while free and not exhausted:
+                    try:
+                        url, params = next(pending)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    curl = free.pop()
+                    curl.reset()
+                    bbuf, hbuf = self.set_opts(curl, url, params, headers, ckey, cert,
+                                               capath, verbose, verb, doseq, cainfo)
+                    curl.request = (url, params, bbuf, hbuf)
+                    multi.add_handle(curl)
+                    in_flight += 1
+                if  not in_flight:
                     break
-            while num_handles:
-                ret = multi.select(1.0)
-                if  ret == -1:
-                    continue
+
                 while True:
-                    ret, num_handles = multi.perform()
+                    ret, _ = multi.perform()
                     if  ret != pycurl.E_CALL_MULTI_PERFORM:
                         break
-            dummyNumq, response, dummyErr = multi.info_read()
-            for dummyCobj in response:
-                data = json.loads(bbuf.getvalue())
-                if  isinstance(data, dict):
-                    data.update(params)
-                    yield data
-                if  isinstance(data, list):
-                    for item in data:
-                        if  isinstance(item, dict):
-                            item.update(params)
-                            yield item
-                        else:
-                            err = 'Unsupported data format: data=%s, type=%s'\
-                                % (item, type(item))
-                            raise Exception(err)
-                bbuf.flush()
-                hbuf.flush()
+
+                done = []
+                while True:
+                    num_q, ok_list, err_list = multi.info_read()
+                    done.extend((curl, None) for curl in ok_list)
+                    done.extend((curl, pycurl.error(errno, errmsg))
+                                for curl, errno, errmsg in err_list)
+                    if  not num_q:
+                        break
+                if  not done:
+                    multi.select(1.0)
+                    continue
+
+                for curl, error in done:
+                    multi.remove_handle(curl)
+                    in_flight -= 1
+                    result = self.multi_result(curl, error, headers, verb, decode)
+                    free.append(curl)
+                    yield result
+        finally:
+            for curl in free:
+                curl.close()
+            multi.close()
+
+    def multi_result(self, curl, error, headers, verb, decode):
+        """Collect the outcome of a request completed by multi_request"""
+        url, params, bbuf, hbuf = curl.request
+        del curl.request
+        result = {'url': url, 'params': params, 'header': None, 'data': None,
+                  'error': error, 'time': curl.getinfo(pycurl.TOTAL_TIME)}
+        if  error is None:
+            header = self.parse_header(hbuf.getvalue())
+            result['header'] = header
+            if  header.status < 300:
+                if  verb != 'HEAD':
+                    result['data'] = self.parse_body(bbuf.getvalue(), decode)
+            else:
+                result['data'] = bbuf.getvalue()
+                result['error'] = self.http_error(url, params, headers,
+                                                  header, result['data'])
+        bbuf.close()
+        hbuf.close()
+        return result
+
+    def multirequest(self, url, parray, headers=None,
+                ckey=None, cert=None, verbose=None):
+        """
+        Fetch data for given set of parameters concurrently and yield the
+        JSON records of every response, updated with their request parameters.
+        """
+        requests = ((url, params) for params in parray)
+        for result in self.multi_request(requests, headers, verbose=verbose,
+                                         ckey=ckey, cert=cert):
+            if  result['error'] is not None:
+                raise result['error']
+            params = result['params']
+            data = json.loads(result['data'])
+            if  isinstance(data, dict):
+                data.update(params)
+                yield data
+            if  isinstance(data, list):
+                for item in data:
+                    if  isinstance(item, dict):
+                        item.update(params)
+                        yield item
+                    else:
+                        err = 'Unsupported data format: data=%s, type=%s'\
+                            % (item, type(item))
+                        raise Exception(err)
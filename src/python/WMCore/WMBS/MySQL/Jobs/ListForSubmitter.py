@@ -33,7 +33,16 @@ class ListForSubmitter(DBFormatter):
                  wmbs_subscription.workflow = wmbs_workflow.id
              WHERE wmbs_job_state.name = 'created'"""
 
-    def execute(self, conn = None, transaction = False):
+    def execute(self, conn = None, transaction = False, stream = False):
+        """
+        _execute_
+
+        With stream = True a generator of job dictionaries is returned
+        and the rows are read from the database as they are consumed.
+        """
         result = self.dbi.processData(self.sql, conn = conn,
-                                      transaction = transaction)
+                                      transaction = transaction,
+                                      stream = stream)
+        if stream:
+            return self.formatDictIter(result)
         return self.formatDict(result)
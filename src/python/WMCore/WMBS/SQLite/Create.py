@@ -0,0 +1,57 @@
+"""
+_CreateWMBS_
+
+Implementation of CreateWMBS for SQLite.
+
+Inherit from CreateWMBSBase, and add SQLite specific substitutions.  SQLite
+does not support adding constraints to an existing table, so the unique
+constraints the base class adds with ALTER TABLE are created as unique
+indexes instead.
+"""
+
+from WMCore.WMBS.CreateWMBSBase import CreateWMBSBase
+
+class Create(CreateWMBSBase):
+    """
+    Class to set up the WMBS schema in a SQLite database
+    """
+    def __init__(self, logger = None, dbi = None, params = None):
+        """
+        _init_
+
+        Call the base class's constructor and create all necessary tables,
+        constraints and inserts.
+        """
+        CreateWMBSBase.__init__(self, logger, dbi, params)
+
+        self.create["03wmbs_fileset_files"] = \
+          """CREATE TABLE wmbs_fileset_files (
+             fileid      INTEGER   NOT NULL,
+             fileset     INTEGER   NOT NULL,
+             insert_time INTEGER   NOT NULL,
+             UNIQUE(fileid, fileset),
+             FOREIGN KEY(fileset) REFERENCES wmbs_fileset(id)
+               ON DELETE CASCADE,
+             FOREIGN KEY(fileid)  REFERENCES wmbs_file_details(id)
+               ON DELETE CASCADE)"""
+
+        self.indexes["03_pk_wmbs_workflow"] = \
+          """CREATE UNIQUE INDEX wmbs_workflow_unique ON
+             wmbs_workflow (name, spec, task)"""
+
+        self.indexes["03_pk_wmbs_job"] = \
+          """CREATE UNIQUE INDEX wmbs_job_unique ON
+             wmbs_job (name, cache_dir, fwjr_path)"""
+
+        self.constraints["uniquewfname"] = \
+          "CREATE UNIQUE INDEX uniq_wf_name on wmbs_workflow (name, task)"
+
+        self.constraints["uniquefilerunlumi"] = \
+          """CREATE UNIQUE INDEX uniq_wmbs_file_run_lumi on
+             wmbs_file_runlumi_map (fileid, run, lumi)"""
+
+    def execute(self, conn = None, transaction = None):
+        for i in self.create.keys():
+            self.create[i] = self.create[i].replace('AUTO_INCREMENT', 'AUTOINCREMENT')
+
+        return CreateWMBSBase.execute(self, conn, transaction)
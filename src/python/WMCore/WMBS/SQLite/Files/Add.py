@@ -0,0 +1,10 @@
+"""
+_Add_
+
+SQLite implementation of Files.Add
+"""
+
+from WMCore.WMBS.MySQL.Files.Add import Add as MySQLAdd
+
+class Add(MySQLAdd):
+    pass
@@ -0,0 +1,11 @@
+"""
+_AddBulkParentage_
+
+SQLite implementation of Files.AddBulkParentage
+"""
+
+from WMCore.WMBS.MySQL.Files.AddBulkParentage \
+     import AddBulkParentage as MySQLAddBulkParentage
+
+class AddBulkParentage(MySQLAddBulkParentage):
+    pass
@@ -0,0 +1,10 @@
+"""
+_AddCKType_
+
+SQLite implementation of Files.AddCKType
+"""
+
+from WMCore.WMBS.MySQL.Files.AddCKType import AddCKType as MySQLAddCKType
+
+class AddCKType(MySQLAddCKType):
+    pass
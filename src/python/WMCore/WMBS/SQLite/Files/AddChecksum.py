@@ -0,0 +1,13 @@
+"""
+_AddChecksum_
+
+SQLite implementation of Files.AddChecksum
+"""
+
+from WMCore.WMBS.MySQL.Files.AddChecksum import AddChecksum as MySQLAddChecksum
+
+class AddChecksum(MySQLAddChecksum):
+    sql = """INSERT INTO wmbs_file_checksums (fileid, typeid, cksum)
+             SELECT :fileid, (SELECT id FROM wmbs_checksum_type WHERE type = :cktype), :cksum
+             WHERE NOT EXISTS (SELECT fileid FROM wmbs_file_checksums WHERE
+                               fileid = :fileid AND typeid = (SELECT id FROM wmbs_checksum_type WHERE type = :cktype))"""
@@ -0,0 +1,14 @@
+"""
+_AddChecksumByLFN_
+
+SQLite implementation of Files.AddChecksumByLFN
+"""
+
+from WMCore.WMBS.MySQL.Files.AddChecksumByLFN \
+     import AddChecksumByLFN as MySQLAddChecksumByLFN
+
+class AddChecksumByLFN(MySQLAddChecksumByLFN):
+    sql = """INSERT OR IGNORE INTO wmbs_file_checksums (fileid, typeid, cksum)
+             SELECT (SELECT id FROM wmbs_file_details WHERE lfn = :lfn),
+              (SELECT id FROM wmbs_checksum_type WHERE type = :cktype),
+              :cksum"""
@@ -0,0 +1,12 @@
+"""
+_AddRunLumi_
+
+SQLite implementation of Files.AddRunLumi
+"""
+
+from WMCore.WMBS.MySQL.Files.AddRunLumi import AddRunLumi as MySQLAddRunLumi
+
+class AddRunLumi(MySQLAddRunLumi):
+    sql = """INSERT OR IGNORE INTO wmbs_file_runlumi_map (fileid, run, lumi)
+            select id, :run, :lumi from wmbs_file_details
+            where lfn = :lfn"""
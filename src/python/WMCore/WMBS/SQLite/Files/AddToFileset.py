@@ -0,0 +1,23 @@
+"""
+_AddToFileset_
+
+SQLite implementation of Files.AddToFileset
+"""
+
+from WMCore.WMBS.MySQL.Files.AddToFileset \
+     import AddToFileset as MySQLAddToFileset
+
+class AddToFileset(MySQLAddToFileset):
+    sql = """INSERT OR IGNORE INTO wmbs_fileset_files (fileid, fileset, insert_time)
+               SELECT wmbs_file_details.id, :fileset, :insert_time
+               FROM wmbs_file_details
+               WHERE wmbs_file_details.lfn = :lfn
+               """
+
+    sqlAvail = """INSERT OR IGNORE INTO wmbs_sub_files_available (subscription, fileid)
+                    SELECT wmbs_subscription.id AS subscription,
+                           wmbs_file_details.id AS fileid FROM wmbs_subscription
+                      INNER JOIN wmbs_file_details ON
+                        wmbs_file_details.lfn = :lfn
+                    WHERE wmbs_subscription.fileset = :fileset
+                    """
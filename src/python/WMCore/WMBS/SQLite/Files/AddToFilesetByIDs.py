@@ -0,0 +1,11 @@
+"""
+_AddToFilesetByIDs_
+
+SQLite implementation of Files.AddToFilesetByIDs
+"""
+
+from WMCore.WMBS.MySQL.Files.AddToFilesetByIDs \
+     import AddToFilesetByIDs as MySQLAddToFilesetByIDs
+
+class AddToFilesetByIDs(MySQLAddToFilesetByIDs):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Delete_
+
+SQLite implementation of Files.Delete
+"""
+
+from WMCore.WMBS.MySQL.Files.Delete import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
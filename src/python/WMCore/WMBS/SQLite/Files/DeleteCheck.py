@@ -0,0 +1,10 @@
+"""
+_DeleteCheck_
+
+SQLite implementation of Files.DeleteCheck
+"""
+
+from WMCore.WMBS.MySQL.Files.DeleteCheck import DeleteCheck as MySQLDeleteCheck
+
+class DeleteCheck(MySQLDeleteCheck):
+    pass
@@ -0,0 +1,11 @@
+"""
+_DeleteParentCheck_
+
+SQLite implementation of Files.DeleteParentCheck
+"""
+
+from WMCore.WMBS.MySQL.Files.DeleteParentCheck \
+     import DeleteParentCheck as MySQLDeleteParentCheck
+
+class DeleteParentCheck(MySQLDeleteParentCheck):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Exists_
+
+SQLite implementation of Files.Exists
+"""
+
+from WMCore.WMBS.MySQL.Files.Exists import Exists as MySQLExists
+
+class Exists(MySQLExists):
+    pass
@@ -0,0 +1,10 @@
+"""
+_ExistsByID_
+
+SQLite implementation of Files.ExistsByID
+"""
+
+from WMCore.WMBS.MySQL.Files.ExistsByID import ExistsByID as MySQLExistsByID
+
+class ExistsByID(MySQLExistsByID):
+    pass
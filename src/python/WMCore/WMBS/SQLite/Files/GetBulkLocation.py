@@ -0,0 +1,11 @@
+"""
+_GetBulkLocation_
+
+SQLite implementation of Files.GetBulkLocation
+"""
+
+from WMCore.WMBS.MySQL.Files.GetBulkLocation \
+     import GetBulkLocation as MySQLGetBulkLocation
+
+class GetBulkLocation(MySQLGetBulkLocation):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetBulkRunLumi_
+
+SQLite implementation of Files.GetBulkRunLumi
+"""
+
+from WMCore.WMBS.MySQL.Files.GetBulkRunLumi \
+     import GetBulkRunLumi as MySQLGetBulkRunLumi
+
+class GetBulkRunLumi(MySQLGetBulkRunLumi):
+    pass
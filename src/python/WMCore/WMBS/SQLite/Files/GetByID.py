@@ -0,0 +1,10 @@
+"""
+_GetByID_
+
+SQLite implementation of Files.GetByID
+"""
+
+from WMCore.WMBS.MySQL.Files.GetByID import GetByID as MySQLGetByID
+
+class GetByID(MySQLGetByID):
+    pass
@@ -0,0 +1,10 @@
+"""
+_GetByLFN_
+
+SQLite implementation of Files.GetByLFN
+"""
+
+from WMCore.WMBS.MySQL.Files.GetByLFN import GetByLFN as MySQLGetByLFN
+
+class GetByLFN(MySQLGetByLFN):
+    pass
@@ -0,0 +1,10 @@
+"""
+_GetChecksum_
+
+SQLite implementation of Files.GetChecksum
+"""
+
+from WMCore.WMBS.MySQL.Files.GetChecksum import GetChecksum as MySQLGetChecksum
+
+class GetChecksum(MySQLGetChecksum):
+    pass
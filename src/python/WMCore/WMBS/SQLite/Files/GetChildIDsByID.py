@@ -0,0 +1,11 @@
+"""
+_GetChildIDsByID_
+
+SQLite implementation of Files.GetChildIDsByID
+"""
+
+from WMCore.WMBS.MySQL.Files.GetChildIDsByID \
+     import GetChildIDsByID as MySQLGetChildIDsByID
+
+class GetChildIDsByID(MySQLGetChildIDsByID):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetForJobSplittingByID_
+
+SQLite implementation of Files.GetForJobSplittingByID
+"""
+
+from WMCore.WMBS.MySQL.Files.GetForJobSplittingByID \
+     import GetForJobSplittingByID as MySQLGetForJobSplittingByID
+
+class GetForJobSplittingByID(MySQLGetForJobSplittingByID):
+    pass
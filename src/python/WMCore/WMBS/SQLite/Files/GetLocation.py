@@ -0,0 +1,10 @@
+"""
+_GetLocation_
+
+SQLite implementation of Files.GetLocation
+"""
+
+from WMCore.WMBS.MySQL.Files.GetLocation import GetLocation as MySQLGetLocation
+
+class GetLocation(MySQLGetLocation):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetLocationBulk_
+
+SQLite implementation of Files.GetLocationBulk
+"""
+
+from WMCore.WMBS.MySQL.Files.GetLocationBulk \
+     import GetLocationBulk as MySQLGetLocationBulk
+
+class GetLocationBulk(MySQLGetLocationBulk):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetParentIDsByID_
+
+SQLite implementation of Files.GetParentIDsByID
+"""
+
+from WMCore.WMBS.MySQL.Files.GetParentIDsByID \
+     import GetParentIDsByID as MySQLGetParentIDsByID
+
+class GetParentIDsByID(MySQLGetParentIDsByID):
+    pass
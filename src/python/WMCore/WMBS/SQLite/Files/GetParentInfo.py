@@ -0,0 +1,11 @@
+"""
+_GetParentInfo_
+
+SQLite implementation of Files.GetParentInfo
+"""
+
+from WMCore.WMBS.MySQL.Files.GetParentInfo \
+     import GetParentInfo as MySQLGetParentInfo
+
+class GetParentInfo(MySQLGetParentInfo):
+    pass
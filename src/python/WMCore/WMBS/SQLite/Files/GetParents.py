@@ -0,0 +1,10 @@
+"""
+_GetParents_
+
+SQLite implementation of Files.GetParents
+"""
+
+from WMCore.WMBS.MySQL.Files.GetParents import GetParents as MySQLGetParents
+
+class GetParents(MySQLGetParents):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetRunLumiFile_
+
+SQLite implementation of Files.GetRunLumiFile
+"""
+
+from WMCore.WMBS.MySQL.Files.GetRunLumiFile \
+     import GetRunLumiFile as MySQLGetRunLumiFile
+
+class GetRunLumiFile(MySQLGetRunLumiFile):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Heritage_
+
+SQLite implementation of Files.Heritage
+"""
+
+from WMCore.WMBS.MySQL.Files.Heritage import Heritage as MySQLHeritage
+
+class Heritage(MySQLHeritage):
+    pass
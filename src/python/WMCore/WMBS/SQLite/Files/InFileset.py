@@ -0,0 +1,10 @@
+"""
+_InFileset_
+
+SQLite implementation of Files.InFileset
+"""
+
+from WMCore.WMBS.MySQL.Files.InFileset import InFileset as MySQLInFileset
+
+class InFileset(MySQLInFileset):
+    pass
@@ -0,0 +1,10 @@
+"""
+_SetLocation_
+
+SQLite implementation of Files.SetLocation
+"""
+
+from WMCore.WMBS.MySQL.Files.SetLocation import SetLocation as MySQLSetLocation
+
+class SetLocation(MySQLSetLocation):
+    pass
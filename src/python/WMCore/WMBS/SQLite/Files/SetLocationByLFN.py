@@ -0,0 +1,11 @@
+"""
+_SetLocationByLFN_
+
+SQLite implementation of Files.SetLocationByLFN
+"""
+
+from WMCore.WMBS.MySQL.Files.SetLocationByLFN \
+     import SetLocationByLFN as MySQLSetLocationByLFN
+
+class SetLocationByLFN(MySQLSetLocationByLFN):
+    pass
@@ -0,0 +1,15 @@
+"""
+_SetLocationForWorkQueue_
+
+SQLite implementation of Files.SetLocationForWorkQueue
+"""
+
+from WMCore.WMBS.MySQL.Files.SetLocationForWorkQueue \
+     import SetLocationForWorkQueue as MySQLSetLocationForWorkQueue
+
+class SetLocationForWorkQueue(MySQLSetLocationForWorkQueue):
+    insertSQL = """INSERT OR IGNORE INTO wmbs_file_location (fileid, location)
+                     SELECT wmbs_file_details.id, wls.location
+                       FROM wmbs_location_pnns wls, wmbs_file_details
+                       WHERE wls.pnn = :location
+                       AND wmbs_file_details.lfn = :lfn"""
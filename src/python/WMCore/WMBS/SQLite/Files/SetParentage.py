@@ -0,0 +1,16 @@
+"""
+_SetParentage_
+
+SQLite implementation of Files.SetParentage
+"""
+
+from WMCore.WMBS.MySQL.Files.SetParentage \
+     import SetParentage as MySQLSetParentage
+
+class SetParentage(MySQLSetParentage):
+    sql = """INSERT OR IGNORE INTO wmbs_file_parent (child, parent)
+             SELECT DISTINCT wfd1.id, wfd2.id
+             FROM wmbs_file_details wfd1 INNER JOIN wmbs_file_details wfd2
+             WHERE wfd1.lfn = :child
+             AND wfd2.lfn = :parent
+    """
@@ -0,0 +1,11 @@
+"""
+_SetParentageByJob_
+
+SQLite implementation of Files.SetParentageByJob
+"""
+
+from WMCore.WMBS.MySQL.Files.SetParentageByJob \
+     import SetParentageByJob as MySQLSetParentageByJob
+
+class SetParentageByJob(MySQLSetParentageByJob):
+    pass
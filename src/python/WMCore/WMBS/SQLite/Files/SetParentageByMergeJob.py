@@ -0,0 +1,11 @@
+"""
+_SetParentageByMergeJob_
+
+SQLite implementation of Files.SetParentageByMergeJob
+"""
+
+from WMCore.WMBS.MySQL.Files.SetParentageByMergeJob \
+     import SetParentageByMergeJob as MySQLSetParentageByMergeJob
+
+class SetParentageByMergeJob(MySQLSetParentageByMergeJob):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Update_
+
+SQLite implementation of Files.Update
+"""
+
+from WMCore.WMBS.MySQL.Files.Update import Update as MySQLUpdate
+
+class Update(MySQLUpdate):
+    pass
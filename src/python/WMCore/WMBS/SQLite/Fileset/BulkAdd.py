@@ -0,0 +1,10 @@
+"""
+_BulkAdd_
+
+SQLite implementation of Fileset.BulkAdd
+"""
+
+from WMCore.WMBS.MySQL.Fileset.BulkAdd import BulkAdd as MySQLBulkAdd
+
+class BulkAdd(MySQLBulkAdd):
+    pass
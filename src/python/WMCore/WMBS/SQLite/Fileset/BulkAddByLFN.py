@@ -0,0 +1,11 @@
+"""
+_BulkAddByLFN_
+
+SQLite implementation of Fileset.BulkAddByLFN
+"""
+
+from WMCore.WMBS.MySQL.Fileset.BulkAddByLFN \
+     import BulkAddByLFN as MySQLBulkAddByLFN
+
+class BulkAddByLFN(MySQLBulkAddByLFN):
+    pass
@@ -0,0 +1,11 @@
+"""
+_BulkNewReturn_
+
+SQLite implementation of Fileset.BulkNewReturn
+"""
+
+from WMCore.WMBS.MySQL.Fileset.BulkNewReturn \
+     import BulkNewReturn as MySQLBulkNewReturn
+
+class BulkNewReturn(MySQLBulkNewReturn):
+    pass
@@ -0,0 +1,11 @@
+"""
+_CheckForDelete_
+
+SQLite implementation of Fileset.CheckForDelete
+"""
+
+from WMCore.WMBS.MySQL.Fileset.CheckForDelete \
+     import CheckForDelete as MySQLCheckForDelete
+
+class CheckForDelete(MySQLCheckForDelete):
+    pass
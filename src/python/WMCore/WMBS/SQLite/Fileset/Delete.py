@@ -0,0 +1,10 @@
+"""
+_Delete_
+
+SQLite implementation of Fileset.Delete
+"""
+
+from WMCore.WMBS.MySQL.Fileset.Delete import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
@@ -0,0 +1,11 @@
+"""
+_DeleteCheck_
+
+SQLite implementation of Fileset.DeleteCheck
+"""
+
+from WMCore.WMBS.MySQL.Fileset.DeleteCheck \
+     import DeleteCheck as MySQLDeleteCheck
+
+class DeleteCheck(MySQLDeleteCheck):
+    pass
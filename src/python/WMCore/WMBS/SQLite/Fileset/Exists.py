@@ -0,0 +1,10 @@
+"""
+_Exists_
+
+SQLite implementation of Fileset.Exists
+"""
+
+from WMCore.WMBS.MySQL.Fileset.Exists import Exists as MySQLExists
+
+class Exists(MySQLExists):
+    pass
@@ -0,0 +1,10 @@
+"""
+_ExistsByID_
+
+SQLite implementation of Fileset.ExistsByID
+"""
+
+from WMCore.WMBS.MySQL.Fileset.ExistsByID import ExistsByID as MySQLExistsByID
+
+class ExistsByID(MySQLExistsByID):
+    pass
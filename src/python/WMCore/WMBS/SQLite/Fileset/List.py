@@ -0,0 +1,10 @@
+"""
+_List_
+
+SQLite implementation of Fileset.List
+"""
+
+from WMCore.WMBS.MySQL.Fileset.List import List as MySQLList
+
+class List(MySQLList):
+    pass
@@ -0,0 +1,11 @@
+"""
+_ListClosable_
+
+SQLite implementation of Fileset.ListClosable
+"""
+
+from WMCore.WMBS.MySQL.Fileset.ListClosable \
+     import ListClosable as MySQLListClosable
+
+class ListClosable(MySQLListClosable):
+    pass
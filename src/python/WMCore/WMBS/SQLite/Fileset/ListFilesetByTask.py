@@ -0,0 +1,11 @@
+"""
+_ListFilesetByTask_
+
+SQLite implementation of Fileset.ListFilesetByTask
+"""
+
+from WMCore.WMBS.MySQL.Fileset.ListFilesetByTask \
+     import ListFilesetByTask as MySQLListFilesetByTask
+
+class ListFilesetByTask(MySQLListFilesetByTask):
+    pass
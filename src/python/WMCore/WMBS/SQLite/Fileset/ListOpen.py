@@ -0,0 +1,10 @@
+"""
+_ListOpen_
+
+SQLite implementation of Fileset.ListOpen
+"""
+
+from WMCore.WMBS.MySQL.Fileset.ListOpen import ListOpen as MySQLListOpen
+
+class ListOpen(MySQLListOpen):
+    pass
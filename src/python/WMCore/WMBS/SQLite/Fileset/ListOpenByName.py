@@ -0,0 +1,11 @@
+"""
+_ListOpenByName_
+
+SQLite implementation of Fileset.ListOpenByName
+"""
+
+from WMCore.WMBS.MySQL.Fileset.ListOpenByName \
+     import ListOpenByName as MySQLListOpenByName
+
+class ListOpenByName(MySQLListOpenByName):
+    pass
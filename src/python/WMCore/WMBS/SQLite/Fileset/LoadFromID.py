@@ -0,0 +1,10 @@
+"""
+_LoadFromID_
+
+SQLite implementation of Fileset.LoadFromID
+"""
+
+from WMCore.WMBS.MySQL.Fileset.LoadFromID import LoadFromID as MySQLLoadFromID
+
+class LoadFromID(MySQLLoadFromID):
+    pass
@@ -0,0 +1,11 @@
+"""
+_LoadFromName_
+
+SQLite implementation of Fileset.LoadFromName
+"""
+
+from WMCore.WMBS.MySQL.Fileset.LoadFromName \
+     import LoadFromName as MySQLLoadFromName
+
+class LoadFromName(MySQLLoadFromName):
+    pass
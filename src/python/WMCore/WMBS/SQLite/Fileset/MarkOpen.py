@@ -0,0 +1,10 @@
+"""
+_MarkOpen_
+
+SQLite implementation of Fileset.MarkOpen
+"""
+
+from WMCore.WMBS.MySQL.Fileset.MarkOpen import MarkOpen as MySQLMarkOpen
+
+class MarkOpen(MySQLMarkOpen):
+    pass
@@ -0,0 +1,10 @@
+"""
+_New_
+
+SQLite implementation of Fileset.New
+"""
+
+from WMCore.WMBS.MySQL.Fileset.New import New as MySQLNew
+
+class New(MySQLNew):
+    pass
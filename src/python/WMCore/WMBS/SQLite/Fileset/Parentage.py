@@ -0,0 +1,10 @@
+"""
+_Parentage_
+
+SQLite implementation of Fileset.Parentage
+"""
+
+from WMCore.WMBS.MySQL.Fileset.Parentage import Parentage as MySQLParentage
+
+class Parentage(MySQLParentage):
+    pass
@@ -0,0 +1,11 @@
+"""
+_SetLastUpdate_
+
+SQLite implementation of Fileset.SetLastUpdate
+"""
+
+from WMCore.WMBS.MySQL.Fileset.SetLastUpdate \
+     import SetLastUpdate as MySQLSetLastUpdate
+
+class SetLastUpdate(MySQLSetLastUpdate):
+    pass
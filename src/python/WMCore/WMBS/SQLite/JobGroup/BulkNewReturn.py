@@ -0,0 +1,11 @@
+"""
+_BulkNewReturn_
+
+SQLite implementation of JobGroup.BulkNewReturn
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.BulkNewReturn \
+     import BulkNewReturn as MySQLBulkNewReturn
+
+class BulkNewReturn(MySQLBulkNewReturn):
+    pass
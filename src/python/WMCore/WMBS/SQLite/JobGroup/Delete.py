@@ -0,0 +1,10 @@
+"""
+_Delete_
+
+SQLite implementation of JobGroup.Delete
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.Delete import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Exists_
+
+SQLite implementation of JobGroup.Exists
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.Exists import Exists as MySQLExists
+
+class Exists(MySQLExists):
+    pass
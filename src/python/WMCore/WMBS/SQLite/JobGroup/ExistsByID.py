@@ -0,0 +1,10 @@
+"""
+_ExistsByID_
+
+SQLite implementation of JobGroup.ExistsByID
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.ExistsByID import ExistsByID as MySQLExistsByID
+
+class ExistsByID(MySQLExistsByID):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetLocationsForJobs_
+
+SQLite implementation of JobGroup.GetLocationsForJobs
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.GetLocationsForJobs \
+     import GetLocationsForJobs as MySQLGetLocationsForJobs
+
+class GetLocationsForJobs(MySQLGetLocationsForJobs):
+    pass
@@ -0,0 +1,10 @@
+"""
+_GetSite_
+
+SQLite implementation of JobGroup.GetSite
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.GetSite import GetSite as MySQLGetSite
+
+class GetSite(MySQLGetSite):
+    pass
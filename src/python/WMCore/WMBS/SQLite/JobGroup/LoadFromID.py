@@ -0,0 +1,10 @@
+"""
+_LoadFromID_
+
+SQLite implementation of JobGroup.LoadFromID
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.LoadFromID import LoadFromID as MySQLLoadFromID
+
+class LoadFromID(MySQLLoadFromID):
+    pass
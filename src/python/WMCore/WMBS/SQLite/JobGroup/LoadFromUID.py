@@ -0,0 +1,11 @@
+"""
+_LoadFromUID_
+
+SQLite implementation of JobGroup.LoadFromUID
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.LoadFromUID \
+     import LoadFromUID as MySQLLoadFromUID
+
+class LoadFromUID(MySQLLoadFromUID):
+    pass
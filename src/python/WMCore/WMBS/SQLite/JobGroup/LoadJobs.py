@@ -0,0 +1,10 @@
+"""
+_LoadJobs_
+
+SQLite implementation of JobGroup.LoadJobs
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.LoadJobs import LoadJobs as MySQLLoadJobs
+
+class LoadJobs(MySQLLoadJobs):
+    pass
@@ -0,0 +1,10 @@
+"""
+_New_
+
+SQLite implementation of JobGroup.New
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.New import New as MySQLNew
+
+class New(MySQLNew):
+    pass
@@ -0,0 +1,12 @@
+"""
+_SetSite_
+
+SQLite implementation of JobGroup.SetSite
+"""
+
+from WMCore.WMBS.MySQL.JobGroup.SetSite import SetSite as MySQLSetSite
+
+class SetSite(MySQLSetSite):
+    sql = """UPDATE wmbs_jobgroup
+              SET location = (SELECT id FROM wmbs_location WHERE site_name = :site_name)
+              WHERE id = :jobGroupID"""
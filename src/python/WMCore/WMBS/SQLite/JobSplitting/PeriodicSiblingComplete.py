@@ -0,0 +1,11 @@
+"""
+_PeriodicSiblingComplete_
+
+SQLite implementation of JobSplitting.PeriodicSiblingComplete
+"""
+
+from WMCore.WMBS.MySQL.JobSplitting.PeriodicSiblingComplete \
+     import PeriodicSiblingComplete as MySQLPeriodicSiblingComplete
+
+class PeriodicSiblingComplete(MySQLPeriodicSiblingComplete):
+    pass
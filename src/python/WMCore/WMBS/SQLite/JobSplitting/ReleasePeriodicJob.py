@@ -0,0 +1,11 @@
+"""
+_ReleasePeriodicJob_
+
+SQLite implementation of JobSplitting.ReleasePeriodicJob
+"""
+
+from WMCore.WMBS.MySQL.JobSplitting.ReleasePeriodicJob \
+     import ReleasePeriodicJob as MySQLReleasePeriodicJob
+
+class ReleasePeriodicJob(MySQLReleasePeriodicJob):
+    pass
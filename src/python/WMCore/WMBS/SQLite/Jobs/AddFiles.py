@@ -0,0 +1,10 @@
+"""
+_AddFiles_
+
+SQLite implementation of Jobs.AddFiles
+"""
+
+from WMCore.WMBS.MySQL.Jobs.AddFiles import AddFiles as MySQLAddFiles
+
+class AddFiles(MySQLAddFiles):
+    pass
@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+_AutoIncrementCheck_
+
+SQLite implementation of Jobs.AutoIncrementCheck
+
+SQLite keeps the AUTOINCREMENT counter in the sqlite_sequence table instead
+of the table definition, so the counter is read and reset there.
+"""
+
+from WMCore.WMBS.MySQL.Jobs.AutoIncrementCheck \
+     import AutoIncrementCheck as MySQLAutoIncrementCheck
+
+class AutoIncrementCheck(MySQLAutoIncrementCheck):
+    """
+    _AutoIncrementCheck_
+
+    Check and properly set the sqlite_sequence counter for wmbs_job
+    """
+
+    currentSQL = """SELECT IFNULL(MAX(seq), 0) + 1 FROM sqlite_sequence
+                      WHERE name = 'wmbs_job'"""
+
+    deleteSQL = "DELETE FROM sqlite_sequence WHERE name = 'wmbs_job'"
+
+    alterSQL = """INSERT INTO sqlite_sequence (name, seq)
+                    VALUES ('wmbs_job', :value - 1)"""
+
+    def execute(self, input = 0, conn = None, transaction = False):
+        """
+        _execute_
+
+        """
+        highest = self.dbi.processData(self.highestSQL, {}, conn = conn,
+                                       transaction = transaction)[0].fetchall()[0][0]
+
+        current = self.dbi.processData(self.currentSQL, {}, conn = conn,
+                                       transaction = transaction)[0].fetchall()[0][0]
+
+        value = max(input + 1, highest + 1)
+
+        if value > current:
+            self.dbi.processData(self.deleteSQL, {}, conn = conn,
+                                 transaction = transaction)
+            self.dbi.processData(self.alterSQL, {'value': value},
+                                 conn = conn, transaction = transaction)
+
+        return
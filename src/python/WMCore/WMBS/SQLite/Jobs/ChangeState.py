@@ -0,0 +1,10 @@
+"""
+_ChangeState_
+
+SQLite implementation of Jobs.ChangeState
+"""
+
+from WMCore.WMBS.MySQL.Jobs.ChangeState import ChangeState as MySQLChangeState
+
+class ChangeState(MySQLChangeState):
+    pass
@@ -0,0 +1,17 @@
+"""
+_CompleteInput_
+
+SQLite implementation of Jobs.CompleteInput
+"""
+
+from WMCore.WMBS.MySQL.Jobs.CompleteInput \
+     import CompleteInput as MySQLCompleteInput
+
+class CompleteInput(MySQLCompleteInput):
+    sql = """INSERT OR IGNORE INTO wmbs_sub_files_complete (fileid, subscription)
+               VALUES (:fileid, :subid)
+               """
+
+    failSql = """INSERT OR IGNORE INTO wmbs_sub_files_failed (fileid, subscription)
+               VALUES (:fileid, :subid)
+               """
@@ -0,0 +1,10 @@
+"""
+_Delete_
+
+SQLite implementation of Jobs.Delete
+"""
+
+from WMCore.WMBS.MySQL.Jobs.Delete import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
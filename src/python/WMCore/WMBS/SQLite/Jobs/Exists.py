@@ -0,0 +1,10 @@
+"""
+_Exists_
+
+SQLite implementation of Jobs.Exists
+"""
+
+from WMCore.WMBS.MySQL.Jobs.Exists import Exists as MySQLExists
+
+class Exists(MySQLExists):
+    pass
@@ -0,0 +1,10 @@
+"""
+_ExistsByID_
+
+SQLite implementation of Jobs.ExistsByID
+"""
+
+from WMCore.WMBS.MySQL.Jobs.ExistsByID import ExistsByID as MySQLExistsByID
+
+class ExistsByID(MySQLExistsByID):
+    pass
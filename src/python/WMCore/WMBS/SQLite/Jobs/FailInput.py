@@ -0,0 +1,11 @@
+"""
+_FailInput_
+
+SQLite implementation of Jobs.FailInput
+"""
+
+from WMCore.WMBS.MySQL.Jobs.FailInput import FailInput as MySQLFailInput
+
+class FailInput(MySQLFailInput):
+    sql = """INSERT OR IGNORE INTO wmbs_sub_files_failed (fileid, subscription)
+               VALUES (:fileid, :subid)"""
@@ -0,0 +1,10 @@
+"""
+_GetAllJobs_
+
+SQLite implementation of Jobs.GetAllJobs
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetAllJobs import GetAllJobs as MySQLGetAllJobs
+
+class GetAllJobs(MySQLGetAllJobs):
+    pass
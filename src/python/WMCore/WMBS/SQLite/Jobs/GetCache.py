@@ -0,0 +1,10 @@
+"""
+_GetCache_
+
+SQLite implementation of Jobs.GetCache
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetCache import GetCache as MySQLGetCache
+
+class GetCache(MySQLGetCache):
+    pass
@@ -0,0 +1,10 @@
+"""
+_GetCouchID_
+
+SQLite implementation of Jobs.GetCouchID
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetCouchID import GetCouchID as MySQLGetCouchID
+
+class GetCouchID(MySQLGetCouchID):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetFWJRByState_
+
+SQLite implementation of Jobs.GetFWJRByState
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetFWJRByState \
+     import GetFWJRByState as MySQLGetFWJRByState
+
+class GetFWJRByState(MySQLGetFWJRByState):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetFWJRTaskName_
+
+SQLite implementation of Jobs.GetFWJRTaskName
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetFWJRTaskName \
+     import GetFWJRTaskName as MySQLGetFWJRTaskName
+
+class GetFWJRTaskName(MySQLGetFWJRTaskName):
+    pass
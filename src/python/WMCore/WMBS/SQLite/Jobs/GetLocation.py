@@ -0,0 +1,10 @@
+"""
+_GetLocation_
+
+SQLite implementation of Jobs.GetLocation
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetLocation import GetLocation as MySQLGetLocation
+
+class GetLocation(MySQLGetLocation):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetNumberOfJobsForWorkflowTaskStatus_
+
+SQLite implementation of Jobs.GetNumberOfJobsForWorkflowTaskStatus
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetNumberOfJobsForWorkflowTaskStatus \
+     import GetNumberOfJobsForWorkflowTaskStatus as MySQLGetNumberOfJobsForWorkflowTaskStatus
+
+class GetNumberOfJobsForWorkflowTaskStatus(MySQLGetNumberOfJobsForWorkflowTaskStatus):
+    pass
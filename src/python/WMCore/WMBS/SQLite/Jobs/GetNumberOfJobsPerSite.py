@@ -0,0 +1,11 @@
+"""
+_GetNumberOfJobsPerSite_
+
+SQLite implementation of Jobs.GetNumberOfJobsPerSite
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetNumberOfJobsPerSite \
+     import GetNumberOfJobsPerSite as MySQLGetNumberOfJobsPerSite
+
+class GetNumberOfJobsPerSite(MySQLGetNumberOfJobsPerSite):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetNumberOfJobsPerWorkflow_
+
+SQLite implementation of Jobs.GetNumberOfJobsPerWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetNumberOfJobsPerWorkflow \
+     import GetNumberOfJobsPerWorkflow as MySQLGetNumberOfJobsPerWorkflow
+
+class GetNumberOfJobsPerWorkflow(MySQLGetNumberOfJobsPerWorkflow):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetOutputMap_
+
+SQLite implementation of Jobs.GetOutputMap
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetOutputMap \
+     import GetOutputMap as MySQLGetOutputMap
+
+class GetOutputMap(MySQLGetOutputMap):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetOutputParentLFNs_
+
+SQLite implementation of Jobs.GetOutputParentLFNs
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetOutputParentLFNs \
+     import GetOutputParentLFNs as MySQLGetOutputParentLFNs
+
+class GetOutputParentLFNs(MySQLGetOutputParentLFNs):
+    pass
@@ -0,0 +1,10 @@
+"""
+_GetState_
+
+SQLite implementation of Jobs.GetState
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetState import GetState as MySQLGetState
+
+class GetState(MySQLGetState):
+    pass
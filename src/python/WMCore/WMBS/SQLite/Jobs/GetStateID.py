@@ -0,0 +1,10 @@
+"""
+_GetStateID_
+
+SQLite implementation of Jobs.GetStateID
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetStateID import GetStateID as MySQLGetStateID
+
+class GetStateID(MySQLGetStateID):
+    pass
@@ -0,0 +1,10 @@
+"""
+_GetTask_
+
+SQLite implementation of Jobs.GetTask
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetTask import GetTask as MySQLGetTask
+
+class GetTask(MySQLGetTask):
+    pass
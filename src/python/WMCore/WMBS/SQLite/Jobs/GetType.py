@@ -0,0 +1,10 @@
+"""
+_GetType_
+
+SQLite implementation of Jobs.GetType
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetType import GetType as MySQLGetType
+
+class GetType(MySQLGetType):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetWorkflowTask_
+
+SQLite implementation of Jobs.GetWorkflowTask
+"""
+
+from WMCore.WMBS.MySQL.Jobs.GetWorkflowTask \
+     import GetWorkflowTask as MySQLGetWorkflowTask
+
+class GetWorkflowTask(MySQLGetWorkflowTask):
+    pass
@@ -0,0 +1,11 @@
+"""
+_IncrementRetry_
+
+SQLite implementation of Jobs.IncrementRetry
+"""
+
+from WMCore.WMBS.MySQL.Jobs.IncrementRetry \
+     import IncrementRetry as MySQLIncrementRetry
+
+class IncrementRetry(MySQLIncrementRetry):
+    pass
@@ -0,0 +1,11 @@
+"""
+_KillWorkflow_
+
+SQLite implementation of Jobs.KillWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Jobs.KillWorkflow \
+     import KillWorkflow as MySQLKillWorkflow
+
+class KillWorkflow(MySQLKillWorkflow):
+    pass
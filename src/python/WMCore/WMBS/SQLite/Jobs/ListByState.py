@@ -0,0 +1,10 @@
+"""
+_ListByState_
+
+SQLite implementation of Jobs.ListByState
+"""
+
+from WMCore.WMBS.MySQL.Jobs.ListByState import ListByState as MySQLListByState
+
+class ListByState(MySQLListByState):
+    pass
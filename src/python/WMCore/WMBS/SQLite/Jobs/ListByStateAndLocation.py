@@ -0,0 +1,11 @@
+"""
+_ListByStateAndLocation_
+
+SQLite implementation of Jobs.ListByStateAndLocation
+"""
+
+from WMCore.WMBS.MySQL.Jobs.ListByStateAndLocation \
+     import ListByStateAndLocation as MySQLListByStateAndLocation
+
+class ListByStateAndLocation(MySQLListByStateAndLocation):
+    pass
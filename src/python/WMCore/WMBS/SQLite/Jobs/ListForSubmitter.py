@@ -0,0 +1,11 @@
+"""
+_ListForSubmitter_
+
+SQLite implementation of Jobs.ListForSubmitter
+"""
+
+from WMCore.WMBS.MySQL.Jobs.ListForSubmitter \
+     import ListForSubmitter as MySQLListForSubmitter
+
+class ListForSubmitter(MySQLListForSubmitter):
+    pass
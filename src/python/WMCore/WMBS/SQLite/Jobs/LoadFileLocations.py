@@ -0,0 +1,11 @@
+"""
+_LoadFileLocations_
+
+SQLite implementation of Jobs.LoadFileLocations
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadFileLocations \
+     import LoadFileLocations as MySQLLoadFileLocations
+
+class LoadFileLocations(MySQLLoadFileLocations):
+    pass
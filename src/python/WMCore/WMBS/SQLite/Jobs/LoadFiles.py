@@ -0,0 +1,10 @@
+"""
+_LoadFiles_
+
+SQLite implementation of Jobs.LoadFiles
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadFiles import LoadFiles as MySQLLoadFiles
+
+class LoadFiles(MySQLLoadFiles):
+    pass
@@ -0,0 +1,11 @@
+"""
+_LoadForErrorHandler_
+
+SQLite implementation of Jobs.LoadForErrorHandler
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadForErrorHandler \
+     import LoadForErrorHandler as MySQLLoadForErrorHandler
+
+class LoadForErrorHandler(MySQLLoadForErrorHandler):
+    pass
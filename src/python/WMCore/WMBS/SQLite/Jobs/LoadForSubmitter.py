@@ -0,0 +1,11 @@
+"""
+_LoadForSubmitter_
+
+SQLite implementation of Jobs.LoadForSubmitter
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadForSubmitter \
+     import LoadForSubmitter as MySQLLoadForSubmitter
+
+class LoadForSubmitter(MySQLLoadForSubmitter):
+    pass
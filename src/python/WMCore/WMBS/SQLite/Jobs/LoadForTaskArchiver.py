@@ -0,0 +1,11 @@
+"""
+_LoadForTaskArchiver_
+
+SQLite implementation of Jobs.LoadForTaskArchiver
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadForTaskArchiver \
+     import LoadForTaskArchiver as MySQLLoadForTaskArchiver
+
+class LoadForTaskArchiver(MySQLLoadForTaskArchiver):
+    pass
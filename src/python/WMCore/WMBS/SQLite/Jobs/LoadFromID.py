@@ -0,0 +1,10 @@
+"""
+_LoadFromID_
+
+SQLite implementation of Jobs.LoadFromID
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadFromID import LoadFromID as MySQLLoadFromID
+
+class LoadFromID(MySQLLoadFromID):
+    pass
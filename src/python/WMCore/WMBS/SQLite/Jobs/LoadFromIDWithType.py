@@ -0,0 +1,11 @@
+"""
+_LoadFromIDWithType_
+
+SQLite implementation of Jobs.LoadFromIDWithType
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadFromIDWithType \
+     import LoadFromIDWithType as MySQLLoadFromIDWithType
+
+class LoadFromIDWithType(MySQLLoadFromIDWithType):
+    pass
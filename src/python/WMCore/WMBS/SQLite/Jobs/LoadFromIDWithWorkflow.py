@@ -0,0 +1,11 @@
+"""
+_LoadFromIDWithWorkflow_
+
+SQLite implementation of Jobs.LoadFromIDWithWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadFromIDWithWorkflow \
+     import LoadFromIDWithWorkflow as MySQLLoadFromIDWithWorkflow
+
+class LoadFromIDWithWorkflow(MySQLLoadFromIDWithWorkflow):
+    pass
@@ -0,0 +1,11 @@
+"""
+_LoadFromName_
+
+SQLite implementation of Jobs.LoadFromName
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadFromName \
+     import LoadFromName as MySQLLoadFromName
+
+class LoadFromName(MySQLLoadFromName):
+    pass
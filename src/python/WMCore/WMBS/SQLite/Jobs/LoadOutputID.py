@@ -0,0 +1,11 @@
+"""
+_LoadOutputID_
+
+SQLite implementation of Jobs.LoadOutputID
+"""
+
+from WMCore.WMBS.MySQL.Jobs.LoadOutputID \
+     import LoadOutputID as MySQLLoadOutputID
+
+class LoadOutputID(MySQLLoadOutputID):
+    pass
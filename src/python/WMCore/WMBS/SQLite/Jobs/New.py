@@ -0,0 +1,10 @@
+"""
+_New_
+
+SQLite implementation of Jobs.New
+"""
+
+from WMCore.WMBS.MySQL.Jobs.New import New as MySQLNew
+
+class New(MySQLNew):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Save_
+
+SQLite implementation of Jobs.Save
+"""
+
+from WMCore.WMBS.MySQL.Jobs.Save import Save as MySQLSave
+
+class Save(MySQLSave):
+    pass
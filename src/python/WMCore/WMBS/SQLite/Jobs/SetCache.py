@@ -0,0 +1,10 @@
+"""
+_SetCache_
+
+SQLite implementation of Jobs.SetCache
+"""
+
+from WMCore.WMBS.MySQL.Jobs.SetCache import SetCache as MySQLSetCache
+
+class SetCache(MySQLSetCache):
+    pass
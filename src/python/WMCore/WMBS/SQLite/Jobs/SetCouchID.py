@@ -0,0 +1,10 @@
+"""
+_SetCouchID_
+
+SQLite implementation of Jobs.SetCouchID
+"""
+
+from WMCore.WMBS.MySQL.Jobs.SetCouchID import SetCouchID as MySQLSetCouchID
+
+class SetCouchID(MySQLSetCouchID):
+    pass
@@ -0,0 +1,10 @@
+"""
+_SetFWJRPath_
+
+SQLite implementation of Jobs.SetFWJRPath
+"""
+
+from WMCore.WMBS.MySQL.Jobs.SetFWJRPath import SetFWJRPath as MySQLSetFWJRPath
+
+class SetFWJRPath(MySQLSetFWJRPath):
+    pass
@@ -0,0 +1,10 @@
+"""
+_SetLocation_
+
+SQLite implementation of Jobs.SetLocation
+"""
+
+from WMCore.WMBS.MySQL.Jobs.SetLocation import SetLocation as MySQLSetLocation
+
+class SetLocation(MySQLSetLocation):
+    pass
@@ -0,0 +1,11 @@
+"""
+_SetOutcomeBulk_
+
+SQLite implementation of Jobs.SetOutcomeBulk
+"""
+
+from WMCore.WMBS.MySQL.Jobs.SetOutcomeBulk \
+     import SetOutcomeBulk as MySQLSetOutcomeBulk
+
+class SetOutcomeBulk(MySQLSetOutcomeBulk):
+    pass
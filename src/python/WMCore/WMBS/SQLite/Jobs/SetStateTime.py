@@ -0,0 +1,11 @@
+"""
+_SetStateTime_
+
+SQLite implementation of Jobs.SetStateTime
+"""
+
+from WMCore.WMBS.MySQL.Jobs.SetStateTime \
+     import SetStateTime as MySQLSetStateTime
+
+class SetStateTime(MySQLSetStateTime):
+    pass
@@ -0,0 +1,11 @@
+"""
+_UpdateLocation_
+
+SQLite implementation of Jobs.UpdateLocation
+"""
+
+from WMCore.WMBS.MySQL.Jobs.UpdateLocation \
+     import UpdateLocation as MySQLUpdateLocation
+
+class UpdateLocation(MySQLUpdateLocation):
+    pass
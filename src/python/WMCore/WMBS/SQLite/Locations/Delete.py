@@ -0,0 +1,10 @@
+"""
+_Delete_
+
+SQLite implementation of Locations.Delete
+"""
+
+from WMCore.WMBS.MySQL.Locations.Delete import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetJobSlots_
+
+SQLite implementation of Locations.GetJobSlots
+"""
+
+from WMCore.WMBS.MySQL.Locations.GetJobSlots \
+     import GetJobSlots as MySQLGetJobSlots
+
+class GetJobSlots(MySQLGetJobSlots):
+    pass
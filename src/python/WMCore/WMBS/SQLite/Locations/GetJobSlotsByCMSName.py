@@ -0,0 +1,11 @@
+"""
+_GetJobSlotsByCMSName_
+
+SQLite implementation of Locations.GetJobSlotsByCMSName
+"""
+
+from WMCore.WMBS.MySQL.Locations.GetJobSlotsByCMSName \
+     import GetJobSlotsByCMSName as MySQLGetJobSlotsByCMSName
+
+class GetJobSlotsByCMSName(MySQLGetJobSlotsByCMSName):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetPNNtoPSNMapping_
+
+SQLite implementation of Locations.GetPNNtoPSNMapping
+"""
+
+from WMCore.WMBS.MySQL.Locations.GetPNNtoPSNMapping \
+     import GetPNNtoPSNMapping as MySQLGetPNNtoPSNMapping
+
+class GetPNNtoPSNMapping(MySQLGetPNNtoPSNMapping):
+    pass
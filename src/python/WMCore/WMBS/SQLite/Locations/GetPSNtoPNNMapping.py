@@ -0,0 +1,11 @@
+"""
+_GetPSNtoPNNMapping_
+
+SQLite implementation of Locations.GetPSNtoPNNMapping
+"""
+
+from WMCore.WMBS.MySQL.Locations.GetPSNtoPNNMapping \
+     import GetPSNtoPNNMapping as MySQLGetPSNtoPNNMapping
+
+class GetPSNtoPNNMapping(MySQLGetPSNtoPNNMapping):
+    pass
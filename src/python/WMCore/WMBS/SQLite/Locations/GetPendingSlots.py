@@ -0,0 +1,11 @@
+"""
+_GetPendingSlots_
+
+SQLite implementation of Locations.GetPendingSlots
+"""
+
+from WMCore.WMBS.MySQL.Locations.GetPendingSlots \
+     import GetPendingSlots as MySQLGetPendingSlots
+
+class GetPendingSlots(MySQLGetPendingSlots):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetRunningSlots_
+
+SQLite implementation of Locations.GetRunningSlots
+"""
+
+from WMCore.WMBS.MySQL.Locations.GetRunningSlots \
+     import GetRunningSlots as MySQLGetRunningSlots
+
+class GetRunningSlots(MySQLGetRunningSlots):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetSiteInfo_
+
+SQLite implementation of Locations.GetSiteInfo
+"""
+
+from WMCore.WMBS.MySQL.Locations.GetSiteInfo \
+     import GetSiteInfo as MySQLGetSiteInfo
+
+class GetSiteInfo(MySQLGetSiteInfo):
+    pass
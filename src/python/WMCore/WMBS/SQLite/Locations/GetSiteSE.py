@@ -0,0 +1,10 @@
+"""
+_GetSiteSE_
+
+SQLite implementation of Locations.GetSiteSE
+"""
+
+from WMCore.WMBS.MySQL.Locations.GetSiteSE import GetSiteSE as MySQLGetSiteSE
+
+class GetSiteSE(MySQLGetSiteSE):
+    pass
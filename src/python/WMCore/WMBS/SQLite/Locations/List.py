@@ -0,0 +1,10 @@
+"""
+_List_
+
+SQLite implementation of Locations.List
+"""
+
+from WMCore.WMBS.MySQL.Locations.List import List as MySQLList
+
+class List(MySQLList):
+    pass
@@ -0,0 +1,10 @@
+"""
+_ListSites_
+
+SQLite implementation of Locations.ListSites
+"""
+
+from WMCore.WMBS.MySQL.Locations.ListSites import ListSites as MySQLListSites
+
+class ListSites(MySQLListSites):
+    pass
@@ -0,0 +1,22 @@
+"""
+_New_
+
+SQLite implementation of Locations.New
+"""
+
+from WMCore.WMBS.MySQL.Locations.New import New as MySQLNew
+
+class New(MySQLNew):
+    sql = """INSERT OR IGNORE INTO wmbs_location (site_name, ce_name,
+                                               pending_slots, running_slots,
+                                               plugin, cms_name, state)
+                      SELECT
+                      :location AS site_name, :cename AS ce_name,
+                      :pending_slots AS pending_slots,
+                      :running_slots AS running_slots,
+                      :plugin as plugin,
+                      :cmsname AS cms_name,
+                      (SELECT id FROM wmbs_location_state WHERE name = 'Normal') AS state"""
+
+    seSQL = """INSERT OR IGNORE INTO wmbs_location_pnns (location, pnn)
+                 SELECT id, :pnn FROM wmbs_location WHERE site_name = :location """
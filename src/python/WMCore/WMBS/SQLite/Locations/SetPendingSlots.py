@@ -0,0 +1,11 @@
+"""
+_SetPendingSlots_
+
+SQLite implementation of Locations.SetPendingSlots
+"""
+
+from WMCore.WMBS.MySQL.Locations.SetPendingSlots \
+     import SetPendingSlots as MySQLSetPendingSlots
+
+class SetPendingSlots(MySQLSetPendingSlots):
+    pass
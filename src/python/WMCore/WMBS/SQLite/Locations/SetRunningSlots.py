@@ -0,0 +1,11 @@
+"""
+_SetRunningSlots_
+
+SQLite implementation of Locations.SetRunningSlots
+"""
+
+from WMCore.WMBS.MySQL.Locations.SetRunningSlots \
+     import SetRunningSlots as MySQLSetRunningSlots
+
+class SetRunningSlots(MySQLSetRunningSlots):
+    pass
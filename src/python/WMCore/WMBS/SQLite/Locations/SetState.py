@@ -0,0 +1,10 @@
+"""
+_SetState_
+
+SQLite implementation of Locations.SetState
+"""
+
+from WMCore.WMBS.MySQL.Locations.SetState import SetState as MySQLSetState
+
+class SetState(MySQLSetState):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Delete_
+
+SQLite implementation of Masks.Delete
+"""
+
+from WMCore.WMBS.MySQL.Masks.Delete import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
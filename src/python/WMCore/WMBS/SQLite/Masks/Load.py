@@ -0,0 +1,10 @@
+"""
+_Load_
+
+SQLite implementation of Masks.Load
+"""
+
+from WMCore.WMBS.MySQL.Masks.Load import Load as MySQLLoad
+
+class Load(MySQLLoad):
+    pass
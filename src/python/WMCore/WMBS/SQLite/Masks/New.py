@@ -0,0 +1,10 @@
+"""
+_New_
+
+SQLite implementation of Masks.New
+"""
+
+from WMCore.WMBS.MySQL.Masks.New import New as MySQLNew
+
+class New(MySQLNew):
+    pass
@@ -0,0 +1,14 @@
+"""
+_Save_
+
+SQLite implementation of Masks.Save
+"""
+
+from WMCore.WMBS.MySQL.Masks.Save import Save as MySQLSave
+
+class Save(MySQLSave):
+    sql = """INSERT OR IGNORE INTO wmbs_job_mask (job, firstevent, lastevent, firstrun,
+               lastrun, firstlumi, lastlumi, inclusivemask)
+             VALUES (:jobid, :firstevent, :lastevent, :firstrun, :lastrun, :firstlumi,
+               :lastlumi, :inclusivemask)
+    """
@@ -0,0 +1,10 @@
+#!/usr/bin/env python
+"""
+_WMBS_
+
+Workload Management Book-keeping Service
+
+
+"""
+
+__all__ = []
@@ -0,0 +1,11 @@
+"""
+_DefaultFormatter_
+
+SQLite implementation of Monitoring.DefaultFormatter
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.DefaultFormatter \
+     import DefaultFormatter as MySQLDefaultFormatter
+
+class DefaultFormatter(MySQLDefaultFormatter):
+    pass
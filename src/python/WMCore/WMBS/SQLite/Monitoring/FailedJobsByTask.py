@@ -0,0 +1,11 @@
+"""
+_FailedJobsByTask_
+
+SQLite implementation of Monitoring.FailedJobsByTask
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.FailedJobsByTask \
+     import FailedJobsByTask as MySQLFailedJobsByTask
+
+class FailedJobsByTask(MySQLFailedJobsByTask):
+    pass
@@ -0,0 +1,11 @@
+"""
+_FailedJobsByWorkflow_
+
+SQLite implementation of Monitoring.FailedJobsByWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.FailedJobsByWorkflow \
+     import FailedJobsByWorkflow as MySQLFailedJobsByWorkflow
+
+class FailedJobsByWorkflow(MySQLFailedJobsByWorkflow):
+    pass
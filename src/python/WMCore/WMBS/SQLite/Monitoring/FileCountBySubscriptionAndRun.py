@@ -0,0 +1,11 @@
+"""
+_FileCountBySubscriptionAndRun_
+
+SQLite implementation of Monitoring.FileCountBySubscriptionAndRun
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.FileCountBySubscriptionAndRun \
+     import FileCountBySubscriptionAndRun as MySQLFileCountBySubscriptionAndRun
+
+class FileCountBySubscriptionAndRun(MySQLFileCountBySubscriptionAndRun):
+    pass
@@ -0,0 +1,11 @@
+"""
+_JobCountByState_
+
+SQLite implementation of Monitoring.JobCountByState
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.JobCountByState \
+     import JobCountByState as MySQLJobCountByState
+
+class JobCountByState(MySQLJobCountByState):
+    pass
@@ -0,0 +1,11 @@
+"""
+_JobCountBySubscriptionAndRun_
+
+SQLite implementation of Monitoring.JobCountBySubscriptionAndRun
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.JobCountBySubscriptionAndRun \
+     import JobCountBySubscriptionAndRun as MySQLJobCountBySubscriptionAndRun
+
+class JobCountBySubscriptionAndRun(MySQLJobCountBySubscriptionAndRun):
+    pass
@@ -0,0 +1,11 @@
+"""
+_JobTypeCountByState_
+
+SQLite implementation of Monitoring.JobTypeCountByState
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.JobTypeCountByState \
+     import JobTypeCountByState as MySQLJobTypeCountByState
+
+class JobTypeCountByState(MySQLJobTypeCountByState):
+    pass
@@ -0,0 +1,11 @@
+"""
+_JobsByState_
+
+SQLite implementation of Monitoring.JobsByState
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.JobsByState \
+     import JobsByState as MySQLJobsByState
+
+class JobsByState(MySQLJobsByState):
+    pass
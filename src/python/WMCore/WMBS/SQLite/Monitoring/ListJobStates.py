@@ -0,0 +1,11 @@
+"""
+_ListJobStates_
+
+SQLite implementation of Monitoring.ListJobStates
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.ListJobStates \
+     import ListJobStates as MySQLListJobStates
+
+class ListJobStates(MySQLListJobStates):
+    pass
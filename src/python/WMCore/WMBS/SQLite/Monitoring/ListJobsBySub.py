@@ -0,0 +1,11 @@
+"""
+_ListJobsBySub_
+
+SQLite implementation of Monitoring.ListJobsBySub
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.ListJobsBySub \
+     import ListJobsBySub as MySQLListJobsBySub
+
+class ListJobsBySub(MySQLListJobsBySub):
+    pass
@@ -0,0 +1,11 @@
+"""
+_ListRunningJobs_
+
+SQLite implementation of Monitoring.ListRunningJobs
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.ListRunningJobs \
+     import ListRunningJobs as MySQLListRunningJobs
+
+class ListRunningJobs(MySQLListRunningJobs):
+    pass
@@ -0,0 +1,11 @@
+"""
+_ListSubTypes_
+
+SQLite implementation of Monitoring.ListSubTypes
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.ListSubTypes \
+     import ListSubTypes as MySQLListSubTypes
+
+class ListSubTypes(MySQLListSubTypes):
+    pass
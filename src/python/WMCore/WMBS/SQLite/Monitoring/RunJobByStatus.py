@@ -0,0 +1,11 @@
+"""
+_RunJobByStatus_
+
+SQLite implementation of Monitoring.RunJobByStatus
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.RunJobByStatus \
+     import RunJobByStatus as MySQLRunJobByStatus
+
+class RunJobByStatus(MySQLRunJobByStatus):
+    pass
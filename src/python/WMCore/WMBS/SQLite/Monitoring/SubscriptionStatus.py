@@ -0,0 +1,11 @@
+"""
+_SubscriptionStatus_
+
+SQLite implementation of Monitoring.SubscriptionStatus
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.SubscriptionStatus \
+     import SubscriptionStatus as MySQLSubscriptionStatus
+
+class SubscriptionStatus(MySQLSubscriptionStatus):
+    pass
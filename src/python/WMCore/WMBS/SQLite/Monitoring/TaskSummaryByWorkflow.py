@@ -0,0 +1,11 @@
+"""
+_TaskSummaryByWorkflow_
+
+SQLite implementation of Monitoring.TaskSummaryByWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.TaskSummaryByWorkflow \
+     import TaskSummaryByWorkflow as MySQLTaskSummaryByWorkflow
+
+class TaskSummaryByWorkflow(MySQLTaskSummaryByWorkflow):
+    pass
@@ -0,0 +1,11 @@
+"""
+_WorkflowSummary_
+
+SQLite implementation of Monitoring.WorkflowSummary
+"""
+
+from WMCore.WMBS.MySQL.Monitoring.WorkflowSummary \
+     import WorkflowSummary as MySQLWorkflowSummary
+
+class WorkflowSummary(MySQLWorkflowSummary):
+    pass
@@ -0,0 +1,12 @@
+"""
+_AcquireFiles_
+
+SQLite implementation of Subscriptions.AcquireFiles
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.AcquireFiles \
+     import AcquireFiles as MySQLAcquireFiles
+
+class AcquireFiles(MySQLAcquireFiles):
+    sql = """INSERT OR IGNORE INTO wmbs_sub_files_acquired (subscription, fileid)
+               VALUES (:subscription, :fileid)"""
@@ -0,0 +1,14 @@
+"""
+_AddValidation_
+
+SQLite implementation of Subscriptions.AddValidation
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.AddValidation \
+     import AddValidation as MySQLAddValidation
+
+class AddValidation(MySQLAddValidation):
+    sql = """INSERT OR IGNORE INTO wmbs_subscription_validation
+                               (subscription_id, location_id, valid)
+               SELECT :sub, id, :valid FROM wmbs_location
+               WHERE site_name = :site_name"""
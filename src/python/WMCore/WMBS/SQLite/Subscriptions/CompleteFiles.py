@@ -0,0 +1,12 @@
+"""
+_CompleteFiles_
+
+SQLite implementation of Subscriptions.CompleteFiles
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.CompleteFiles \
+     import CompleteFiles as MySQLCompleteFiles
+
+class CompleteFiles(MySQLCompleteFiles):
+    sql = """INSERT OR IGNORE INTO wmbs_sub_files_complete (subscription, fileid)
+               VALUES (:subscription, :fileid)"""
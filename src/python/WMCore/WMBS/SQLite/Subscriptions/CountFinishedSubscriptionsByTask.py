@@ -0,0 +1,11 @@
+"""
+_CountFinishedSubscriptionsByTask_
+
+SQLite implementation of Subscriptions.CountFinishedSubscriptionsByTask
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.CountFinishedSubscriptionsByTask \
+     import CountFinishedSubscriptionsByTask as MySQLCountFinishedSubscriptionsByTask
+
+class CountFinishedSubscriptionsByTask(MySQLCountFinishedSubscriptionsByTask):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Delete_
+
+SQLite implementation of Subscriptions.Delete
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.Delete import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Exists_
+
+SQLite implementation of Subscriptions.Exists
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.Exists import Exists as MySQLExists
+
+class Exists(MySQLExists):
+    pass
@@ -0,0 +1,11 @@
+"""
+_FailFiles_
+
+SQLite implementation of Subscriptions.FailFiles
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.FailFiles \
+     import FailFiles as MySQLFailFiles
+
+class FailFiles(MySQLFailFiles):
+    pass
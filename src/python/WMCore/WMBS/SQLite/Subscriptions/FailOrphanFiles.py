@@ -0,0 +1,11 @@
+"""
+_FailOrphanFiles_
+
+SQLite implementation of Subscriptions.FailOrphanFiles
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.FailOrphanFiles \
+     import FailOrphanFiles as MySQLFailOrphanFiles
+
+class FailOrphanFiles(MySQLFailOrphanFiles):
+    pass
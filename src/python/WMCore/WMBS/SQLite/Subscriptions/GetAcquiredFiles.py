@@ -0,0 +1,11 @@
+"""
+_GetAcquiredFiles_
+
+SQLite implementation of Subscriptions.GetAcquiredFiles
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetAcquiredFiles \
+     import GetAcquiredFiles as MySQLGetAcquiredFiles
+
+class GetAcquiredFiles(MySQLGetAcquiredFiles):
+    pass
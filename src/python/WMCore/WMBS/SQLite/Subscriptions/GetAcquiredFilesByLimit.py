@@ -0,0 +1,11 @@
+"""
+_GetAcquiredFilesByLimit_
+
+SQLite implementation of Subscriptions.GetAcquiredFilesByLimit
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetAcquiredFilesByLimit \
+     import GetAcquiredFilesByLimit as MySQLGetAcquiredFilesByLimit
+
+class GetAcquiredFilesByLimit(MySQLGetAcquiredFilesByLimit):
+    pass
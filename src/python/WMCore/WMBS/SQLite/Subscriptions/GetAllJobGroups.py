@@ -0,0 +1,11 @@
+"""
+_GetAllJobGroups_
+
+SQLite implementation of Subscriptions.GetAllJobGroups
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetAllJobGroups \
+     import GetAllJobGroups as MySQLGetAllJobGroups
+
+class GetAllJobGroups(MySQLGetAllJobGroups):
+    pass
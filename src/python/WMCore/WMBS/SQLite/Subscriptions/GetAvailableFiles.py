@@ -0,0 +1,11 @@
+"""
+_GetAvailableFiles_
+
+SQLite implementation of Subscriptions.GetAvailableFiles
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetAvailableFiles \
+     import GetAvailableFiles as MySQLGetAvailableFiles
+
+class GetAvailableFiles(MySQLGetAvailableFiles):
+    pass
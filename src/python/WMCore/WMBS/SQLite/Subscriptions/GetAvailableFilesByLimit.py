@@ -0,0 +1,11 @@
+"""
+_GetAvailableFilesByLimit_
+
+SQLite implementation of Subscriptions.GetAvailableFilesByLimit
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetAvailableFilesByLimit \
+     import GetAvailableFilesByLimit as MySQLGetAvailableFilesByLimit
+
+class GetAvailableFilesByLimit(MySQLGetAvailableFilesByLimit):
+    pass
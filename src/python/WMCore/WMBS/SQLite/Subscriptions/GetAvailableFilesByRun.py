@@ -0,0 +1,11 @@
+"""
+_GetAvailableFilesByRun_
+
+SQLite implementation of Subscriptions.GetAvailableFilesByRun
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetAvailableFilesByRun \
+     import GetAvailableFilesByRun as MySQLGetAvailableFilesByRun
+
+class GetAvailableFilesByRun(MySQLGetAvailableFilesByRun):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetAvailableFilesMeta_
+
+SQLite implementation of Subscriptions.GetAvailableFilesMeta
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetAvailableFilesMeta \
+     import GetAvailableFilesMeta as MySQLGetAvailableFilesMeta
+
+class GetAvailableFilesMeta(MySQLGetAvailableFilesMeta):
+    pass
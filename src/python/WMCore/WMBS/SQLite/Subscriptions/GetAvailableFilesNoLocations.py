@@ -0,0 +1,11 @@
+"""
+_GetAvailableFilesNoLocations_
+
+SQLite implementation of Subscriptions.GetAvailableFilesNoLocations
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetAvailableFilesNoLocations \
+     import GetAvailableFilesNoLocations as MySQLGetAvailableFilesNoLocations
+
+class GetAvailableFilesNoLocations(MySQLGetAvailableFilesNoLocations):
+    pass
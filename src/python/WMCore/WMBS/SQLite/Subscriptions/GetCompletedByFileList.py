@@ -0,0 +1,11 @@
+"""
+_GetCompletedByFileList_
+
+SQLite implementation of Subscriptions.GetCompletedByFileList
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetCompletedByFileList \
+     import GetCompletedByFileList as MySQLGetCompletedByFileList
+
+class GetCompletedByFileList(MySQLGetCompletedByFileList):
+    pass
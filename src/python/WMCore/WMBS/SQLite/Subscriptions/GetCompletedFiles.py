@@ -0,0 +1,11 @@
+"""
+_GetCompletedFiles_
+
+SQLite implementation of Subscriptions.GetCompletedFiles
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetCompletedFiles \
+     import GetCompletedFiles as MySQLGetCompletedFiles
+
+class GetCompletedFiles(MySQLGetCompletedFiles):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetCompletedFilesByLimit_
+
+SQLite implementation of Subscriptions.GetCompletedFilesByLimit
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetCompletedFilesByLimit \
+     import GetCompletedFilesByLimit as MySQLGetCompletedFilesByLimit
+
+class GetCompletedFilesByLimit(MySQLGetCompletedFilesByLimit):
+    pass
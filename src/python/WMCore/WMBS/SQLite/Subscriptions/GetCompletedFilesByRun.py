@@ -0,0 +1,11 @@
+"""
+_GetCompletedFilesByRun_
+
+SQLite implementation of Subscriptions.GetCompletedFilesByRun
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetCompletedFilesByRun \
+     import GetCompletedFilesByRun as MySQLGetCompletedFilesByRun
+
+class GetCompletedFilesByRun(MySQLGetCompletedFilesByRun):
+    pass
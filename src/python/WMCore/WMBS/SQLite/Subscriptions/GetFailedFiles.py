@@ -0,0 +1,11 @@
+"""
+_GetFailedFiles_
+
+SQLite implementation of Subscriptions.GetFailedFiles
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetFailedFiles \
+     import GetFailedFiles as MySQLGetFailedFiles
+
+class GetFailedFiles(MySQLGetFailedFiles):
+    pass
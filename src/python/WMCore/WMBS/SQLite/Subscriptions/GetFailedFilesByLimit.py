@@ -0,0 +1,11 @@
+"""
+_GetFailedFilesByLimit_
+
+SQLite implementation of Subscriptions.GetFailedFilesByLimit
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetFailedFilesByLimit \
+     import GetFailedFilesByLimit as MySQLGetFailedFilesByLimit
+
+class GetFailedFilesByLimit(MySQLGetFailedFilesByLimit):
+    pass
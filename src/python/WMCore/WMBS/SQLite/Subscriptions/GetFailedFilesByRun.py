@@ -0,0 +1,11 @@
+"""
+_GetFailedFilesByRun_
+
+SQLite implementation of Subscriptions.GetFailedFilesByRun
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetFailedFilesByRun \
+     import GetFailedFilesByRun as MySQLGetFailedFilesByRun
+
+class GetFailedFilesByRun(MySQLGetFailedFilesByRun):
+    pass
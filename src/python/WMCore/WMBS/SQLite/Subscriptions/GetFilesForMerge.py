@@ -0,0 +1,11 @@
+"""
+_GetFilesForMerge_
+
+SQLite implementation of Subscriptions.GetFilesForMerge
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetFilesForMerge \
+     import GetFilesForMerge as MySQLGetFilesForMerge
+
+class GetFilesForMerge(MySQLGetFilesForMerge):
+    pass
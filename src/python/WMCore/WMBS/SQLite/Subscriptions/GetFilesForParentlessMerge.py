@@ -0,0 +1,11 @@
+"""
+_GetFilesForParentlessMerge_
+
+SQLite implementation of Subscriptions.GetFilesForParentlessMerge
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetFilesForParentlessMerge \
+     import GetFilesForParentlessMerge as MySQLGetFilesForParentlessMerge
+
+class GetFilesForParentlessMerge(MySQLGetFilesForParentlessMerge):
+    pass
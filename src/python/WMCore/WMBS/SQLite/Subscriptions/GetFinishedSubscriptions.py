@@ -0,0 +1,11 @@
+"""
+_GetFinishedSubscriptions_
+
+SQLite implementation of Subscriptions.GetFinishedSubscriptions
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetFinishedSubscriptions \
+     import GetFinishedSubscriptions as MySQLGetFinishedSubscriptions
+
+class GetFinishedSubscriptions(MySQLGetFinishedSubscriptions):
+    pass
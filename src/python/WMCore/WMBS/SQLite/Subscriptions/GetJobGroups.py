@@ -0,0 +1,11 @@
+"""
+_GetJobGroups_
+
+SQLite implementation of Subscriptions.GetJobGroups
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetJobGroups \
+     import GetJobGroups as MySQLGetJobGroups
+
+class GetJobGroups(MySQLGetJobGroups):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetNumberOfJobsPerSite_
+
+SQLite implementation of Subscriptions.GetNumberOfJobsPerSite
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetNumberOfJobsPerSite \
+     import GetNumberOfJobsPerSite as MySQLGetNumberOfJobsPerSite
+
+class GetNumberOfJobsPerSite(MySQLGetNumberOfJobsPerSite):
+    pass
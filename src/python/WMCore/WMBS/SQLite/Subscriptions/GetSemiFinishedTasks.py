@@ -0,0 +1,11 @@
+"""
+_GetSemiFinishedTasks_
+
+SQLite implementation of Subscriptions.GetSemiFinishedTasks
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetSemiFinishedTasks \
+     import GetSemiFinishedTasks as MySQLGetSemiFinishedTasks
+
+class GetSemiFinishedTasks(MySQLGetSemiFinishedTasks):
+    pass
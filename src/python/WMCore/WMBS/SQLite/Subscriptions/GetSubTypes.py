@@ -0,0 +1,11 @@
+"""
+_GetSubTypes_
+
+SQLite implementation of Subscriptions.GetSubTypes
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetSubTypes \
+     import GetSubTypes as MySQLGetSubTypes
+
+class GetSubTypes(MySQLGetSubTypes):
+    pass
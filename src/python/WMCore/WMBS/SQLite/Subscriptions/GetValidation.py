@@ -0,0 +1,11 @@
+"""
+_GetValidation_
+
+SQLite implementation of Subscriptions.GetValidation
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.GetValidation \
+     import GetValidation as MySQLGetValidation
+
+class GetValidation(MySQLGetValidation):
+    pass
@@ -0,0 +1,11 @@
+"""
+_IDFromFilesetWorkflow_
+
+SQLite implementation of Subscriptions.IDFromFilesetWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.IDFromFilesetWorkflow \
+     import IDFromFilesetWorkflow as MySQLIDFromFilesetWorkflow
+
+class IDFromFilesetWorkflow(MySQLIDFromFilesetWorkflow):
+    pass
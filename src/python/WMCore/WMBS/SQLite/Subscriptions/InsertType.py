@@ -0,0 +1,13 @@
+"""
+_InsertType_
+
+SQLite implementation of Subscriptions.InsertType
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.InsertType \
+     import InsertType as MySQLInsertType
+
+class InsertType(MySQLInsertType):
+    sql = """INSERT INTO wmbs_sub_types (name)
+               SELECT :name AS name WHERE NOT EXISTS
+                (SELECT name FROM wmbs_sub_types WHERE name = :name)"""
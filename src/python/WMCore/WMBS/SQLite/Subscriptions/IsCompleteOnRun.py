@@ -0,0 +1,11 @@
+"""
+_IsCompleteOnRun_
+
+SQLite implementation of Subscriptions.IsCompleteOnRun
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.IsCompleteOnRun \
+     import IsCompleteOnRun as MySQLIsCompleteOnRun
+
+class IsCompleteOnRun(MySQLIsCompleteOnRun):
+    pass
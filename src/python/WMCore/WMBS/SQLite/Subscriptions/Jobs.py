@@ -0,0 +1,10 @@
+"""
+_Jobs_
+
+SQLite implementation of Subscriptions.Jobs
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.Jobs import Jobs as MySQLJobs
+
+class Jobs(MySQLJobs):
+    pass
@@ -0,0 +1,11 @@
+"""
+_KillWorkflow_
+
+SQLite implementation of Subscriptions.KillWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.KillWorkflow \
+     import KillWorkflow as MySQLKillWorkflow
+
+class KillWorkflow(MySQLKillWorkflow):
+    pass
@@ -0,0 +1,10 @@
+"""
+_List_
+
+SQLite implementation of Subscriptions.List
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.List import List as MySQLList
+
+class List(MySQLList):
+    pass
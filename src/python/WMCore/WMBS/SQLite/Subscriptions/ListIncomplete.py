@@ -0,0 +1,11 @@
+"""
+_ListIncomplete_
+
+SQLite implementation of Subscriptions.ListIncomplete
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.ListIncomplete \
+     import ListIncomplete as MySQLListIncomplete
+
+class ListIncomplete(MySQLListIncomplete):
+    pass
@@ -0,0 +1,11 @@
+"""
+_LoadFromFilesetWorkflow_
+
+SQLite implementation of Subscriptions.LoadFromFilesetWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.LoadFromFilesetWorkflow \
+     import LoadFromFilesetWorkflow as MySQLLoadFromFilesetWorkflow
+
+class LoadFromFilesetWorkflow(MySQLLoadFromFilesetWorkflow):
+    pass
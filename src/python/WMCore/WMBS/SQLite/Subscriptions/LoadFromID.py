@@ -0,0 +1,11 @@
+"""
+_LoadFromID_
+
+SQLite implementation of Subscriptions.LoadFromID
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.LoadFromID \
+     import LoadFromID as MySQLLoadFromID
+
+class LoadFromID(MySQLLoadFromID):
+    pass
@@ -0,0 +1,11 @@
+"""
+_MarkFinishedSubscriptions_
+
+SQLite implementation of Subscriptions.MarkFinishedSubscriptions
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.MarkFinishedSubscriptions \
+     import MarkFinishedSubscriptions as MySQLMarkFinishedSubscriptions
+
+class MarkFinishedSubscriptions(MySQLMarkFinishedSubscriptions):
+    pass
@@ -0,0 +1,21 @@
+"""
+_MarkNewFinishedSubscriptions_
+
+SQLite implementation of Subscriptions.MarkNewFinishedSubscriptions
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.MarkNewFinishedSubscriptions \
+     import MarkNewFinishedSubscriptions as MySQLMarkNewFinishedSubscriptions
+
+class MarkNewFinishedSubscriptions(MySQLMarkNewFinishedSubscriptions):
+    sql = """ UPDATE wmbs_subscription
+             SET finished = 1, last_update = :timestamp
+             WHERE id IN (
+             SELECT id FROM (
+                    SELECT complete_subscription.id
+                        FROM ( %s ) complete_subscription
+                    WHERE complete_subscription.id
+                        NOT IN ( %s )
+                    GROUP BY complete_subscription.id) deletable_subscriptions )""" % (
+                        MySQLMarkNewFinishedSubscriptions.completeNonJobSQL,
+                        MySQLMarkNewFinishedSubscriptions.subWithUnfinishedJobSQL)
@@ -0,0 +1,11 @@
+"""
+_New_
+
+SQLite implementation of Subscriptions.New
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.New import New as MySQLNew
+
+class New(MySQLNew):
+    typesSQL = """INSERT OR IGNORE INTO wmbs_sub_types (name)
+                    VALUES (:subtype)"""
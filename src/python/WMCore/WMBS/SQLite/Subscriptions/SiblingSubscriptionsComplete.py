@@ -0,0 +1,11 @@
+"""
+_SiblingSubscriptionsComplete_
+
+SQLite implementation of Subscriptions.SiblingSubscriptionsComplete
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.SiblingSubscriptionsComplete \
+     import SiblingSubscriptionsComplete as MySQLSiblingSubscriptionsComplete
+
+class SiblingSubscriptionsComplete(MySQLSiblingSubscriptionsComplete):
+    pass
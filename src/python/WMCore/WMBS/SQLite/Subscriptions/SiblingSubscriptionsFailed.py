@@ -0,0 +1,12 @@
+"""
+_SiblingSubscriptionsFailed_
+
+SQLite implementation of Subscriptions.SiblingSubscriptionsFailed
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.SiblingSubscriptionsFailed \
+     import SiblingSubscriptionsFailed as MySQLSiblingSubscriptionsFailed
+
+class SiblingSubscriptionsFailed(MySQLSiblingSubscriptionsFailed):
+    insert = """INSERT OR IGNORE INTO wmbs_sub_files_complete (subscription, fileid) VALUES
+                  (:subscription, :fileid)"""
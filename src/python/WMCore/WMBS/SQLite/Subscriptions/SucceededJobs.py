@@ -0,0 +1,11 @@
+"""
+_SucceededJobs_
+
+SQLite implementation of Subscriptions.SucceededJobs
+"""
+
+from WMCore.WMBS.MySQL.Subscriptions.SucceededJobs \
+     import SucceededJobs as MySQLSucceededJobs
+
+class SucceededJobs(MySQLSucceededJobs):
+    pass
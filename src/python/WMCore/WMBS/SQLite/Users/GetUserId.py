@@ -0,0 +1,10 @@
+"""
+_GetUserId_
+
+SQLite implementation of Users.GetUserId
+"""
+
+from WMCore.WMBS.MySQL.Users.GetUserId import GetUserId as MySQLGetUserId
+
+class GetUserId(MySQLGetUserId):
+    pass
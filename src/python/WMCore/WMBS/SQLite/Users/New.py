@@ -0,0 +1,12 @@
+"""
+_New_
+
+SQLite implementation of Users.New
+"""
+
+from WMCore.WMBS.MySQL.Users.New import New as MySQLNew
+
+class New(MySQLNew):
+    sql = """INSERT OR IGNORE INTO wmbs_users (cert_dn, name_hn, owner, grp, group_name, role_name)
+                 VALUES (:dn, :hn, :owner, :grp, :gr, :role)
+          """
@@ -0,0 +1,11 @@
+"""
+_UpdateHyperNewsName_
+
+SQLite implementation of Users.UpdateHyperNewsName
+"""
+
+from WMCore.WMBS.MySQL.Users.UpdateHyperNewsName \
+     import UpdateHyperNewsName as MySQLUpdateHyperNewsName
+
+class UpdateHyperNewsName(MySQLUpdateHyperNewsName):
+    pass
@@ -0,0 +1,11 @@
+"""
+_CheckInjectedWorkflow_
+
+SQLite implementation of Workflow.CheckInjectedWorkflow
+"""
+
+from WMCore.WMBS.MySQL.Workflow.CheckInjectedWorkflow \
+     import CheckInjectedWorkflow as MySQLCheckInjectedWorkflow
+
+class CheckInjectedWorkflow(MySQLCheckInjectedWorkflow):
+    pass
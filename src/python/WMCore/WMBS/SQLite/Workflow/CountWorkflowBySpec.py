@@ -0,0 +1,11 @@
+"""
+_CountWorkflowBySpec_
+
+SQLite implementation of Workflow.CountWorkflowBySpec
+"""
+
+from WMCore.WMBS.MySQL.Workflow.CountWorkflowBySpec \
+     import CountWorkflowBySpec as MySQLCountWorkflowBySpec
+
+class CountWorkflowBySpec(MySQLCountWorkflowBySpec):
+    pass
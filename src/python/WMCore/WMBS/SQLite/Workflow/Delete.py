@@ -0,0 +1,10 @@
+"""
+_Delete_
+
+SQLite implementation of Workflow.Delete
+"""
+
+from WMCore.WMBS.MySQL.Workflow.Delete import Delete as MySQLDelete
+
+class Delete(MySQLDelete):
+    pass
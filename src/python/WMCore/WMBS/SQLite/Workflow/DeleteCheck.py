@@ -0,0 +1,11 @@
+"""
+_DeleteCheck_
+
+SQLite implementation of Workflow.DeleteCheck
+"""
+
+from WMCore.WMBS.MySQL.Workflow.DeleteCheck \
+     import DeleteCheck as MySQLDeleteCheck
+
+class DeleteCheck(MySQLDeleteCheck):
+    pass
@@ -0,0 +1,10 @@
+"""
+_Exists_
+
+SQLite implementation of Workflow.Exists
+"""
+
+from WMCore.WMBS.MySQL.Workflow.Exists import Exists as MySQLExists
+
+class Exists(MySQLExists):
+    pass
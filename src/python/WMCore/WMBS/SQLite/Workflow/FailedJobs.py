@@ -0,0 +1,10 @@
+"""
+_FailedJobs_
+
+SQLite implementation of Workflow.FailedJobs
+"""
+
+from WMCore.WMBS.MySQL.Workflow.FailedJobs import FailedJobs as MySQLFailedJobs
+
+class FailedJobs(MySQLFailedJobs):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetDeletableWorkflows_
+
+SQLite implementation of Workflow.GetDeletableWorkflows
+"""
+
+from WMCore.WMBS.MySQL.Workflow.GetDeletableWorkflows \
+     import GetDeletableWorkflows as MySQLGetDeletableWorkflows
+
+class GetDeletableWorkflows(MySQLGetDeletableWorkflows):
+    pass
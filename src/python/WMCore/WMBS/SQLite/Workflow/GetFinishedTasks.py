@@ -0,0 +1,11 @@
+"""
+_GetFinishedTasks_
+
+SQLite implementation of Workflow.GetFinishedTasks
+"""
+
+from WMCore.WMBS.MySQL.Workflow.GetFinishedTasks \
+     import GetFinishedTasks as MySQLGetFinishedTasks
+
+class GetFinishedTasks(MySQLGetFinishedTasks):
+    pass
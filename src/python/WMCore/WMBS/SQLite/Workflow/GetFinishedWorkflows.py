@@ -0,0 +1,11 @@
+"""
+_GetFinishedWorkflows_
+
+SQLite implementation of Workflow.GetFinishedWorkflows
+"""
+
+from WMCore.WMBS.MySQL.Workflow.GetFinishedWorkflows \
+     import GetFinishedWorkflows as MySQLGetFinishedWorkflows
+
+class GetFinishedWorkflows(MySQLGetFinishedWorkflows):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetInjectedWorkflows_
+
+SQLite implementation of Workflow.GetInjectedWorkflows
+"""
+
+from WMCore.WMBS.MySQL.Workflow.GetInjectedWorkflows \
+     import GetInjectedWorkflows as MySQLGetInjectedWorkflows
+
+class GetInjectedWorkflows(MySQLGetInjectedWorkflows):
+    pass
@@ -0,0 +1,11 @@
+"""
+_GetSpecAndNameFromTask_
+
+SQLite implementation of Workflow.GetSpecAndNameFromTask
+"""
+
+from WMCore.WMBS.MySQL.Workflow.GetSpecAndNameFromTask \
+     import GetSpecAndNameFromTask as MySQLGetSpecAndNameFromTask
+
+class GetSpecAndNameFromTask(MySQLGetSpecAndNameFromTask):
+    pass
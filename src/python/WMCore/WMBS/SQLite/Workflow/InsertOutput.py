@@ -0,0 +1,19 @@
+"""
+_InsertOutput_
+
+SQLite implementation of Workflow.InsertOutput
+"""
+
+from WMCore.WMBS.MySQL.Workflow.InsertOutput \
+     import InsertOutput as MySQLInsertOutput
+
+class InsertOutput(MySQLInsertOutput):
+    sql = """INSERT INTO wmbs_workflow_output (workflow_id, output_identifier,
+                                               output_fileset, merged_output_fileset)
+               SELECT :workflow AS workflow_id, :output AS output_identifier,
+                 :fileset AS output_fileset, :mfileset AS merged_output_fileset
+                 WHERE NOT EXISTS
+               (SELECT workflow_id FROM wmbs_workflow_output
+                 WHERE :workflow = workflow_id AND
+                       :output = output_identifier AND
+                       :fileset = output_fileset)"""
@@ -0,0 +1,11 @@
+"""
+_ListForJobUpdater_
+
+SQLite implementation of Workflow.ListForJobUpdater
+"""
+
+from WMCore.WMBS.MySQL.Workflow.ListForJobUpdater \
+     import ListForJobUpdater as MySQLListForJobUpdater
+
+class ListForJobUpdater(MySQLListForJobUpdater):
+    pass
@@ -0,0 +1,11 @@
+"""
+_ListForSubmitter_
+
+SQLite implementation of Workflow.ListForSubmitter
+"""
+
+from WMCore.WMBS.MySQL.Workflow.ListForSubmitter \
+     import ListForSubmitter as MySQLListForSubmitter
+
+class ListForSubmitter(MySQLListForSubmitter):
+    pass
@@ -0,0 +1,10 @@
+"""
+_LoadFromID_
+
+SQLite implementation of Workflow.LoadFromID
+"""
+
+from WMCore.WMBS.MySQL.Workflow.LoadFromID import LoadFromID as MySQLLoadFromID
+
+class LoadFromID(MySQLLoadFromID):
+    pass
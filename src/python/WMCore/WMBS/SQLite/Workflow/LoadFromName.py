@@ -0,0 +1,11 @@
+"""
+_LoadFromName_
+
+SQLite implementation of Workflow.LoadFromName
+"""
+
+from WMCore.WMBS.MySQL.Workflow.LoadFromName \
+     import LoadFromName as MySQLLoadFromName
+
+class LoadFromName(MySQLLoadFromName):
+    pass
@@ -0,0 +1,11 @@
+"""
+_LoadFromSpecOwner_
+
+SQLite implementation of Workflow.LoadFromSpecOwner
+"""
+
+from WMCore.WMBS.MySQL.Workflow.LoadFromSpecOwner \
+     import LoadFromSpecOwner as MySQLLoadFromSpecOwner
+
+class LoadFromSpecOwner(MySQLLoadFromSpecOwner):
+    pass
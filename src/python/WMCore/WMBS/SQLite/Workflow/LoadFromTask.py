@@ -0,0 +1,11 @@
+"""
+_LoadFromTask_
+
+SQLite implementation of Workflow.LoadFromTask
+"""
+
+from WMCore.WMBS.MySQL.Workflow.LoadFromTask \
+     import LoadFromTask as MySQLLoadFromTask
+
+class LoadFromTask(MySQLLoadFromTask):
+    pass
@@ -0,0 +1,10 @@
+"""
+_LoadOutput_
+
+SQLite implementation of Workflow.LoadOutput
+"""
+
+from WMCore.WMBS.MySQL.Workflow.LoadOutput import LoadOutput as MySQLLoadOutput
+
+class LoadOutput(MySQLLoadOutput):
+    pass
@@ -0,0 +1,11 @@
+"""
+_MarkInjectedWorkflows_
+
+SQLite implementation of Workflow.MarkInjectedWorkflows
+"""
+
+from WMCore.WMBS.MySQL.Workflow.MarkInjectedWorkflows \
+     import MarkInjectedWorkflows as MySQLMarkInjectedWorkflows
+
+class MarkInjectedWorkflows(MySQLMarkInjectedWorkflows):
+    pass
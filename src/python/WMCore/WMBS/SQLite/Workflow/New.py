@@ -0,0 +1,10 @@
+"""
+_New_
+
+SQLite implementation of Workflow.New
+"""
+
+from WMCore.WMBS.MySQL.Workflow.New import New as MySQLNew
+
+class New(MySQLNew):
+    pass
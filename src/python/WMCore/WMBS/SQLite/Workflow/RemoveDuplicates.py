@@ -0,0 +1,11 @@
+"""
+_RemoveDuplicates_
+
+SQLite implementation of Workflow.RemoveDuplicates
+"""
+
+from WMCore.WMBS.MySQL.Workflow.RemoveDuplicates \
+     import RemoveDuplicates as MySQLRemoveDuplicates
+
+class RemoveDuplicates(MySQLRemoveDuplicates):
+    pass
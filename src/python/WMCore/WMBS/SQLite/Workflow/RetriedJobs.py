@@ -0,0 +1,11 @@
+"""
+_RetriedJobs_
+
+SQLite implementation of Workflow.RetriedJobs
+"""
+
+from WMCore.WMBS.MySQL.Workflow.RetriedJobs \
+     import RetriedJobs as MySQLRetriedJobs
+
+class RetriedJobs(MySQLRetriedJobs):
+    pass
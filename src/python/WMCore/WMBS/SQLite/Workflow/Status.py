@@ -0,0 +1,10 @@
+"""
+_Status_
+
+SQLite implementation of Workflow.Status
+"""
+
+from WMCore.WMBS.MySQL.Workflow.Status import Status as MySQLStatus
+
+class Status(MySQLStatus):
+    pass
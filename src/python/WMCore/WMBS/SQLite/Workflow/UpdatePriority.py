@@ -0,0 +1,11 @@
+"""
+_UpdatePriority_
+
+SQLite implementation of Workflow.UpdatePriority
+"""
+
+from WMCore.WMBS.MySQL.Workflow.UpdatePriority \
+     import UpdatePriority as MySQLUpdatePriority
+
+class UpdatePriority(MySQLUpdatePriority):
+    pass
@@ -125,6 +125,8 @@ class WMInit:
             dialect = 'Oracle'
         elif dialect.lower() == 'http':
             dialect = 'CouchDB'
+        elif dialect.lower() == 'sqlite':
+            dialect = 'SQLite'
         else:
             msg = "Unsupported dialect %s !" % dialect
             logging.error(msg)
@@ -120,20 +120,25 @@ class DataLocationMapper(object):
                 args['subscribed'] = 'y'
             if not fullResync and self.lastLocationUpdate:
                 args['update_since'] = timeFloor(self.lastLocationUpdate, self.params['updateIntervalCoarseness'])
-            for dataItem in dataItems:
+            datasets = [x for x in dataItems if datasetSearch or isDataset(x)]
+            blocks = [x for x in dataItems if not (datasetSearch or isDataset(x))]
+            for dataItem in datasets:
                 try:
-                    if datasetSearch or isDataset(dataItem):
-                        response = self.phedex.getReplicaInfoForBlocks(dataset=[dataItem], **args)['phedex']
-                    else:
-                        response = self.phedex.getReplicaInfoForBlocks(block=[dataItem], **args)['phedex']
+                    response = self.phedex.getReplicaInfoForBlocks(dataset=[dataItem], **args)['phedex']
                     for block in response['block']:
-                        nodes = [replica['node'] for replica in block['replica']]
-                        if datasetSearch or isDataset(dataItem):
-                            result[dataItem].update(nodes)
-                        else:
-                            result[block['name']].update(nodes)
+                        result[dataItem].update([replica['node'] for replica in block['replica']])
                 except Exception as ex:
                     logging.error('Error getting block location from phedex for %s: %s' % (dataItem, str(ex)))
+            if blocks:
+                # all blocks at once, PhEDEx splits them into parallel requests
+                # and leaves out the blocks of the requests that failed
+                try:
+                    response = self.phedex.getReplicaInfoForBlocks(block=blocks, skipFailures=True,
+                                                                   **args)['phedex']
+                    for block in response['block']:
+                        result[block['name']].update([replica['node'] for replica in block['replica']])
+                except Exception as ex:
+                    logging.error('Error getting block location from phedex for %i blocks: %s' % (len(blocks), str(ex)))
         else:
             raise RuntimeError("shouldn't get here")
 
@@ -181,11 +181,17 @@ class Block(StartPolicyInterface):
                     block[self.lumiType] = acceptedLumiCount
                     block['NumberOfFiles'] = acceptedFileCount
                     block['NumberOfEvents'] = acceptedEventCount
-            # save locations
-            if task.getTrustSitelists().get('trustlists'):
-                self.data[block['block']] = self.sites
-            else:
-                self.data[block['block']] = self.siteDB.PNNstoPSNs(dbs.listFileBlockLocation(block['block']))
+            validBlocks.append(block)
+
+        # save locations, looking up all the blocks at once
+        if task.getTrustSitelists().get('trustlists'):
+            blockLocations = dict((block['block'], self.sites) for block in validBlocks)
+        elif validBlocks:
+            blockLocations = dbs.listFileBlockLocation([block['block'] for block in validBlocks])
+            blockLocations = dict((blockName, self.siteDB.PNNstoPSNs(pnns))
+                                  for blockName, pnns in blockLocations.items())
+        for block in validBlocks:
+            self.data[block['block']] = blockLocations[block['block']]
 
             # TODO: need to decide what to do when location is no find.
             # There could be case for network problem (no connection to dbs, phedex)
@@ -196,7 +202,6 @@ class Block(StartPolicyInterface):
             #    self.rejectedWork.append(blockName)
             #    continue
 
-            validBlocks.append(block)
         return validBlocks
 
 
@@ -166,10 +166,10 @@ class Dataset(StartPolicyInterface):
 
             validBlocks.append(blockSummary)
 
-            if locations is None:
-                locations = set(dbs.listFileBlockLocation(blockName))
-            else:
-                locations = locations.intersection(dbs.listFileBlockLocation(blockName))
+        # locations holding all the needed blocks, looking up all the blocks at once
+        if validBlocks:
+            blockLocations = dbs.listFileBlockLocation([block['block'] for block in validBlocks])
+            locations = set.intersection(*[set(pnns) for pnns in blockLocations.values()])
 
         # all needed blocks present at these sites
         if task.getTrustSitelists().get('trustlists'):
@@ -17,6 +17,7 @@ import traceback
 import sys
 
 from WMCore.Database.Transaction import Transaction
+from WMCore.Database.DAOStats import daoStats
 from WMCore.Database.CMSCouch import CouchError
 from WMCore.Database.CouchUtils import CouchConnectionError
 from WMCore.Alerts import API as alertAPI
@@ -184,6 +185,7 @@ class BaseWorkerThread:
                                     msg += " Raise a bug against me. Rollback."
                                     logging.error(msg)
                                     myThread.transaction.rollback()
+                                daoStats.dumpIfDue()
                         except Exception as ex:
                             if myThread.transaction.transaction is not None:
                                 myThread.transaction.rollback()
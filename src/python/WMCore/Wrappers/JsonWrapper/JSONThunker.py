@@ -4,6 +4,63 @@ import types
 class _EmptyClass:
     pass
 
+# class -> encoder(object, thunker), None for the generic introspection
+_encoders = {}
+# class -> decoder(jsondata, thunker)
+_decoders = {}
+# 'module.name' -> class of thunked objects
+_thunkedClasses = {}
+
+
+def registerJSONClass(cls, encoder=None, decoder=None):
+    """
+    _registerJSONClass_
+
+    Register fast encoder(object, thunker) and decoder(jsondata, thunker)
+    functions for cls, used by all JSONThunkers instead of working out how
+    to (un)thunk its instances. Classes with __to_json__ or __from_json__
+    methods are registered automatically the first time they are seen.
+    """
+    if encoder:
+        _encoders[cls] = encoder
+    if decoder:
+        _decoders[cls] = decoder
+    return
+
+
+def _newInstance(ourClass):
+    """
+    Create an instance of ourClass without calling __init__ when possible
+    """
+    if isinstance(ourClass, types.ClassType):
+        value = _EmptyClass()
+        value.__class__ = ourClass
+        return value
+    return ourClass()
+
+
+def _classEncoder(cls):
+    """
+    Work out the encoder to use for instances of cls
+    """
+    if hasattr(cls, '__to_json__'):
+        return lambda data, thunker: data.__to_json__(thunker)
+    elif issubclass(cls, dict):
+        return lambda data, thunker: thunker.handleDictObjectThunk(data)
+    elif issubclass(cls, list):
+        return lambda data, thunker: thunker.handleListObjectThunk(data)
+    return None
+
+
+def _classDecoder(ourClass):
+    """
+    Work out the decoder to use for thunked instances of ourClass
+    """
+    if hasattr(ourClass, '__from_json__'):
+        return lambda jsondata, thunker: ourClass.__from_json__(_newInstance(ourClass), jsondata, thunker)
+    return None
+
+
 class JSONThunker:
     """
     _JSONThunker_
@@ -19,8 +76,15 @@ class JSONThunker:
     self.blackListedModules - a list of modules that should not be stored in
       the JSON.
 
+    With acyclic set the recursion bookkeeping is skipped, which is only safe
+    for trees of objects without reference cycles. With fastPath set the
+    encoders and decoders registered per class are used, see
+    registerJSONClass.
+
     """
-    def __init__(self):
+    def __init__(self, acyclic=False, fastPath=True):
+        self.acyclic = acyclic
+        self.fastPath = fastPath
         self.passThroughTypes = (type(None),
                                  bool,
                                  int,
@@ -53,11 +117,18 @@ class JSONThunker:
                                    'WMCore.Database.Transaction',
                                    'threading',
                                    'datetime')
+        # values of these types are copied as they are, without calling
+        # _thunk on them, when on the fast path
+        self.leafTypes = frozenset(self.passThroughTypes) if fastPath else frozenset()
+        # decoded JSON values that unthunk returns as they are
+        self.plainTypes = frozenset((type(None), bool, int, long, float, str, list)) if fastPath else frozenset()
 
     def checkRecursion(self, data):
         """
         handles checking for infinite recursion
         """
+        if self.acyclic:
+            return data
         if (id(data) in self.foundIDs):
             if (self.foundIDs[id(data)] > 5):
                 self.unrecurse(data)
@@ -73,6 +144,8 @@ class JSONThunker:
         """
         backs off the recursion counter if we're returning from _thunk
         """
+        if self.acyclic:
+            return
         self.foundIDs[id(data)] = self.foundIDs[id(data)] -1
 
     def checkBlackListed(self, data):
@@ -117,8 +190,10 @@ class JSONThunker:
 
     def handleListThunk(self, toThunk):
         toThunk = self.checkRecursion( toThunk )
+        leafTypes = self.leafTypes
         for k,v in enumerate(toThunk):
-            toThunk[k] = self._thunk(v)
+            if type(v) not in leafTypes:
+                toThunk[k] = self._thunk(v)
         self.unrecurse(toThunk)
         return toThunk
 
@@ -126,6 +201,7 @@ class JSONThunker:
         toThunk = self.checkRecursion( toThunk )
         special = False
         tmpdict = {}
+        leafTypes = self.leafTypes
         for k,v in toThunk.iteritems():
             if type(k) == type(int):
                 special = True
@@ -133,6 +209,8 @@ class JSONThunker:
             elif type(k) == type(float):
                 special = True
                 tmpdict['_f:%s' % k] = self._thunk(v)
+            elif type(v) in leafTypes:
+                tmpdict[k] = v
             else:
                 tmpdict[k] = self._thunk(v)
         if special:
@@ -144,7 +222,29 @@ class JSONThunker:
         self.unrecurse(toThunk)
         return toThunk
 
+    def getEncoder(self, cls):
+        """
+        Return the fast encoder for instances of cls, or None
+        """
+        try:
+            encoder = _encoders[cls]
+        except KeyError:
+            encoder = _encoders.setdefault(cls, _classEncoder(cls))
+        if encoder is None or cls.__module__ in self.blackListedModules:
+            return None
+        return encoder
+
     def handleObjectThunk(self, toThunk):
+        if self.fastPath:
+            encoder = self.getEncoder(toThunk.__class__)
+            if encoder is not None:
+                checked = self.checkRecursion(toThunk)
+                if checked is not toThunk:
+                    return checked
+                toThunk2 = encoder(toThunk, self)
+                self.unrecurse(toThunk)
+                return toThunk2
+
         toThunk = self.checkRecursion( toThunk )
         toThunk = self.checkBlackListed(toThunk)
 
@@ -186,10 +286,11 @@ class JSONThunker:
                     'type': thunktype,
                     thunktype: {}}
 
+        leafTypes = self.leafTypes
         for k,v in data.__dict__.iteritems():
-            tempDict[k] = self._thunk(v)
+            tempDict[k] = v if type(v) in leafTypes else self._thunk(v)
         for k,v in data.iteritems():
-            tempDict[thunktype][k] = self._thunk(v)
+            tempDict[thunktype][k] = v if type(v) in leafTypes else self._thunk(v)
 
         return tempDict
 
@@ -198,12 +299,13 @@ class JSONThunker:
         data.pop('is_dict', False)
         thunktype = data.pop('type', False)
 
+        plainTypes = self.plainTypes
         for k,v in data.iteritems():
             if (k == thunktype):
                 for k2,v2 in data[thunktype].iteritems():
-                    value[k2] = self._unthunk(v2)
+                    value[k2] = v2 if type(v2) in plainTypes else self._unthunk(v2)
             else:
-                value.__dict__[k] = self._unthunk(v)
+                value.__dict__[k] = v if type(v) in plainTypes else self._unthunk(v)
         return value
 
     def handleListObjectThunk(self, data):
@@ -238,18 +340,19 @@ class JSONThunker:
         helper function for thunk, does the actual work
         """
 
-        if (type(toThunk) in self.passThroughTypes):
+        thunkType = type(toThunk)
+        if (thunkType in self.passThroughTypes):
             return toThunk
-        elif (type(toThunk) == type([])):
+        elif (thunkType == list):
             return self.handleListThunk(toThunk)
 
-        elif (type(toThunk) == type({})):
+        elif (thunkType == dict):
             return self.handleDictThunk(toThunk)
 
-        elif ((type(toThunk) == type(set()))):
+        elif (thunkType == set):
             return self.handleSetThunk(toThunk)
 
-        elif (type(toThunk) == types.FunctionType):
+        elif (thunkType == types.FunctionType):
             self.unrecurse(toThunk)
             return "function reference"
         elif (isinstance(toThunk, object)):
@@ -290,6 +393,11 @@ class JSONThunker:
                     #   inspired from python's pickle code
                     ourClass = self.getThunkedClass(jsondata)
 
+                    if self.fastPath:
+                        decoder = self.getDecoder(ourClass)
+                        if decoder is not None:
+                            return decoder(jsondata, self)
+
                     value = _EmptyClass()
                     if (hasattr(ourClass, '__from_json__')):
                         # Use classes own json loader
@@ -338,17 +446,29 @@ class JSONThunker:
             else:
                 #print 'last ditch attempt'
                 data = {}
+                plainTypes = self.plainTypes
                 for k,v in jsondata.iteritems():
-                    data[k] = self._unthunk(v)
+                    data[k] = v if type(v) in plainTypes else self._unthunk(v)
                 return data
 
         else:
             return jsondata
 
+    def getDecoder(self, ourClass):
+        """
+        Return the fast decoder for thunked instances of ourClass, or None
+        """
+        try:
+            return _decoders[ourClass]
+        except KeyError:
+            return _decoders.setdefault(ourClass, _classDecoder(ourClass))
+
     def getThunkedClass(self, jsondata):
         """
         Work out the class from it's thunked json representation
         """
+        if self.fastPath and jsondata['type'] in _thunkedClasses:
+            return _thunkedClasses[jsondata['type']]
         module = jsondata['type'].rsplit('.',1)[0]
         name = jsondata['type'].rsplit('.',1)[1]
         if (module == 'WMCore.Services.Requests') and (name == JSONThunker):
@@ -357,4 +477,5 @@ class JSONThunker:
         __import__(module)
         mod = sys.modules[module]
         ourClass = getattr(mod, name)
+        _thunkedClasses[jsondata['type']] = ourClass
         return ourClass
@@ -154,6 +154,8 @@ class DBS3Reader:
 
     def listFileBlockLocation(self, block):
         """Fake locations"""
+        if isinstance(block, (list, set)):
+            return dict((x, self.dataBlocks.getLocation(x)) for x in block)
         return self.dataBlocks.getLocation(block)
 
     def listFilesInBlock(self, fileBlockName):
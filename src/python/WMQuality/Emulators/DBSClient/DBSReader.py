@@ -116,6 +116,8 @@ class DBSReader:
 
     def listFileBlockLocation(self, block):
         """Fake locations"""
+        if isinstance(block, (list, set)):
+            return dict((x, self.dataBlocks.getLocation(x)) for x in block)
         return self.dataBlocks.getLocation(block)
 
     def listFilesInBlock(self, fileBlockName):
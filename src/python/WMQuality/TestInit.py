@@ -24,6 +24,7 @@ from _mysql_exceptions import OperationalError
 
 from WMCore.Agent.Configuration import Configuration
 from WMCore.Agent.Configuration import loadConfigurationFile
+from WMCore.Database.DAOCache import invalidateDAOCache
 from WMCore.WMException import WMException
 
 hasDatabase = True
@@ -283,6 +284,7 @@ class TestInit(object):
             return
 
         self.init.clearDatabase()
+        invalidateDAOCache()
 
         return
 
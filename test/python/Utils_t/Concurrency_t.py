@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Unittests for Concurrency module
+
+"""
+
+from __future__ import division, print_function
+
+import threading
+import time
+import unittest
+
+from Utils.Concurrency import parallelMap
+
+
+class ConcurrencyTest(unittest.TestCase):
+    """
+    unittest for Concurrency functions
+    """
+
+    def testParallelMap(self):
+        """
+        Test that parallelMap keeps the item order and runs calls concurrently
+        """
+        running = []
+        maxRunning = [0]
+        lock = threading.Lock()
+
+        def slowSquare(x):
+            with lock:
+                running.append(x)
+                maxRunning[0] = max(maxRunning[0], len(running))
+            time.sleep(0.05)
+            with lock:
+                running.remove(x)
+            return x * x
+
+        self.assertEqual(parallelMap(slowSquare, range(20), maxWorkers=4), [x * x for x in range(20)])
+        self.assertEqual(maxRunning[0], 4)
+        self.assertEqual(parallelMap(slowSquare, []), [])
+
+    def testParallelMapError(self):
+        """
+        Test that the first failure is raised after all calls are done
+        """
+        calls = []
+
+        def failOnOdd(x):
+            calls.append(x)
+            if x % 2:
+                raise ValueError(x)
+            return x
+
+        with self.assertRaises(ValueError) as context:
+            parallelMap(failOnOdd, range(10), maxWorkers=3)
+        self.assertEqual(context.exception.args, (1,))
+        self.assertEqual(sorted(calls), list(range(10)))
+
+
+if __name__ == '__main__':
+    unittest.main()
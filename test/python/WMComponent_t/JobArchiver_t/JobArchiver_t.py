@@ -29,6 +29,7 @@ from WMCore.WMBS.JobGroup     import JobGroup
 from WMCore.WMBS.Job          import Job
 
 from WMCore.DataStructs.Run   import Run
+from WMCore.DataStructs.JobStore import loadJob, saveJobs
 
 from WMComponent.JobArchiver.JobArchiverPoller import JobArchiverPoller
 
@@ -217,6 +218,10 @@ class JobArchiverTest(unittest.TestCase):
             f.write(job['name'])
             f.close()
             job.setCache(path)
+            job['cache_dir'] = path
+
+        # the job objects are in the packed store of their collection
+        saveJobs(testJobGroup.jobs)
 
         changer.propagate(testJobGroup.jobs, 'created', 'new')
         changer.propagate(testJobGroup.jobs, 'executing', 'created')
@@ -251,6 +256,7 @@ class JobArchiverTest(unittest.TestCase):
             fileContents = f.readlines()
             f.close()
             self.assertEqual(fileContents[0].find(job['name']) > -1, True)
+            self.assertEqual(loadJob('Job_%i' % (job['id']))['name'], job['name'])
             shutil.rmtree('Job_%i' %(job['id']))
             if os.path.isfile('Job_%i.tar.bz2' %(job['id'])):
                 os.remove('Job_%i.tar.bz2' %(job['id']))
@@ -194,5 +194,36 @@ class JobSubmitterCachingTest(unittest.TestCase):
                          "Error: The job cache should be empty.  Contains: %i" % len(mySubmitterPoller.cachedJobIDs))
         return
 
+    def testCacheSnapshot(self):
+        """
+        _testCacheSnapshot_
+
+        Verify that a restarted JobSubmitter restores its cache from the
+        snapshot instead of loading the jobs again.
+        """
+        config            = self.createConfig()
+        mySubmitterPoller = JobSubmitterPoller(config)
+        self.injectJobs()
+        mySubmitterPoller.getThresholds()
+        mySubmitterPoller.refreshCache()
+
+        self.assertEqual(len(mySubmitterPoller.cachedJobIDs), 20)
+        self.assertTrue(os.path.isfile(mySubmitterPoller.cacheSnapshotFile),
+                        "Error: The job cache snapshot was not saved.")
+
+        # the jobs can't be loaded anymore, they have to come from the snapshot
+        for jobInfo in mySubmitterPoller.jobDataCache.values():
+            os.remove(os.path.join(jobInfo['cache_dir'], "job.pkl"))
+
+        newSubmitterPoller = JobSubmitterPoller(config)
+        self.assertEqual(len(newSubmitterPoller.cacheSnapshot), 20)
+        newSubmitterPoller.getThresholds()
+        newSubmitterPoller.refreshCache()
+
+        self.assertEqual(newSubmitterPoller.cachedJobIDs, mySubmitterPoller.cachedJobIDs)
+        self.assertEqual(newSubmitterPoller.jobDataCache, mySubmitterPoller.jobDataCache)
+        self.assertEqual(newSubmitterPoller.cacheSnapshot, {})
+        return
+
 if __name__ == "__main__":
     unittest.main()
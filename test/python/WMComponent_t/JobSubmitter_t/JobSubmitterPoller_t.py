@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+_JobSubmitterPoller_t_
+
+Unit tests for the JobSubmitterPoller methods that don't need a database
+"""
+
+import unittest
+
+from WMComponent.JobSubmitter.JobSubmitterPoller import JobSubmitterPoller
+
+
+class LocationPoller(JobSubmitterPoller):
+    """
+    _LocationPoller_
+
+    JobSubmitterPoller with only the site states, no database nor plugins
+    """
+
+    def __init__(self, abortSites, drainSites):
+        self.sender = None
+        self.abortSites = set(abortSites)
+        self.drainSites = set(drainSites)
+
+
+class JobSubmitterPollerTest(unittest.TestCase):
+
+    def filterLocations(self, poller, sites, jobType="Processing"):
+        """
+        _filterLocations_
+
+        Filter the sites of a new job, return the locations and the bad jobs
+        """
+        badJobs = dict([(x, []) for x in range(71101, 71105)])
+        newJob = {'id': 1, 'type': jobType}
+        locations = poller.filterLocations(newJob, sites, "testJob", badJobs)
+        return locations, dict((code, [job['id'] for job in jobs]) for code, jobs in badJobs.items() if jobs)
+
+    def testFilterLocations(self):
+        """
+        _testFilterLocations_
+
+        Aborted and draining sites are removed, jobs without any other site
+        are failed and not given any location
+        """
+        poller = LocationPoller(abortSites=["T2_Aborted"], drainSites=["T2_Draining"])
+
+        self.assertEqual(self.filterLocations(poller, ["T2_Aborted", "T2_Draining", "T2_OK"]),
+                         (["T2_OK"], {}))
+        self.assertEqual(self.filterLocations(poller, []), (None, {71101: [1]}))
+        self.assertEqual(self.filterLocations(poller, ["T2_Aborted"]), (None, {71102: [1]}))
+        self.assertEqual(self.filterLocations(poller, ["T2_Draining"]), (None, {71104: [1]}))
+        self.assertEqual(self.filterLocations(poller, ["T2_Aborted", "T2_Draining"]), (None, {71104: [1]}))
+
+        # draining sites are fine for merge jobs
+        self.assertEqual(self.filterLocations(poller, ["T2_Aborted", "T2_Draining"], "Merge"),
+                         (["T2_Draining"], {}))
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
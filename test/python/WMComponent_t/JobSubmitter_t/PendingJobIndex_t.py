@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+_PendingJobIndex_t_
+
+Unit tests for the index of the jobs cached by the JobSubmitter
+"""
+
+import unittest
+
+from WMComponent.JobSubmitter.PendingJobIndex import PendingJobIndex
+
+
+class PendingJobIndexTest(unittest.TestCase):
+
+    def makeJob(self, jobID, timestamp, sites, jobType="Processing"):
+        """
+        _makeJob_
+
+        Make a cached job like the ones of refreshCache
+        """
+        return {'id': jobID, 'type': jobType, 'possibleLocations': sites, 'timestamp': timestamp}
+
+    def testOrder(self):
+        """
+        _testOrder_
+
+        Jobs come from the highest priority and the oldest first, only once,
+        whatever the order they were added in.
+        """
+        index = PendingJobIndex()
+        index.add(10, self.makeJob(1, 30, ["T2_A", "T2_B"]))
+        index.add(10, self.makeJob(2, 10, ["T2_B"]))
+        index.add(20, self.makeJob(3, 50, ["T2_A"], "Merge"))
+        index.add(10, self.makeJob(4, 20, ["T2_A"]))
+        index.add(10, self.makeJob(5, 20, ["T2_C"]))
+        self.assertEqual(len(index), 5)
+
+        jobs = [(prio, job['id']) for prio, job in index.iterJobs(lambda queueKey: False)]
+        self.assertEqual(jobs, [(20, 3), (10, 2), (10, 4), (10, 5), (10, 1)])
+        return
+
+    def testSkipFullSites(self):
+        """
+        _testSkipFullSites_
+
+        A full site is asked about once and its jobs are only handed out if
+        they have another site with free slots.
+        """
+        index = PendingJobIndex()
+        for i in range(100):
+            index.add(1, self.makeJob(i, i, ["T2_A"] if i % 2 else ["T2_A", "T2_B"]))
+
+        asked = []
+
+        def queueIsFull(queueKey):
+            asked.append(queueKey)
+            return queueKey[1] == "T2_A"
+
+        jobs = [job['id'] for dummyPrio, job in index.iterJobs(queueIsFull)]
+        self.assertEqual(jobs, range(0, 100, 2))
+        self.assertEqual(asked.count(("Processing", "T2_A")), 1)
+        return
+
+    def testRemove(self):
+        """
+        _testRemove_
+
+        Removed jobs are not handed out anymore, also while iterating, and
+        the queues are compacted once they are mostly made of removed jobs.
+        """
+        index = PendingJobIndex()
+        for i in range(3000):
+            index.add(i % 3, self.makeJob(i, i, ["T2_A", "T2_B"]))
+
+        handedOut = []
+        for dummyPrio, job in index.iterJobs(lambda queueKey: False):
+            handedOut.append(job['id'])
+            index.remove(job['id'])
+            if len(handedOut) == 2000:
+                break
+        self.assertEqual(len(index), 1000)
+        self.assertEqual(index.remove(handedOut[0]), None)
+        self.assertTrue(handedOut[0] not in index)
+
+        # a job can be added back, with another priority
+        index.add(5, self.makeJob(handedOut[0], 0, ["T2_A"]))
+        self.assertEqual(index.deadEntries, 0)
+        self.assertEqual(sum(len(queue) for queues in index.queues.values() for queue in queues.values()),
+                         2001)
+
+        jobs = [job['id'] for dummyPrio, job in index.iterJobs(lambda queueKey: False)]
+        self.assertEqual(jobs, [handedOut[0]] + range(0, 3000, 3))
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
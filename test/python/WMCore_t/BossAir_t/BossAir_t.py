@@ -35,6 +35,7 @@ from WMCore.BossAir.BossAirAPI   import BossAirAPI, BossAirException
 
 from WMCore_t.WMSpec_t.TestSpec import testWorkload
 
+from mock import mock
 from nose.plugins.attrib import attr
 
 def getNArcJobs():
@@ -535,6 +536,7 @@ class BossAirTest(unittest.TestCase):
         # Should be no more running jobs
         runningJobs = baAPI._listRunJobs()
         self.assertEqual(len(runningJobs), 0)
+        self.assertEqual(baAPI.runningJobs, {})
 
 
         # Check if they're complete
@@ -557,6 +559,112 @@ class BossAirTest(unittest.TestCase):
 
         return
 
+    def testC_TrackResidentJobs(self):
+        """
+        _TrackResidentJobs_
+
+        Check that track() keeps the jobs it tracks between calls, only
+        loads again the jobs changed in the database and only records the
+        location of the jobs which moved.
+        """
+        config = self.getConfig()
+
+        baAPI  = BossAirAPI(config = config)
+
+        nJobs = 4
+
+        jobDummies = self.createDummyJobs(nJobs = nJobs, location = 'Xanadu')
+        changeState = ChangeState(config)
+        changeState.propagate(jobDummies, 'created', 'new')
+        changeState.propagate(jobDummies, 'executing', 'created')
+
+        for job in jobDummies:
+            job['plugin']   = 'TestPlugin'
+            job['owner']    = 'tapas'
+
+        baAPI.submit(jobs = jobDummies)
+
+        # The plugin keeps every job running, moving the ones in newLocations
+        newLocations = {}
+        def pluginTrack(jobs, info = None):
+            changedJobs = []
+            for job in jobs:
+                job['globalState'] = 'Running'
+                if job['jobid'] in newLocations:
+                    job['location'] = newLocations[job['jobid']]
+                    changedJobs.append(job)
+            return jobs, changedJobs, []
+
+        plugin = baAPI.plugins['TestPlugin']
+        with mock.patch.object(plugin, 'track', side_effect = pluginTrack), \
+             mock.patch.object(baAPI, '_loadByID', wraps = baAPI._loadByID) as loadByID, \
+             mock.patch.object(baAPI.stateMachine, 'recordLocationChange') as recordLocationChange:
+
+            # All the jobs are new, they are built in one go
+            self.assertEqual(len(baAPI.track()), nJobs)
+            self.assertEqual(loadByID.call_count, 1)
+            self.assertEqual(len(loadByID.call_args[1]['jobs']), nJobs)
+            self.assertEqual(len(baAPI.runningJobs), nJobs)
+            trackedJobs = dict(baAPI.runningJobs)
+
+            # Unchanged jobs are reused
+            loadByID.reset_mock()
+            self.assertEqual(len(baAPI.track()), nJobs)
+            self.assertEqual(loadByID.call_count, 0)
+            for runJobID, runJob in baAPI.runningJobs.items():
+                self.assertTrue(runJob is trackedJobs[runJobID])
+
+            # A job changed in the database is built again
+            statusJob, timeJob = sorted(trackedJobs)[:2]
+            changedJobs = baAPI._loadByID(jobs = [trackedJobs[statusJob], trackedJobs[timeJob]])
+            for runJob in changedJobs:
+                if runJob['id'] == statusJob:
+                    runJob['status'] = 'Gone'
+                else:
+                    runJob['status_time'] = 123456789
+            baAPI.updateDAO.execute(jobs = changedJobs)
+            loadByID.reset_mock()
+            self.assertEqual(len(baAPI.track()), nJobs)
+            self.assertEqual(loadByID.call_count, 1)
+            self.assertEqual(sorted(x['id'] for x in loadByID.call_args[1]['jobs']),
+                             [statusJob, timeJob])
+            self.assertEqual(baAPI.runningJobs[statusJob]['status'], 'Gone')
+            self.assertEqual(baAPI.runningJobs[timeJob]['status_time'], 123456789)
+            for runJobID in set(trackedJobs) - set([statusJob, timeJob]):
+                self.assertTrue(baAPI.runningJobs[runJobID] is trackedJobs[runJobID])
+            trackedJobs = dict(baAPI.runningJobs)
+
+            # Tracking some of the jobs does not drop the others
+            loadByID.reset_mock()
+            runJob = trackedJobs[statusJob]
+            self.assertEqual(len(baAPI.track(runJobIDs = [runJob['id']])), 1)
+            self.assertEqual(len(baAPI.track(wmbsIDs = [runJob['jobid']])), 1)
+            self.assertEqual(loadByID.call_count, 0)
+            self.assertEqual(baAPI.runningJobs, trackedJobs)
+
+            # Only the jobs which moved have their location recorded
+            self.assertEqual(recordLocationChange.call_count, 0)
+            firstJob, secondJob = sorted(x['jobid'] for x in trackedJobs.values())[:2]
+            newLocations[firstJob] = 'T2_US_UCSD'
+            newLocations[secondJob] = 'T2_US_UCSD'
+            baAPI.track()
+            self.assertEqual(recordLocationChange.call_count, 1)
+            self.assertEqual(sorted(x['jobid'] for x in recordLocationChange.call_args[0][0]),
+                             [firstJob, secondJob])
+
+            newLocations[secondJob] = 'T2_US_Florida'
+            recordLocationChange.reset_mock()
+            baAPI.track()
+            self.assertEqual(recordLocationChange.call_count, 1)
+            self.assertEqual([x['jobid'] for x in recordLocationChange.call_args[0][0]],
+                             [secondJob])
+
+            recordLocationChange.reset_mock()
+            baAPI.track()
+            self.assertEqual(recordLocationChange.call_count, 0)
+
+        return
+
     def testG_monitoringDAO(self):
         """
         _monitoringDAO_
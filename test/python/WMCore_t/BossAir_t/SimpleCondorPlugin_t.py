@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+"""
+_SimpleCondorPlugin_t_
+
+SimpleCondorPlugin unittests for the tracking from the job event logs
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from WMCore.BossAir.Plugins.SimpleCondorPlugin import SimpleCondorPlugin
+
+EVENT = """<c>
+    <a n="MyType"><s>%(type)s</s></a>
+    <a n="EventTypeNumber"><i>%(number)i</i></a>
+    <a n="EventTime"><s>2017-03-01T10:00:00</s></a>
+    <a n="Cluster"><i>1234</i></a>
+    <a n="Proc"><i>%(proc)i</i></a>
+    <a n="Subproc"><i>0</i></a>
+    <a n="SubmitHost"><s>&lt;127.0.0.1:9618&gt;</s></a>
+%(extra)s</c>
+"""
+
+
+class TrackingPlugin(SimpleCondorPlugin):
+    """
+    _TrackingPlugin_
+
+    SimpleCondorPlugin with only the tracking attributes, no schedd nor database
+    """
+
+    def __init__(self):
+        self.agent = "testAgent"
+        self.trackEventLogs = True
+        self.fullTrackInterval = 1800
+        self.eventLogOffsets = {}
+        self.lastFullTrack = 0
+
+
+class SimpleCondorPluginTest(unittest.TestCase):
+
+    def setUp(self):
+        self.testDir = tempfile.mkdtemp()
+        return
+
+    def tearDown(self):
+        shutil.rmtree(self.testDir)
+        return
+
+    def writeEvent(self, job, eventType, number, site=None):
+        """
+        _writeEvent_
+
+        Append an event to the event log of a job
+        """
+        extra = ''
+        if site:
+            extra = '    <a n="MATCH_EXP_JOBGLIDEIN_CMSSite"><s>%s</s></a>\n' % site
+        proc = int(job['gridid'].split('.')[1])
+        with open(os.path.join(job['cache_dir'], "condor.%s.log" % job['gridid']), 'a') as logFile:
+            logFile.write(EVENT % {'type': eventType, 'number': number, 'proc': proc, 'extra': extra})
+        return
+
+    def testParseEventLog(self):
+        """
+        _testParseEventLog_
+
+        Only the complete events are parsed
+        """
+        data = EVENT % {'type': 'SubmitEvent', 'number': 0, 'proc': 3, 'extra': ''}
+        data += EVENT % {'type': 'JobAdInformationEvent', 'number': 28, 'proc': 3,
+                         'extra': '    <a n="MATCH_EXP_JOBGLIDEIN_CMSSite"><s>T2_CH_CERN</s></a>\n'}
+        partial = EVENT % {'type': 'ExecuteEvent', 'number': 1, 'proc': 3, 'extra': ''}
+
+        events, consumed = SimpleCondorPlugin.parseEventLog(data + partial[:50])
+        self.assertEqual(len(events), 2)
+        self.assertEqual(consumed, len(data.rstrip()))
+        self.assertEqual(events[0]['EventTypeNumber'], 0)
+        self.assertEqual(events[0]['Proc'], 3)
+        self.assertEqual(events[0]['SubmitHost'], "<127.0.0.1:9618>")
+        self.assertEqual(events[1]['MATCH_EXP_JOBGLIDEIN_CMSSite'], "T2_CH_CERN")
+        return
+
+    def testTrackEventLogs(self):
+        """
+        _testTrackEventLogs_
+
+        Only the jobs with new events in their logs change
+        """
+        plugin = TrackingPlugin()
+        plugin.lastFullTrack = float('inf')
+
+        jobs = []
+        for i in range(3):
+            job = {'jobid': i, 'gridid': "1234.%i" % i, 'status': 'Idle', 'location': None,
+                   'cache_dir': os.path.join(self.testDir, "job_%i" % i)}
+            os.mkdir(job['cache_dir'])
+            self.writeEvent(job, 'SubmitEvent', 0)
+            jobs.append(job)
+
+        running, changes, completes = plugin.track(jobs)
+        self.assertEqual((len(running), len(changes), len(completes)), (3, 0, 0))
+
+        self.writeEvent(jobs[0], 'ExecuteEvent', 1)
+        self.writeEvent(jobs[0], 'JobAdInformationEvent', 28, site="T2_CH_CERN")
+        self.writeEvent(jobs[1], 'ExecuteEvent', 1)
+        self.writeEvent(jobs[1], 'JobTerminatedEvent', 5)
+        running, changes, completes = plugin.track(jobs)
+        self.assertEqual([job['jobid'] for job in changes], [0, 1])
+        self.assertEqual([job['jobid'] for job in completes], [1])
+        self.assertEqual(jobs[0]['status'], 'Running')
+        self.assertEqual(jobs[0]['location'], 'T2_CH_CERN')
+        self.assertEqual(jobs[1]['globalState'], 'Complete')
+
+        # nothing new, and the completed job is not tracked anymore
+        running, changes, completes = plugin.track([jobs[0], jobs[2]])
+        self.assertEqual((len(running), len(changes), len(completes)), (2, 0, 0))
+        self.assertEqual(sorted(plugin.eventLogOffsets), ["1234.0", "1234.2"])
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+_DAOFactory_t_
+
+Unit tests for the DAOFactory class cache.
+"""
+
+import logging
+import unittest
+
+from WMCore import DAOFactory as DAOFactoryModule
+from WMCore.DAOFactory import DAOFactory
+
+
+class DAOFactoryTest(unittest.TestCase):
+    """
+    Use the CouchDB DAOs of the agent database, they don't need an engine
+    to work out the dialect.
+    """
+
+    def setUp(self):
+        self.couchURL = "http://localhost:5984/agent"
+        DAOFactoryModule._daoClassCache.clear()
+
+    def testClassCache(self):
+        """
+        _testClassCache_
+
+        The DAO class should only be resolved once per process.
+        """
+        daoFactory = DAOFactory(package = "WMCore.Agent.Database",
+                                logger = logging, dbinterface = self.couchURL)
+        existWorker = daoFactory(classname = "ExistWorker")
+        self.assertEqual(existWorker.__class__.__name__, "ExistWorker")
+        self.assertEqual(existWorker.dbi, self.couchURL)
+
+        key = ("WMCore.Agent.Database", "CouchDB", "ExistWorker")
+        self.assertTrue(key in DAOFactoryModule._daoClassCache)
+
+        otherFactory = DAOFactory(package = "WMCore.Agent.Database",
+                                  logger = logging, dbinterface = self.couchURL)
+        self.assertTrue(isinstance(otherFactory(classname = "ExistWorker"),
+                                   DAOFactoryModule._daoClassCache[key]))
+        return
+
+    def testPreload(self):
+        """
+        _testPreload_
+
+        Preloading a package imports all of its DAOs.
+        """
+        daoFactory = DAOFactory(package = "WMCore.Agent.Database",
+                                logger = logging, dbinterface = self.couchURL)
+        self.assertEqual(daoFactory.preload(), 6)
+        for classname in ["CouchService", "ExistWorker", "InsertComponent", "InsertWorker",
+                          "UpdateWorker", "UpdateWorkerError"]:
+            self.assertTrue(("WMCore.Agent.Database", "CouchDB", classname) in DAOFactoryModule._daoClassCache)
+        return
+
+if __name__ == '__main__':
+    unittest.main()
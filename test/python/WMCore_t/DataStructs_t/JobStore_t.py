@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+_JobStore_t_
+
+Unittests for the packed job store
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from WMCore.DataStructs.Job import Job
+from WMCore.DataStructs.JobStore import JobLoader, JobStore, loadJob, saveJobs
+
+
+class JobStoreTest(unittest.TestCase):
+    def setUp(self):
+        """
+        _setUp_
+
+        Create a work directory for the job collections
+        """
+        self.testDir = tempfile.mkdtemp()
+        return
+
+    def tearDown(self):
+        shutil.rmtree(self.testDir)
+        return
+
+    def makeJobs(self, collection, number):
+        """
+        _makeJobs_
+
+        Make jobs with their cache directories in a job collection
+        """
+        jobs = []
+        for i in range(number):
+            job = Job("Job%s" % i)
+            job["id"] = i
+            job["cache_dir"] = os.path.join(self.testDir, collection, "job_%i" % i)
+            job["sandbox"] = "/some/sandbox.tar.bz2"
+            job["owner"] = "Steve"
+            jobs.append(job)
+        return jobs
+
+    def testSaveLoad(self):
+        """
+        _testSaveLoad_
+
+        Jobs are saved once per job collection, with the shared keys stored
+        only once, and loaded back by cache directory.
+        """
+        jobs = self.makeJobs("JobCollection_1_0", 10) + self.makeJobs("JobCollection_1_1", 5)
+        jobs[3]["owner"] = "Bob"
+        for job in jobs:
+            os.makedirs(job["cache_dir"])
+        saveJobs(jobs, sharedKeys=["sandbox", "owner", "notThere"])
+
+        self.assertEqual(sorted(os.listdir(os.path.join(self.testDir, "JobCollection_1_0")))[:2],
+                         [JobStore.indexFile, JobStore.dataFile])
+        store = JobStore(os.path.join(self.testDir, "JobCollection_1_0"))
+        self.assertTrue(store.exists())
+        self.assertEqual(store.names(), ["job_%i" % i for i in range(10)])
+        self.assertEqual(store.shared, {"sandbox": "/some/sandbox.tar.bz2", "owner": "Steve"})
+
+        loader = JobLoader(maxStores=1)
+        for job in jobs:
+            loadedJob = loader.load(job["cache_dir"])
+            self.assertEqual(loadedJob, job)
+            self.assertEqual(loadedJob["name"], job["name"])
+        self.assertEqual(len(loader.stores), 1)
+        self.assertEqual(loader.load(os.path.join(self.testDir, "JobCollection_1_0", "job_99")), None)
+        loader.close()
+
+        # the saved jobs kept all their keys
+        self.assertEqual(jobs[0]["sandbox"], "/some/sandbox.tar.bz2")
+        self.assertEqual(loadJob(jobs[3]["cache_dir"] + "/")["owner"], "Bob")
+        return
+
+    def testPickledJob(self):
+        """
+        _testPickledJob_
+
+        Jobs pickled in their own cache directory are still loaded, and
+        stores written after a loader opened them are picked up.
+        """
+        job = self.makeJobs("JobCollection_2_0", 1)[0]
+        os.makedirs(job["cache_dir"])
+        with open(os.path.join(job["cache_dir"], "job.pkl"), "w") as fd:
+            pickle.dump(job, fd, pickle.HIGHEST_PROTOCOL)
+
+        loader = JobLoader()
+        self.assertEqual(loader.load(job["cache_dir"]), job)
+
+        newJob = self.makeJobs("JobCollection_2_0", 2)[1]
+        self.assertEqual(loader.load(newJob["cache_dir"]), None)
+        saveJobs([newJob], sharedKeys=["sandbox"])
+        self.assertEqual(loader.load(newJob["cache_dir"]), newJob)
+        self.assertEqual(loader.load(job["cache_dir"]), job)
+        loader.close()
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,10 @@
 #! /usr/bin/env python
 
+import pickle
 import unittest
 
 #import FWCore.ParameterSet.Config as cms
-from WMCore.DataStructs.LumiList import LumiList
+from WMCore.DataStructs.LumiList import LumiList, LumiMaskIndex
 
 class LumiListTest(unittest.TestCase):
     """
@@ -336,6 +337,71 @@ class LumiListTest(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             w = LumiList(wmagentFormat=([1], ['1,2,3']))  # Need twice as many lumis as runs
 
+    def testLargeRanges(self):
+        """
+        Set operations and lookups on many ranges spanning millions of lumis
+        """
+        alumis = {'1': [[i * 1000 + 1, i * 1000 + 600] for i in range(5000)],
+                  '2': [[1, 5000000]]}
+        blumis = {'1': [[i * 1000 + 500, i * 1000 + 1100] for i in range(5000)]}
+        a = LumiList(compactList=alumis)
+        b = LumiList(compactList=blumis)
+
+        self.assertEqual((a & b).getCompactList()['1'][:2], [[500, 600], [1001, 1100]])
+        self.assertEqual((a - b).getCompactList()['1'][:2], [[1, 499], [1101, 1499]])
+        self.assertEqual((a - b).getCompactList()['2'], [[1, 5000000]])
+        self.assertEqual((a | b).getCompactList()['1'], [[1, 5000100]])
+        self.assertEqual(len((a & b).getCompactList()['1']), 9999)
+
+        self.assertTrue(a.contains(1, 4000600))
+        self.assertFalse(a.contains(1, 4000601))
+        self.assertTrue((2, 5000000) in a)
+        self.assertEqual(a.filterLumis([(1, 600), (1, 700), (2, 10), (3, 10)]), [(1, 600), (2, 10)])
+
+        # an upper bound of 0 extends the range to the end of the run, for contains only
+        c = LumiList(compactList={'1': [[5, 0], [10, 12]]})
+        self.assertFalse(c.contains(1, 4))
+        self.assertTrue(c.contains(1, 20))
+        self.assertEqual(c.filterLumis([(1, 11), (1, 20)]), [(1, 11)])
+        self.assertEqual((c - LumiList(compactList={'2': [[1, 2]]})).getCompactList(),
+                         {'1': [[5, 0], [10, 12]]})
+        self.assertEqual((c - LumiList(compactList={'1': [[6, 8]]})).getCompactList(),
+                         {'1': [[5, 0], [10, 12]]})
+        self.assertEqual((c - LumiList(compactList={'1': [[1, 2]]})).getCompactList(),
+                         {'1': [[10, 12]]})
+        d = LumiList(compactList={'1': [[3, 10], [12, 15]]})
+        self.assertEqual((d - LumiList(compactList={'1': [[5, 0]]})).getCompactList(),
+                         {'1': [[3, 4]]})
+
+        # the lookups follow changes to the compact list
+        a.removeRuns([2])
+        self.assertFalse(a.contains(2, 10))
+        a.getCompactList()['1'] = [[1, 10]]
+        self.assertEqual(a.filterLumis([(1, 10), (1, 600)]), [(1, 10)])
+
+        # the lookup index is not serialized with the list
+        self.assertEqual(sorted(a.__dict__), ['compactList', 'duplicates'])
+        self.assertEqual(pickle.loads(pickle.dumps(a)).getCompactList(), a.getCompactList())
+
+    def testLumiMaskIndex(self):
+        """
+        LumiMaskIndex answers the same as a scan of the mask ranges
+        """
+        mask = {'1': [[20, 30], [1, 5], [4, 8], [40, 40], [1, 2, 3]], '3': [[7, 9]]}
+        index = LumiMaskIndex(mask, runType=int)
+        self.assertTrue(index.hasRun(1))
+        self.assertFalse(index.hasRun(2))
+        for lumi in range(50):
+            expected = any(x[0] <= lumi <= x[1] for x in mask['1'] if len(x) == 2)
+            self.assertEqual(index.contains(1, lumi), expected)
+        self.assertFalse(index.contains(2, 1))
+        self.assertEqual(index.filterLumis(3, [10, 9, 6, 7]), [9, 7])
+
+        # without a mask everything goes through
+        index = LumiMaskIndex({})
+        self.assertTrue(index.hasRun(2))
+        self.assertTrue(index.contains(2, 1))
+
 
 if __name__ == '__main__':
     unittest.main()
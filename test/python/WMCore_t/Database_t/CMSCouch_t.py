@@ -303,6 +303,60 @@ class CMSCouchTest(unittest.TestCase):
 
         return
 
+    def testCommitInBatches(self):
+        """
+        Test that a commit split into several concurrent requests returns
+        the results in queue order
+        """
+        dbname = 'cmscouch_unittest_%s' % self.testname.lower()
+        db = Database(dbname, url = self.server.url, bulkSize = 300, commitThreads = 3)
+
+        for i in range(20):
+            db.queue(Document(id = str(i), inputDict = {'payload': 'x' * (i * 10)}))
+        # docs with the same id still conflict with each other
+        db.queue(Document(id = "5", inputDict = {'foo': 1}))
+        answer = db.commit()
+        self.assertEqual([x['id'] for x in answer], [str(i) for i in range(20)] + ["5"])
+        self.assertEqual(answer[5]['error'], 'conflict')
+        self.assertEqual(answer[20]['error'], 'conflict')
+        self.assertEqual(len([x for x in answer if 'error' in x]), 2)
+        self.assertEqual(self.db.info()['doc_count'], 19)
+
+        return
+
+    def testCommitInBatchesFailure(self):
+        """
+        Test that the docs of the batches that could not be committed stay
+        in the queue and that the results of the other ones are reported
+        """
+        dbname = 'cmscouch_unittest_%s' % self.testname.lower()
+        db = Database(dbname, url = self.server.url, bulkSize = 300, commitThreads = 1)
+
+        def failingPost(uri, data, encode = True):
+            if '"_id": "7"' in data:
+                raise CouchInternalServerError('Failed batch', data, None)
+            return Database.post(db, uri, data, encode = encode)
+        db.post = failingPost
+
+        for i in range(20):
+            db.queue(Document(id = str(i), inputDict = {'payload': 'x' * (i * 10)}))
+        try:
+            db.commit()
+            self.fail("The commit should have failed")
+        except CouchInternalServerError as ex:
+            committed = [x['id'] for x in ex.commitResults if x is not None]
+        self.assertTrue('7' not in committed)
+        self.assertEqual(self.db.info()['doc_count'], len(committed))
+        self.assertEqual(sorted(committed + [doc['_id'] for doc in db._queue], key = int),
+                         [str(i) for i in range(20)])
+
+        # the remaining docs go with the next commit
+        del db.post
+        db.commit()
+        self.assertEqual(db._queue, [])
+        self.assertEqual(self.db.info()['doc_count'], 20)
+        return
+
     def testUpdateHandler(self):
         """
         Test that update function support works
@@ -363,6 +417,46 @@ class CMSCouchTest(unittest.TestCase):
         self.assertEqual(1, len(self.db.allDocs({'limit':1}, ["1", "3"])['rows']))
         self.assertTrue('error' in self.db.allDocs(keys = ["1", "4"])['rows'][1])
 
+    def testIterAllDocs(self):
+        """
+        Test paging through all docs
+        """
+        for i in range(7):
+            self.db.queue(Document(id = str(i), inputDict = {'foo': i}))
+        self.db.commit()
+
+        ids = [row['id'] for row in self.db.iterAllDocs(pageSize = 2)]
+        self.assertEqual(ids, [str(i) for i in range(7)])
+        ids = [row['id'] for row in self.db.iterAllDocs({'startkey': "2", 'limit': 3}, pageSize = 2)]
+        self.assertEqual(ids, ["2", "3", "4"])
+
+    def testIterView(self):
+        """
+        Test paging through a view where keys are emitted by several docs
+        """
+        ddoc = {
+            '_id':'_design/foo',
+            'language': 'javascript',
+            'views' : {
+                       'byParity' : {
+                                'map' : 'function(doc) {if (doc.foo != undefined) {emit(doc.foo % 2, null)}}'
+                                },
+                       },
+        }
+        self.db.commit(ddoc)
+        for i in range(9):
+            self.db.queue(Document(id = "doc%s" % i, inputDict = {'foo': i}))
+        self.db.commit()
+
+        rows = list(self.db.iterView('foo', 'byParity', pageSize = 2))
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(len(set([row['id'] for row in rows])), 9)
+        # each page starts on the doc where the previous one stopped
+        self.assertEqual([row['id'] for row in rows],
+                         ["doc%s" % i for i in range(0, 9, 2) + range(1, 9, 2)])
+        rows = list(self.db.iterView('foo', 'byParity', {'key': 1}, pageSize = 3))
+        self.assertEqual(sorted([row['id'] for row in rows]), ["doc1", "doc3", "doc5", "doc7"])
+
 if __name__ == "__main__":
     if len(sys.argv) >1 :
         suite = unittest.TestSuite()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""
+_ChangesConsumer_t_
+
+Unit tests for the CMSCouch _changes feed consumer.  The database is faked,
+so these do not need a CouchDB instance.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from WMCore.Database.CMSCouch import ChangesConsumer
+
+
+class FakeDatabase(object):
+    """
+    Serve a fixed list of changes the way longPollChanges does.
+    """
+    name = "changes_test"
+
+    def __init__(self, nChanges):
+        self.changes = [{"seq": i + 1, "id": "doc%i" % (i + 1)} for i in range(nChanges)]
+        self.requests = []
+
+    def longPollChanges(self, since=0, limit=1000, timeout=60000, filter=None, params={}):
+        self.requests.append((since, limit, filter))
+        results = [x for x in self.changes if x["seq"] > since][:limit]
+        lastSeq = results[-1]["seq"] if results else since
+        return {"results": results, "last_seq": lastSeq}
+
+
+class ChangesConsumerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.testDir = tempfile.mkdtemp()
+        self.checkpoint = os.path.join(self.testDir, "checkpoint.json")
+        self.received = []
+        return
+
+    def tearDown(self):
+        shutil.rmtree(self.testDir)
+        return
+
+    def testBatches(self):
+        """
+        _testBatches_
+
+        Changes are delivered in batches and the sequence is checkpointed.
+        """
+        database = FakeDatabase(5)
+        consumer = ChangesConsumer(database, self.received.append, self.checkpoint,
+                                   filter="app/filter", batchSize=2)
+        consumer.run(maxPolls=4)
+
+        self.assertEqual([[x["seq"] for x in batch] for batch in self.received],
+                         [[1, 2], [3, 4], [5]])
+        self.assertEqual([x[0] for x in database.requests], [0, 2, 4, 5])
+        self.assertEqual(database.requests[0][2], "app/filter")
+        self.assertEqual(consumer.loadCheckpoint(), 5)
+        return
+
+    def testResume(self):
+        """
+        _testResume_
+
+        A new consumer carries on from the checkpoint of the previous one.
+        """
+        database = FakeDatabase(3)
+        ChangesConsumer(database, self.received.append, self.checkpoint, batchSize=2).poll()
+
+        consumer = ChangesConsumer(database, self.received.append, self.checkpoint, batchSize=2)
+        self.assertEqual(consumer.since, 2)
+        self.assertEqual(consumer.poll(), 1)
+        self.assertEqual(self.received[-1], [{"seq": 3, "id": "doc3"}])
+        return
+
+    def testCallbackFailure(self):
+        """
+        _testCallbackFailure_
+
+        A batch whose callback raises is not checkpointed and is delivered again.
+        """
+        database = FakeDatabase(2)
+
+        def failingCallback(changes):
+            raise RuntimeError("callback failed")
+
+        consumer = ChangesConsumer(database, failingCallback, self.checkpoint)
+        self.assertRaises(RuntimeError, consumer.poll)
+        self.assertEqual(consumer.since, 0)
+        self.assertFalse(os.path.exists(self.checkpoint))
+
+        consumer.callback = self.received.append
+        self.assertEqual(consumer.poll(), 2)
+        self.assertEqual(consumer.loadCheckpoint(), 2)
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""
+_DAOCache_t_
+
+Unit tests for the read-through DAO cache.
+"""
+
+import time
+import unittest
+
+from WMCore.Database.DAOCache import CachedDAO, invalidateDAOCache
+
+
+class CountingDAO(object):
+    """
+    Return the number of times execute has been called.
+    """
+    def __init__(self):
+        self.calls = 0
+
+    def execute(self, siteName = None, conn = None, transaction = False):
+        self.calls += 1
+        return {"site": siteName, "calls": self.calls}
+
+
+class DAOCacheTest(unittest.TestCase):
+
+    def tearDown(self):
+        invalidateDAOCache()
+
+    def testCache(self):
+        """
+        _testCache_
+
+        Results are shared by DAOs with the same key, per set of arguments,
+        until the time to live expires.
+        """
+        key = ("WMCore.WMBS", "MySQL", "Locations.GetSiteInfo")
+        daoA = CachedDAO(CountingDAO(), key, expire = 0.5)
+        daoB = CachedDAO(CountingDAO(), key, expire = 0.5)
+
+        self.assertEqual(daoA.execute(siteName = "T1_US_FNAL")["calls"], 1)
+        self.assertEqual(daoA.execute(siteName = "T1_US_FNAL", conn = None)["calls"], 1)
+        self.assertEqual(daoB.execute(siteName = "T1_US_FNAL", transaction = True)["calls"], 1)
+        self.assertEqual(daoB.execute(siteName = "T2_CH_CERN")["calls"], 1)
+        self.assertEqual(daoA.execute(siteName = "T2_CH_CERN")["calls"], 1)
+
+        time.sleep(0.6)
+        self.assertEqual(daoA.execute(siteName = "T1_US_FNAL")["calls"], 2)
+
+        # unhashable arguments are not cached
+        self.assertEqual(daoA.execute(siteName = ["T1_US_FNAL"])["calls"], 3)
+        self.assertEqual(daoA.execute(siteName = ["T1_US_FNAL"])["calls"], 4)
+        return
+
+    def testInvalidate(self):
+        """
+        _testInvalidate_
+
+        Test the invalidation by package and classname.
+        """
+        daoA = CachedDAO(CountingDAO(), ("WMCore.WMBS", "MySQL", "Locations.ListSites"), 300)
+        daoB = CachedDAO(CountingDAO(), ("WMCore.WMBS", "MySQL", "Locations.GetSiteInfo"), 300)
+        daoC = CachedDAO(CountingDAO(), ("WMCore.ResourceControl", "MySQL", "ListThresholdsForCreate"), 300)
+        for dao in [daoA, daoB, daoC]:
+            dao.execute()
+            dao.execute()
+
+        invalidateDAOCache(package = "WMCore.WMBS", classnames = ["Locations.ListSites"])
+        self.assertEqual([x.execute()["calls"] for x in [daoA, daoB, daoC]], [2, 1, 1])
+
+        invalidateDAOCache(package = "WMCore.WMBS")
+        self.assertEqual([x.execute()["calls"] for x in [daoA, daoB, daoC]], [3, 2, 1])
+
+        daoC.invalidate()
+        self.assertEqual([x.execute()["calls"] for x in [daoA, daoB, daoC]], [3, 2, 2])
+
+        invalidateDAOCache()
+        self.assertEqual([x.execute()["calls"] for x in [daoA, daoB, daoC]], [4, 3, 3])
+        return
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+"""
+_DAOStats_t_
+
+Unit tests for the DAO instrumentation.
+"""
+
+import unittest
+
+from WMCore.Database.DAOStats import DAOStats, percentile
+from WMCore.Database.ResultSet import ResultSet
+
+
+class DummyDAO(object):
+    """
+    Pretend to run a query returning the given number of rows.
+    """
+    def __init__(self, stats, nRows):
+        self.stats = stats
+        self.nRows = nRows
+
+    def execute(self, conn = None, transaction = False):
+        result = ResultSet()
+        result.data = range(self.nRows)
+        self.stats.addRows([result])
+        return result.data
+
+
+class DAOStatsTest(unittest.TestCase):
+
+    def testPercentile(self):
+        """
+        _testPercentile_
+
+        Test the nearest rank percentiles.
+        """
+        samples = range(1, 101)
+        self.assertEqual(percentile(samples, 50), 50)
+        self.assertEqual(percentile(samples, 90), 90)
+        self.assertEqual(percentile(samples, 99), 99)
+        self.assertEqual(percentile(samples, 100), 100)
+        self.assertEqual(percentile([], 50), 0.0)
+        return
+
+    def testInstrument(self):
+        """
+        _testInstrument_
+
+        Verify that calls and rows are counted per DAO and dialect.
+        """
+        stats = DAOStats()
+        stats.enable()
+
+        daoA = stats.instrument(DummyDAO(stats, 3), "Jobs.ListForSubmitter", "MySQL")
+        daoB = stats.instrument(DummyDAO(stats, 5), "Jobs.ChangeState", "Oracle")
+        for dummy in range(4):
+            self.assertEqual(len(daoA.execute()), 3)
+        daoB.execute(transaction = True)
+
+        # rows reported outside of a DAO call are ignored
+        stats.addRows([ResultSet()])
+
+        summary = stats.summary()
+        self.assertEqual(sorted(summary.keys()),
+                         ["Jobs.ChangeState/Oracle", "Jobs.ListForSubmitter/MySQL"])
+        self.assertEqual(summary["Jobs.ListForSubmitter/MySQL"]["count"], 4)
+        self.assertEqual(summary["Jobs.ListForSubmitter/MySQL"]["rows"], 12)
+        self.assertEqual(summary["Jobs.ChangeState/Oracle"]["count"], 1)
+        self.assertEqual(summary["Jobs.ChangeState/Oracle"]["rows"], 5)
+        self.assertTrue(summary["Jobs.ChangeState/Oracle"]["p99"] <= \
+                        summary["Jobs.ChangeState/Oracle"]["max"])
+
+        stats.reset()
+        self.assertEqual(stats.summary(), {})
+        return
+
+if __name__ == "__main__":
+    unittest.main()
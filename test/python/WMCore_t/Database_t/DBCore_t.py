@@ -284,6 +284,35 @@ class DBCoreTest(unittest.TestCase):
 
         return
 
+    def testChunkBinds(self):
+        """
+        _testChunkBinds_
+
+        Verify that bulk operations are split in chunks of maxBindsPerQuery.
+        """
+        myThread = threading.currentThread()
+        myThread.dbi.maxBindsPerQuery = 10
+
+        binds = []
+        for i in range(25):
+            binds.append({"one": i, "two": i * 2, "three": str(i * 3)})
+
+        chunks = list(myThread.dbi.chunkbinds(binds))
+        self.assertEqual([len(x) for x in chunks], [10, 10, 5])
+        self.assertEqual(sum(chunks, []), binds)
+
+        insertSQL = "INSERT INTO test_tablea VALUES (:one, :two, :three)"
+        myThread.dbi.processData(insertSQL, binds = binds)
+
+        resultSets = myThread.dbi.processData("SELECT column1 FROM test_tablea")
+        results = []
+        for resultSet in resultSets:
+            results.extend([x[0] for x in resultSet.fetchall()])
+
+        self.assertEqual(sorted(results), range(25))
+        myThread.dbi.maxBindsPerQuery = 500
+        return
+
     def testInsertHugeNumber(self):
         """
         _testInsertHugeNumber_
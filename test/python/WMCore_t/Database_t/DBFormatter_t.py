@@ -94,6 +94,29 @@ insert into test (bind1, bind2) values (:bind1, :bind2) """
         output = dbformatter.formatOneDict(result)
         self.assertEqual(output, {'bind2': 'value2a', 'bind1': 'value1a'})
 
+    @attr("integration")
+    def testStreamFormatting(self):
+        """
+        Test the generator based formatting of streamed results
+        """
+        myThread = threading.currentThread()
+        dbformatter = DBFormatter(myThread.logger, myThread.dbi)
+        myThread.dbi.streamBatchSize = 2
+
+        result = myThread.dbi.processData(myThread.select, stream=True)
+        output = dbformatter.formatIter(result)
+        self.assertFalse(isinstance(output, list))
+        self.assertEqual(list(output), [['value1a', 'value2a'], \
+                                        ['value1b', 'value2b'], ['value1c', 'value2d']])
+        self.assertTrue(result[0].closed)
+
+        result = myThread.dbi.processData(myThread.select, stream=True)
+        output = dbformatter.formatDictIter(result)
+        self.assertEqual(next(output), {'bind2': 'value2a', 'bind1': 'value1a'})
+        self.assertEqual(list(output), [{'bind2': 'value2b', 'bind1': 'value1b'}, \
+                                        {'bind2': 'value2d', 'bind1': 'value1c'}])
+        self.assertTrue(result[0].closed)
+
 
 if __name__ == "__main__":
     unittest.main()
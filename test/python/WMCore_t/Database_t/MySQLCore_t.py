@@ -11,6 +11,7 @@ Unit tests for the MySQL version of DBCore.
 import unittest
 import logging
 
+from WMCore.Database import MySQLCore
 from WMCore.Database.MySQLCore import MySQLInterface
 from WMQuality.TestInit import TestInit
 
@@ -122,5 +123,31 @@ class DBCoreTest(unittest.TestCase):
 
         return
 
+    def testBindSubstitutionCache(self):
+        """
+        _testBindSubstitutionCache_
+
+        Verify that the compiled SQL is reused for the same SQL and bind names
+        and that different bind names get their own entry.
+        """
+        sql = "SELECT id FROM wmbs_job WHERE name = :name AND retry_count = :retry_count AND name != :Name2"
+        myInterface = MySQLInterface(logger = logging, engine = None)
+
+        (updatedSQL, bindList) = myInterface.substitute(sql, [{"retry_count": 1, "name": "a", "Name2": "b"},
+                                                              {"name": "c", "Name2": "d", "retry_count": 2}])
+        self.assertEqual(updatedSQL, "SELECT id FROM wmbs_job WHERE name = %s AND retry_count = %s AND name != %s")
+        self.assertEqual(bindList, [("a", 1, "b"), ("c", 2, "d")])
+        self.assertTrue((sql, frozenset(["name", "retry_count", "Name2"])) in MySQLCore._substituteCache)
+
+        (updatedSQL, bindList) = myInterface.substitute(sql, {"Name2": "f", "retry_count": 3, "name": "e"})
+        self.assertEqual(updatedSQL, "SELECT id FROM wmbs_job WHERE name = %s AND retry_count = %s AND name != %s")
+        self.assertEqual(bindList, [("e", 3, "f")])
+
+        sql = "SELECT id FROM wmbs_job WHERE name = :name"
+        (updatedSQL, bindList) = myInterface.substitute(sql, {"name": "g"})
+        self.assertEqual(updatedSQL, "SELECT id FROM wmbs_job WHERE name = %s")
+        self.assertEqual(bindList, [("g",)])
+        return
+
 if __name__ == "__main__":
     unittest.main()
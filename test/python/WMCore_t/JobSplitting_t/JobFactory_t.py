@@ -101,5 +101,37 @@ class JobFactoryTest(unittest.TestCase):
 
         return
 
+    def testTiming(self):
+        """
+        _testTiming_
+
+        Verify that the time spent in each phase is recorded, and reset on
+        every call of the factory.
+        """
+        testWorkflow = Workflow(spec = "spec.pkl", owner = "Steve",
+                                name = "TestWorkflow", task = "TestTask")
+
+        testFileset = Fileset(name = "TestFileset")
+        testFile = File(lfn = "someLFN", locations = set(["site1"]))
+        testFileset.addFile(testFile)
+        testFileset.commit()
+
+        testSubscription = Subscription(fileset = testFileset,
+                                        workflow = testWorkflow,
+                                        split_algo = "FileBased")
+
+        myJobFactory = JobFactory(subscription = testSubscription)
+        myJobFactory.timing['sortByLocation'] = 10
+
+        myJobFactory()
+        self.assertEqual(sorted(myJobFactory.timing),
+                         ['acquireFiles', 'jobGroup', 'jobInstance', 'sortByLocation'])
+        self.assertEqual(myJobFactory.timing['sortByLocation'], 0)
+        self.assertTrue(myJobFactory.timing['jobInstance'] > 0)
+        self.assertTrue(myJobFactory.timing['jobGroup'] > 0)
+        self.assertTrue(myJobFactory.timing['acquireFiles'] > 0)
+        return
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+"""
+_JobSplittingBenchmark_
+
+Measure the throughput of the job splitting algorithms on synthetic
+DataStructs filesets: a number of files, each with some runs of consecutive
+lumis with a fixed number of events, spread over a number of locations.
+
+Every splitter runs in its own process, so that the reported peak memory
+belongs to it alone. For each splitter the jobs per second, the peak RSS,
+the RSS growth while splitting and the per phase timings of
+JobFactory.timing are reported, either as a table or as JSON to track
+regressions between releases.
+
+Usage: python JobSplittingBenchmark.py --files 5000 --json results.json
+"""
+from __future__ import print_function, division
+
+import argparse
+import gc
+import json
+import multiprocessing
+import resource
+import sys
+import time
+
+from WMCore.DataStructs.File import File
+from WMCore.DataStructs.Fileset import Fileset
+from WMCore.DataStructs.Run import Run
+from WMCore.DataStructs.Subscription import Subscription
+from WMCore.DataStructs.Workflow import Workflow
+from WMCore.JobSplitting.SplitterFactory import SplitterFactory
+
+PERFORMANCE = {'timePerEvent': 12, 'memoryRequirement': 2300, 'sizePerEvent': 400}
+
+# splitting algorithm and the arguments it is called with
+SPLITTERS = [("FileBased", {'files_per_job': 5}),
+             ("EventBased", {'events_per_job': 5000}),
+             ("LumiBased", {'lumis_per_job': 20, 'halt_job_on_file_boundaries': False}),
+             ("EventAwareLumiBased", {'events_per_job': 5000, 'halt_job_on_file_boundaries': False}),
+             ("MergeBySize", {'merge_size': 4 * 2 ** 30, 'all_files': True})]
+
+
+def makeFileset(files, runs, lumis, events, locations):
+    """
+    Build a fileset of files with runs of lumis consecutive lumis of events
+    events each, the files are spread round robin over the locations.
+    """
+    fileset = Fileset(name="JobSplittingBenchmark")
+    for i in range(files):
+        newFile = File(lfn="/store/data/Run2016/Benchmark/RAW/v1/%09d.root" % i,
+                       size=events * lumis * runs * 250000, events=events * lumis * runs)
+        for run in range(runs):
+            firstLumi = i * lumis + 1
+            newFile.addRun(Run(run + 1, *range(firstLumi, firstLumi + lumis)))
+        newFile.setLocation("T2_XX_Site%d" % (i % locations))
+        fileset.addFile(newFile)
+    fileset.commit()
+    return fileset
+
+
+def peakRSS():
+    """
+    Peak resident memory of this process, in MB
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def runSplitter(algorithm, kwargs, options):
+    """
+    Split a new fileset with the algorithm and return its measurements
+    """
+    fileset = makeFileset(options.files, options.runs, options.lumis, options.events, options.locations)
+    subscription = Subscription(fileset=fileset, workflow=Workflow(), split_algo=algorithm, type="Processing")
+    jobFactory = SplitterFactory()(package="WMCore.DataStructs", subscription=subscription)
+
+    gc.collect()
+    rssBefore = peakRSS()
+    start = time.time()
+    jobGroups = jobFactory(performance=PERFORMANCE, **kwargs)
+    elapsed = time.time() - start
+
+    jobs = sum(len(jobGroup.jobs) for jobGroup in jobGroups)
+    return {'algorithm': algorithm,
+            'arguments': kwargs,
+            'jobs': jobs,
+            'job_groups': len(jobGroups),
+            'seconds': elapsed,
+            'jobs_per_second': jobs / elapsed if elapsed else 0,
+            'peak_rss_mb': peakRSS(),
+            'split_rss_mb': peakRSS() - rssBefore,
+            'timing': dict(jobFactory.timing)}
+
+
+def _runInChild(queue, algorithm, kwargs, options):
+    """
+    Entry point of the benchmark processes
+    """
+    queue.put(runSplitter(algorithm, kwargs, options))
+
+
+def runBenchmark(options):
+    """
+    Run every requested splitter in a separate process, return the results
+    """
+    results = []
+    for algorithm, kwargs in SPLITTERS:
+        if options.splitters and algorithm not in options.splitters:
+            continue
+        queue = multiprocessing.Queue()
+        proc = multiprocessing.Process(target=_runInChild, args=(queue, algorithm, kwargs, options))
+        proc.start()
+        results.append(queue.get())
+        proc.join()
+    return results
+
+
+def main(argv=None):
+    """
+    Parse the command line, run the benchmark and report the results
+    """
+    parser = argparse.ArgumentParser(description="Job splitting throughput benchmark")
+    parser.add_argument("--files", type=int, default=2000, help="number of files in the fileset")
+    parser.add_argument("--runs", type=int, default=2, help="number of runs per file")
+    parser.add_argument("--lumis", type=int, default=10, help="number of lumis per run and file")
+    parser.add_argument("--events", type=int, default=500, help="number of events per lumi")
+    parser.add_argument("--locations", type=int, default=5, help="number of locations of the files")
+    parser.add_argument("--splitters", nargs="*", help="splitting algorithms to run, default all")
+    parser.add_argument("--json", dest="jsonFile", help="write the results to this file, '-' for stdout")
+    options = parser.parse_args(argv)
+
+    results = runBenchmark(options)
+    report = {'workload': {'files': options.files, 'runs': options.runs, 'lumis': options.lumis,
+                           'events': options.events, 'locations': options.locations},
+              'results': results}
+
+    if options.jsonFile == '-':
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        print()
+        return
+    if options.jsonFile:
+        with open(options.jsonFile, 'w') as fd:
+            json.dump(report, fd, indent=2, sort_keys=True)
+
+    phases = sorted(results[0]['timing']) if results else []
+    print("%-20s %8s %9s %10s %9s %10s " % ("algorithm", "jobs", "time (s)", "jobs/s", "peak (MB)", "split (MB)") +
+          " ".join("%14s" % phase for phase in phases))
+    for result in results:
+        print("%-20s %8d %9.3f %10.1f %9.1f %10.1f " % (result['algorithm'], result['jobs'], result['seconds'],
+                                                    result['jobs_per_second'], result['peak_rss_mb'],
+                                                    result['split_rss_mb']) +
+              " ".join("%14.3f" % result['timing'][phase] for phase in phases))
+    return
+
+
+if __name__ == '__main__':
+    main()
@@ -11,16 +11,13 @@ import unittest
 import threading
 
 from subprocess import Popen, PIPE
-try:
-    import cPickle as pickle
-except ImportError:
-    import pickle
 
 # Imports for testing
 from WMQuality.TestInit import TestInit
 from WMQuality.Emulators import EmulatorSetup
 from WMCore.DAOFactory import DAOFactory
 from WMCore.WMInit import getWMBASE
+from WMCore.DataStructs.JobStore import loadJob
 
 
 
@@ -443,11 +440,8 @@ class WMAgentTest(unittest.TestCase):
 
         # First job should be in here
         self.assertTrue('job_1' in os.listdir(groupDirectory))
-        jobFile = os.path.join(groupDirectory, 'job_1', 'job.pkl')
-        self.assertTrue(os.path.isfile(jobFile))
-        f = open(jobFile, 'r')
-        job = pickle.load(f)
-        f.close()
+        job = loadJob(os.path.join(groupDirectory, 'job_1'))
+        self.assertNotEqual(job, None)
 
 
         self.assertEqual(job['workflow'], name)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""
+_ConnectionPool_t_
+
+Unit tests for the HTTP connection pool shared by Requests.
+"""
+
+import BaseHTTPServer
+import SocketServer
+import json
+import threading
+import time
+import unittest
+
+from WMCore.Services.ConnectionPool import ConnectionPool, getConnectionPool
+from WMCore.Services.Requests import JSONRequests
+
+
+class ThreadedServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class ConnectionHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Answer every GET with the port of the client connection, so that
+    connection reuse can be observed.
+    """
+    protocol_version = 'HTTP/1.1'
+    server_version = 'TestServer'
+    sys_version = ''
+
+    def do_GET(self):
+        body = json.dumps({'client_port': self.client_address[1]})
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return
+
+
+class ConnectionPoolTest(unittest.TestCase):
+
+    def testAcquireRelease(self):
+        """
+        _testAcquireRelease_
+
+        Released connections are handed out again for the same key only.
+        """
+        pool = ConnectionPool()
+        first = pool.acquire('a', object)
+        pool.release('a', first)
+
+        self.assertTrue(pool.acquire('a', object) is first)
+        self.assertFalse(pool.acquire('a', object) is first)
+        self.assertFalse(pool.acquire('b', object) is first)
+
+        stats = pool.stats()
+        self.assertEqual((stats['created'], stats['reused'], stats['idle']), (3, 1, 0))
+        self.assertEqual(stats['reuse_ratio'], 0.25)
+        return
+
+    def testEviction(self):
+        """
+        _testEviction_
+
+        Connections beyond maxSize or idle for too long are closed.
+        """
+        closed = []
+        pool = ConnectionPool(maxSize=2, idleTimeout=0.2)
+        for i in range(3):
+            pool.release('a', i, closed.append)
+        self.assertEqual(closed, [0])
+        self.assertEqual(pool.stats()['idle'], 2)
+
+        time.sleep(0.3)
+        self.assertEqual(pool.acquire('a', lambda: 'new'), 'new')
+        self.assertEqual(sorted(closed), [0, 1, 2])
+        self.assertEqual(pool.stats()['evicted'], 3)
+
+        pool.release('b', 3, closed.append)
+        pool.clear()
+        self.assertEqual(closed[-1], 3)
+        self.assertEqual(pool.stats()['idle'], 0)
+        return
+
+
+class RequestsPoolingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadedServer(('127.0.0.1', 0), ConnectionHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%s' % self.server.server_address[1]
+        return
+
+    def tearDown(self):
+        getConnectionPool().clear()
+        self.server.shutdown()
+        self.server.server_close()
+        return
+
+    def clientPorts(self, idict):
+        """
+        Make requests through several Requests instances and return the
+        client ports the server saw.
+        """
+        ports = set()
+        for _ in range(3):
+            req = JSONRequests(self.url, dict(idict, cachepath=None))
+            for _ in range(2):
+                ports.add(req.get('/')[0]['client_port'])
+        return ports
+
+    def testHttplib2Reuse(self):
+        """
+        _testHttplib2Reuse_
+
+        Separate Requests instances share one keep-alive connection.
+        """
+        self.assertEqual(len(self.clientPorts({})), 1)
+        return
+
+    def testPycurlReuse(self):
+        """
+        _testPycurlReuse_
+
+        Same with the pycurl backend.
+        """
+        try:
+            import pycurl
+        except ImportError:
+            raise unittest.SkipTest("pycurl is not available")
+        self.assertEqual(len(self.clientPorts({'pycurl': True})), 1)
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
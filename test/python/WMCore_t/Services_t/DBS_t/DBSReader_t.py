@@ -226,6 +226,25 @@ class DBSReaderTest(EmulatedUnitTestCase):
         self.assertTrue(FILE in [x['LogicalFileName'] for x in self.dbs.listFilesInBlock(BLOCK)])
         self.assertRaises(DBSReaderError, self.dbs.listFilesInBlock, DATASET + '#blah')
 
+    def testListFilesInBlocks(self):
+        """listFilesInBlocks returns the same files as listFilesInBlock, per block"""
+        self.dbs = DBSReader(self.endpoint)
+        blocks = [BLOCK, PARENT_BLOCK]
+        files = self.dbs.listFilesInBlocks(blocks)
+        self.assertItemsEqual(files.keys(), blocks)
+        for block in blocks:
+            self.assertEqual(files[block], self.dbs.listFilesInBlock(block))
+        self.assertRaises(DBSReaderError, self.dbs.listFilesInBlocks, [BLOCK, DATASET + '#blah'])
+
+    def testGetLumiListForBlocks(self):
+        """getLumiListForBlocks merges the lumis of all blocks in a single mapping"""
+        self.dbs = DBSReader(self.endpoint)
+        lumis = self.dbs.getLumiListForBlocks([BLOCK, PARENT_BLOCK])
+        self.assertTrue(FILE in lumis)
+        self.assertTrue(PARENT_FILE in lumis)
+        self.assertEqual(lumis[FILE], [x['LumiList'] for x in self.dbs.listFilesInBlock(BLOCK)
+                                       if x['LogicalFileName'] == FILE][0])
+
     def testListFilesInBlockWithParents(self):
         """listFilesInBlockWithParents gets files with parents for a block"""
         self.dbs = DBSReader(self.endpoint)
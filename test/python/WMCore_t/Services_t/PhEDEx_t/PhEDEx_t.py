@@ -11,7 +11,7 @@ import time
 
 from WMCore.Services.UUID import makeUUID
 import WMCore.Services.PhEDEx.XMLDrop as XMLDrop
-from WMCore.Services.PhEDEx.PhEDEx import PhEDEx
+from WMCore.Services.PhEDEx.PhEDEx import PhEDEx, clearReplicaCache, _replicaCache
 from WMCore.Services.PhEDEx.DataStructs.SubscriptionList import PhEDExSubscription
 from WMCore.Services.PhEDEx.DataStructs.SubscriptionList import SubscriptionList
 from WMCore.Storage.TrivialFileCatalog import readTFC
@@ -182,6 +182,81 @@ class PhEDExTest(unittest.TestCase):
 
         self.assertTrue(phedexJSON.getNodeSE('T1_US_FNAL_Buffer') == 'cmssrm.fnal.gov')
 
+    def testBlockReplicasSplitAndCache(self):
+        """
+        _testBlockReplicasSplitAndCache_
+
+        Verify that long block lists are split, merged back and cached.
+        """
+        calls = []
+
+        def fakeResult(callname, clearCache = False, args = None, verb = "POST"):
+            calls.append(list(args['block']))
+            return {'phedex': {'request_timestamp': 1,
+                               'block': [{'name': x, 'replica': [{'node': 'T1_US_FNAL_Disk'}]}
+                                         for x in args['block'] if not x.endswith('9')]}}
+
+        clearReplicaCache()
+        phedex = PhEDEx({'maxBlocksPerCall': 4, 'replicaCacheTTL': 60})
+        phedex.wrapped._getResult = fakeResult
+        blocks = ['/A/B/RAW#%i' % i for i in range(10)]
+
+        result = phedex.getReplicaInfoForBlocks(block = blocks, complete = 'y')['phedex']
+        self.assertEqual(sorted(len(x) for x in calls), [2, 4, 4])
+        self.assertEqual([x['name'] for x in result['block']], blocks[:9])
+        self.assertEqual(result['request_timestamp'], 1)
+
+        nodes = phedex.getReplicaPhEDExNodesForBlocks(block = blocks[5:] + ['/A/B/RAW#10'], complete = 'y')
+        self.assertEqual(calls[-1], ['/A/B/RAW#10'])
+        self.assertEqual(sorted(nodes.keys()), ['/A/B/RAW#10', '/A/B/RAW#5', '/A/B/RAW#6',
+                                                '/A/B/RAW#7', '/A/B/RAW#8'])
+
+        phedex.getReplicaInfoForBlocks(block = blocks[:2], complete = 'n')
+        self.assertEqual(calls[-1], blocks[:2])
+
+        # changes since a given time are not cached
+        phedex.getReplicaInfoForBlocks(block = blocks[:2], update_since = 10)
+        phedex.getReplicaInfoForBlocks(block = blocks[:2], update_since = 10)
+        self.assertEqual(calls[-2:], [blocks[:2], blocks[:2]])
+
+        # the cache is capped and expired entries are dropped
+        clearReplicaCache()
+        phedex = PhEDEx({'maxBlocksPerCall': 4, 'replicaCacheTTL': 60, 'replicaCacheSize': 5})
+        phedex.wrapped._getResult = fakeResult
+        phedex.getReplicaInfoForBlocks(block = blocks)
+        self.assertEqual(len(_replicaCache), 5)
+        self.assertEqual([key[1] for key in _replicaCache], blocks[5:])
+        phedex['replicaCacheTTL'] = -1
+        phedex.getReplicaInfoForBlocks(block = blocks[:1])
+        self.assertEqual(len(_replicaCache), 0)
+        clearReplicaCache()
+        return
+
+    def testBlockReplicasFailures(self):
+        """
+        _testBlockReplicasFailures_
+
+        Verify that with skipFailures only the blocks of the failed requests
+        are missing from the answer.
+        """
+        def fakeResult(callname, clearCache = False, args = None, verb = "POST"):
+            if '/A/B/RAW#5' in args['block']:
+                raise RuntimeError("PhEDEx is down")
+            return {'phedex': {'block': [{'name': x, 'replica': [{'node': 'T1_US_FNAL_Disk'}]}
+                                         for x in args['block']]}}
+
+        clearReplicaCache()
+        phedex = PhEDEx({'maxBlocksPerCall': 4, 'replicaCacheTTL': 60})
+        phedex.wrapped._getResult = fakeResult
+        blocks = ['/A/B/RAW#%i' % i for i in range(10)]
+
+        self.assertRaises(RuntimeError, phedex.getReplicaInfoForBlocks, block = blocks)
+        result = phedex.getReplicaInfoForBlocks(block = blocks, skipFailures = True)['phedex']
+        self.assertEqual([x['name'] for x in result['block']], blocks[:4] + blocks[8:])
+        self.assertEqual(sorted(key[1] for key in _replicaCache), sorted(blocks[:4] + blocks[8:]))
+        clearReplicaCache()
+        return
+
     @attr('integration')
     def testAuth(self):
         """
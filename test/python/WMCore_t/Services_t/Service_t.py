@@ -13,7 +13,7 @@ from httplib import BadStatusLine, IncompleteRead
 
 from nose.plugins.attrib import attr
 
-from WMCore.Services.Service import Service
+from WMCore.Services.Service import Service, getDecodedDataCache
 from WMCore.Services.Requests import Requests
 from WMCore.Algorithms import Permissions
 from WMQuality.TestInitCouchApp import TestInitCouchApp as TestInit
@@ -38,6 +38,13 @@ class CrappyRequest(Requests):
         # METAL \m/
         raise BadStatusLine(666)
 
+class CountingRequest(Requests):
+    def makeRequest(self, uri=None, data={}, verb='GET', incoming_headers={},
+                     encoder=True, decoder=True, contentType=None):
+        self.setdefault('calls', 0)
+        self['calls'] += 1
+        return '{"calls": %i}' % self['calls'], 200, 'OK', False
+
 class RegularServer(object):
     def regular(self):
         return "This is silly."
@@ -336,6 +343,32 @@ class ServiceTest(unittest.TestCase):
         myService['requests'] = CrappyRequest('http://bad.com', {})
         self.assertRaises(BadStatusLine, myService.getData, 'foo', '')
 
+    def testRefreshCacheData(self):
+        """
+        _testRefreshCacheData_
+
+        Decoded data is served from memory until it expires or is cleared.
+        """
+        getDecodedDataCache().clear()
+        test_dict = {'logger': self.logger, 'endpoint': 'http://127.0.0.1:%i/' % self.port,
+                     'cachepath': self.testDir}
+        myService = Service(test_dict)
+        myService['requests'] = CountingRequest('http://127.0.0.1', {'cachepath': None})
+
+        self.assertEqual(myService.refreshCacheData('counting'), {'calls': 1})
+        self.assertEqual(myService.refreshCacheData('counting'), {'calls': 1})
+        self.assertEqual(myService.refreshCacheData('counting', inputdata={'a': 1}), {'calls': 2})
+        self.assertEqual(getDecodedDataCache().stats()['hits'], 1)
+
+        myService.clearCache('counting')
+        self.assertEqual(myService.refreshCacheData('counting'), {'calls': 3})
+
+        myService['cacheduration'] = 0
+        myService.refreshCacheData('expiring')
+        myService.refreshCacheData('expiring')
+        self.assertEqual(getDecodedDataCache().stats()['hits'], 1)
+        getDecodedDataCache().clear()
+
     @attr("integration")
     def testZ_InterruptedConnection(self):
         """
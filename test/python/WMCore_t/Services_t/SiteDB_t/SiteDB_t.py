@@ -4,9 +4,17 @@ Test case for SiteDB
 """
 from __future__ import print_function
 
+import json
+import os
+import shutil
+import tempfile
+import time
 import unittest
 
-from WMCore.Services.SiteDB.SiteDB import SiteDBJSON
+import mock
+
+from WMCore.Services.SiteDB.SiteDB import SiteDBJSON, clearSiteIndex
+from WMCore.Services.SiteDB.SiteDBAPI import SiteDBAPI
 from WMCore.Services.EmulatorSwitch import EmulatorHelper
 from WMQuality.Emulators.EmulatedUnitTestCase import EmulatedUnitTestCase
 
@@ -24,6 +32,7 @@ class SiteDBTest(EmulatedUnitTestCase):
         """
         super(SiteDBTest, self).setUp()
         EmulatorHelper.setEmulators(phedex=False, dbs=False, siteDB=False, requestMgr=True)
+        clearSiteIndex()
         self.mySiteDB = SiteDBJSON()
 
 
@@ -33,6 +42,7 @@ class SiteDBTest(EmulatedUnitTestCase):
         """
         super(SiteDBTest, self).tearDown()
         EmulatorHelper.resetEmulators()
+        clearSiteIndex()
         return
 
 
@@ -126,5 +136,40 @@ class SiteDBTest(EmulatedUnitTestCase):
         self.assertItemsEqual(result, ['T2_UK_London_IC', 'T2_US_Purdue'])
         return
 
+    def testSiteIndexSnapshot(self):
+        """
+        _testSiteIndexSnapshot_
+
+        Test that the index is written to the snapshot file and used from
+        there when SiteDB is not available
+        """
+        cacheDir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cacheDir)
+        siteDB = SiteDBJSON({'cachepath': cacheDir}).wrapped
+        self.assertItemsEqual(siteDB.PSNtoPNN('T1_US_FNAL'), siteDB._dataProcessing(psn='T1_US_FNAL'))
+        self.assertEqual(siteDB.cmsNametoList("T1_US*", "SE"), [u'cmsdcadisk01.fnal.gov'])
+        self.assertTrue(os.path.exists(siteDB['snapshotfile']))
+
+        # a fresh snapshot is used without contacting SiteDB
+        clearSiteIndex()
+        with mock.patch.object(SiteDBAPI, 'getJSON', side_effect=RuntimeError("SiteDB is down")):
+            siteDB = SiteDBJSON({'cachepath': cacheDir}).wrapped
+            self.assertEqual(siteDB.PNNtoPSN('T1_US_FNAL_Disk'), ['T1_US_FNAL'])
+            self.assertItemsEqual(siteDB.seToCMSName("srm-cms.cern.ch"), [u'T0_CH_CERN', u'T1_CH_CERN'])
+
+            # an expired one only until maxcachereuse
+            clearSiteIndex()
+            with open(siteDB['snapshotfile']) as snapshotFile:
+                snapshot = json.load(snapshotFile)
+            snapshot['timestamp'] = time.time() - 3600
+            with open(siteDB['snapshotfile'], 'w') as snapshotFile:
+                json.dump(snapshot, snapshotFile)
+            self.assertEqual(siteDB.PNNtoPSN('T1_US_FNAL_Disk'), ['T1_US_FNAL'])
+
+            clearSiteIndex()
+            siteDB['maxcachereuse'] = 0.5
+            self.assertRaises(RuntimeError, siteDB.PNNtoPSN, 'T1_US_FNAL_Disk')
+        return
+
 if __name__ == '__main__':
     unittest.main()
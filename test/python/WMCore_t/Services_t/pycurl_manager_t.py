@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+"""
+_pycurl_manager_t_
+
+Unit tests for the pycurl RequestHandler against a local HTTP server.
+"""
+
+import BaseHTTPServer
+import SocketServer
+import httplib
+import json
+import threading
+import time
+import unittest
+import urlparse
+
+from WMCore.Services.pycurl_manager import RequestHandler
+
+
+class ThreadedServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class JSONHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """
+    Answer GET /sleep?delay=X with {"delay": X} after sleeping X seconds
+    and any other path with a 404.
+    """
+    protocol_version = 'HTTP/1.1'
+    server_version = 'TestServer'
+    sys_version = ''
+
+    def do_GET(self):
+        path, _, query = self.path.partition('?')
+        if path != '/sleep':
+            self.reply(404, 'not found')
+            return
+        delay = float(urlparse.parse_qs(query)['delay'][0])
+        time.sleep(delay)
+        self.reply(200, json.dumps({'delay': delay}))
+
+    def reply(self, code, body):
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        return
+
+
+class RequestHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadedServer(('127.0.0.1', 0), JSONHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:%s' % self.server.server_address[1]
+        self.mgr = RequestHandler()
+        return
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        return
+
+    def testMultiRequestConcurrent(self):
+        """
+        _testMultiRequestConcurrent_
+
+        Requests run in parallel and complete in the order they finish.
+        """
+        requests = [(self.url + '/sleep', {'delay': delay}) for delay in [0.6, 0.2, 0.4]] * 2
+        start = time.time()
+        results = list(self.mgr.multi_request(requests, decode=True, num_conn=6))
+        self.assertTrue(time.time() - start < 1.5)
+
+        self.assertEqual([x['data']['delay'] for x in results], [0.2, 0.2, 0.4, 0.4, 0.6, 0.6])
+        for result in results:
+            self.assertEqual(result['error'], None)
+            self.assertEqual(result['header'].status, 200)
+            self.assertEqual(result['params']['delay'], result['data']['delay'])
+            self.assertTrue(result['time'] >= result['data']['delay'])
+        return
+
+    def testMultiRequestErrors(self):
+        """
+        _testMultiRequestErrors_
+
+        Failed requests are reported individually, with a limited pool.
+        """
+        requests = [(self.url + '/sleep', {'delay': 0}),
+                    (self.url + '/missing', {}),
+                    ('http://127.0.0.1:1/sleep', {'delay': 0})] * 3
+        results = list(self.mgr.multi_request(requests, decode=True, num_conn=2))
+        self.assertEqual(len(results), 9)
+
+        byUrl = {}
+        for result in results:
+            byUrl.setdefault(result['url'].split('?')[0], []).append(result)
+        for result in byUrl[self.url + '/sleep']:
+            self.assertEqual(result['data'], {'delay': 0})
+        for result in byUrl[self.url + '/missing']:
+            self.assertTrue(isinstance(result['error'], httplib.HTTPException))
+            self.assertEqual(result['error'].status, 404)
+        for result in byUrl['http://127.0.0.1:1/sleep']:
+            self.assertEqual(result['header'], None)
+            self.assertTrue(isinstance(result['error'], Exception))
+        return
+
+    def testMultirequest(self):
+        """
+        _testMultirequest_
+
+        multirequest yields the records updated with their parameters.
+        """
+        parray = [{'delay': 0.1}, {'delay': 0.2}]
+        data = sorted(self.mgr.multirequest(self.url + '/sleep', parray),
+                      key = lambda x: x['delay'])
+        self.assertEqual(data, parray)
+
+        self.assertRaises(httplib.HTTPException, list,
+                          self.mgr.multirequest(self.url + '/missing', [{}]))
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
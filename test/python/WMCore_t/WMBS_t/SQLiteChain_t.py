@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""
+_SQLiteChain_t_
+
+Run jobs through the JobCreator, JobSubmitter and JobAccountant pollers with
+WMBS, BossAir and DBSBuffer in SQLite databases, on disk and in memory.
+"""
+
+import os
+import threading
+import unittest
+
+from WMComponent.JobAccountant.JobAccountantPoller import JobAccountantPoller
+from WMComponent.JobCreator.JobCreatorPoller import JobCreatorPoller
+from WMComponent.JobSubmitter.JobSubmitterPoller import JobSubmitterPoller
+from WMCore.DAOFactory import DAOFactory
+from WMCore.FwkJobReport.Report import Report
+from WMCore.ResourceControl.ResourceControl import ResourceControl
+from WMCore.WMBase import getTestBase
+from WMCore.WMBS.File import File
+from WMCore.WMBS.Fileset import Fileset
+from WMCore.WMBS.Job import Job
+from WMCore.WMBS.Subscription import Subscription
+from WMCore.WMBS.Workflow import Workflow
+from WMCore.WMSpec.Makers.TaskMaker import TaskMaker
+from WMCore_t.WMSpec_t.TestSpec import testWorkload
+from WMQuality.Emulators import EmulatorSetup
+from WMQuality.TestInitCouchApp import TestInitCouchApp as TestInit
+
+
+class SQLiteChainTest(unittest.TestCase):
+    """
+    _SQLiteChainTest_
+
+    Test the agent components on the SQLite backend
+    """
+
+    site = "T2_XX_SQLite"
+
+    def setUp(self):
+        """
+        _setUp_
+
+        Setup couch and the work directory, each test picks its database.
+        """
+        self.testInit = TestInit(__file__)
+        self.testInit.setLogging()
+        self.testInit.setupCouch("sqlitechain_t/jobs", "JobDump")
+        self.testInit.setupCouch("sqlitechain_t/fwjrs", "FWJRDump")
+        self.testInit.setupCouch("sqlitechain_wmstats_t", "WMStats")
+        self.testInit.setupCouch("sqlitechain_acdc_t", "ACDC", "GroupUser")
+        self.testDir = self.testInit.generateWorkDir()
+        self.configFile = EmulatorSetup.setupWMAgentConfig()
+        self.connectUrl = None
+        return
+
+    def tearDown(self):
+        """
+        _tearDown_
+
+        Drop the schemas and couch databases.
+        """
+        if self.connectUrl:
+            self.testInit.clearDatabase()
+            self.resetConnection()
+        self.testInit.delWorkDir()
+        self.testInit.tearDownCouch()
+        EmulatorSetup.deleteConfig(self.configFile)
+        return
+
+    def resetConnection(self):
+        """
+        _resetConnection_
+
+        Forget the database of this thread, the next test connects again.
+        """
+        myThread = threading.currentThread()
+        myThread.dialect = None
+        myThread.transaction = None
+        myThread.dbFactory = None
+        return
+
+    def setupDatabase(self, connectUrl):
+        """
+        _setupDatabase_
+
+        Install the agent schemas in the SQLite database and add a site.
+        """
+        self.resetConnection()
+        self.connectUrl = connectUrl
+        self.testInit.setDatabaseConnection(connectUrl = connectUrl)
+        self.testInit.setSchema(customModules = ["WMCore.WMBS", "WMCore.BossAir",
+                                                 "WMCore.ResourceControl",
+                                                 "WMCore.Agent.Database",
+                                                 "WMComponent.DBS3Buffer"],
+                                useDefault = False)
+
+        myThread = threading.currentThread()
+        self.daoFactory = DAOFactory(package = "WMCore.WMBS",
+                                     logger = myThread.logger,
+                                     dbinterface = myThread.dbi)
+
+        resourceControl = ResourceControl()
+        resourceControl.insertSite(siteName = self.site, pnn = self.site,
+                                   ceName = self.site, plugin = "MockPlugin",
+                                   pendingSlots = 100, runningSlots = 100,
+                                   cmsName = self.site)
+        resourceControl.insertThreshold(siteName = self.site, taskType = "Processing",
+                                        maxSlots = 100, pendingSlots = 100)
+        return
+
+    def getConfig(self):
+        """
+        _getConfig_
+
+        Config for the three components, using the test database.
+        """
+        config = self.testInit.getConfiguration(connectUrl = self.connectUrl)
+
+        config.section_("General")
+        config.General.workDir = self.testDir
+
+        config.component_("Agent")
+        config.Agent.componentName = "SQLiteChain"
+        config.Agent.useHeartbeat = False
+
+        config.section_("ACDC")
+        config.ACDC.couchurl = os.getenv("COUCHURL")
+        config.ACDC.database = "sqlitechain_acdc_t"
+
+        config.component_("JobStateMachine")
+        config.JobStateMachine.couchurl = os.getenv("COUCHURL")
+        config.JobStateMachine.couchDBName = "sqlitechain_t"
+        config.JobStateMachine.jobSummaryDBName = "sqlitechain_wmstats_t"
+
+        config.component_("JobCreator")
+        config.JobCreator.namespace = "WMComponent.JobCreator.JobCreator"
+        config.JobCreator.componentDir = self.testDir
+        config.JobCreator.defaultJobType = "processing"
+        config.JobCreator.workerThreads = 1
+
+        config.section_("BossAir")
+        config.BossAir.pluginNames = ["MockPlugin"]
+        config.BossAir.pluginDir = "WMCore.BossAir.Plugins"
+        config.BossAir.section_("MockPlugin")
+        config.BossAir.MockPlugin.fakeReport = os.path.join(getTestBase(),
+                                                            "WMComponent_t/JobSubmitter_t",
+                                                            "submit.sh")
+
+        config.component_("JobSubmitter")
+        config.JobSubmitter.submitScript = config.BossAir.MockPlugin.fakeReport
+        config.JobSubmitter.componentDir = os.path.join(self.testDir, "JobSubmitter")
+        os.makedirs(config.JobSubmitter.componentDir)
+
+        config.component_("JobAccountant")
+        config.JobAccountant.componentDir = self.testDir
+        config.JobAccountant.specDir = self.testDir
+
+        config.component_("TaskArchiver")
+        config.TaskArchiver.ReqMgr2ServiceURL = "https://cmsweb-dev.cern.ch/reqmgr2"
+        config.TaskArchiver.localWMStatsURL = "%s/%s" % (config.JobStateMachine.couchurl,
+                                                         config.JobStateMachine.jobSummaryDBName)
+        return config
+
+    def createSubscription(self, nFiles):
+        """
+        _createSubscription_
+
+        Create a processing subscription with nFiles files at the site.  The
+        JobCreator loads its files 5 at a time, committing in between.
+        """
+        workload = testWorkload("Tier1ReReco")
+        workload.getTask("ReReco").setSplittingAlgorithm("FileBased", files_per_job = 1,
+                                                         file_load_limit = 5)
+        taskMaker = TaskMaker(workload, os.path.join(self.testDir, "workloadTest"))
+        taskMaker.skipSubscription = True
+        taskMaker.processWorkload()
+
+        testWorkflow = Workflow(spec = os.path.join(self.testDir, "workloadTest", "TestWorkload",
+                                                    "WMSandbox", "WMWorkload.pkl"),
+                                owner = "Steve", name = "SQLiteChain",
+                                task = "/TestWorkload/ReReco")
+        testWorkflow.create()
+
+        testFileset = Fileset(name = "SQLiteChain")
+        testFileset.create()
+        for i in range(nFiles):
+            testFile = File(lfn = "/lfn/sqlitechain/%i" % i, size = 1024,
+                            events = 10, locations = set([self.site]))
+            testFile.create()
+            testFileset.addFile(testFile)
+        testFileset.commit()
+
+        testSubscription = Subscription(fileset = testFileset, workflow = testWorkflow,
+                                        type = "Processing", split_algo = "FileBased")
+        testSubscription.create()
+        return
+
+    def completeJobs(self, jobIDs):
+        """
+        _completeJobs_
+
+        Do the tracker's work: move the jobs to complete with a successful
+        job report.
+        """
+        changeStateAction = self.daoFactory(classname = "Jobs.ChangeState")
+        setFWJRAction = self.daoFactory(classname = "Jobs.SetFWJRPath")
+        for jobID in jobIDs:
+            testJob = Job(id = jobID)
+            testJob.load()
+            testJob["state"] = "complete"
+            changeStateAction.execute(jobs = [testJob])
+
+            jobReport = Report("cmsRun1")
+            jobReport.setStepStatus("cmsRun1", 0)
+            jobReport.setTaskName("/TestWorkload/ReReco")
+            fwjrPath = os.path.join(testJob["cache_dir"], "Report.0.pkl")
+            jobReport.persist(fwjrPath)
+            setFWJRAction.execute(jobID = jobID, fwjrPath = fwjrPath)
+        return
+
+    def runChain(self, connectUrl):
+        """
+        _runChain_
+
+        Create, submit and account 12 jobs.
+        """
+        self.setupDatabase(connectUrl)
+        self.createSubscription(nFiles = 12)
+        config = self.getConfig()
+        getJobsAction = self.daoFactory(classname = "Jobs.GetAllJobs")
+
+        JobCreatorPoller(config = config).algorithm()
+        self.assertEqual(len(getJobsAction.execute(state = "Created", jobType = "Processing")), 12)
+
+        JobSubmitterPoller(config = config).algorithm()
+        self.assertEqual(getJobsAction.execute(state = "Created", jobType = "Processing"), [])
+        jobIDs = getJobsAction.execute(state = "Executing", jobType = "Processing")
+        self.assertEqual(len(jobIDs), 12)
+
+        self.completeJobs(jobIDs)
+        accountant = JobAccountantPoller(config)
+        accountant.setup()
+        accountant.algorithm()
+        self.assertEqual(sorted(getJobsAction.execute(state = "Success", jobType = "Processing")),
+                         sorted(jobIDs))
+        return
+
+    def testFileDatabase(self):
+        """
+        _testFileDatabase_
+
+        Run the chain on a database file.
+        """
+        self.runChain("sqlite:///%s" % os.path.join(self.testDir, "wmagent.db"))
+        return
+
+    def testInMemoryDatabase(self):
+        """
+        _testInMemoryDatabase_
+
+        Run the chain on an in-memory database.
+        """
+        self.runChain("sqlite://")
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
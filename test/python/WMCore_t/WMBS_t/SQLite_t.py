@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+_SQLite_t_
+
+Unit tests for the SQLite WMBS schema and its MySQL derived DAOs.  These run
+against a private in-memory database whatever the DATABASE setting is.
+"""
+
+import logging
+import unittest
+
+from WMCore.DAOFactory import DAOFactory
+from WMCore.Database.DBFactory import DBFactory
+from WMCore.WMBS.SQLite.Create import Create
+
+
+class SQLiteTest(unittest.TestCase):
+
+    def setUp(self):
+        """
+        _setUp_
+
+        Build the WMBS schema in a fresh in-memory database.
+        """
+        self.dbi = DBFactory(logging, "sqlite://").connect()
+        self.assertTrue(Create(logging, self.dbi).execute())
+        self.daoFactory = DAOFactory(package = "WMCore.WMBS", logger = logging,
+                                     dbinterface = self.dbi)
+        self.dbFactory = DAOFactory(package = "WMCore.Database", logger = logging,
+                                    dbinterface = self.dbi)
+        return
+
+    def tearDown(self):
+        self.dbi.engine.dispose()
+        return
+
+    def countRows(self, sql):
+        return self.dbi.processData(sql)[0].fetchall()[0][0]
+
+    def testSchema(self):
+        """
+        _testSchema_
+
+        List and destroy the schema.
+        """
+        listContent = self.dbFactory(classname = "ListUserContent")
+        tables = [x["table_name"] for x in listContent.execute()]
+        self.assertTrue("wmbs_job" in tables)
+        self.assertTrue("wmbs_fileset_files" in tables)
+        self.assertTrue(self.countRows("SELECT COUNT(*) FROM wmbs_job_state") > 0)
+
+        self.dbFactory(classname = "Destroy").execute()
+        self.assertEqual(listContent.execute(), [])
+        return
+
+    def testInsertIgnore(self):
+        """
+        _testInsertIgnore_
+
+        Inserting a location twice keeps a single row.
+        """
+        newLocation = self.daoFactory(classname = "Locations.New")
+        newLocation.execute(siteName = "T2_XX_Site", pnn = "T2_XX_Site_Disk")
+        newLocation.execute(siteName = "T2_XX_Site", pnn = "T2_XX_Site_Disk")
+
+        self.assertEqual(self.countRows("SELECT COUNT(*) FROM wmbs_location"), 1)
+        self.assertEqual(self.countRows("SELECT COUNT(*) FROM wmbs_location_pnns"), 1)
+        return
+
+    def testForeignKeys(self):
+        """
+        _testForeignKeys_
+
+        Deleting a location cascades to its PNNs.
+        """
+        self.daoFactory(classname = "Locations.New").execute(siteName = "T2_XX_Site",
+                                                             pnn = "T2_XX_Site_Disk")
+        self.daoFactory(classname = "Locations.Delete").execute(siteName = "T2_XX_Site")
+
+        self.assertEqual(self.countRows("SELECT COUNT(*) FROM wmbs_location_pnns"), 0)
+        return
+
+    def testAutoIncrementCheck(self):
+        """
+        _testAutoIncrementCheck_
+
+        The job id counter only ever moves forward.
+        """
+        autoIncrement = self.daoFactory(classname = "Jobs.AutoIncrementCheck")
+        sql = "SELECT seq FROM sqlite_sequence WHERE name = 'wmbs_job'"
+
+        autoIncrement.execute(input = 10)
+        self.assertEqual(self.countRows(sql), 10)
+
+        autoIncrement.execute(input = 5)
+        self.assertEqual(self.countRows(sql), 10)
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
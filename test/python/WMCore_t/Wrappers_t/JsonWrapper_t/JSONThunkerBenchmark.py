@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+"""
+_JSONThunkerBenchmark_
+
+Compare the JSONThunker speed with the registered per class encoders and
+decoders (and optionally without recursion checks) against the generic
+introspection, on jobs with files and runs and on plain nested dictionaries
+like job report summaries, as they are sent to Couch and REST clients.
+
+Usage: python JSONThunkerBenchmark.py [number of jobs] [repetitions]
+"""
+from __future__ import print_function, division
+
+import gc
+import json
+import sys
+import time
+
+from WMCore.DataStructs.File import File
+from WMCore.DataStructs.Job import Job
+from WMCore.DataStructs.Run import Run
+from WMCore.WorkQueue.DataStructs.WorkQueueElement import WorkQueueElement
+from WMCore.Wrappers.JsonWrapper.JSONThunker import JSONThunker
+
+
+def makeJobs(numJobs):
+    """
+    Build numJobs jobs with 5 files of 3 runs each, plus a work queue
+    element and a few runs per job, keyed by job name.
+    """
+    jobs = {}
+    for i in range(numJobs):
+        files = []
+        for j in range(5):
+            newFile = File(lfn='/store/data/Run2016/file_%s_%s.root' % (i, j),
+                           size=2 ** 30, events=1000, locations=set(['T1_US_FNAL_Disk']))
+            for run in range(3):
+                newFile.addRun(Run(run, *range(10 * j, 10 * j + 10)))
+            files.append(newFile)
+        job = Job(name='job_%s' % i, files=files)
+        jobs[job['name']] = {'job': job,
+                             'element': WorkQueueElement(Inputs={'/a/b/c#%s' % i: ['T1_US_FNAL_Disk']}),
+                             'run': Run(i, 1, 2, 3),
+                             'sites': set(['T1_US_FNAL', 'T2_CH_CERN'])}
+    return jobs
+
+
+def makeReports(numJobs):
+    """
+    Build numJobs job report like dictionaries of plain values
+    """
+    reports = {}
+    for i in range(numJobs):
+        reports['job_%s' % i] = {'state': 'success', 'exitCode': 0, 'retryCount': i % 3,
+                                 'output': [{'lfn': '/store/data/Run2016/file_%s_%s.root' % (i, j),
+                                             'size': 2 ** 30, 'events': 1000,
+                                             'runs': dict((str(run), range(10)) for run in range(3))}
+                                            for j in range(5)],
+                                 'performance': {'cpu': {'TotalJobCPU': 1.5, 'TotalJobTime': 2.5},
+                                                 'memory': {'PeakValueRss': 2000.0}}}
+    return reports
+
+
+def timeThunker(thunker, makeData, numJobs, repetitions):
+    """
+    Return the best (thunk, unthunk) time over the repetitions. Thunking
+    modifies its input, so the data is rebuilt every time. The garbage
+    collector is paused while timing.
+    """
+    thunkTimes = []
+    unthunkTimes = []
+    for _ in range(repetitions):
+        data = makeData(numJobs)
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.time()
+            encoded = thunker.thunk(data)
+            thunkTimes.append(time.time() - start)
+            encoded = json.loads(json.dumps(encoded))
+            start = time.time()
+            thunker.unthunk(encoded)
+            unthunkTimes.append(time.time() - start)
+        finally:
+            gc.enable()
+    return min(thunkTimes), min(unthunkTimes)
+
+
+def main(numJobs=2000, repetitions=3):
+    """
+    Print the thunk and unthunk times of each thunker configuration
+    """
+    print("%-10s %-20s %10s %11s %8s" % ("data", "thunker", "thunk (s)", "unthunk (s)", "speedup"))
+    for dataLabel, makeData in [("jobs", makeJobs), ("reports", makeReports)]:
+        generic = None
+        for label, thunker in [("generic", JSONThunker(fastPath=False)),
+                               ("fast path", JSONThunker()),
+                               ("fast path, acyclic", JSONThunker(acyclic=True))]:
+            times = timeThunker(thunker, makeData, numJobs, repetitions)
+            generic = generic or times
+            print("%-10s %-20s %10.3f %11.3f %7.1fx" % (dataLabel, label, times[0], times[1],
+                                                       sum(generic) / sum(times)))
+    return
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:3]])
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+"""
+_JSONThunker_t_
+
+Unit tests for the JSONThunker fast path.
+"""
+
+import json
+import unittest
+
+from WMCore.DataStructs.File import File
+from WMCore.DataStructs.Job import Job
+from WMCore.DataStructs.Run import Run
+from WMCore.WorkQueue.DataStructs.WorkQueueElement import WorkQueueElement
+from WMCore.Wrappers.JsonWrapper.JSONThunker import JSONThunker, registerJSONClass
+
+
+class Point(object):
+    """
+    Class (un)thunked by registered functions only
+    """
+    def __init__(self, x=0, y=0):
+        self.x = x
+        self.y = y
+
+
+class Node(object):
+    """
+    Class thunked by the generic introspection
+    """
+    def __init__(self):
+        self.child = self
+
+
+registerJSONClass(Point,
+                  encoder=lambda point, thunker: {'thunker_encoded_json': True,
+                                                  'type': '%s.Point' % __name__,
+                                                  'xy': [point.x, point.y]},
+                  decoder=lambda jsondata, thunker: Point(*jsondata['xy']))
+
+
+def makeData():
+    """
+    Build some WMCore objects mixed with plain types
+    """
+    newFile = File(lfn='/store/data/file.root', size=1024, events=10,
+                   locations=set(['T1_US_FNAL_Disk']))
+    newFile.addRun(Run(1, 2, 3))
+    return {'job': Job(name='job1', files=[newFile]),
+            'run': Run(5, 7, 8),
+            'element': WorkQueueElement(Inputs={'/a/b/c#1': ['T2_CH_CERN']}),
+            'sites': set(['T1_US_FNAL', 'T2_CH_CERN']),
+            'nested': [1, 'a', {'b': [2.5, None, True]}]}
+
+
+class JSONThunkerTest(unittest.TestCase):
+
+    def roundTrip(self, thunker, data):
+        """
+        Thunk data, pass it through json and unthunk it
+        """
+        return thunker.unthunk(json.loads(json.dumps(thunker.thunk(data))))
+
+    def testFastPathMatchesGeneric(self):
+        """
+        _testFastPathMatchesGeneric_
+
+        The fast path, with and without recursion checks, gives the same
+        results as the generic introspection.
+        """
+        generic = JSONThunker(fastPath=False).thunk(makeData())
+        self.assertEqual(JSONThunker().thunk(makeData()), generic)
+        self.assertEqual(JSONThunker(acyclic=True).thunk(makeData()), generic)
+
+        decoded = self.roundTrip(JSONThunker(fastPath=False), makeData())
+        for thunker in (JSONThunker(), JSONThunker(acyclic=True)):
+            fastDecoded = self.roundTrip(thunker, makeData())
+            self.assertEqual(fastDecoded, decoded)
+            self.assertTrue(isinstance(fastDecoded['run'], Run))
+            self.assertTrue(isinstance(fastDecoded['element'], WorkQueueElement))
+            self.assertTrue(isinstance(fastDecoded['job'], Job))
+            self.assertEqual(fastDecoded['sites'], set(['T1_US_FNAL', 'T2_CH_CERN']))
+        return
+
+    def testRegisterJSONClass(self):
+        """
+        _testRegisterJSONClass_
+
+        Registered encoders and decoders are used for their class.
+        """
+        thunker = JSONThunker()
+        self.assertEqual(thunker.thunk({'p': Point(1, 2)})['p']['xy'], [1, 2])
+        point = self.roundTrip(thunker, {'p': Point(3, 4)})['p']
+        self.assertTrue(isinstance(point, Point))
+        self.assertEqual((point.x, point.y), (3, 4))
+        return
+
+    def testRecursion(self):
+        """
+        _testRecursion_
+
+        Reference cycles are still cut on the fast path unless acyclic is set.
+        """
+        for thunker in (JSONThunker(fastPath=False), JSONThunker()):
+            self.assertEqual(thunker.thunk(Node())['type'], '%s.Node' % __name__)
+        return
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,5 @@
+#!/usr/bin/env python
+"""
+Wrappers test methods
+"""
+__all__ = []